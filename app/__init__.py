@@ -24,7 +24,10 @@ def unauthorized_callback():
     return redirect(url_for('auth.login', next=request.url))
 
 def create_app(config_class=Config):
+    from app.services.boot_profile import BootProfile
+    boot = BootProfile()
     app = Flask(__name__)
+    app.extensions['boot_profile'] = boot
     app.config.from_object(config_class)
     # Bazani doim instance/eduspace.db ga yo'naltirish (bitta fayl bo'lishi uchun)
     if not os.environ.get('DATABASE_URL'):
@@ -38,11 +41,17 @@ def create_app(config_class=Config):
     os.makedirs(os.path.join(app.config.get('UPLOAD_FOLDER', 'uploads'), 'submissions'), exist_ok=True)
     os.makedirs(os.path.join(app.config.get('UPLOAD_FOLDER', 'uploads'), 'lesson_files'), exist_ok=True)
     os.makedirs(os.path.join(app.config.get('UPLOAD_FOLDER', 'uploads'), 'site'), exist_ok=True)
+    boot.mark('config')
     
     db.init_app(app)
+    # SQLite: WAL, busy_timeout va boshqa PRAGMA lar – birinchi ulanishdan oldin (app/services/sqlite_profile.py)
+    with app.app_context():
+        from app.services.sqlite_profile import apply_sqlite_profile
+        app.extensions['sqlite_profile'] = apply_sqlite_profile(app, db.engine)
     migrate.init_app(app, db)
     login_manager.init_app(app)
     csrf.init_app(app)
+    boot.mark('extensions')
     
     @app.errorhandler(CSRFError)
     def handle_csrf_error(e):
@@ -51,163 +60,21 @@ def create_app(config_class=Config):
         flash("Sessiya muddati tugadi. Iltimos, qaytadan kiring.", "warning")
         return redirect(url_for('auth.login'))
     
-    # superadmin_flag ustuni yo'q bo'lsa qo'shish (eski bazalar uchun)
+    # Baza sxemasi – Alembic migratsiyalari (migrations/versions). Odatda faqat "head da?" tekshiruvi;
+    # yangilash kerak bo'lsa bitta worker fayl qulfi ostida bajaradi (app/services/schema.py)
     with app.app_context():
         try:
-            from sqlalchemy import text, inspect
-            conn = db.engine.connect()
-            try:
-                inspector = inspect(db.engine)
-                if 'user' in inspector.get_table_names():
-                    cols = [c['name'] for c in inspector.get_columns('user')]
-                    if 'superadmin_flag' not in cols:
-                        conn.execute(text("ALTER TABLE user ADD COLUMN superadmin_flag INTEGER"))
-                        conn.commit()
-                    if 'managed_department_id' not in cols:
-                        conn.execute(text("ALTER TABLE user ADD COLUMN managed_department_id INTEGER"))
-                        conn.commit()
-                if 'subject' in inspector.get_table_names():
-                    cols = [c['name'] for c in inspector.get_columns('subject')]
-                    if 'department_id' not in cols:
-                        conn.execute(text("ALTER TABLE subject ADD COLUMN department_id INTEGER"))
-                        conn.commit()
-            finally:
-                conn.close()
-        except Exception as e:
-            app.logger.warning("superadmin_flag migration: %s", e)
-        try:
-            from app.models import FlashMessage, SiteSetting
-            from datetime import date
-            from sqlalchemy import inspect
-            inspector = inspect(db.engine)
-            if 'flash_message' in inspector.get_table_names() and FlashMessage.query.count() == 0:
-                tuz = (SiteSetting.get('ticker_text_uz') or '').strip()
-                tru = (SiteSetting.get('ticker_text_ru') or '').strip()
-                ten = (SiteSetting.get('ticker_text_en') or '').strip()
-                tmain = (SiteSetting.get('ticker_text') or '').strip()
-                if tuz or tru or ten or tmain:
-                    fm = FlashMessage()
-                    fm.text_uz = tuz or tmain
-                    fm.text_ru = tru or tmain
-                    fm.text_en = ten or tmain
-                    fm.url = (SiteSetting.get('ticker_url') or '').strip()
-                    fm.text_color = (SiteSetting.get('ticker_text_color') or 'white').strip().lower()
-                    fm.enabled = (SiteSetting.get('ticker_enabled') or '').strip().lower() in ('1', 'true', 'yes', 'on')
-                    df = (SiteSetting.get('ticker_date_from') or '').strip()
-                    dt = (SiteSetting.get('ticker_date_to') or '').strip()
-                    try:
-                        fm.date_from = date.fromisoformat(df) if df else None
-                    except (ValueError, TypeError):
-                        fm.date_from = None
-                    try:
-                        fm.date_to = date.fromisoformat(dt) if dt else None
-                    except (ValueError, TypeError):
-                        fm.date_to = None
-                    db.session.add(fm)
-                    db.session.commit()
+            from app.services.schema import ensure_schema
+            boot.notes['schema'] = ensure_schema(app)
         except Exception as e:
-            app.logger.warning("flash_message data migration: %s", e)
-    # Qayta ishga tushirish kerak bo'lsa (yangilanishdan keyin)
-    @app.before_request
-    def check_restart_required():
-        try:
-            from app.services.updater import schedule_restart, RESTART_FLAG
-            root = Path(app.root_path).resolve().parent
-            flag_file = root / RESTART_FLAG
-        except Exception:
-            return None
-        if not flag_file.exists():
-            return None
-        try:
-            version = flag_file.read_text(encoding='utf-8').strip()
-        except Exception:
-            version = ''
-        try:
-            flag_file.unlink()
-        except Exception:
-            pass
-        from flask import Response
-        html = f'''<!DOCTYPE html><html><head><meta charset="utf-8"><meta http-equiv="refresh" content="5;url=/"><title>Yangilanish</title>
-<style>body{{font-family:sans-serif;text-align:center;padding:80px;background:#f5f5f5;}}
-.box{{background:#fff;padding:40px;border-radius:8px;max-width:500px;margin:0 auto;box-shadow:0 2px 10px rgba(0,0,0,0.1);}}
-h1{{color:#0a0;}}</style></head><body>
-<div class="box"><h1>Yangilanish mavjud</h1><p>Versiya: {version}</p><p>Qayta ishga tushirilmoqda (5 soniya)...</p></div></body></html>'''
-        schedule_restart()
-        return Response(html, status=200, mimetype='text/html; charset=utf-8')
-
-    # Markaz o'zi bloklanganmi (faqat markaz UI; institutlar va /central-api ishlaydi)
-    @app.before_request
-    def check_center_blocked():
-        try:
-            is_central = app.config.get('IS_CENTRAL_SERVER') or not (app.config.get('CENTRAL_API_URL') or '').strip()
-        except Exception:
-            is_central = False
-        if not is_central:
-            return None
-        try:
-            from app.central_api import get_center_block_status
-            st = get_center_block_status()
-        except Exception:
-            return None
-        if not st.get('blocked'):
-            return None
-        path = (request.path or '').rstrip('/')
-        allow_paths = ('/static', '/central-api', '/admin/update', '/auth/login', '/auth/logout', '/.well-known')
-        if any(path.startswith(p) for p in allow_paths):
-            return None
-        reason = st.get('block_reason') or 'Markaz vaqtincha bloklangan.'
-        from flask import Response
-        html = f'''<!DOCTYPE html><html><head><meta charset="utf-8"><title>Tizim bloklangan</title>
-<style>body{{font-family:sans-serif;text-align:center;padding:80px;background:#f5f5f5;}}
-.box{{background:#fff;padding:40px;border-radius:8px;max-width:500px;margin:0 auto;box-shadow:0 2px 10px rgba(0,0,0,0.1);}}
-h1{{color:#c00;}}p{{color:#666;}}</style></head><body>
-<div class="box"><h1>Tizim bloklangan</h1><p>{reason}</p>
-<p>Tizim Administratorlari bilan bog'laning.</p><p><a href="/admin/update">Tizim yangilanishi (blokni olish)</a></p></div></body></html>'''
-        return Response(html, status=403, mimetype='text/html; charset=utf-8')
-
-    # Markazdan bloklash va ruxsat tekshiruvi (central-api uchun o'tkazib yuborish)
-    @app.before_request
-    def check_central_block_and_permission():
-        from app.services.central_client import is_central_enabled, get_status, check_blueprint_permission
-        if not is_central_enabled():
-            return None
-        # Ham markaz ham institut bo'lgan server hech qachon bloklanmaydi
-        try:
-            is_central = app.config.get('IS_CENTRAL_SERVER') or not (app.config.get('CENTRAL_API_URL') or '').strip()
-            if not is_central and (app.config.get('CENTRAL_API_URL') or '').strip():
-                from urllib.parse import urlparse
-                central_host = urlparse((app.config.get('CENTRAL_API_URL') or '').strip()).netloc.split(':')[0].lower()
-                request_host = (request.host or '').split(':')[0].lower()
-                if central_host and request_host and central_host == request_host:
-                    is_central = True  # CENTRAL_API_URL o'zimizga qaraydi – markaz rejimi
-        except Exception:
-            is_central = False
-        if is_central:
-            return None
-        path = (request.path or '').rstrip('/')
-        skip_paths = ('/static', '/face-api/receive', '/face-api/receive.php', '/face-api/ping', '/.well-known', '/central-api')
-        if any(path.startswith(p) for p in skip_paths):
-            return None
-        status = get_status(use_cache=True)
-        if status.get('blocked'):
-            reason = status.get('block_reason') or 'Tizim vaqtincha bloklangan.'
-            from flask import Response
-            html = f'''<!DOCTYPE html><html><head><meta charset="utf-8"><title>Tizim bloklangan</title>
-<style>body{{font-family:sans-serif;text-align:center;padding:80px;background:#f5f5f5;}}
-.box{{background:#fff;padding:40px;border-radius:8px;max-width:500px;margin:0 auto;box-shadow:0 2px 10px rgba(0,0,0,0.1);}}
-h1{{color:#c00;}}p{{color:#666;}}</style></head><body>
-<div class="box"><h1>Tizim bloklangan</h1><p>{reason}</p>
-<p>Tizim Administratorlari bilan bog'laning.</p></div></body></html>'''
-            return Response(html, status=403, mimetype='text/html; charset=utf-8')
-        # Ruxsat tekshiruvi – blueprint bo'yicha
-        bp = request.blueprint
-        if bp and not check_blueprint_permission(bp):
-            from flask import redirect, url_for
-            try:
-                return redirect(url_for('main.dashboard'))
-            except Exception:
-                from flask import abort
-                abort(403)
+            boot.notes['schema'] = 'error'
+            app.logger.warning("Baza sxemasini yangilashda xato: %s", e)
+    boot.mark('schema')
+
+    # Qayta ishga tushirish belgisi, markaz bloki va markazdan blok/ruxsat – bitta darvoza;
+    # rejim shu yerda bir marta aniqlanadi (app/services/request_gate.py)
+    from app.services.request_gate import RequestGate
+    app.before_request(RequestGate(app))
 
     # Session timeout middleware (central-api / SSE uchun session kerak emas)
     @app.before_request
@@ -341,7 +208,7 @@ h1{{color:#c00;}}p{{color:#666;}}</style></head><body>
         from flask import session
         from flask_login import current_user
         from app.utils.translations import get_translation
-        from app.models import Message, SiteSetting, FlashMessage
+        from app.models import SiteSetting
         from datetime import date
         
         lang = session.get('language', 'uz')
@@ -349,10 +216,7 @@ h1{{color:#c00;}}p{{color:#666;}}</style></head><body>
         unread_msg_count = 0
         if current_user.is_authenticated:
             try:
-                unread_msg_count = Message.query.filter_by(
-                    receiver_id=current_user.id, 
-                    is_read=False
-                ).count()
+                unread_msg_count = current_user.unread_message_count or 0
             except:
                 pass
         site_institution_name = (SiteSetting.get('institution_name_' + lang) or '').strip()
@@ -366,17 +230,10 @@ h1{{color:#c00;}}p{{color:#666;}}</style></head><body>
         ticker_visible = False
         ticker_items = []  # Barcha faol va muddatiga mos flash xabarlar
         try:
-            fm_list = FlashMessage.query.filter_by(enabled=True).order_by(FlashMessage.sort_order.asc(), FlashMessage.id.asc()).all()
-            for fm in fm_list:
-                if fm.is_in_date_range():
-                    txt = fm.get_text(lang)
-                    if txt:
-                        ticker_items.append({
-                            'text': txt,
-                            'url': (fm.url or '').strip(),
-                            'text_color': (fm.text_color or 'white').strip().lower()
-                        })
-                        ticker_visible = True
+            # Faol xabarlar til bo'yicha keshda (settings_cache) – tahrir yoki sana almashganda yangilanadi
+            from app.services.settings_cache import get_flash_ticker
+            ticker_items = get_flash_ticker(lang)
+            ticker_visible = bool(ticker_items)
             if ticker_items:
                 random.shuffle(ticker_items)
             if ticker_items and not ticker_text:
@@ -439,6 +296,8 @@ h1{{color:#c00;}}p{{color:#666;}}</style></head><body>
             }
         }
     
+    boot.mark('request_hooks')
+
     from app.routes import main, auth, admin, dean, courses, api, accounting
     from app.face_api import face_api_bp
     from app.attendance import attendance_bp
@@ -472,125 +331,48 @@ h1{{color:#c00;}}p{{color:#666;}}</style></head><body>
     csrf.exempt(face_api_bp)
     csrf.exempt(central_bp)
     
+    boot.mark('blueprints')
+
     with app.app_context():
-        db.create_all()
-        
-        # Assignment va Submission jadvallariga yangi maydonlarni qo'shish
-        try:
-            from sqlalchemy import inspect, text
-            inspector = inspect(db.engine)
-            
-            # Assignment jadvalini tekshirish
-            if 'assignment' in inspector.get_table_names():
-                assignment_columns = [col['name'] for col in inspector.get_columns('assignment')]
-                
-                with db.engine.begin() as conn:
-                    if 'direction_id' not in assignment_columns:
-                        conn.execute(text("ALTER TABLE assignment ADD COLUMN direction_id INTEGER"))
-                    
-                    if 'lesson_type' not in assignment_columns:
-                        conn.execute(text("ALTER TABLE assignment ADD COLUMN lesson_type VARCHAR(20)"))
-                    
-                    if 'lesson_ids' not in assignment_columns:
-                        conn.execute(text("ALTER TABLE assignment ADD COLUMN lesson_ids TEXT"))
-            
-            # Submission jadvalini tekshirish
-            if 'submission' in inspector.get_table_names():
-                submission_columns = [col['name'] for col in inspector.get_columns('submission')]
-                
-                with db.engine.begin() as conn:
-                    if 'resubmission_count' not in submission_columns:
-                        conn.execute(text("ALTER TABLE submission ADD COLUMN resubmission_count INTEGER DEFAULT 0"))
-                    
-                    if 'allow_resubmission' not in submission_columns:
-                        conn.execute(text("ALTER TABLE submission ADD COLUMN allow_resubmission BOOLEAN DEFAULT 0"))
-                    
-                    if 'is_active' not in submission_columns:
-                        conn.execute(text("ALTER TABLE submission ADD COLUMN is_active BOOLEAN DEFAULT 1"))
-                        conn.execute(text("UPDATE submission SET is_active = 1 WHERE is_active IS NULL"))
-
-            # FaceLog jadvaliga yangi ustunlar
-            if 'face_logs' in inspector.get_table_names():
-                fl_cols = [col['name'] for col in inspector.get_columns('face_logs')]
-                with db.engine.begin() as conn:
-                    if 'device_employee_id' not in fl_cols:
-                        conn.execute(text("ALTER TABLE face_logs ADD COLUMN device_employee_id VARCHAR(50)"))
-                    if 'picture_path' not in fl_cols:
-                        conn.execute(text("ALTER TABLE face_logs ADD COLUMN picture_path VARCHAR(255)"))
-                    if 'direction' not in fl_cols:
-                        conn.execute(text("ALTER TABLE face_logs ADD COLUMN direction VARCHAR(10) DEFAULT 'IN'"))
-
-                # User jadvaliga employee_code
-                if 'user' in inspector.get_table_names():
-                    user_cols = [col['name'] for col in inspector.get_columns('user')]
-                    with db.engine.begin() as conn:
-                        if 'employee_code' not in user_cols:
-                            conn.execute(text("ALTER TABLE user ADD COLUMN employee_code VARCHAR(50)"))
-                # Message jadvaliga reply_to_id, is_pinned (chat javob/qilish)
-                if 'message' in inspector.get_table_names():
-                    msg_cols = [col['name'] for col in inspector.get_columns('message')]
-                    with db.engine.begin() as conn:
-                        if 'reply_to_id' not in msg_cols:
-                            conn.execute(text("ALTER TABLE message ADD COLUMN reply_to_id INTEGER"))
-                        if 'is_pinned' not in msg_cols:
-                            conn.execute(text("ALTER TABLE message ADD COLUMN is_pinned BOOLEAN DEFAULT 0"))
-        except Exception as e:
-            # Migration xatosi bo'lsa, xato log qilish lekin dasturni ishga tushirish
-            app.logger.warning(f"Migration xatosi (bu normal bo'lishi mumkin): {e}")
-        
         from app.models import GradeScale
         GradeScale.init_default_grades()
 
-        # Superadmin hisobi – tizim ichida, qaysi serverda bo'lishidan qat'iy nazar
-        from app.models import User, UserRole, RolePermission
+        # Superadmin hisobi – tizim ichida, qaysi serverda bo'lishidan qat'iy nazar.
+        # Parol xeshi faqat config paroli yoki xesh parametrlari o'zgarganda qayta hisoblanadi
         super_login = app.config.get('SUPERADMIN_LOGIN', 'Avazbek.Tursunqulov.99')
         super_pass = app.config.get('SUPERADMIN_PASSWORD', 'Avazbek.Tursunqulov.99')
         if super_login and super_pass:
-            super_user = User.query.filter_by(login=super_login).first()
-            if not super_user:
-                super_user = User(
-                    login=super_login,
-                    full_name='Superadmin',
-                    role='admin',
-                    is_active=True,
-                    superadmin_flag=True
-                )
-                super_user.set_password(super_pass)
-                db.session.add(super_user)
-                db.session.flush()
-                if not UserRole.query.filter_by(user_id=super_user.id, role='admin').first():
-                    db.session.add(UserRole(user_id=super_user.id, role='admin'))
-                db.session.commit()
-            else:
-                # Superadmin mavjud – parolni config ga moslashtirish, superadmin_flag qo'yish
-                super_user.set_password(super_pass)
-                super_user.is_active = True
-                super_user.superadmin_flag = True
-                db.session.commit()
+            try:
+                from app.services.superadmin import ensure_superadmin
+                boot.notes['superadmin'] = ensure_superadmin(app, super_login, super_pass)
+            except Exception as e:
+                db.session.rollback()
+                app.logger.warning("Superadmin hisobini tekshirishda xato: %s", e)
+
+        boot.mark('seed_data')
 
         # Rol ruxsatlari – default holatda DB bo'sh; sahifa kod dagi default ni ko'rsatadi, "Boshlang'ich holatga qaytarish" yoki "Saqlash" orqali DB yangilanadi
 
-        # Davomat – har kuni 00:05 da kunlik hisoblash (Toshkent vaqti uchun TZ=Asia/Tashkent qo'yiladi)
+        # Rejalashtirilgan ishlar (davomat va h.k.) – faqat lider jarayonda (app/services/scheduler.py)
         try:
-            from apscheduler.schedulers.background import BackgroundScheduler
-            from app.services.attendance_service import compute_daily_attendance
-            from datetime import date, timedelta
-
-            def _run_daily_attendance():
-                with app.app_context():
-                    try:
-                        yesterday = date.today() - timedelta(days=1)
-                        compute_daily_attendance(yesterday)
-                        app.logger.info("Daily attendance computed for %s", yesterday)
-                    except Exception as e:
-                        app.logger.exception("Daily attendance compute error: %s", e)
-
-            scheduler = BackgroundScheduler()
-            scheduler.add_job(_run_daily_attendance, 'cron', hour=0, minute=5, id='daily_attendance')
-            scheduler.start()
-            app.logger.info("APScheduler: daily attendance job at 00:05 registered")
+            from app.services.scheduler import register_default_jobs, start_scheduler
+            register_default_jobs()
+            boot.notes['scheduler'] = start_scheduler(app)
         except Exception as e:
             app.logger.warning("APScheduler not started: %s", e)
+        boot.mark('scheduler')
+
+        # Face log spool: oldingi ishga tushirishdan qolgan loglar shu yerda DB ga yoziladi (replay)
+        try:
+            from app.services.face_log_writer import start_face_log_worker, add_commit_listener
+            from app.face_api.dashboard_state import on_logs_committed
+            from app.services.attendance_service import on_face_logs_committed
+            add_commit_listener(on_logs_committed)
+            add_commit_listener(on_face_logs_committed)
+            start_face_log_worker(app)
+        except Exception as e:
+            app.logger.warning("Face log worker ishga tushmadi: %s", e)
+        boot.mark('face_log_worker')
 
     # Markazda yangi versiya faqat qo'lda: flask release
     import click
@@ -630,6 +412,183 @@ h1{{color:#c00;}}p{{color:#666;}}</style></head><body>
                 else:
                     raise
 
+    @app.cli.command('face-logs-backfill')
+    @click.option('--chunk', default=1000, show_default=True, help="Bir commit dagi qatorlar soni")
+    def face_logs_backfill_command(chunk):
+        """Eski face loglar uchun raw_data dan ajratilgan ustunlarni to'ldirish (bir martalik)."""
+        with app.app_context():
+            from app.face_api.routes import backfill_parsed_fields
+            n = backfill_parsed_fields(chunk_size=max(1, chunk))
+            click.echo("Face log backfill: %d ta qator yangilandi." % n)
+
+    @app.cli.command('face-log-requeue')
+    def face_log_requeue_command():
+        """Spool dead_letter dagi face loglarni qayta yozish navbatiga qaytarish."""
+        from app.services import face_log_spool
+        face_log_spool.init_spool(app.instance_path, app.config.get('FACE_LOG_SPOOL_PATH') or None)
+        click.echo("Face log: %d ta yozuv spool ga qaytarildi." % face_log_spool.requeue_dead_letters())
+
+    @app.cli.command('attendance-benchmark')
+    @click.option('--sizes', default='1000,5000,20000', show_default=True, help="Sintetik log soni (vergul bilan)")
+    @click.option('--legacy-max', default=5000, show_default=True, help="Eski usul shu sondan katta to'plamda o'lchanmaydi")
+    @click.option('--date', 'dates', multiple=True, help="Haqiqiy kun(lar) uchun to'liq compute vaqti (YYYY-MM-DD)")
+    def attendance_benchmark_command(sizes, legacy_max, dates):
+        """Davomat: log -> user bog'lash (eski usul va resolver) va kunlik compute vaqti."""
+        from datetime import date as _date
+        with app.app_context():
+            from app.services.attendance_service import benchmark_resolver, benchmark_compute
+            size_list = [int(x) for x in sizes.split(',') if x.strip()]
+            click.echo("%8s %12s %12s %10s" % ('logs', 'legacy_ms', 'resolver_ms', 'load_ms'))
+            for r in benchmark_resolver(size_list, legacy_max=legacy_max):
+                legacy = '-' if r['legacy_ms'] is None else r['legacy_ms']
+                click.echo("%8d %12s %12s %10s" % (r['logs'], legacy, r['resolver_ms'], r['load_ms']))
+            for d in dates:
+                r = benchmark_compute(_date.fromisoformat(d))
+                click.echo("compute %s: %d ta log, %.1f ms" % (r['date'], r['logs'], r['compute_ms']))
+
+    @app.cli.command('request-gate-benchmark')
+    @click.option('--path', default='/dashboard', show_default=True, help="So'rov yo'li")
+    @click.option('--iterations', default=20000, show_default=True)
+    def request_gate_benchmark_command(path, iterations):
+        """before_request tekshiruvlari: eski uchta hook va RequestGate – so'rov boshiga mikrosoniya."""
+        from app.services.request_gate import benchmark
+        with app.app_context():
+            r = benchmark(app, path=path, iterations=iterations)
+        click.echo("rejim: %s, yo'l: %s, %d marta" % (r['mode'], r['path'], r['iterations']))
+        click.echo("eski hooklar: %8.2f us/so'rov" % r['legacy_us'])
+        click.echo("RequestGate:  %8.2f us/so'rov" % r['gate_us'])
+
+    @app.cli.command('translations-compile')
+    def translations_compile_command():
+        """Tarjima kataloglarini (instance/translations/*.cat) manbadan qayta yaratish."""
+        from app.utils.translations import compile_catalogs, reload_catalogs
+        for lang, (path, count) in compile_catalogs().items():
+            click.echo("%s: %d ta kalit -> %s" % (lang, count, path))
+        reload_catalogs()
+
+    @app.cli.command('translations-benchmark')
+    @click.option('--runs', default=5, show_default=True, help="Har usul uchun jarayonlar soni")
+    def translations_benchmark_command(runs):
+        """Worker ishga tushishi: tarjimalar manbasini import qilish va bitta til katalogini yuklash."""
+        from app.utils.translations import benchmark_startup
+        r = benchmark_startup(runs=runs)
+        for name, label in (('legacy', 'manba moduli (3 til)'), ('catalog', 'katalog (1 til)')):
+            click.echo("%-22s %8.2f ms  %8d KB" % (label, r[name]['import_ms'], r[name]['memory_kb']))
+
+    @app.cli.command('query-plan-check')
+    @click.option('--verbose', is_flag=True, help="Har so'rov rejasini chiqarish")
+    def query_plan_check_command(verbose):
+        """Asosiy so'rovlar indeks ishlatishini tekshirish (SQLite, EXPLAIN QUERY PLAN)."""
+        from app.services.query_plans import check_query_plans
+        with app.app_context():
+            results = check_query_plans()
+        if results is None:
+            click.echo("Faqat SQLite uchun – tekshiruv o'tkazib yuborildi.")
+            return
+        failed = 0
+        for r in results:
+            failed += not r['ok']
+            click.echo("%-4s %-24s %s" % ('OK' if r['ok'] else 'XATO', r['name'], r['index']))
+            if verbose or not r['ok']:
+                for line in r['plan']:
+                    click.echo("       " + line)
+        if failed:
+            click.echo("%d ta so'rov kutilgan indeksni ishlatmayapti (flask db upgrade bajarilganmi?)." % failed, err=True)
+            raise SystemExit(1)
+
+    @app.cli.command('startup-profile')
+    def startup_profile_command():
+        """Ilova ishga tushishi (create_app) bosqichlari bo'yicha vaqt."""
+        import time as _time
+        from app.services.schema import is_at_head
+        profile = app.extensions['boot_profile']
+        for name, sec in profile.phases:
+            click.echo("%-18s %9.1f ms" % (name, sec * 1000))
+        click.echo("%-18s %9.1f ms" % ('jami', profile.total * 1000))
+        for key, value in sorted(profile.notes.items()):
+            click.echo("%s: %s" % (key, value))
+        with app.app_context():
+            started = _time.perf_counter()
+            at_head = is_at_head(app)
+            click.echo("'head da?' tekshiruvi: %.2f ms (%s)" % ((_time.perf_counter() - started) * 1000,
+                                                             'ha' if at_head else "yo'q"))
+
+    @app.cli.command('scheduler-status')
+    def scheduler_status_command():
+        """Rejalashtirilgan ishlar: lider jarayon, oxirgi ishga tushish va davomiyligi."""
+        from app.services.scheduler import read_state, registered_jobs
+        state = read_state(app)
+        leader = state.get('leader') or {}
+        click.echo("lider: pid %s (%s), %s dan" % (leader.get('pid', '-'), leader.get('host', '-'), leader.get('since', '-')))
+        jobs = state.get('jobs') or {}
+        for job_id, job in sorted(registered_jobs().items()):
+            last = jobs.get(job_id) or {}
+            args = ', '.join('%s=%s' % kv for kv in sorted(job['trigger_args'].items()))
+            click.echo("%-20s %s(%s)  oxirgi: %s  %s s  %s%s" % (
+                job_id, job['trigger'], args, last.get('last_run_at', '-'), last.get('duration_sec', '-'),
+                last.get('status', '-'), (' – ' + last['error']) if last.get('error') else ''))
+
+    @app.cli.command('scheduler-run')
+    @click.argument('job_id')
+    def scheduler_run_command(job_id):
+        """Rejalashtirilgan ishni hozir bajarish (natija scheduler-status da ko'rinadi)."""
+        from app.services.scheduler import registered_jobs, run_job
+        if job_id not in registered_jobs():
+            click.echo("Noma'lum ish: %s (mavjud: %s)" % (job_id, ', '.join(sorted(registered_jobs()))), err=True)
+            raise SystemExit(1)
+        r = run_job(app, job_id)
+        click.echo("%s: %s, %.2f s%s" % (job_id, r['status'], r['duration_sec'], (' – ' + r['error']) if r['error'] else ''))
+        if r['status'] != 'ok':
+            raise SystemExit(1)
+
+    @app.cli.command('sqlite-benchmark')
+    @click.option('--readers', default=8, show_default=True, help="O'quvchi threadlar soni")
+    @click.option('--duration', default=5.0, show_default=True, help='Har profil uchun soniya')
+    @click.option('--batch', default=200, show_default=True, help='Yozuvchi bitta commit dagi loglar')
+    @click.option('--rows', default=50000, show_default=True, help="Boshlang'ich face_logs qatorlari")
+    def sqlite_benchmark_command(readers, duration, batch, rows):
+        """Vaqtinchalik bazada stock va SQLITE_* profili: o'quvchilar + face log yozuvchi, qulf kutish va xatolar."""
+        from app.services.sqlite_profile import benchmark, current_pragmas, profile_from_config
+        with app.app_context():
+            if db.engine.dialect.name == 'sqlite':
+                with db.engine.connect() as conn:
+                    click.echo("Joriy baza: %s" % ', '.join('%s=%s' % kv for kv in current_pragmas(conn).items()))
+        pragmas = profile_from_config(app.config)
+        click.echo("Profil: %s" % ', '.join('%s=%s' % kv for kv in pragmas))
+        results = benchmark(pragmas, readers=readers, duration=duration, batch=batch, rows=rows)
+        click.echo("%-8s %8s %7s %9s %9s %7s %7s %9s %9s" % (
+            '', "o'qish", 'xato', 'p50 ms', 'p95 ms', 'yozish', 'xato', 'p50 ms', 'p95 ms'))
+        for label in ('stock', 'profile'):
+            r = results[label]
+            click.echo("%-8s %8d %7d %9.2f %9.2f %7d %7d %9.2f %9.2f" % (
+                label, r['reads'], r['read_errors'], r['read_p50_ms'], r['read_p95_ms'],
+                r['writes'], r['write_errors'], r['write_p50_ms'], r['write_p95_ms']))
+
+    @app.cli.command('attendance-recompute')
+    @click.option('--from', 'date_from', required=True, help="Boshlanish sanasi (YYYY-MM-DD)")
+    @click.option('--to', 'date_to', default=None, help="Tugash sanasi (YYYY-MM-DD), default: --from")
+    @click.option('--workers', default=4, show_default=True, help="Parallel kunlar soni")
+    def attendance_recompute_command(date_from, date_to, workers):
+        """Davomatni sanalar oralig'i uchun qayta hisoblash (kunlar parallel)."""
+        import time as _time
+        from datetime import date as _date
+        from app.services.attendance_service import recompute_range
+        d_from = _date.fromisoformat(date_from)
+        d_to = _date.fromisoformat(date_to) if date_to else d_from
+        if d_to < d_from:
+            click.echo("Xato: --to --from dan oldin.", err=True)
+            raise SystemExit(1)
+
+        def _done(day, err):
+            click.echo("%s: %s" % (day.isoformat(), 'OK' if err is None else 'XATO – ' + err))
+
+        started = _time.perf_counter()
+        results = recompute_range(app, d_from, d_to, workers=workers, on_day_done=_done)
+        failed = [d for d, err in results.items() if err]
+        click.echo("Jami %d kun, %d xato, %.1f s." % (len(results), len(failed), _time.perf_counter() - started))
+        if failed:
+            raise SystemExit(1)
+
     @app.cli.command('check-update')
     def check_update_command():
         """Institut: yangilanish mavjudligini qo'lda tekshirish (joriy va so'nggi versiya)."""
@@ -667,4 +626,6 @@ h1{{color:#c00;}}p{{color:#666;}}</style></head><body>
             else:
                 click.echo("Yangilanish o'tkazilmadi (so'nggi versiya allaqachon o'rnatilgan yoki xato).", err=True)
 
+    boot.mark('cli_commands')
+    app.logger.info("Ishga tushish: %.0f ms (sxema: %s)", boot.total * 1000, boot.notes.get('schema'))
     return app
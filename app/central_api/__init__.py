@@ -5,6 +5,7 @@ Main app ichida /central-api/ prefiksi bilan qo'shiladi.
 import json
 import logging
 import threading
+import time
 from pathlib import Path
 from flask import Blueprint, jsonify, request, Response, stream_with_context, current_app, send_from_directory, send_from_directory
 
@@ -16,6 +17,13 @@ central_bp = Blueprint('central_api', __name__, url_prefix='/central-api')
 sse_subscribers = []
 sse_lock = threading.Lock()
 
+# Markaz bloki keshi (request darvozasi uchun): institutions.json mtime soniyasiga bir marta tekshiriladi,
+# shu jarayonda _save_institutions keshni darhol yangilaydi
+CENTER_BLOCK_CHECK_SEC = 1.0
+_center_block = None        # {'mtime': float, 'status': dict}
+_center_block_checked_at = 0.0
+_center_block_lock = threading.Lock()
+
 
 def get_connected_institution_ids():
     """Markazga hozir ulangan institut ID lari (SSE orqali)."""
@@ -67,19 +75,56 @@ def _load_institutions():
 def _save_institutions(data):
     data_dir, _ = _get_central_dirs()
     data_dir.mkdir(parents=True, exist_ok=True)
-    with open(data_dir / 'institutions.json', 'w', encoding='utf-8') as f:
+    inst_file = data_dir / 'institutions.json'
+    with open(inst_file, 'w', encoding='utf-8') as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
+    _set_center_block_cache(_file_mtime(inst_file), _block_status(data))
 
 
-def get_center_block_status():
-    """Markaz o'zi bloklanganmi (faqat markaz UI taqiqlanadi, institutlar ishlaydi)."""
-    data = _load_institutions()
+def _block_status(data):
     return {
         "blocked": bool(data.get("center_blocked", False)),
         "block_reason": (data.get("center_block_reason") or "").strip()
     }
 
 
+def _file_mtime(path):
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+def _set_center_block_cache(mtime, status):
+    global _center_block, _center_block_checked_at
+    with _center_block_lock:
+        _center_block = {'mtime': mtime, 'status': status}
+        _center_block_checked_at = time.monotonic()
+
+
+def get_center_block_status():
+    """Markaz o'zi bloklanganmi (faqat markaz UI taqiqlanadi, institutlar ishlaydi)."""
+    return _block_status(_load_institutions())
+
+
+def get_center_block_cached():
+    """get_center_block_status – xotiradan. Fayl o'zgargan bo'lsa (boshqa jarayon) qayta o'qiladi."""
+    global _center_block_checked_at
+    now = time.monotonic()
+    with _center_block_lock:
+        cached = _center_block
+        if cached is not None and now - _center_block_checked_at < CENTER_BLOCK_CHECK_SEC:
+            return cached['status']
+        _center_block_checked_at = now
+    data_dir, _ = _get_central_dirs()
+    mtime = _file_mtime(data_dir / 'institutions.json')
+    if cached is not None and mtime is not None and mtime == cached['mtime']:
+        return cached['status']
+    status = get_center_block_status()
+    _set_center_block_cache(_file_mtime(data_dir / 'institutions.json'), status)
+    return status
+
+
 def set_center_block(blocked, block_reason=""):
     """Markaz blokini o'rnatish (True/False)."""
     data = _load_institutions()
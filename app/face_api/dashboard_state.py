@@ -0,0 +1,402 @@
+"""
+Smart Dashboard uchun bugungi kun holati – xotirada, inkremental yangilanadi.
+Har bir yangi face log bir marta qo'llanadi: xodim bo'yicha birinchi IN / oxirgi OUT, so'nggi IN lar
+(live ring buffer). Javob (snapshot) faqat versiya o'zgarganda qayta quriladi; /dashboard-cards
+so'rovlari keshdagi tayyor javobni va ETag ni oladi.
+Bir nechta worker bo'lsa har jarayon o'z holatini face_logs dan id > oxirgi_id bo'yicha to'ldiradi,
+shuning uchun ETag (sana + oxirgi log id) barcha workerlarda bir xil.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, time as dt_time
+
+from sqlalchemy import or_, and_
+from sqlalchemy.orm import defer
+
+from app import db
+from app.models import FaceLog
+from app.utils.face_log_parser import parse_raw_extra
+
+logger = logging.getLogger(__name__)
+
+TZ = timedelta(hours=5)
+LATE_THRESHOLD = '09:00:00'
+EXIT_ON_TIME_THRESHOLD = '17:00:00'
+LIVE_BUFFER_SIZE = 100          # live_limit ning maksimumi
+REFRESH_MIN_INTERVAL_SEC = 1.0  # boshqa workerlar yozgan loglarni tekshirish oralig'i
+LOAD_CHUNK = 2000
+EVENT_BUFFER_SIZE = 500         # SSE oqimi uchun so'nggi voqealar (Last-Event-ID bilan davom ettirish)
+
+
+def _is_valid_person_name(name):
+    """Haqqiqiy shaxs ismi borligini tekshiradi. Ismsiz (ID 12345, A kirish va h.k.) False."""
+    if not name or not isinstance(name, str):
+        return False
+    s = name.strip()
+    if not s or s == '—' or s == '-' or len(s) < 3:
+        return False
+    s_upper = s.upper()
+    if s_upper.startswith('ID'):
+        rest = s_upper[2:].strip()
+        if rest.isdigit():
+            return False
+    s_lower = s.lower()
+    if s_lower.endswith(' kirish') or s_lower.endswith(' chiqish'):
+        if len(s_lower) < 12:
+            return False
+    if len(s.split()) == 1 and len(s) <= 2:
+        return False
+    return True
+
+
+def _log_extra(log):
+    """Dashboard uchun qo'shimcha maydonlar – ingestion da ajratilgan ustunlardan (eski qatorlar uchun raw_data dan)."""
+    if log.raw_parsed:
+        return {
+            'role': log.role,
+            'department': log.department,
+            'attendanceStatus': log.attendance_status or 'present',
+            'kpiScore': log.kpi_score,
+            'similarity': log.similarity,
+        }
+    return parse_raw_extra(log.raw_data or '')
+
+
+def _dashboard_card_from_log(log, tz, extra, time_str, event_time, photo_url):
+    """FaceLog dan bitta kartochka obyektini yasaydi."""
+    person_name = (log.person_name or '').strip()
+    kpi = extra.get('kpiScore')
+    if kpi is not None:
+        try:
+            kpi = min(100, max(0, int(kpi)))
+        except (TypeError, ValueError):
+            kpi = None
+    sim = extra.get('similarity')
+    if sim is not None:
+        try:
+            sim = min(100, max(0, int(sim)))
+        except (TypeError, ValueError):
+            sim = None
+    return {
+        'personName': person_name,
+        'employeeNo': (log.device_employee_id or str(log.id)).strip()[:20] if (log.device_employee_id or log.id) else '—',
+        'role': extra.get('role') or 'Employee',
+        'department': extra.get('department') or '—',
+        'photoUrl': photo_url,
+        'lastEntryTime': time_str,
+        'attendanceStatus': extra.get('attendanceStatus') or 'present',
+        'kpiScore': kpi if kpi is not None else 0,
+        'similarity': sim if sim is not None else 0,
+        'lastUpdated': int((event_time or log.created_at or datetime.utcnow()).timestamp() * 1000),
+    }
+
+
+def _log_direction(log):
+    direction = (log.direction or 'IN').strip().upper()
+    if 'CHIQISH' in (log.person_name or '').upper():
+        direction = 'OUT'
+    return direction
+
+
+def _today_tashkent():
+    return (datetime.utcnow() + TZ).date()
+
+
+def _today_filter(day):
+    """Toshkent sanasi uchun keng oraliq (qurilma vaqti farqlari uchun), aniq sana keyin tekshiriladi."""
+    start_utc = datetime.combine(day, dt_time(0, 0, 0)) - TZ
+    start_tashkent = datetime.combine(day, dt_time(0, 0, 0))
+    return or_(
+        and_(FaceLog.event_time.isnot(None),
+             FaceLog.event_time >= start_tashkent - timedelta(hours=12),
+             FaceLog.event_time < start_tashkent + timedelta(days=1, hours=2)),
+        and_(FaceLog.event_time.is_(None),
+             FaceLog.created_at >= start_utc, FaceLog.created_at < start_utc + timedelta(days=1)),
+    )
+
+
+def _with_tv(card, tv_mode):
+    c = dict(card)
+    if tv_mode and c.get('photoUrl'):
+        c['photoUrl'] = c['photoUrl'] + '?tv=1'
+    return c
+
+
+def _entry_time_for_sort(card):
+    t = (card.get('lastEntryTime') or card.get('firstEntryTime') or '').strip()
+    if len(t) == 5:
+        t = t + ':00'
+    return t or '00:00:00'
+
+
+def _pad_time(t):
+    t = (t or '').strip()
+    return t + ':00' if len(t) == 5 else t
+
+
+def _aggregates(kirish_on_time, kirish_late):
+    """Umumiy statistika va bo'linmalar (kirish kartochkalaridan)."""
+    # Umumiy statistika (KPI dashboard): vaqtida keldi / kechikdi / kelmagan
+    ontime_count = len(kirish_on_time)
+    late_count = len(kirish_late)
+    total_came = ontime_count + late_count
+    total_all = max(total_came, 1)
+    stats = {
+        'total_came': total_came,
+        'total_all': total_came,
+        'ontime_count': ontime_count,
+        'late_count': late_count,
+        'absent_count': 0,
+        'ontime_percent': round((ontime_count / total_all) * 100),
+        'late_percent': round((late_count / total_all) * 100),
+        'absent_percent': 0,
+    }
+
+    # Markaziy bo'linmalar: department bo'yicha guruhlash
+    dept_map = {}
+    for c in kirish_on_time + kirish_late:
+        dept_name = (c.get('department') or '—').strip() or 'Bo\'linmasi yo\'q'
+        d = dept_map.setdefault(dept_name, {'count': 0, 'kpi_sum': 0})
+        d['count'] += 1
+        d['kpi_sum'] += (c.get('kpiScore') or 0)
+    departments = [
+        {'name': name, 'employee_count': v['count'], 'avg_kpi': round(v['kpi_sum'] / v['count']) if v['count'] else 0}
+        for name, v in dept_map.items()
+    ]
+    departments.sort(key=lambda d: d['employee_count'], reverse=True)
+    return {'stats': stats, 'departments': departments}
+
+
+class _DayState:
+    """Bitta kun (Toshkent) holati."""
+
+    def __init__(self, day):
+        self.day = day
+        self.first_in = {}    # key -> (event_time, card)
+        self.last_out = {}    # key -> (event_time, card)
+        self.live = []        # [(event_time, log_id, card)], vaqt bo'yicha kamayish
+        self.last_id = 0
+        self.logs_seen = 0
+        self.version = 0
+        self.snapshots = {}   # (tv_mode, live_limit) -> (version, out)
+        self.events = deque(maxlen=EVENT_BUFFER_SIZE)  # {'id', 'direction', 'bucket', 'card'}
+        self.aggregates_cache = None  # (version, {'stats', 'departments'})
+
+    def apply(self, logs):
+        """Loglarni holatga qo'llash (tartibdan qat'iy nazar: min IN, max OUT)."""
+        changed = False
+        live_added = False
+        for log in logs:
+            if log.id > self.last_id:
+                self.last_id = log.id
+            self.logs_seen += 1
+            event_time = log.display_event_time() or (log.created_at + TZ if log.created_at else None)
+            if not event_time or event_time.date() != self.day:
+                continue
+            person_name = (log.person_name or '').strip()
+            if person_name in ('', '—', '-') or not _is_valid_person_name(person_name):
+                continue
+            key = (log.device_employee_id or '').strip() or person_name
+            time_str = event_time.strftime('%H:%M:%S')
+            photo_url = f"/face-api/picture/{log.id}" if log.picture_path else None
+            card = _dashboard_card_from_log(log, TZ, _log_extra(log), time_str, event_time, photo_url)
+            direction = _log_direction(log)
+            bucket = None
+            if direction == 'OUT':
+                prev = self.last_out.get(key)
+                if prev is None or event_time > prev[0]:
+                    self.last_out[key] = (event_time, card)
+                    bucket = 'chiqish_on_time' if time_str >= EXIT_ON_TIME_THRESHOLD else 'chiqish_late'
+                    changed = True
+                self.events.append({'id': log.id, 'direction': direction, 'bucket': bucket, 'card': card})
+                changed = True
+                continue
+            prev = self.first_in.get(key)
+            if prev is None or event_time < prev[0]:
+                self.first_in[key] = (event_time, card)
+                bucket = 'kirish_on_time' if time_str < LATE_THRESHOLD else 'kirish_late'
+                changed = True
+            live_card = dict(card)
+            live_card['firstEntryTime'] = time_str
+            self.live.append((event_time, log.id, live_card))
+            live_added = True
+            self.events.append({'id': log.id, 'direction': direction, 'bucket': bucket, 'card': live_card})
+        if live_added:
+            self.live.sort(key=lambda x: (x[0], x[1]), reverse=True)
+            del self.live[LIVE_BUFFER_SIZE:]
+            changed = True
+        if changed:
+            self.version += 1
+            self.snapshots.clear()
+        return changed
+
+    def build(self, tv_mode, live_limit):
+        """Javobni qurish – faqat versiya o'zgarganda chaqiriladi."""
+        kirish_on_time, kirish_late = [], []
+        for key, (_et, base) in self.first_in.items():
+            card = _with_tv(base, tv_mode)
+            card['firstEntryTime'] = card.get('lastEntryTime') or '—'
+            card['lastExitTime'] = (self.last_out[key][1].get('lastEntryTime') if key in self.last_out else None) or '—'
+            t = (card.get('lastEntryTime') or '').strip()
+            if len(t) == 5:
+                t = t + ':00'
+            if t and t < LATE_THRESHOLD:
+                kirish_on_time.append(card)
+            else:
+                kirish_late.append(card)
+
+        chiqish_on_time, chiqish_late = [], []
+        for key, (_et, base) in self.last_out.items():
+            card = _with_tv(base, tv_mode)
+            card['lastExitTime'] = card.get('lastEntryTime') or '—'
+            card['firstEntryTime'] = (self.first_in[key][1].get('lastEntryTime') if key in self.first_in else None) or '—'
+            t = (card.get('lastEntryTime') or '').strip()
+            if len(t) == 5:
+                t = t + ':00'
+            if t and t >= EXIT_ON_TIME_THRESHOLD:
+                chiqish_on_time.append(card)
+            else:
+                chiqish_late.append(card)
+
+        # So'ngi o'tganlar birinchi: vaqt bo'yicha kamayish tartibida
+        for lst in (kirish_on_time, kirish_late, chiqish_on_time, chiqish_late):
+            lst.sort(key=_entry_time_for_sort, reverse=True)
+
+        live_entries = [_with_tv(card, tv_mode) for _et, _id, card in self.live[:live_limit]]
+
+        agg = _aggregates(kirish_on_time, kirish_late)
+
+        # Faol xodimlar: bugun kelganlar (vaqtida + kechikkan), KPI va status bilan
+        active_employees = []
+        seen_key = set()
+        for c in kirish_on_time + kirish_late:
+            key = (c.get('employeeNo') or '') + (c.get('personName') or '')
+            if key in seen_key:
+                continue
+            seen_key.add(key)
+            active_employees.append({
+                'personName': c.get('personName') or '—',
+                'employeeNo': c.get('employeeNo') or '—',
+                'department': c.get('department') or '—',
+                'photoUrl': c.get('photoUrl'),
+                'kpiScore': c.get('kpiScore') or 0,
+                'attendanceStatus': c.get('attendanceStatus') or 'present',
+                'firstEntryTime': c.get('firstEntryTime') or c.get('lastEntryTime') or '—',
+            })
+        active_employees.sort(key=lambda x: (x.get('firstEntryTime') or ''), reverse=True)
+
+        return {
+            'status': 'success',
+            'kirish_on_time': kirish_on_time,
+            'kirish_late': kirish_late,
+            'chiqish_on_time': chiqish_on_time,
+            'chiqish_late': chiqish_late,
+            'live_entries': live_entries,
+            'date': self.day.isoformat(),
+            'stats': agg['stats'],
+            'departments': agg['departments'],
+            'active_employees': active_employees,
+            'version': self.etag,
+        }
+
+    def aggregates(self):
+        """Faqat stats va departments (SSE delta uchun) – versiya bo'yicha keshlanadi."""
+        if self.aggregates_cache is None or self.aggregates_cache[0] != self.version:
+            on_time, late = [], []
+            for _et, base in self.first_in.values():
+                t = _pad_time(base.get('lastEntryTime'))
+                (on_time if t and t < LATE_THRESHOLD else late).append(base)
+            self.aggregates_cache = (self.version, _aggregates(on_time, late))
+        return self.aggregates_cache[1]
+
+    @property
+    def etag(self):
+        return '%s-%d' % (self.day.isoformat(), self.last_id)
+
+
+_state = None
+_lock = threading.RLock()
+_last_refresh = 0.0
+_listeners = []
+
+
+def _load_new_logs(state):
+    """face_logs dan id > state.last_id bo'lgan bugungi loglarni bo'laklab o'qib qo'llash."""
+    changed = False
+    while True:
+        rows = FaceLog.query.options(defer(FaceLog.raw_data)).filter(
+            FaceLog.id > state.last_id, _today_filter(state.day),
+        ).order_by(FaceLog.id.asc()).limit(LOAD_CHUNK).all()
+        if not rows:
+            break
+        changed = state.apply(rows) or changed
+        if len(rows) < LOAD_CHUNK:
+            break
+    return changed
+
+
+def refresh(force=False):
+    """
+    Holatni yangilash: kun almashgan bo'lsa qaytadan quriladi, aks holda faqat yangi loglar qo'llanadi.
+    force=False bo'lsa REFRESH_MIN_INTERVAL_SEC dan tez-tez DB ga murojaat qilinmaydi.
+    """
+    global _state, _last_refresh
+    today = _today_tashkent()
+    now = time.monotonic()
+    with _lock:
+        if _state is not None and _state.day == today and not force and now - _last_refresh < REFRESH_MIN_INTERVAL_SEC:
+            return _state
+        if _state is None or _state.day != today:
+            _state = _DayState(today)
+        prev_version = _state.version
+        try:
+            _load_new_logs(_state)
+        except Exception as e:
+            db.session.rollback()
+            logger.warning("Dashboard holatini yangilashda xato: %s", e)
+        _last_refresh = now
+        state = _state
+    if state.version != prev_version:
+        for fn in list(_listeners):
+            try:
+                fn(state)
+            except Exception as e:
+                logger.warning("Dashboard listener xatosi: %s", e)
+    return state
+
+
+def reset():
+    """Holatni tashlab yuborish (masalan, loglar tozalanganda) – keyingi so'rovda qayta quriladi."""
+    global _state
+    with _lock:
+        _state = None
+
+
+def snapshot(tv_mode=False, live_limit=50):
+    """Joriy javob va ETag – versiya o'zgarmagan bo'lsa keshdagi tayyor dict qaytadi."""
+    state = refresh()
+    live_limit = max(0, min(int(live_limit), LIVE_BUFFER_SIZE))
+    cache_key = (bool(tv_mode), live_limit)
+    with _lock:
+        cached = state.snapshots.get(cache_key)
+        if cached is None or cached[0] != state.version:
+            cached = (state.version, state.build(bool(tv_mode), live_limit))
+            state.snapshots[cache_key] = cached
+        return cached[1], '%s-%d-%d' % (state.etag, int(bool(tv_mode)), live_limit), state
+
+
+def add_listener(fn):
+    """Holat o'zgarganda chaqiriladigan funksiya (fn(state))."""
+    if fn not in _listeners:
+        _listeners.append(fn)
+
+
+def on_logs_committed(app, rows=None):
+    """Face log yozuvchi commit qilgandan keyin – holatni darhol yangilash (polling kutmasdan)."""
+    try:
+        with app.app_context():
+            refresh(force=True)
+    except Exception as e:
+        logger.warning("Dashboard holati yangilanmadi: %s", e)
@@ -1,12 +1,11 @@
 """
 Hikvision face API – qurilmalardan log qabul qilish va superadmin uchun ko‘rsatish.
-Qotishni oldini olish: loglar navbatga qo‘yiladi, har 3 soniyada bitta DB ga yoziladi.
+Qotishni oldini olish: loglar navbatga qo‘yiladi, worker ularni batch qilib DB ga yozadi
+(app/services/face_log_writer.py).
 """
 import json
 import logging
-import queue
 import threading
-import time
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -31,71 +30,19 @@ def _raw_time_has_timezone(raw_str):
     s = raw_str.strip()
     return ('T' in s or 't' in s) and ('+' in s or 'Z' in s)
 
-from flask import request, jsonify, current_app, send_file, abort
+from flask import request, jsonify, current_app, send_file, abort, Response
 from sqlalchemy import or_, and_
+from sqlalchemy.orm import defer
 
 from app import db
 from app.models import FaceLog, User
+from app.services.face_log_writer import enqueue_face_log, start_face_log_worker, get_face_log_metrics
+from app.utils.face_log_parser import extract_event_log_from_multipart as _extract_event_log_from_multipart
+from app.face_api import dashboard_state, stream
+from app.face_api.dashboard_state import _is_valid_person_name
 
 logger = logging.getLogger(__name__)
 
-# Har 3 soniyada 1 ta xodim logini qabul qilish (qotishni oldini olish)
-FACE_LOG_QUEUE = queue.Queue()
-FACE_LOG_INTERVAL_SEC = 3
-_face_log_worker_started = False
-_face_log_worker_lock = threading.Lock()
-
-
-def _start_face_log_worker(app):
-    """Navbatdan har 3 soniyada bitta logni DB ga yozadigan worker ni ishga tushirish."""
-    global _face_log_worker_started
-    with _face_log_worker_lock:
-        if _face_log_worker_started:
-            return
-        _face_log_worker_started = True
-
-    def _worker():
-        while True:
-            time.sleep(FACE_LOG_INTERVAL_SEC)
-            try:
-                entry_dict = FACE_LOG_QUEUE.get_nowait()
-            except queue.Empty:
-                continue
-            try:
-                with app.app_context():
-                    log = FaceLog(
-                        device_employee_id=entry_dict.get('device_employee_id'),
-                        person_name=entry_dict.get('person_name'),
-                        event_time=entry_dict.get('event_time'),
-                        direction=entry_dict.get('direction') or 'IN',
-                        device_ip=entry_dict.get('device_ip') or '',
-                        raw_data=entry_dict.get('raw_data'),
-                        picture_path=entry_dict.get('picture_path'),
-                    )
-                    db.session.add(log)
-                    db.session.commit()
-                    logger.debug("Face log navbatdan yozildi: id=%s", log.id)
-            except Exception as e:
-                logger.exception("Face log navbatdan yozishda xato: %s", e)
-            try:
-                FACE_LOG_QUEUE.task_done()
-            except Exception:
-                pass
-
-    t = threading.Thread(target=_worker, daemon=True)
-    t.start()
-    logger.info("Face log worker ishga tushdi (har %d soniyada 1 ta log)", FACE_LOG_INTERVAL_SEC)
-
-
-def _enqueue_face_log(entry_dict):
-    """Logni navbatga qo‘shish; so‘rov tez qaytadi, DB yozuvi keyinroq worker tomonidan."""
-    try:
-        FACE_LOG_QUEUE.put_nowait(entry_dict)
-        if FACE_LOG_QUEUE.qsize() > 500:
-            logger.warning("Face log navbati o‘smoqda: %d ta", FACE_LOG_QUEUE.qsize())
-    except queue.Full:
-        logger.error("Face log navbati to‘ldi, log qo‘shilmadi")
-
 PERSON_NAME_KEYS = (
     'personName', 'person_name', 'PersonName', 'name', 'Name',
     'userName', 'user_name', 'UserName',  # Dahua
@@ -305,31 +252,6 @@ def _write_last_request(client_ip):
         pass
 
 
-def _extract_event_log_from_multipart(raw_str):
-    """Hikvision multipart/form-data dan event_log qismidagi JSON ni ajratib oladi."""
-    try:
-        idx = raw_str.find('name="event_log"')
-        if idx == -1:
-            idx = raw_str.find("name='event_log'")
-        if idx == -1:
-            return None
-        rest = raw_str[idx:]
-        start = rest.find('{')
-        if start == -1:
-            return None
-        depth = 0
-        for i, c in enumerate(rest[start:], start):
-            if c == '{':
-                depth += 1
-            elif c == '}':
-                depth -= 1
-                if depth == 0:
-                    return rest[start:i + 1]
-        return None
-    except Exception:
-        return None
-
-
 def _get_boundary_from_content_type(content_type):
     """Content-Type dan boundary qiymatini ajratib oladi."""
     if not content_type:
@@ -481,9 +403,9 @@ def receive():
                     'raw_data': dahua_json,
                     'picture_path': None,
                 }
-                _enqueue_face_log(entry_dict)
+                enqueue_face_log(entry_dict)
                 try:
-                    _start_face_log_worker(current_app._get_current_object())
+                    start_face_log_worker(current_app._get_current_object())
                 except Exception:
                     pass
                 return jsonify({'status': 'success'}), 200
@@ -536,22 +458,22 @@ def receive():
             'raw_data': raw_str,
             'picture_path': None,
         }
-        _enqueue_face_log(entry_dict)
+        enqueue_face_log(entry_dict)
         try:
-            _start_face_log_worker(current_app._get_current_object())
+            start_face_log_worker(current_app._get_current_object())
         except Exception:
             pass
         return jsonify({'status': 'success'}), 200
 
     except json.JSONDecodeError:
         _write_last_request(client_ip)
-        _enqueue_face_log({
+        enqueue_face_log({
             'device_employee_id': None, 'person_name': None, 'event_time': None,
             'direction': 'IN', 'device_ip': client_ip,
             'raw_data': raw_str or '(invalid json)', 'picture_path': None,
         })
         try:
-            _start_face_log_worker(current_app._get_current_object())
+            start_face_log_worker(current_app._get_current_object())
         except Exception:
             pass
         return jsonify({'status': 'success'}), 200
@@ -567,6 +489,42 @@ def receive():
         return jsonify({'status': 'error', 'message': 'Internal server error'}), 500
 
 
+@face_api_bp.route('/metrics', methods=['GET'])
+def face_log_metrics():
+    """Face log yozuvchi ko'rsatkichlari (navbat chuqurligi, flush kechikishi, rows/sec) – faqat superadmin."""
+    from flask_login import current_user
+    if not current_user.is_authenticated or not getattr(current_user, 'is_superadmin', False):
+        return jsonify({'status': 'error', 'message': 'Access denied'}), 403
+    return jsonify({'status': 'success', 'metrics': get_face_log_metrics(), 'stream': stream.get_stream_stats()}), 200
+
+
+@face_api_bp.route('/stream', methods=['GET'])
+def face_stream():
+    """
+    SSE: yangi kirish/chiqishlar ('entry') va umumiy statistika ('stats') – polling o'rniga.
+    TV rejimida (?tv=1) login talab qilinmaydi, aks holda superadmin. Last-Event-ID bilan davom ettiriladi.
+    """
+    from flask_login import current_user
+    tv_mode = request.args.get('tv', '').strip() == '1'
+    if not tv_mode and (not current_user.is_authenticated or not getattr(current_user, 'is_superadmin', False)):
+        return jsonify({'status': 'error', 'message': 'Access denied'}), 403
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        last_event_id = int(last_event_id) if last_event_id not in (None, '') else None
+    except ValueError:
+        last_event_id = None
+    sub, initial = stream.subscribe(current_app._get_current_object(), tv_mode, last_event_id)
+    # Oqim davomida DB ulanishi band qilinmasin
+    db.session.remove()
+    if sub is None:
+        return jsonify({'status': 'error', 'message': 'Too many subscribers'}), 503, {'Retry-After': '30'}
+    return Response(
+        stream.stream_frames(sub, initial),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
 @face_api_bp.route('/picture/<int:log_id>', methods=['GET'])
 def serve_picture(log_id):
     """Face log rasmini ko'rsatish. Superadmin yoki TV rejimi (?tv=1) da ruxsat."""
@@ -610,6 +568,35 @@ def backfill_device_employee_ids(limit=5000):
     return updated
 
 
+def backfill_parsed_fields(chunk_size=1000, limit=None):
+    """
+    Eski loglar uchun raw_data dan pre-parse ustunlarni (qurilma vaqti, IP, nomi, rol, bo'lim, ...) to'ldirish.
+    id bo'yicha bo'laklab (chunk_size) yuradi, har bo'lak alohida commit – katta jadvalda ham xotira tekis.
+    """
+    from app.utils.face_log_parser import parse_face_log_fields
+    updated = 0
+    last_id = 0
+    while limit is None or updated < limit:
+        size = chunk_size if limit is None else min(chunk_size, limit - updated)
+        chunk = db.session.query(FaceLog.id, FaceLog.raw_data).filter(
+            FaceLog.id > last_id,
+            or_(FaceLog.raw_parsed.is_(None), FaceLog.raw_parsed == False),  # noqa: E712
+        ).order_by(FaceLog.id.asc()).limit(size).all()
+        if not chunk:
+            break
+        mappings = []
+        for log_id, raw in chunk:
+            fields = parse_face_log_fields(raw)
+            fields['id'] = log_id
+            mappings.append(fields)
+        db.session.bulk_update_mappings(FaceLog, mappings)
+        db.session.commit()
+        updated += len(chunk)
+        last_id = chunk[-1][0]
+        logger.info("Face log backfill: %d ta qator (oxirgi id=%s)", updated, last_id)
+    return updated
+
+
 @face_api_bp.route('/backfill-device-ids', methods=['POST'])
 def face_logs_backfill():
     """Eski loglardan Xodim ID ni qayta to'ldirish – faqat superadmin."""
@@ -633,6 +620,7 @@ def face_logs_clear():
     try:
         deleted = FaceLog.query.delete()
         db.session.commit()
+        dashboard_state.reset()
         return jsonify({'status': 'success', 'deleted': deleted, 'message': f'{deleted} ta yozuv o\'chirildi'}), 200
     except Exception as e:
         logger.exception("Loglarni tozalashda xato: %s", e)
@@ -695,7 +683,7 @@ def logs():
         search_q = (request.args.get('q') or request.args.get('search') or '').strip()
         order_col = getattr(FaceLog, sort_by)
         order_fn = order_col.desc() if sort_order == 'desc' else order_col.asc()
-        q = FaceLog.query.filter(
+        q = FaceLog.query.options(defer(FaceLog.raw_data)).filter(
             FaceLog.event_time >= start_dt,
             FaceLog.event_time < end_dt,
         )
@@ -711,6 +699,7 @@ def logs():
         rows = q.limit(limit * 4).all()
         rows = [r for r in rows if _is_valid_person_name((r.person_name or '').strip())]
         rows = _dedupe_face_logs(rows)[:limit]
+        _load_raw_for_unparsed(rows)
         staff_names = _staff_full_names_for_logs(rows)
         log_dicts = []
         for r in rows:
@@ -728,25 +717,19 @@ def logs():
         return jsonify({'status': 'error', 'message': 'Internal server error'}), 500
 
 
-def _is_valid_person_name(name):
-    """Haqqiqiy shaxs ismi borligini tekshiradi. Ismsiz (ID 12345, A kirish va h.k.) False."""
-    if not name or not isinstance(name, str):
-        return False
-    s = name.strip()
-    if not s or s == '—' or s == '-' or len(s) < 3:
-        return False
-    s_upper = s.upper()
-    if s_upper.startswith('ID'):
-        rest = s_upper[2:].strip()
-        if rest.isdigit():
-            return False
-    s_lower = s.lower()
-    if s_lower.endswith(' kirish') or s_lower.endswith(' chiqish'):
-        if len(s_lower) < 12:
-            return False
-    if len(s.split()) == 1 and len(s) <= 2:
-        return False
-    return True
+def _load_raw_for_unparsed(logs):
+    """
+    raw_data defer qilingan ro'yxat: ajratilgan ustunlari yo'q (raw_parsed emas, backfill gacha) loglar uchun
+    raw_data bitta so'rov bilan – har qatorda alohida lazy load bo'lmasin.
+    """
+    from sqlalchemy.orm.attributes import set_committed_value
+    ids = [log.id for log in logs if not log.raw_parsed]
+    raw = {}
+    for i in range(0, len(ids), 500):
+        raw.update(db.session.query(FaceLog.id, FaceLog.raw_data).filter(FaceLog.id.in_(ids[i:i + 500])).all())
+    for log in logs:
+        if log.id in raw:
+            set_committed_value(log, 'raw_data', raw[log.id])
 
 
 def _dedupe_face_logs(logs):
@@ -769,293 +752,42 @@ def _dedupe_face_logs(logs):
     return out
 
 
-def _parse_raw_extra(raw_data):
-    """raw_data (JSON) dan dashboard uchun qo'shimcha maydonlarni ajratib oladi."""
-    out = {'role': None, 'department': None, 'attendanceStatus': 'present', 'kpiScore': None, 'similarity': None}
-    if not raw_data or not isinstance(raw_data, str):
-        return out
-    try:
-        if 'event_log' in raw_data and '{' in raw_data:
-            json_str = _extract_event_log_from_multipart(raw_data) or raw_data
-        else:
-            json_str = raw_data.strip()
-        if not json_str.startswith('{'):
-            return out
-        data = json.loads(json_str)
-        if not isinstance(data, dict):
-            return out
-        out['role'] = (data.get('role') or data.get('userType') or '').strip() or None
-        out['department'] = (data.get('department') or data.get('group') or data.get('departmentName') or '').strip() or None
-        out['attendanceStatus'] = (data.get('attendanceStatus') or data.get('status') or 'present')
-        if isinstance(out['attendanceStatus'], str):
-            out['attendanceStatus'] = out['attendanceStatus'].strip().lower().replace(' ', '_')
-        out['kpiScore'] = data.get('kpiScore') or data.get('kpi')
-        out['similarity'] = data.get('similarity') or data.get('faceMatch')
-        return out
-    except Exception:
-        return out
-
-
-def _dashboard_card_from_log(log, tz, extra, time_str, event_time, photo_url):
-    """FaceLog dan bitta kartochka obyektini yasaydi."""
-    person_name = (log.person_name or '').strip()
-    kpi = extra.get('kpiScore')
-    if kpi is not None:
-        try:
-            kpi = min(100, max(0, int(kpi)))
-        except (TypeError, ValueError):
-            kpi = None
-    sim = extra.get('similarity')
-    if sim is not None:
-        try:
-            sim = min(100, max(0, int(sim)))
-        except (TypeError, ValueError):
-            sim = None
-    return {
-        'personName': person_name,
-        'employeeNo': (log.device_employee_id or str(log.id)).strip()[:20] if (log.device_employee_id or log.id) else '—',
-        'role': extra.get('role') or 'Employee',
-        'department': extra.get('department') or '—',
-        'photoUrl': photo_url,
-        'lastEntryTime': time_str,
-        'attendanceStatus': extra.get('attendanceStatus') or 'present',
-        'kpiScore': kpi if kpi is not None else 0,
-        'similarity': sim if sim is not None else 0,
-        'lastUpdated': int((event_time or log.created_at or datetime.utcnow()).timestamp() * 1000),
-    }
-
-
 @face_api_bp.route('/dashboard-cards', methods=['GET'])
 def dashboard_cards():
     """
     Smart Attendance Dashboard – faqat bugungi kun. Kirishlar 09:00 bo'yicha vaqtida/kech,
-    chiqishlar 17:00 dan keyin. Barcha bugungi kirish va chiqishlar qaytariladi.
+    chiqishlar 17:00 dan keyin. Javob xotiradagi inkremental holatdan (dashboard_state) olinadi;
+    ETag mos kelsa (If-None-Match) 304 qaytadi.
     """
     from flask_login import current_user
-    from datetime import timedelta, date, time as dt_time
 
     try:
         tv_mode = request.args.get('tv', '').strip() == '1'
         if not tv_mode and (not current_user.is_authenticated or not getattr(current_user, 'is_superadmin', False)):
             return jsonify({'status': 'error', 'message': 'Access denied'}), 403
 
-        tz = timedelta(hours=5)
-        now_utc = datetime.utcnow()
-        today_tashkent = (now_utc + tz).date()
-        today_str = today_tashkent.isoformat()
-        today_start_utc = datetime.combine(today_tashkent, dt_time(0, 0, 0)) - tz
-        today_end_utc = today_start_utc + timedelta(days=1)
-        today_start_tashkent = datetime.combine(today_tashkent, dt_time(0, 0, 0))
-        today_end_tashkent = today_start_tashkent + timedelta(days=1)
-        today_start_wide = today_start_tashkent - timedelta(hours=12)
-        today_end_wide = today_end_tashkent + timedelta(hours=2)
-
-        today_filter = or_(
-            and_(FaceLog.event_time.isnot(None), FaceLog.event_time >= today_start_wide, FaceLog.event_time < today_end_wide),
-            and_(FaceLog.event_time.is_(None), FaceLog.created_at >= today_start_utc, FaceLog.created_at < today_end_utc),
-        )
-        limit_val = min(int(request.args.get('limit', 300)), 500)
-        rows = FaceLog.query.filter(today_filter).order_by(
-            FaceLog.created_at.desc()
-        ).limit(limit_val).all()
-        rows_before = len(rows)
-        # Toshkent sanasiga qat’iy moslashtirish (boshqa kunlar qolmasin)
-        def _log_date_tashkent(log):
-            disp = log.display_event_time()
-            if disp:
-                return disp.date()
-            return (log.created_at + tz).date() if log.created_at else None
-        rows = [r for r in rows if _log_date_tashkent(r) == today_tashkent]
-        rows = sorted(rows, key=lambda r: (r.display_event_time() or r.created_at or now_utc), reverse=False)
-
-        LATE_THRESHOLD = '09:00:00'
-        EXIT_ON_TIME_THRESHOLD = '17:00:00'
-
-        first_kirish_by_key = {}
-        last_chiqish_by_key = {}
-
-        for log in rows:
-            person_name = (log.person_name or '').strip()
-            if not person_name or person_name in ('—', '-'):
-                person_name = (log.device_employee_id or '').strip() or ('ID %s' % log.id)
-            if not person_name:
-                continue
-            if not _is_valid_person_name(person_name):
-                continue
-            if (log.person_name or '').strip() in ('', '—', '-'):
-                continue
-            event_time = log.display_event_time() or (log.created_at + tz if log.created_at else None)
-            if not event_time:
-                continue
-            key = (log.device_employee_id or '').strip() or person_name or ''
-            if not key:
-                continue
-            time_tashkent = event_time
-            time_str = time_tashkent.strftime('%H:%M:%S')
-            time_compare = time_str
-            if len(time_compare) == 5:
-                time_compare = time_compare + ':00'
-            extra = _parse_raw_extra(log.raw_data or '')
-            photo_url = None
-            if log.picture_path:
-                photo_url = f"/face-api/picture/{log.id}" + ("?tv=1" if tv_mode else "")
-            card = _dashboard_card_from_log(log, tz, extra, time_str, event_time, photo_url)
-            if not (log.person_name or '').strip() or (log.person_name or '').strip() in ('—', '-'):
-                card['personName'] = person_name
-
-            direction = (log.direction or 'IN').strip().upper()
-            if 'CHIQISH' in (log.person_name or '').upper():
-                direction = 'OUT'
-            if direction == 'OUT':
-                if key not in last_chiqish_by_key or event_time > (last_chiqish_by_key[key][0] or event_time):
-                    last_chiqish_by_key[key] = (event_time, card)
-            else:
-                if key not in first_kirish_by_key:
-                    first_kirish_by_key[key] = (event_time, card)
-
-        kirish_on_time = []
-        kirish_late = []
-        for key, (_et, card) in first_kirish_by_key.items():
-            card['firstEntryTime'] = card.get('lastEntryTime') or '—'
-            card['lastExitTime'] = (last_chiqish_by_key[key][1].get('lastEntryTime') if key in last_chiqish_by_key else None) or '—'
-            t = (card.get('lastEntryTime') or '').strip()
-            if len(t) == 5:
-                t = t + ':00'
-            if t and t < LATE_THRESHOLD:
-                kirish_on_time.append(card)
-            else:
-                kirish_late.append(card)
-
-        chiqish_on_time = []
-        chiqish_late = []
-        for key, (_et, card) in last_chiqish_by_key.items():
-            card['lastExitTime'] = card.get('lastEntryTime') or '—'
-            card['firstEntryTime'] = (first_kirish_by_key[key][1].get('lastEntryTime') if key in first_kirish_by_key else None) or '—'
-            t = (card.get('lastEntryTime') or '').strip()
-            if len(t) == 5:
-                t = t + ':00'
-            if t and t >= EXIT_ON_TIME_THRESHOLD:
-                chiqish_on_time.append(card)
-            else:
-                chiqish_late.append(card)
-
-        # So'ngi o'tganlar birinchi: vaqt bo'yicha kamayish tartibida
-        def _entry_time_for_sort(card):
-            t = (card.get('lastEntryTime') or card.get('firstEntryTime') or '').strip()
-            if len(t) == 5:
-                t = t + ':00'
-            return t or '00:00:00'
-        kirish_on_time.sort(key=_entry_time_for_sort, reverse=True)
-        kirish_late.sort(key=_entry_time_for_sort, reverse=True)
-        chiqish_on_time.sort(key=_entry_time_for_sort, reverse=True)
-        chiqish_late.sort(key=_entry_time_for_sort, reverse=True)
-
-        # Markaz panel: so'nggi 50 ta kirish (IN) – har bir log alohida kartochka
         live_limit = min(int(request.args.get('live_limit', 50)), 100)
-        in_logs = []
-        for log in rows:
-            direction = (log.direction or 'IN').strip().upper()
-            if 'CHIQISH' in (log.person_name or '').upper():
-                direction = 'OUT'
-            if direction != 'IN':
-                continue
-            person_name = (log.person_name or '').strip()
-            if not person_name or not _is_valid_person_name(person_name) or person_name in ('—', '-'):
-                continue
-            event_time = log.display_event_time() or (log.created_at + tz if log.created_at else None)
-            if not event_time:
-                continue
-            in_logs.append((event_time, log))
-        in_logs.sort(key=lambda x: x[0], reverse=True)
-        live_entries = []
-        for event_time, log in in_logs[:live_limit]:
-            extra = _parse_raw_extra(log.raw_data or '')
-            time_str = event_time.strftime('%H:%M:%S')
-            photo_url = None
-            if log.picture_path:
-                photo_url = f"/face-api/picture/{log.id}" + ("?tv=1" if tv_mode else "")
-            card = _dashboard_card_from_log(log, tz, extra, time_str, event_time, photo_url)
-            card['firstEntryTime'] = time_str
-            pn = (log.person_name or '').strip() or (log.device_employee_id or '').strip() or ('ID %s' % log.id)
-            if pn:
-                card['personName'] = pn
-            live_entries.append(card)
-
-        # Umumiy statistika (KPI dashboard): vaqtida keldi / kechikdi / kelmagan
-        ontime_count = len(kirish_on_time)
-        late_count = len(kirish_late)
-        total_came = ontime_count + late_count
-        total_all = max(total_came, 1)
-        ontime_percent = round((ontime_count / total_all) * 100) if total_all else 0
-        late_percent = round((late_count / total_all) * 100) if total_all else 0
-        absent_count = 0
-        absent_percent = 0
-        stats = {
-            'total_came': total_came,
-            'total_all': total_came,
-            'ontime_count': ontime_count,
-            'late_count': late_count,
-            'absent_count': absent_count,
-            'ontime_percent': ontime_percent,
-            'late_percent': late_percent,
-            'absent_percent': absent_percent,
-        }
-
-        # Markaziy bo'linmalar: department bo'yicha guruhlash (kirish kartochkalaridan)
-        dept_map = {}
-        for c in kirish_on_time + kirish_late:
-            dept_name = (c.get('department') or '—').strip() or 'Bo\'linmasi yo\'q'
-            if dept_name not in dept_map:
-                dept_map[dept_name] = {'count': 0, 'kpi_sum': 0}
-            dept_map[dept_name]['count'] += 1
-            dept_map[dept_name]['kpi_sum'] += (c.get('kpiScore') or 0)
-        departments = []
-        for name, v in dept_map.items():
-            avg_kpi = round(v['kpi_sum'] / v['count']) if v['count'] else 0
-            departments.append({'name': name, 'employee_count': v['count'], 'avg_kpi': avg_kpi})
-        departments.sort(key=lambda d: d['employee_count'], reverse=True)
-
-        # Faol xodimlar: bugun kelganlar (vaqtida + kechikkan), KPI va status bilan
-        active_employees = []
-        seen_key = set()
-        for c in kirish_on_time + kirish_late:
-            key = (c.get('employeeNo') or '') + (c.get('personName') or '')
-            if key in seen_key:
-                continue
-            seen_key.add(key)
-            active_employees.append({
-                'personName': c.get('personName') or '—',
-                'employeeNo': c.get('employeeNo') or '—',
-                'department': c.get('department') or '—',
-                'photoUrl': c.get('photoUrl'),
-                'kpiScore': c.get('kpiScore') or 0,
-                'attendanceStatus': c.get('attendanceStatus') or 'present',
-                'firstEntryTime': c.get('firstEntryTime') or c.get('lastEntryTime') or '—',
-            })
-        active_employees.sort(key=lambda x: (x.get('firstEntryTime') or ''), reverse=True)
-
-        out = {
-            'status': 'success',
-            'kirish_on_time': kirish_on_time,
-            'kirish_late': kirish_late,
-            'chiqish_on_time': chiqish_on_time,
-            'chiqish_late': chiqish_late,
-            'live_entries': live_entries,
-            'date': today_tashkent.isoformat(),
-            'stats': stats,
-            'departments': departments,
-            'active_employees': active_employees,
-        }
-        if request.args.get('debug', '').strip() == '1':
+        out, etag, state = dashboard_state.snapshot(tv_mode=tv_mode, live_limit=live_limit)
+        debug = request.args.get('debug', '').strip() == '1'
+        if not debug and etag in request.if_none_match:
+            resp = current_app.response_class(status=304)
+            resp.set_etag(etag)
+            return resp
+        if debug:
+            out = dict(out)
             out['_debug'] = {
-                'today_tashkent': today_tashkent.isoformat(),
-                'now_utc': now_utc.isoformat() + 'Z',
-                'rows_fetched': rows_before,
-                'rows_today': len(rows),
-                'kirish_count': len(first_kirish_by_key),
-                'chiqish_count': len(last_chiqish_by_key),
+                'today_tashkent': state.day.isoformat(),
+                'now_utc': datetime.utcnow().isoformat() + 'Z',
+                'rows_today': state.logs_seen,
+                'last_log_id': state.last_id,
+                'state_version': state.version,
+                'kirish_count': len(state.first_in),
+                'chiqish_count': len(state.last_out),
             }
-        return jsonify(out), 200
+        resp = jsonify(out)
+        resp.set_etag(etag)
+        resp.headers['Cache-Control'] = 'no-cache'
+        return resp, 200
     except Exception as e:
         logger.exception("Dashboard cards xato: %s", e)
         return jsonify({'status': 'error', 'message': 'Internal server error'}), 500
@@ -0,0 +1,185 @@
+"""
+Live monitor va Smart Dashboard uchun SSE oqimi – har obunachiga alohida navbat (central_api.api_stream kabi).
+Yangi loglar dashboard_state ga qo'llanganda bir marta 'entry' va 'stats' voqealari tayyorlanib,
+barcha obunachilarga tarqatiladi; har TV uchun alohida qayta hisoblash bo'lmaydi.
+Voqea id si – face_logs.id, shuning uchun Last-Event-ID bilan qayta ulanish boshqa workerda ham ishlaydi.
+"""
+import json
+import logging
+import queue
+import threading
+import time
+
+from app.face_api import dashboard_state
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SUBSCRIBERS = 40
+HEARTBEAT_SEC = 15
+PUMP_INTERVAL_SEC = 1.0
+SUBSCRIBER_QUEUE_SIZE = 256  # sekin mijoz navbati to'lsa uziladi va Last-Event-ID bilan qayta ulanadi
+
+# Obunachilar: {'q': queue, 'tv': bool, 'closed': bool}
+stream_subscribers = []
+stream_lock = threading.Lock()
+
+_last_broadcast_id = 0
+_last_state = None
+_pump_started = False
+
+
+def format_event(event_type, data=None, event_id=None):
+    """SSE kadr: ixtiyoriy id qatori + data (central_api dagi {'type', 'data'} formatida)."""
+    payload = json.dumps({'type': event_type, 'data': data or {}}, ensure_ascii=False)
+    if event_id is not None:
+        return 'id: %s\ndata: %s\n\n' % (event_id, payload)
+    return 'data: %s\n\n' % payload
+
+
+def _entry_frames(events, tv):
+    frames = []
+    for ev in events:
+        card = dict(ev['card'])
+        if tv and card.get('photoUrl'):
+            card['photoUrl'] = card['photoUrl'] + '?tv=1'
+        frames.append(format_event('entry', {
+            'direction': ev['direction'], 'bucket': ev['bucket'], 'card': card,
+        }, event_id=ev['id']))
+    return frames
+
+
+def _stats_frame(state):
+    agg = state.aggregates()
+    return format_event('stats', {
+        'stats': agg['stats'], 'departments': agg['departments'], 'version': state.etag,
+    }, event_id=state.last_id)
+
+
+def _put(sub, frames):
+    """Obunachi navbatiga yozish; to'lgan bo'lsa obunachi yopiladi."""
+    try:
+        for f in frames:
+            sub['q'].put_nowait(f)
+        return True
+    except queue.Full:
+        sub['closed'] = True
+        return False
+
+
+def _broadcast_locked(frames_by_tv):
+    dead = []
+    for s in stream_subscribers:
+        if s.get('closed') or not _put(s, frames_by_tv[s['tv']]):
+            dead.append(s)
+    for d in dead:
+        if d in stream_subscribers:
+            stream_subscribers.remove(d)
+    if dead:
+        logger.info("SSE: %d ta sekin obunachi uzildi", len(dead))
+
+
+def on_state_changed(state):
+    """dashboard_state listener: hali tarqatilmagan voqealarni barcha obunachilarga yuborish."""
+    global _last_broadcast_id, _last_state
+    with stream_lock:
+        if state is not _last_state:
+            # Kun almashdi yoki loglar tozalandi – mijozlar to'liq snapshot ni qayta oladi
+            first = _last_state is None
+            _last_state = state
+            _last_broadcast_id = state.last_id
+            if not first and stream_subscribers:
+                frame = format_event('reset', {'date': state.day.isoformat()}, event_id=state.last_id)
+                _broadcast_locked({False: [frame], True: [frame]})
+            return
+        new_events = [ev for ev in list(state.events) if ev['id'] > _last_broadcast_id]
+        if not new_events:
+            return
+        _last_broadcast_id = max(ev['id'] for ev in new_events)
+        if not stream_subscribers:
+            return
+        stats = _stats_frame(state)
+        _broadcast_locked({
+            False: _entry_frames(new_events, False) + [stats],
+            True: _entry_frames(new_events, True) + [stats],
+        })
+
+
+def _ensure_pump(app):
+    """Obunachilar bor paytda boshqa workerlar yozgan loglarni ham olish uchun fon thread (bir marta)."""
+    global _pump_started
+    with stream_lock:
+        if _pump_started:
+            return
+        _pump_started = True
+
+    def _pump():
+        while True:
+            time.sleep(PUMP_INTERVAL_SEC)
+            if not stream_subscribers:
+                continue
+            try:
+                with app.app_context():
+                    dashboard_state.refresh()
+            except Exception as e:
+                logger.warning("SSE pump xatosi: %s", e)
+
+    threading.Thread(target=_pump, daemon=True, name='face-stream-pump').start()
+
+
+def subscribe(app, tv, last_event_id=None):
+    """
+    Yangi obunachi. Qaytaradi: (sub, boshlang'ich kadrlar) yoki limit to'lgan bo'lsa (None, None).
+    last_event_id berilsa va bufer uni qamrasa – o'tkazib yuborilgan voqealar qayta yuboriladi,
+    aks holda 'reset' (mijoz snapshot ni qayta oladi).
+    """
+    max_subs = int(app.config.get('FACE_STREAM_MAX_SUBSCRIBERS') or DEFAULT_MAX_SUBSCRIBERS)
+    _ensure_pump(app)
+    state = dashboard_state.refresh()
+    dashboard_state.add_listener(on_state_changed)
+    on_state_changed(state)
+    with stream_lock:
+        stream_subscribers[:] = [s for s in stream_subscribers if not s.get('closed')]
+        if len(stream_subscribers) >= max_subs:
+            return None, None
+        sub = {'q': queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE), 'tv': bool(tv), 'closed': False}
+        stream_subscribers.append(sub)
+        frames = [format_event('connected', {'date': state.day.isoformat(), 'version': state.etag})]
+        if last_event_id is not None and last_event_id < _last_broadcast_id:
+            events = list(state.events)
+            covered = len(events) < dashboard_state.EVENT_BUFFER_SIZE or (events and events[0]['id'] <= last_event_id)
+            missed = [ev for ev in events if last_event_id < ev['id'] <= _last_broadcast_id]
+            if covered and state is _last_state:
+                frames += _entry_frames(missed, bool(tv)) + [_stats_frame(state)]
+            else:
+                frames.append(format_event('reset', {'date': state.day.isoformat()}, event_id=_last_broadcast_id))
+    return sub, frames
+
+
+def unsubscribe(sub):
+    with stream_lock:
+        sub['closed'] = True
+        if sub in stream_subscribers:
+            stream_subscribers.remove(sub)
+
+
+def stream_frames(sub, initial):
+    """SSE generator: boshlang'ich kadrlar, keyin navbatdagi voqealar; bo'sh paytda heartbeat."""
+    try:
+        for f in initial:
+            yield f
+        while not sub.get('closed'):
+            try:
+                yield sub['q'].get(timeout=HEARTBEAT_SEC)
+            except queue.Empty:
+                yield format_event('ping')
+    finally:
+        unsubscribe(sub)
+
+
+def get_stream_stats():
+    with stream_lock:
+        return {
+            'subscribers': len(stream_subscribers),
+            'tv_subscribers': sum(1 for s in stream_subscribers if s['tv']),
+            'last_event_id': _last_broadcast_id,
+        }
@@ -523,7 +523,10 @@ class DirectionCurriculum(db.Model):
     subject = db.relationship('Subject', backref='curriculum_items')
     
     # Unique constraint: bir yo'nalishda bir semestrda bir fan bir marta bo'lishi kerak (yil va ta'lim shakli bo'yicha)
-    __table_args__ = (db.UniqueConstraint('direction_id', 'subject_id', 'semester', 'enrollment_year', 'education_type', name='uq_direction_subject_semester_year_type'),)
+    __table_args__ = (
+        db.UniqueConstraint('direction_id', 'subject_id', 'semester', 'enrollment_year', 'education_type', name='uq_direction_subject_semester_year_type'),
+        db.Index('ix_direction_curriculum_dir_sem_year_type', 'direction_id', 'semester', 'enrollment_year', 'education_type'),
+    )
 
     @staticmethod
     def filter_by_group_context(query, group):
@@ -650,6 +653,8 @@ class TeacherSubject(db.Model):
     group = db.relationship('Group', backref='subject_assignments')
     assigner = db.relationship('User', foreign_keys=[assigned_by])
 
+    __table_args__ = (db.Index('ix_teacher_subject_subject_group_type', 'subject_id', 'group_id', 'lesson_type'),)
+
 
 # ==================== FOYDALANUVCHI ROLI ====================
 class UserRole(db.Model):
@@ -679,13 +684,17 @@ class SiteSetting(db.Model):
 
     @staticmethod
     def get(key, default=''):
-        """Kalit bo'yicha qiymat olish"""
-        row = SiteSetting.query.filter_by(key=key).first()
-        return (row.value or '').strip() if row else default
+        """Kalit bo'yicha qiymat olish (jarayon keshidan – settings_cache)"""
+        from app.services.settings_cache import get_settings
+        settings = get_settings()
+        if key not in settings:
+            return default
+        return (settings[key] or '').strip()
 
     @staticmethod
     def set(key, value):
         """Kalit qiymatini o'rnatish"""
+        from app.services.settings_cache import bump_version
         row = SiteSetting.query.filter_by(key=key).first()
         if row:
             row.value = value
@@ -693,6 +702,7 @@ class SiteSetting(db.Model):
             row = SiteSetting(key=key, value=value)
             db.session.add(row)
         db.session.commit()
+        bump_version()
 
 
 # ==================== FLASH XABAR ====================
@@ -771,6 +781,7 @@ class User(UserMixin, db.Model):
 
     # Superadminlar bo'limi – bir nechta superadmin bo'lishi mumkin (config dagi login ham doim superadmin)
     superadmin_flag = db.Column(db.Boolean, default=False)
+    unread_message_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # Message hodisalari yangilaydi
     
     # Relationships
     submissions = db.relationship('Submission', backref='student', lazy='dynamic', foreign_keys='Submission.student_id')
@@ -779,6 +790,8 @@ class User(UserMixin, db.Model):
     managed_department = db.relationship('Department', foreign_keys=[managed_department_id], uselist=False)
     # Bir nechta rollar
     roles_list = db.relationship('UserRole', backref='user', lazy='dynamic', cascade='all, delete-orphan', foreign_keys='UserRole.user_id')
+
+    __table_args__ = (db.Index('ix_user_role_group', 'role', 'group_id'),)
     
     def set_password(self, password):
         self.password_hash = generate_password_hash(password)
@@ -787,12 +800,21 @@ class User(UserMixin, db.Model):
         return check_password_hash(self.password_hash, password)
     
     def get_roles(self):
-        """Foydalanuvchining barcha rollarini olish"""
-        if self.roles_list.count() > 0:
-            return [r.role for r in self.roles_list]
+        """Foydalanuvchining barcha rollarini olish (obyekt expire bo'lguncha – odatda so'rov davomida – eslab qolinadi)"""
+        roles = self.__dict__.get('_roles_memo')
+        if roles is None:
+            roles = []
+            if self.id is not None:
+                roles = [r for (r,) in db.session.query(UserRole.role).filter(UserRole.user_id == self.id).all()]
+                self.__dict__['_roles_memo'] = roles
+        if roles:
+            return list(roles)
         # Agar roles_list bo'sh bo'lsa, eski role maydonini qaytaramiz
         return [self.role] if self.role else []
 
+    def _clear_roles_memo(self):
+        self.__dict__.pop('_roles_memo', None)
+
     def get_sorted_roles(self):
         """Rollarni tartiblangan holda qaytarish: admin, dean, edu_dept, department_head, teacher, accounting, student"""
         role_order = ['admin', 'dean', 'edu_dept', 'department_head', 'teacher', 'accounting', 'student']
@@ -851,11 +873,13 @@ class User(UserMixin, db.Model):
             user_role = UserRole(user_id=self.id, role=role_name)
             db.session.add(user_role)
             db.session.commit()
+            self._clear_roles_memo()
     
     def remove_role(self, role_name):
         """Foydalanuvchidan rol olib tashlash"""
         UserRole.query.filter_by(user_id=self.id, role=role_name).delete()
         db.session.commit()
+        self._clear_roles_memo()
     
     def set_roles(self, role_list):
         """Foydalanuvchiga bir nechta rol biriktirish (eski rollarni o'chirib, yangilarini qo'shish)"""
@@ -866,6 +890,7 @@ class User(UserMixin, db.Model):
             user_role = UserRole(user_id=self.id, role=role)
             db.session.add(user_role)
         db.session.commit()
+        self._clear_roles_memo()
     
     def get_role_display(self):
         """Asosiy rol nomini olish (superadmin uchun Superadmin). Rol belgilanmagan xodimlar uchun UserRole dagi 'xodim' asosida 'Xodim' ko'rsatiladi."""
@@ -925,50 +950,17 @@ class User(UserMixin, db.Model):
         """Ruxsatni tekshirish. for_role berilsa, faqat shu rol uchun tekshiradi (tanlangan rol bo'yicha UI filtrlash)."""
         if self.is_superadmin:
             return True
-        defaults = {
-            'admin': ['view_admin_panel', 'view_users', 'create_user', 'edit_user', 'delete_user', 'toggle_user', 'reset_user_password',
-                      'view_staff', 'create_staff', 'edit_staff', 'delete_staff', 'view_students', 'create_student', 'edit_student', 'delete_student',
-                      'view_faculties', 'create_faculty', 'edit_faculty', 'delete_faculty', 'view_directions', 'create_direction', 'edit_direction', 'delete_direction',
-                      'manage_groups', 'create_group', 'edit_group', 'delete_group', 'view_subjects', 'create_subject', 'edit_subject', 'delete_subject',
-                      'view_curriculum', 'edit_curriculum', 'view_schedule', 'create_schedule', 'edit_schedule', 'delete_schedule',
-                      'view_reports', 'view_grade_scale', 'manage_grade_scale', 'view_teachers', 'assign_teachers',
-                      'export_subjects', 'import_subjects', 'import_schedule', 'import_students', 'import_staff',
-                      'view_announcements', 'send_message', 'view_messages', 'view_departments', 'create_department', 'edit_department', 'delete_department'],
-            'dean': ['view_dean_panel', 'view_subjects', 'view_students', 'view_teachers', 'view_reports',
-                     'create_announcement', 'manage_groups', 'assign_teachers',
-                     'dean_manage_students', 'dean_manage_directions', 'dean_manage_groups',
-                     'dean_manage_curriculum', 'dean_manage_teachers', 'dean_manage_schedule',
-                     'view_announcements', 'send_message', 'view_messages'],
-            'edu_dept': ['view_directions', 'view_curriculum', 'edit_curriculum',
-                         'view_subjects', 'create_subject'],
-            'department_head': ['view_admin_panel', 'view_subjects',
-                               'create_subject', 'view_teachers', 'assign_teachers'],
-            'teacher': ['view_subjects', 'view_students', 'create_lesson', 'edit_lesson', 'delete_lesson',
-                        'create_assignment', 'edit_assignment', 'delete_assignment',
-                        'grade_students', 'view_submissions', 'create_announcement',
-                        'view_announcements', 'send_message', 'view_messages'],
-            'student': ['view_subjects', 'view_lessons', 'submit_assignment', 'view_grades', 'view_announcements', 'send_message', 'view_messages'],
-            'accounting': ['view_accounting', 'view_students', 'view_reports', 'manage_payments', 'manage_contracts', 'view_contract_amounts', 'import_payments',
-                          'view_announcements', 'send_message', 'view_messages'],
-            'xodim': ['view_subjects', 'view_students', 'create_lesson', 'edit_lesson', 'delete_lesson',
-                      'create_assignment', 'edit_assignment', 'delete_assignment',
-                      'grade_students', 'view_submissions', 'create_announcement',
-                      'view_announcements', 'send_message', 'view_messages'],
-        }
         if for_role:
             if for_role not in self.get_roles():
                 return False
             roles_to_check = [for_role]
         else:
             roles_to_check = self.get_roles()
+        # Rol uchun DB da yozuv bo'lsa – faqat DB dagi ruxsatlar (superadmin sozlagan), aks holda default;
+        # matritsa xotirada (permission_cache), shuning uchun bu yerda SQL so'rov yo'q
+        from app.services.permission_cache import get_role_permissions
         for role in roles_to_check:
-            # Rol uchun DB da yozuv bo'lsa – faqat DB dagi ruxsatlar (superadmin sozlagan); bo'sh ro'yxat ham mumkin
-            perms_list = RolePermission.query.filter_by(role=role).all()
-            if perms_list:
-                user_perms = [p.permission for p in perms_list if getattr(p, 'permission', '') and p.permission != '__configured__']
-            else:
-                user_perms = defaults.get(role, [])
-            if permission in user_perms:
+            if permission in get_role_permissions(role):
                 return True
         return False
     
@@ -987,6 +979,13 @@ class User(UserMixin, db.Model):
         return []
 
 
+
+@db.event.listens_for(User, 'expire')
+def _user_expired(target, attrs):
+    # commit/rollback/refresh dan keyin rollar DB dan qayta o'qiladi
+    target._clear_roles_memo()
+
+
 # ==================== DARS ====================
 class Lesson(db.Model):
     """Dars modeli"""
@@ -1012,6 +1011,8 @@ class Lesson(db.Model):
     # Video ko'rish yozuvlari
     views = db.relationship('LessonView', backref='lesson', lazy='dynamic', cascade='all, delete-orphan')
 
+    __table_args__ = (db.Index('ix_lesson_subject_direction_type_order', 'subject_id', 'direction_id', 'lesson_type', 'order'),)
+
 
 # ==================== DARS KO'RISH YOZUVI ====================
 class LessonView(db.Model):
@@ -1027,6 +1028,8 @@ class LessonView(db.Model):
     
     student = db.relationship('User', backref='lesson_views')
 
+    __table_args__ = (db.Index('ix_lesson_view_lesson_student', 'lesson_id', 'student_id'),)
+
 
 # ==================== TOPSHIRIQ ====================
 class Assignment(db.Model):
@@ -1084,6 +1087,8 @@ class Submission(db.Model):
     is_active = db.Column(db.Boolean, default=True)  # Faol topshiriq (oxirgi yuborilgan)
     
     grader = db.relationship('User', foreign_keys=[graded_by], backref='graded_submissions')
+
+    __table_args__ = (db.Index('ix_submission_student_assignment', 'student_id', 'assignment_id'),)
     
     def can_resubmit(self, max_resubmissions=3):
         """Qayta topshirish mumkinligini tekshirish"""
@@ -1266,6 +1271,90 @@ class Message(db.Model):
     receiver = db.relationship('User', foreign_keys=[receiver_id], backref='received_messages')
     reply_to = db.relationship('Message', remote_side=[id], foreign_keys=[reply_to_id])
 
+    __table_args__ = (
+        db.Index('ix_message_receiver_read', 'receiver_id', 'is_read'),
+        db.Index('ix_message_sender_receiver_created', 'sender_id', 'receiver_id', 'created_at'),
+    )
+
+    @staticmethod
+    def recount_unread(user_ids):
+        """User.unread_message_count ni (receiver_id, is_read) indeksi bo'yicha qayta sanash (commit chaqiruvchida)."""
+        from sqlalchemy import select, update, func
+        user_ids = [uid for uid in set(user_ids or []) if uid]
+        if not user_ids:
+            return
+        unread = (select(func.count(Message.id))
+                  .where(Message.receiver_id == User.id, Message.is_read == False)
+                  .scalar_subquery())
+        db.session.execute(
+            update(User).where(User.id.in_(user_ids)).values(unread_message_count=unread),
+            execution_options={'synchronize_session': False},
+        )
+
+    @staticmethod
+    def mark_read(sender_id, receiver_id):
+        """sender -> receiver xabarlarini o'qilgan deb belgilash va hisoblagichni yangilash."""
+        updated = Message.query.filter_by(sender_id=sender_id, receiver_id=receiver_id, is_read=False).update({'is_read': True})
+        if updated:
+            Message.recount_unread([receiver_id])
+        return updated
+
+    @staticmethod
+    def delete_for_user(user_id):
+        """Foydalanuvchi yuborgan/olgan barcha xabarlarni o'chirish (qabul qiluvchilar hisoblagichi bilan)."""
+        receivers = [r for (r,) in db.session.query(Message.receiver_id).filter(
+            Message.sender_id == user_id, Message.is_read == False).distinct().all()]
+        Message.query.filter((Message.sender_id == user_id) | (Message.receiver_id == user_id)).delete(synchronize_session=False)
+        Message.recount_unread([r for r in receivers if r != user_id])
+
+
+def _bump_unread(connection, receiver_id, delta):
+    from sqlalchemy import func
+    users = User.__table__
+    stmt = users.update().where(users.c.id == receiver_id)
+    if delta < 0:
+        stmt = stmt.where(users.c.unread_message_count > 0)
+    connection.execute(stmt.values(unread_message_count=func.coalesce(users.c.unread_message_count, 0) + delta))
+
+
+@db.event.listens_for(Message, 'after_insert')
+def _message_inserted(mapper, connection, target):
+    if not target.is_read:
+        _bump_unread(connection, target.receiver_id, 1)
+
+
+@db.event.listens_for(Message, 'after_delete')
+def _message_deleted(mapper, connection, target):
+    if not target.is_read:
+        _bump_unread(connection, target.receiver_id, -1)
+
+
+@db.event.listens_for(Message, 'after_update')
+def _message_updated(mapper, connection, target):
+    from sqlalchemy import inspect
+    hist = inspect(target).attrs.is_read.history
+    if hist.has_changes() and hist.deleted:
+        was_unread = not hist.deleted[0]
+        if was_unread != (not target.is_read):
+            _bump_unread(connection, target.receiver_id, -1 if was_unread else 1)
+
+
+# ==================== TARJIMA XOTIRASI ====================
+class TranslationMemory(db.Model):
+    """Mashina tarjimasi keshi – matn xeshi + til juftligi bo'yicha (translation_memory servisi yozadi)."""
+    __tablename__ = 'translation_memory'
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    source_hash = db.Column(db.String(64), nullable=False)
+    source_lang = db.Column(db.String(10), nullable=False)  # 'auto' ham bo'lishi mumkin
+    target_lang = db.Column(db.String(10), nullable=False)
+    source_text = db.Column(db.Text, nullable=False)
+    translated_text = db.Column(db.Text, nullable=False)
+    backend = db.Column(db.String(30))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (db.UniqueConstraint('source_hash', 'source_lang', 'target_lang', name='uq_translation_memory_key'),)
+
 
 # ==================== PAROLNI TIKLASH TOKENI ====================
 class PasswordResetToken(db.Model):
@@ -1296,6 +1385,8 @@ class StudentPayment(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     student = db.relationship('User', backref='payments')
+
+    __table_args__ = (db.Index('ix_student_payment_student', 'student_id'),)
     
     def get_remaining_amount(self):
         """Qolgan to'lov summasi"""
@@ -1422,121 +1513,67 @@ class FaceLog(db.Model):
     direction = db.Column(db.String(10), nullable=True, default='IN', index=True)  # IN / OUT
     device_ip = db.Column(db.String(50), nullable=True, index=True)
     raw_data = db.Column(db.Text, nullable=True)
+    # raw_data ni yuklamasdan "raw bormi" (ro'yxatlarda raw_data defer qilinadi)
+    has_raw = db.column_property(db.and_(raw_data.isnot(None), raw_data != ''))
     picture_path = db.Column(db.String(255), nullable=True)
+    dedupe_key = db.Column(db.String(64), nullable=True, unique=True, index=True)  # qurilma + vaqt + xodim ID (spool exactly-once)
+    # raw_data dan ingestion paytida bir marta ajratilgan maydonlar (o'qishda raw parse qilinmaydi)
+    raw_parsed = db.Column(db.Boolean, nullable=True, default=False, index=True)
+    device_time = db.Column(db.DateTime, nullable=True, index=True)        # raw dagi dateTime (qurilma vaqti)
+    device_local_ip = db.Column(db.String(50), nullable=True, index=True)  # raw dagi ipAddress
+    device_name = db.Column(db.String(150), nullable=True, index=True)
+    role = db.Column(db.String(100), nullable=True, index=True)
+    department = db.Column(db.String(150), nullable=True, index=True)
+    similarity = db.Column(db.Integer, nullable=True)
+    kpi_score = db.Column(db.Integer, nullable=True)
+    attendance_status = db.Column(db.String(30), nullable=True, index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
+    # Kunlik davomat: kun oralig'i bo'yicha (xodim, yo'nalish) guruhlash – jadvalga qaytmasdan (covering)
+    __table_args__ = (
+        db.Index('ix_face_logs_event_emp_dir', 'event_time', 'device_employee_id', 'direction'),
+    )
+
     def _event_time_from_raw(self):
         """Raw dan to'g'ridan to'g'ri dateTime ni o'qiydi — qurilma yuborgan vaqt ko'rsatiladi (JSON yoki multipart)."""
         if not self.raw_data:
             return None
-        import re
+        from app.utils.face_log_parser import parse_device_time
         raw = self.raw_data if isinstance(self.raw_data, str) else str(self.raw_data)
-        # Multipart yoki JSON ichida "dateTime":"2026-02-25T09:04:14+05:00" qidirish
-        m = re.search(r'"dateTime"\s*:\s*"([^"]+)"', raw) or re.search(r'"date_time"\s*:\s*"([^"]+)"', raw)
-        if m:
-            s = m.group(1).strip()
-            if len(s) >= 16:
-                part = s.split('+')[0].split('Z')[0].strip()[:19]
-                try:
-                    if 'T' in part:
-                        return datetime.strptime(part, '%Y-%m-%dT%H:%M:%S')
-                    if ' ' in part:
-                        return datetime.strptime(part, '%Y-%m-%d %H:%M:%S')
-                except ValueError:
-                    pass
-        try:
-            import json
-            data = json.loads(raw)
-            if isinstance(data, dict):
-                for key in ('dateTime', 'date_time', 'eventTime', 'event_time', 'EventTime', 'DateTime'):
-                    val = data.get(key)
-                    if not val:
-                        continue
-                    s = str(val).strip()
-                    if len(s) < 16:
-                        continue
-                    part = s.split('+')[0].split('Z')[0].strip()[:19]
-                    if 'T' in part:
-                        return datetime.strptime(part, '%Y-%m-%dT%H:%M:%S')
-                    if ' ' in part:
-                        return datetime.strptime(part, '%Y-%m-%d %H:%M:%S')
-        except (json.JSONDecodeError, ValueError, TypeError):
-            pass
-        return None
+        return parse_device_time(raw)
 
     def display_event_time(self):
-        """Ko'rsatish uchun: avval raw dagi dateTime, yo'q bo'lsa DB dagi event_time."""
+        """Ko'rsatish uchun: qurilma vaqti (ingestion da ajratilgan), yo'q bo'lsa DB dagi event_time."""
+        if self.raw_parsed:
+            return self.device_time or self.event_time
         from_raw = self._event_time_from_raw()
         if from_raw is not None:
             return from_raw
         return self.event_time
 
     def get_device_local_ip(self):
-        """Raw_data (JSON) dan qurilmaning lokal IP si (ipAddress) ni ajratib oladi. Tashqi IP emas, raw ichidagi ipAddress."""
-        import json
-        import re
-        raw = self.raw_data
-        if not raw or not isinstance(raw, str):
+        """Qurilmaning lokal IP si (ipAddress). Tashqi IP emas, raw ichidagi ipAddress."""
+        if self.raw_parsed:
+            return self.device_local_ip
+        if not self.raw_data or not isinstance(self.raw_data, str):
             return None
-        raw = raw.strip()
-        # Multipart bo'lsa event_log ichidagi JSON ni ajratib olish
-        if 'event_log' in raw and '{' in raw:
-            idx = raw.find('name="event_log"') if 'name="event_log"' in raw else raw.find("name='event_log'")
-            if idx >= 0:
-                rest = raw[idx:]
-                start = rest.find('{')
-                if start >= 0:
-                    depth = 0
-                    for i, c in enumerate(rest[start:], start):
-                        if c == '{':
-                            depth += 1
-                        elif c == '}':
-                            depth -= 1
-                            if depth == 0:
-                                raw = rest[start:start + i + 1]
-                                break
-        # To'liq JSON parse
-        try:
-            if raw.startswith('{'):
-                data = json.loads(raw)
-                if isinstance(data, dict):
-                    v = (data.get('ipAddress') or data.get('ip_address') or '').strip()
-                    if v:
-                        return v
-        except Exception:
-            pass
-        # Regex orqali "ipAddress": "10.10.11.183" qidirish (multipart yoki boshqa format)
-        m = re.search(r'"ipAddress"\s*:\s*"([^"]+)"', raw)
-        if m:
-            return m.group(1).strip() or None
-        m = re.search(r'"ip_address"\s*:\s*"([^"]+)"', raw)
-        if m:
-            return m.group(1).strip() or None
-        return None
+        from app.utils.face_log_parser import parse_face_log_fields
+        return parse_face_log_fields(self.raw_data)['device_local_ip']
 
     def get_device_name(self):
-        """Raw_data (JSON) dan qurilma nomini (deviceName) ajratib oladi."""
-        import json
-        import re
-        raw = self.raw_data
-        if not raw or not isinstance(raw, str):
+        """Qurilma nomi (deviceName)."""
+        if self.raw_parsed:
+            return self.device_name
+        if not self.raw_data or not isinstance(self.raw_data, str):
             return None
-        try:
-            if raw.strip().startswith('{'):
-                data = json.loads(raw.strip())
-                if isinstance(data, dict):
-                    v = (data.get('deviceName') or data.get('device_name') or '').strip()
-                    if v:
-                        return v
-        except Exception:
-            pass
-        m = re.search(r'"deviceName"\s*:\s*"([^"]+)"', raw)
-        if m:
-            return m.group(1).strip() or None
-        m = re.search(r'"device_name"\s*:\s*"([^"]+)"', raw)
-        if m:
-            return m.group(1).strip() or None
-        return None
+        from app.utils.face_log_parser import parse_face_log_fields
+        return parse_face_log_fields(self.raw_data)['device_name']
+
+    def apply_parsed_fields(self, fields=None):
+        """raw_data dan ajratilgan ustunlarni to'ldirish (ingestion yoki backfill)."""
+        from app.utils.face_log_parser import parse_face_log_fields
+        for k, v in (fields or parse_face_log_fields(self.raw_data)).items():
+            setattr(self, k, v)
 
     def to_dict(self):
         from datetime import timedelta
@@ -1579,7 +1616,7 @@ class FaceLog(db.Model):
             'device_local_ip': self.get_device_local_ip(),
             'device_name': self.get_device_name(),
             'picture_path': self.picture_path,
-            'has_raw': bool(self.raw_data),
+            'has_raw': bool(self.has_raw),
             'created_at': to_tashkent(self.created_at),
             'direction': self.direction or 'IN',
         }
@@ -1615,6 +1652,20 @@ class StaffAttendanceDaily(db.Model):
     __table_args__ = (db.UniqueConstraint('staff_id', 'date', name='uq_staff_attendance_staff_date'),)
 
 
+class StaffKpiMonthly(db.Model):
+    """Xodim KPI sining oylik yig'indisi – StaffAttendanceDaily dan (attendance_service yangilaydi)."""
+    __tablename__ = 'staff_kpi_monthly'
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    staff_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
+    month = db.Column(db.Date, nullable=False, index=True)  # oyning 1-kuni
+    total_kpi = db.Column(db.Integer, nullable=False, default=0)
+    days_count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (db.UniqueConstraint('staff_id', 'month', name='uq_staff_kpi_monthly_staff_month'),)
+
+
 class StudentAttendanceDaily(db.Model):
     """Talabalar uchun kunlik davomat – kamida 1 ta IN bo‘lsa Present."""
     __tablename__ = 'student_attendance_daily'
@@ -1,11 +1,12 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, send_file, Response, session, current_app
 from flask_login import login_required, current_user
-from app.models import User, Faculty, Group, Subject, TeacherSubject, TeacherDepartment, Assignment, Direction, GradeScale, Schedule, UserRole, RolePermission, StudentPayment, DirectionCurriculum, Message, Submission, Lesson, LessonView, Announcement, PasswordResetToken, SiteSetting, FlashMessage, Department, DepartmentHead, UserFaculty, SubjectDepartment, FaceLog, StaffAttendanceDaily, StudentAttendanceDaily, Test
+from app.models import User, Faculty, Group, Subject, TeacherSubject, TeacherDepartment, Assignment, Direction, GradeScale, Schedule, UserRole, RolePermission, StudentPayment, DirectionCurriculum, Message, Submission, Lesson, LessonView, Announcement, PasswordResetToken, SiteSetting, FlashMessage, Department, DepartmentHead, UserFaculty, SubjectDepartment, FaceLog, StaffAttendanceDaily, StudentAttendanceDaily, StaffKpiMonthly, Test
 from app import db
 from functools import wraps
 from datetime import datetime, date, timedelta, time as dt_time
 from pathlib import Path
 from sqlalchemy import func, or_, exists, asc, desc
+from sqlalchemy.orm import defer
 
 from app.utils.excel_export import create_all_users_excel, create_subjects_excel, create_departments_excel
 from app.utils.excel_import import (
@@ -19,6 +20,8 @@ from app.utils.excel_import import (
 )
 from werkzeug.security import generate_password_hash
 from app.utils.translations import t
+from app.services.settings_cache import invalidate_flash_ticker
+from app.services.permission_cache import invalidate as invalidate_permissions
 
 bp = Blueprint('admin', __name__, url_prefix='/admin')
 
@@ -255,6 +258,7 @@ def role_settings():
             for role, perm in DEFAULT_ROLE_PERMISSIONS:
                 db.session.add(RolePermission(role=role, permission=perm))
             db.session.commit()
+            invalidate_permissions()
             flash(t('role_settings_reset_to_default'), 'success')
             return redirect(url_for('admin.role_settings'))
         for role in ROLE_ORDER:
@@ -266,6 +270,7 @@ def role_settings():
             if not checked:
                 db.session.add(RolePermission(role=role, permission='__configured__'))
         db.session.commit()
+        invalidate_permissions()
         flash(t('role_permissions_saved'), 'success')
         return redirect(url_for('admin.role_settings'))
     perms_by_role = {}
@@ -347,6 +352,7 @@ def update_flash_message(fm_id=None):
         fm.date_to = None
     fm.sort_order = fm.sort_order or 0
     db.session.commit()
+    invalidate_flash_ticker()
     flash(t('flash_xabar_saved'), 'success')
     return redirect(url_for('admin.reklamalar'))
 
@@ -359,6 +365,7 @@ def toggle_flash_message(fm_id):
     fm = FlashMessage.query.get_or_404(fm_id)
     fm.enabled = not fm.enabled
     db.session.commit()
+    invalidate_flash_ticker()
     flash(t('flash_xabar_saved'), 'success')
     return redirect(url_for('admin.reklamalar'))
 
@@ -371,6 +378,7 @@ def delete_flash_message(fm_id):
     fm = FlashMessage.query.get_or_404(fm_id)
     db.session.delete(fm)
     db.session.commit()
+    invalidate_flash_ticker()
     flash(t('flash_xabar_deleted'), 'success')
     return redirect(url_for('admin.reklamalar'))
 
@@ -540,6 +548,15 @@ def update_check():
     return jsonify({'ok': True, 'current_version': current, 'latest_version': latest, 'update_available': update_available})
 
 
+@bp.route('/update/central-status')
+@login_required
+@superadmin_required
+def update_central_status():
+    """Institut: markaz holati keshi va yangilash hisoblagichlari (JSON)."""
+    from app.services.central_client import is_central_enabled, get_refresh_stats
+    return jsonify({'enabled': is_central_enabled(), 'stats': get_refresh_stats()})
+
+
 @bp.route('/update/run', methods=['POST'])
 @login_required
 @superadmin_required
@@ -943,7 +960,7 @@ def delete_superadmin(id):
         flash(t('cannot_delete_last_superadmin'), 'error')
         return redirect(url_for('admin.superadmins'))
     # Bog'liq jadvallarni tozalash (delete_user bilan bir xil)
-    Message.query.filter((Message.sender_id == user.id) | (Message.receiver_id == user.id)).delete(synchronize_session=False)
+    Message.delete_for_user(user.id)
     Submission.query.filter_by(student_id=user.id).delete(synchronize_session=False)
     LessonView.query.filter_by(student_id=user.id).delete(synchronize_session=False)
     Announcement.query.filter_by(author_id=user.id).delete(synchronize_session=False)
@@ -956,6 +973,7 @@ def delete_superadmin(id):
     Schedule.query.filter_by(teacher_id=user.id).update({Schedule.teacher_id: None}, synchronize_session=False)
     StudentPayment.query.filter_by(student_id=user.id).delete(synchronize_session=False)
     StaffAttendanceDaily.query.filter_by(staff_id=user.id).delete(synchronize_session=False)
+    StaffKpiMonthly.query.filter_by(staff_id=user.id).delete(synchronize_session=False)
     StudentAttendanceDaily.query.filter_by(student_id=user.id).delete(synchronize_session=False)
     Lesson.query.filter_by(created_by=user.id).update({Lesson.created_by: None}, synchronize_session=False)
     Assignment.query.filter_by(created_by=user.id).update({Assignment.created_by: None}, synchronize_session=False)
@@ -1026,8 +1044,8 @@ def face_logs():
     logs_list = []
     pagination = None
     try:
-        from app.face_api.routes import _is_valid_person_name, _dedupe_face_logs, _staff_full_names_for_logs
-        q = FaceLog.query.filter(
+        from app.face_api.routes import _is_valid_person_name, _dedupe_face_logs, _staff_full_names_for_logs, _load_raw_for_unparsed
+        q = FaceLog.query.options(defer(FaceLog.raw_data)).filter(
             FaceLog.event_time >= start_dt,
             FaceLog.event_time < end_dt,
         )
@@ -1047,6 +1065,7 @@ def face_logs():
         start_idx = (page - 1) * per_page
         end_idx = start_idx + per_page
         logs_list = full_list[start_idx:end_idx]
+        _load_raw_for_unparsed(logs_list)
         staff_names = _staff_full_names_for_logs(logs_list)
         for log in logs_list:
             fid = (log.device_employee_id or '').strip()
@@ -1055,8 +1074,8 @@ def face_logs():
     except Exception as e:
         try:
             db.create_all()
-            from app.face_api.routes import _is_valid_person_name, _dedupe_face_logs, _staff_full_names_for_logs
-            q = FaceLog.query.filter(
+            from app.face_api.routes import _is_valid_person_name, _dedupe_face_logs, _staff_full_names_for_logs, _load_raw_for_unparsed
+            q = FaceLog.query.options(defer(FaceLog.raw_data)).filter(
                 FaceLog.event_time >= start_dt,
                 FaceLog.event_time < end_dt,
             )
@@ -1076,6 +1095,7 @@ def face_logs():
             start_idx = (page - 1) * per_page
             end_idx = start_idx + per_page
             logs_list = full_list[start_idx:end_idx]
+            _load_raw_for_unparsed(logs_list)
             staff_names = _staff_full_names_for_logs(logs_list)
             for log in logs_list:
                 fid = (log.device_employee_id or '').strip()
@@ -1404,9 +1424,7 @@ def delete_user(id):
         flash(t('cannot_delete_yourself'), 'error')
     else:
         # Foydalanuvchi xabarlarini o'chirish (sender yoki receiver bo'lgan)
-        Message.query.filter(
-            (Message.sender_id == user.id) | (Message.receiver_id == user.id)
-        ).delete(synchronize_session=False)
+        Message.delete_for_user(user.id)
         # Foydalanuvchi topshiriq yuborishlarini o'chirish
         Submission.query.filter_by(student_id=user.id).delete(synchronize_session=False)
         # Foydalanuvchi dars ko'rish yozuvlarini o'chirish (lesson_view.student_id NOT NULL)
@@ -1431,6 +1449,7 @@ def delete_user(id):
         StudentPayment.query.filter_by(student_id=user.id).delete(synchronize_session=False)
         # Davomat (StaffAttendanceDaily, StudentAttendanceDaily)
         StaffAttendanceDaily.query.filter_by(staff_id=user.id).delete(synchronize_session=False)
+        StaffKpiMonthly.query.filter_by(staff_id=user.id).delete(synchronize_session=False)
         StudentAttendanceDaily.query.filter_by(student_id=user.id).delete(synchronize_session=False)
         # created_by, graded_by NULL qilish (Lesson, Assignment, Submission, Test)
         Lesson.query.filter_by(created_by=user.id).update({Lesson.created_by: None}, synchronize_session=False)
@@ -2407,15 +2426,12 @@ def api_translate_department_name():
     if not text or source_lang not in ('uz', 'ru', 'en'):
         return jsonify({'ok': False, 'error': 'invalid_params'}), 400
     try:
-        from deep_translator import GoogleTranslator
+        from app.services.translation_memory import translate
         result = {'uz': '', 'ru': '', 'en': ''}
         result[source_lang] = text
         targets = [l for l in ('uz', 'ru', 'en') if l != source_lang]
         for target in targets:
-            try:
-                result[target] = GoogleTranslator(source=source_lang, target=target).translate(text) or ''
-            except Exception:
-                result[target] = ''
+            result[target] = translate(text, source_lang, target)
         return jsonify({'ok': True, 'translations': result})
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)}), 500
@@ -4064,30 +4080,20 @@ def subjects():
 @permission_required('edit_subject')
 def migrate_subject_translations():
     """Mavjud fanlarni ko'p tilli formatga o'tkazish (name -> name_uz va tarjima)."""
-    try:
-        from deep_translator import GoogleTranslator
-        translator_ru = GoogleTranslator(source='uz', target='ru')
-        translator_en = GoogleTranslator(source='uz', target='en')
-    except ImportError:
-        translator_ru = None
-        translator_en = None
-    
+    from app.services.translation_memory import translate_many
     updated_count = 0
-    subjects = Subject.query.all()
+    subjects = [s for s in Subject.query.all() if s.name and not s.name_uz]
+    # Barcha nomlar bir marta, parallel tarjima qilinadi (takrorlanganlar va xotiradagilar – so'rovsiz)
+    ru_names = translate_many([s.name for s in subjects if not s.name_ru], 'uz', 'ru')
+    en_names = translate_many([s.name for s in subjects if not s.name_en], 'uz', 'en')
     for subj in subjects:
-        if subj.name and not subj.name_uz:
-            subj.name_uz = subj.name
-            if translator_ru and not subj.name_ru:
-                try:
-                    subj.name_ru = translator_ru.translate(subj.name) or subj.name
-                except Exception:
-                    subj.name_ru = subj.name
-            if translator_en and not subj.name_en:
-                try:
-                    subj.name_en = translator_en.translate(subj.name) or subj.name
-                except Exception:
-                    subj.name_en = subj.name
-            updated_count += 1
+        subj.name_uz = subj.name
+        key = subj.name.strip()
+        if not subj.name_ru:
+            subj.name_ru = ru_names.get(key) or subj.name
+        if not subj.name_en:
+            subj.name_en = en_names.get(key) or subj.name
+        updated_count += 1
     db.session.commit()
     flash(t('subjects_migrated', count=updated_count) if updated_count else t('no_subjects_to_migrate'), 'success' if updated_count else 'info')
     return redirect(url_for('admin.subjects'))
@@ -4112,6 +4118,18 @@ def download_schedule_sample():
         flash(t('template_file_creation_error', error=str(e)), 'danger')
         return redirect(url_for('admin.schedule'))
 
+@bp.route('/schedule/zoom-job/<int:job_id>')
+@login_required
+@admin_required
+@permission_required('import_schedule')
+def schedule_zoom_job(job_id):
+    """Import dan keyingi Zoom meeting navbati holati (JSON)."""
+    from app.services.zoom_jobs import get_job
+    job = get_job(job_id)
+    if not job:
+        return jsonify({'error': 'not_found'}), 404
+    return jsonify(job)
+
 @bp.route('/schedule/import', methods=['GET', 'POST'])
 @login_required
 @admin_required
@@ -4134,6 +4152,10 @@ def import_schedule():
                 if result.get('success'):
                     count = result.get('imported', 0)
                     errors = result.get('errors', [])
+                    if current_app.config.get('ZOOM_CREATE_ON_IMPORT'):
+                        from app.services.zoom_jobs import enqueue_schedule_meetings
+                        if enqueue_schedule_meetings(current_app._get_current_object(), result.get('schedule_ids') or []):
+                            flash(t('zoom_links_queued', count=len(result['schedule_ids'])), 'info')
                     
                     if errors:
                         for error in errors[:10]:
@@ -4700,7 +4722,7 @@ def clear_all_staff():
     for user in staff_users:
         if user.id == current_user.id:
             continue
-        Message.query.filter((Message.sender_id == user.id) | (Message.receiver_id == user.id)).delete(synchronize_session=False)
+        Message.delete_for_user(user.id)
         Submission.query.filter_by(student_id=user.id).delete(synchronize_session=False)
         LessonView.query.filter_by(student_id=user.id).delete(synchronize_session=False)
         Announcement.query.filter_by(author_id=user.id).delete(synchronize_session=False)
@@ -4713,6 +4735,7 @@ def clear_all_staff():
         Schedule.query.filter_by(teacher_id=user.id).update({Schedule.teacher_id: None}, synchronize_session=False)
         StudentPayment.query.filter_by(student_id=user.id).delete(synchronize_session=False)
         StaffAttendanceDaily.query.filter_by(staff_id=user.id).delete(synchronize_session=False)
+        StaffKpiMonthly.query.filter_by(staff_id=user.id).delete(synchronize_session=False)
         StudentAttendanceDaily.query.filter_by(student_id=user.id).delete(synchronize_session=False)
         Lesson.query.filter_by(created_by=user.id).update({Lesson.created_by: None}, synchronize_session=False)
         Assignment.query.filter_by(created_by=user.id).update({Assignment.created_by: None}, synchronize_session=False)
@@ -4736,9 +4759,7 @@ def clear_all_students():
     students = [u for u in students if not getattr(u, 'is_superadmin', False) and u.id != current_user.id]
     count = 0
     for student in students:
-        Message.query.filter(
-            (Message.sender_id == student.id) | (Message.receiver_id == student.id)
-        ).delete(synchronize_session=False)
+        Message.delete_for_user(student.id)
         Submission.query.filter_by(student_id=student.id).delete(synchronize_session=False)
         LessonView.query.filter_by(student_id=student.id).delete(synchronize_session=False)
         PasswordResetToken.query.filter_by(user_id=student.id).delete(synchronize_session=False)
@@ -6527,9 +6548,7 @@ def delete_student(id):
     student_name = student.full_name
     
     # Talabaning xabarlarini o'chirish (sender yoki receiver bo'lgan)
-    Message.query.filter(
-        (Message.sender_id == student.id) | (Message.receiver_id == student.id)
-    ).delete(synchronize_session=False)
+    Message.delete_for_user(student.id)
     
     # Talabaning topshiriq yuborishlarini o'chirish
     Submission.query.filter_by(student_id=student.id).delete(synchronize_session=False)
@@ -6982,16 +7001,10 @@ def create_schedule():
         if not link or not link.strip():
             try:
                 from flask import current_app
-                from app.services.zoom_service import create_schedule_meeting
+                from app.services.zoom_service import create_schedule_meeting, zoom_config as get_zoom_config
                 subject = Subject.query.get(subject_id)
                 group = Group.query.get(group_id)
-                zoom_config = {
-                    'ZOOM_ACCOUNT_ID': current_app.config.get('ZOOM_ACCOUNT_ID'),
-                    'ZOOM_CLIENT_ID': current_app.config.get('ZOOM_CLIENT_ID'),
-                    'ZOOM_CLIENT_SECRET': current_app.config.get('ZOOM_CLIENT_SECRET'),
-                    'ZOOM_DURATION_MINUTES': current_app.config.get('ZOOM_DURATION_MINUTES'),
-                    'ZOOM_TIMEZONE': current_app.config.get('ZOOM_TIMEZONE'),
-                }
+                zoom_config = get_zoom_config(current_app.config)
                 zoom_link = create_schedule_meeting(
                     subject_name=subject.name if subject else '',
                     group_name=group.name if group else '',
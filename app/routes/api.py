@@ -105,11 +105,8 @@ def search_users():
 @bp.route('/messages/unread')
 @login_required
 def unread_messages():
-    count = Message.query.filter_by(
-        receiver_id=current_user.id,
-        is_read=False
-    ).count()
-    return jsonify({'count': count})
+    # Hisoblagich User qatorida (Message hodisalari yangilaydi) – current_user bilan birga yuklangan
+    return jsonify({'count': current_user.unread_message_count or 0})
 
 @bp.route('/dashboard/stats')
 @login_required
@@ -1634,9 +1634,7 @@ def delete_student(id):
     student_name = student.full_name
     
     # Talabaning xabarlarini o'chirish (sender yoki receiver bo'lgan)
-    Message.query.filter(
-        (Message.sender_id == student.id) | (Message.receiver_id == student.id)
-    ).delete(synchronize_session=False)
+    Message.delete_for_user(student.id)
     
     # Talabaning topshiriq yuborishlarini o'chirish
     Submission.query.filter_by(student_id=student.id).delete(synchronize_session=False)
@@ -3009,6 +3007,11 @@ def import_schedule():
             result = import_schedule_from_excel(file)
             
             if result['success']:
+                from flask import current_app
+                if current_app.config.get('ZOOM_CREATE_ON_IMPORT'):
+                    from app.services.zoom_jobs import enqueue_schedule_meetings
+                    if enqueue_schedule_meetings(current_app._get_current_object(), result.get('schedule_ids') or []):
+                        flash(t('zoom_links_queued', count=len(result['schedule_ids'])), 'info')
                 msg = t('schedules_imported', count=result['imported'])
                 if result['errors']:
                     msg += " " + t('curriculum_import_errors', errors_count=len(result['errors']))
@@ -3321,16 +3324,10 @@ def create_schedule():
         if not link.strip():
             try:
                 from flask import current_app
-                from app.services.zoom_service import create_schedule_meeting
+                from app.services.zoom_service import create_schedule_meeting, zoom_config as get_zoom_config
                 subject = Subject.query.get(subject_id)
                 group = Group.query.get(group_id)
-                zoom_config = {
-                    'ZOOM_ACCOUNT_ID': current_app.config.get('ZOOM_ACCOUNT_ID'),
-                    'ZOOM_CLIENT_ID': current_app.config.get('ZOOM_CLIENT_ID'),
-                    'ZOOM_CLIENT_SECRET': current_app.config.get('ZOOM_CLIENT_SECRET'),
-                    'ZOOM_DURATION_MINUTES': current_app.config.get('ZOOM_DURATION_MINUTES'),
-                    'ZOOM_TIMEZONE': current_app.config.get('ZOOM_TIMEZONE'),
-                }
+                zoom_config = get_zoom_config(current_app.config)
                 zoom_link = create_schedule_meeting(
                     subject_name=subject.name if subject else '',
                     group_name=group.name if group else '',
@@ -2400,7 +2400,7 @@ def chat(user_id):
     ).order_by(Message.created_at.asc()).all()
     
     # Xabarlarni o'qilgan deb belgilash
-    Message.query.filter_by(sender_id=user_id, receiver_id=current_user.id, is_read=False).update({'is_read': True})
+    Message.mark_read(user_id, current_user.id)
     db.session.commit()
     
     # Forward modal uchun boshqa foydalanuvchilar (messages sahifasidagi kabi)
@@ -2438,7 +2438,7 @@ def chat_messages_api(user_id):
         Message.id > after_id
     ).order_by(Message.created_at.asc()).all()
     # O'qilgan deb belgilash
-    Message.query.filter_by(sender_id=user_id, receiver_id=current_user.id, is_read=False).update({'is_read': True})
+    Message.mark_read(user_id, current_user.id)
     db.session.commit()
     out = []
     for m in messages:
@@ -2537,7 +2537,7 @@ def chat_forward_api():
 @bp.route('/api/chat/translate', methods=['POST'])
 @login_required
 def chat_translate_api():
-    """Xabar matnini boshqa tilga tarjima qilish (deep_translator)."""
+    """Xabar matnini boshqa tilga tarjima qilish (tarjima xotirasi orqali)."""
     data = request.get_json(silent=True) or {}
     text = (data.get('text') or '').strip()
     target_lang = (data.get('target_lang') or 'uz').strip().lower()
@@ -2546,9 +2546,11 @@ def chat_translate_api():
     if target_lang not in ('uz', 'ru', 'en'):
         target_lang = 'uz'
     try:
-        from deep_translator import GoogleTranslator
-        # GoogleTranslator da source='auto' va target='uz'|'ru'|'en'
-        translated = GoogleTranslator(source='auto', target=target_lang).translate(text[:5000]) or text
+        from app.services.translation_memory import translate
+        # source='auto' – bir xil xabar qayta tarjima qilinmaydi (xotiradan)
+        translated = translate(text, 'auto', target_lang)
+        if not translated:
+            return jsonify({'error': 'translate_failed', 'message': 'translation unavailable'}), 500
         return jsonify({'translated': translated, 'target_lang': target_lang})
     except Exception as e:
         return jsonify({'error': 'translate_failed', 'message': str(e)}), 500
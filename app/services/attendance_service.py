@@ -3,24 +3,32 @@ Davomat va KPI xizmati – Hikvision face log asosida kunlik hisoblash.
 Staff: 08:30–17:30, OnTime/Late/Serious/Absent, KPI score.
 Student: Present/Absent (kamida 1 IN).
 """
+import logging
+import random
+import threading
+import time as _time
 from datetime import date, datetime, time, timedelta
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, case, event, inspect, literal, or_, select, union_all
 
 from app import db
 from app.models import (
     User, FaceLog, UserRole,
-    StaffAttendanceDaily, StudentAttendanceDaily,
+    StaffAttendanceDaily, StudentAttendanceDaily, StaffKpiMonthly,
     STAFF_ROLES, STAFF_STATUS_ON_TIME, STAFF_STATUS_LATE,
     STAFF_STATUS_SERIOUS_LATE, STAFF_STATUS_ABSENT,
     STUDENT_STATUS_PRESENT, STUDENT_STATUS_ABSENT,
 )
 
+logger = logging.getLogger(__name__)
+
 WORK_START = time(8, 30)   # 08:30
 LATE_THRESHOLD_MIN = 10    # 10 min gacha = Late, undan ortiq = Serious
 KPI_ON_TIME = 1
 KPI_LATE = 0
 KPI_SERIOUS = -1
 KPI_ABSENT = -2
+UPSERT_CHUNK = 500
+RESOLVER_MAX_AGE_SEC = 300  # boshqa jarayondagi tahrirlar uchun – keshdagi resolver shu muddatdan keyin qayta yuklanadi
 
 
 def _device_id_to_user(device_employee_id):
@@ -66,193 +74,599 @@ def _is_student(user):
     return 'student' in user.get_roles()
 
 
-def compute_staff_daily(date_obj):
+class UserResolver:
     """
-    Kun uchun barcha staff ning davomatini hisoblab StaffAttendanceDaily ga yozadi.
-    Face logs dan IN/OUT ni olish; direction bo'lmasa barcha loglar IN deb hisoblanadi.
+    device_employee_id -> user_id va user_id -> rollar to'plami – bitta yuklash bilan (bir necha so'rov).
+    _device_id_to_user bilan bir xil tartib: employee_code, id, login, student_id.
     """
-    day_start = datetime.combine(date_obj, time.min)
-    day_end = datetime.combine(date_obj, time(23, 59, 59))
-    work_start_dt = datetime.combine(date_obj, WORK_START)
 
-    staff_ids = set()
-    for r in UserRole.query.filter(UserRole.role.in_(STAFF_ROLES)).all():
-        staff_ids.add(r.user_id)
+    def __init__(self, users, role_rows):
+        self.by_employee_code = {}
+        self.by_login = {}
+        self.by_student_id = {}
+        self.user_ids = set()
+        self.user_keys = {}  # user_id -> (employee_code, login, student_id)
+        self.roles = {}
+        self._cache = {}
+        legacy_role = {}
+        for uid, employee_code, login, student_id, role in sorted(users, key=lambda u: u[0]):
+            self.user_ids.add(uid)
+            self.user_keys[uid] = (employee_code, login, student_id)
+            if employee_code:
+                self.by_employee_code.setdefault(employee_code, uid)
+            if login:
+                self.by_login.setdefault(login, uid)
+            if student_id:
+                self.by_student_id.setdefault(student_id, uid)
+            legacy_role[uid] = role
+        for uid, role in role_rows:
+            self.roles.setdefault(uid, set()).add(role)
+        self.listed_role_users = set(self.roles)  # user_roles jadvalida roli borlar
+        self._staff_ids = None
+        # get_roles(): roles_list bo'sh bo'lsa eski role ustuni
+        for uid, role in legacy_role.items():
+            if uid not in self.roles:
+                self.roles[uid] = {role} if role else set()
+        self.roles = {uid: frozenset(r) for uid, r in self.roles.items()}
+
+    @classmethod
+    def load(cls):
+        users = db.session.query(User.id, User.employee_code, User.login, User.student_id, User.role).all()
+        role_rows = db.session.query(UserRole.user_id, UserRole.role).all()
+        return cls(users, role_rows)
+
+    def resolve(self, device_employee_id):
+        """device_employee_id -> user_id (topilmasa None)."""
+        if not device_employee_id:
+            return None
+        dev_id = str(device_employee_id).strip()
+        if not dev_id:
+            return None
+        if dev_id in self._cache:
+            return self._cache[dev_id]
+        uid = self.by_employee_code.get(dev_id)
+        if uid is None:
+            try:
+                as_int = int(dev_id)
+                if as_int in self.user_ids:
+                    uid = as_int
+            except (ValueError, TypeError):
+                pass
+        if uid is None:
+            uid = self.by_login.get(dev_id)
+        if uid is None:
+            uid = self.by_student_id.get(dev_id)
+        self._cache[dev_id] = uid
+        return uid
+
+    def get_roles(self, user_id):
+        return self.roles.get(user_id, frozenset())
+
+    def is_staff(self, user_id):
+        return user_id is not None and not self.get_roles(user_id).isdisjoint(STAFF_ROLES)
+
+    def is_student(self, user_id):
+        return user_id is not None and 'student' in self.get_roles(user_id)
+
+    def staff_ids(self):
+        """compute_staff_daily dagi kabi: user_roles jadvalida staff roli borlar."""
+        if self._staff_ids is None:
+            self._staff_ids = frozenset(uid for uid in self.listed_role_users if not self.roles[uid].isdisjoint(STAFF_ROLES))
+        return self._staff_ids
+
+    def device_ids_for(self, user_id):
+        """Shu userga tushadigan device ID lar (employee_code, id, login, student_id dan – resolve bilan tekshirilgan)."""
+        out = set()
+        for v in (str(user_id),) + tuple(self.user_keys.get(user_id, ())):
+            if v and self.resolve(v) == user_id:
+                out.add(v)
+        return out
+
+
+_resolver = None
+_resolver_loaded_at = 0.0
+_resolver_lock = threading.Lock()
+
+
+def invalidate_user_resolver():
+    """Foydalanuvchi yoki roli o'zgarganda keshdagi resolver ni tashlab yuborish."""
+    global _resolver
+    _resolver = None
+
+
+def get_user_resolver(max_age=RESOLVER_MAX_AGE_SEC):
+    """Keshdagi resolver (bitta log uchun tez-tez chaqiriladigan joylar uchun). Tahrirda yoki max_age dan keyin qayta yuklanadi."""
+    global _resolver, _resolver_loaded_at
+    with _resolver_lock:
+        if _resolver is None or _time.monotonic() - _resolver_loaded_at > max_age:
+            _resolver = UserResolver.load()
+            _resolver_loaded_at = _time.monotonic()
+        return _resolver
+
+
+_RESOLVER_USER_FIELDS = ('employee_code', 'login', 'student_id', 'role')
+
+
+def _on_user_changed(mapper, connection, target):
+    invalidate_user_resolver()
+
+
+def _on_user_updated(mapper, connection, target):
+    # last_login va h.k. o'zgarishi resolver ga ta'sir qilmaydi
+    state = inspect(target)
+    if any(state.attrs[f].history.has_changes() for f in _RESOLVER_USER_FIELDS):
+        invalidate_user_resolver()
+
+
+for _model in (User, UserRole):
+    event.listen(_model, 'after_insert', _on_user_changed)
+    event.listen(_model, 'after_delete', _on_user_changed)
+event.listen(User, 'after_update', _on_user_updated)
+event.listen(UserRole, 'after_update', _on_user_changed)
+
+
+_conflict_targets = {}  # (engine url, jadval, ustunlar) -> unique constraint/indeks bormi
+_conflict_targets_lock = threading.Lock()
 
-    staff_logs = {}  # staff_id -> [(event_time, direction), ...]
-    logs = FaceLog.query.filter(
-        FaceLog.event_time >= day_start,
-        FaceLog.event_time <= day_end,
-        FaceLog.device_employee_id.isnot(None),
-    ).order_by(FaceLog.event_time.asc()).all()
 
-    for log in logs:
-        user = _device_id_to_user(log.device_employee_id)
-        if not user or not _is_staff(user):
-            continue
-        direction = (log.direction or 'IN').upper()
-        if direction not in ('IN', 'OUT'):
-            direction = 'IN'
-        staff_logs.setdefault(user.id, []).append((log.event_time, direction))
-
-    for staff_id in staff_ids:
-        rows = staff_logs.get(staff_id, [])
-        ins = [t for t, d in rows if d == 'IN']
-        outs = [t for t, d in rows if d == 'OUT']
-
-        first_entry = min(ins) if ins else None
-        # last_exit: oxirgi OUT yoki agar OUT bo'lmasa oxirgi IN
-        last_exit = None
-        if outs:
-            last_exit = max(outs)
-        elif ins:
-            last_exit = max(ins)
-
-        late_minutes = 0
-        status = STAFF_STATUS_ABSENT
-        kpi_score = KPI_ABSENT
-
-        if first_entry:
-            work_duration = None
-            if first_entry and last_exit:
-                work_duration = int((last_exit - first_entry).total_seconds() / 60)
-
-            if first_entry.time() <= WORK_START:
-                status = STAFF_STATUS_ON_TIME
-                kpi_score = KPI_ON_TIME
-            else:
-                delta = first_entry - work_start_dt
-                late_minutes = max(0, int(delta.total_seconds() / 60))
-                if late_minutes <= LATE_THRESHOLD_MIN:
-                    status = STAFF_STATUS_LATE
-                    kpi_score = KPI_LATE
-                else:
-                    status = STAFF_STATUS_SERIOUS_LATE
-                    kpi_score = KPI_SERIOUS
-
-            rec = StaffAttendanceDaily.query.filter_by(staff_id=staff_id, date=date_obj).first()
-            if rec:
-                rec.first_entry = first_entry
-                rec.last_exit = last_exit
-                rec.late_minutes = late_minutes
-                rec.work_duration = work_duration
-                rec.status = status
-                rec.kpi_score = kpi_score
-                rec.updated_at = datetime.utcnow()
-            else:
-                rec = StaffAttendanceDaily(
-                    staff_id=staff_id,
-                    date=date_obj,
-                    first_entry=first_entry,
-                    last_exit=last_exit,
-                    late_minutes=late_minutes,
-                    work_duration=work_duration,
-                    status=status,
-                    kpi_score=kpi_score,
-                )
-                db.session.add(rec)
+def has_unique_key(model, columns):
+    """
+    Jadvalda aynan shu ustunlar bo'yicha unique constraint yoki unique indeks bormi (ON CONFLICT uchun).
+    Bazadan bir marta o'qiladi va jarayonda eslab qolinadi.
+    """
+    bind = db.session.get_bind()
+    key = (str(bind.url), model.__tablename__, frozenset(columns))
+    with _conflict_targets_lock:
+        if key in _conflict_targets:
+            return _conflict_targets[key]
+    insp = inspect(bind)
+    wanted = set(columns)
+    found = any(set(uc['column_names']) == wanted for uc in insp.get_unique_constraints(model.__tablename__)) \
+        or any(ix.get('unique') and set(ix['column_names']) == wanted for ix in insp.get_indexes(model.__tablename__))
+    if not found:
+        logger.warning("%s: (%s) bo'yicha unique kalit yo'q – ON CONFLICT o'rniga prefetch yo'li",
+                       model.__tablename__, ', '.join(columns))
+    with _conflict_targets_lock:
+        _conflict_targets[key] = found
+    return found
+
+
+def upsert_daily_rows(model, person_col, date_obj, rows, chunk_size=UPSERT_CHUNK, date_col='date'):
+    """
+    Kunlik qatorlarni (person, date) bo'yicha to'plam sifatida yozish va commit.
+    SQLite/PostgreSQL: INSERT ... ON CONFLICT DO UPDATE (unique constraint bo'yicha), bo'laklab.
+    Boshqa bazalar yoki (person, date) unique kaliti yo'q eski jadval: kun qatorlarini bitta so'rov bilan
+    oldindan o'qib, bulk insert/update. Yozish xatolari (masalan "database is locked") chaqiruvchiga chiqadi.
+    """
+    if not rows:
+        db.session.commit()
+        return 0
+    dialect = db.session.get_bind().dialect.name
+    done = False
+    if dialect in ('sqlite', 'postgresql') and has_unique_key(model, (person_col, date_col)):
+        if dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
         else:
-            rec = StaffAttendanceDaily.query.filter_by(staff_id=staff_id, date=date_obj).first()
-            if rec:
-                rec.first_entry = None
-                rec.last_exit = None
-                rec.late_minutes = 0
-                rec.work_duration = None
-                rec.status = STAFF_STATUS_ABSENT
-                rec.kpi_score = KPI_ABSENT
-                rec.updated_at = datetime.utcnow()
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        update_cols = [k for k in rows[0] if k not in (person_col, date_col)]
+        stmt = dialect_insert(model)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[person_col, date_col],
+            set_={c: stmt.excluded[c] for c in update_cols},
+        )
+        for i in range(0, len(rows), chunk_size):
+            db.session.execute(stmt, rows[i:i + chunk_size])
+        done = True
+    if not done:
+        person_attr = getattr(model, person_col)
+        existing = dict(db.session.query(person_attr, model.id).filter(getattr(model, date_col) == date_obj).all())
+        inserts, updates = [], []
+        for r in rows:
+            rec_id = existing.get(r[person_col])
+            if rec_id is None:
+                inserts.append(r)
             else:
-                rec = StaffAttendanceDaily(
-                    staff_id=staff_id,
-                    date=date_obj,
-                    status=STAFF_STATUS_ABSENT,
-                    kpi_score=KPI_ABSENT,
-                )
-                db.session.add(rec)
-
+                updates.append(dict(r, id=rec_id))
+        for i in range(0, len(inserts), chunk_size):
+            db.session.execute(db.insert(model), inserts[i:i + chunk_size])
+        for i in range(0, len(updates), chunk_size):
+            db.session.bulk_update_mappings(model, updates[i:i + chunk_size])
     db.session.commit()
+    return len(rows)
 
 
-def compute_student_daily(date_obj):
-    """Talabalar uchun kunlik davomat – kamida 1 ta IN bo'lsa Present."""
+def daily_log_bounds(date_obj, resolver, device_ids=None):
+    """
+    Kun loglari SQL da guruhlanadi: (device_employee_id, yo'nalish) bo'yicha MIN/MAX event_time.
+    Yo'nalish: IN, OUT yoki OTHER (direction bo'sh bo'lsa IN). Xotirada faqat guruhlar turadi –
+    loglar soniga bog'liq emas.
+    Qaytaradi: {user_id: {'IN'|'OUT'|'OTHER': (min, max)}} – bir nechta device ID bitta userga tushsa birlashtiriladi.
+    device_ids berilsa – faqat shu ID lar (materializer uchun).
+    """
     day_start = datetime.combine(date_obj, time.min)
     day_end = datetime.combine(date_obj, time(23, 59, 59))
-
-    student_ids = set()
-    for r in UserRole.query.filter(UserRole.role == 'student').all():
-        student_ids.add(r.user_id)
-    # Eski role ustuniga ham qarab
-    for u in User.query.filter(User.role == 'student').all():
-        student_ids.add(u.id)
-
-    student_ins = {}
-    logs = FaceLog.query.filter(
+    norm = func.upper(func.coalesce(FaceLog.direction, 'IN'))
+    direction = case((norm == 'IN', 'IN'), (norm == 'OUT', 'OUT'), else_='OTHER')
+    rows = db.session.query(
+        FaceLog.device_employee_id, direction,
+        func.min(FaceLog.event_time), func.max(FaceLog.event_time),
+    ).filter(
         FaceLog.event_time >= day_start,
         FaceLog.event_time <= day_end,
         FaceLog.device_employee_id.isnot(None),
-    ).all()
-
-    for log in logs:
-        user = _device_id_to_user(log.device_employee_id)
-        if not user or not _is_student(user):
+    )
+    if device_ids is not None:
+        rows = rows.filter(FaceLog.device_employee_id.in_(list(device_ids)))
+    rows = rows.group_by(FaceLog.device_employee_id, direction).all()
+
+    bounds = {}
+    for dev_id, d, t_min, t_max in rows:
+        user_id = resolver.resolve(dev_id)
+        if user_id is None or t_min is None:
             continue
-        direction = (log.direction or 'IN').upper()
-        if direction == 'IN':
-            student_ins.setdefault(user.id, []).append(log.event_time)
-
-    for student_id in student_ids:
-        ins = student_ins.get(student_id, [])
-        first_entry = min(ins) if ins else None
-        last_exit = max(ins) if ins else None
-        status = STUDENT_STATUS_PRESENT if ins else STUDENT_STATUS_ABSENT
-
-        rec = StudentAttendanceDaily.query.filter_by(student_id=student_id, date=date_obj).first()
-        if rec:
-            rec.first_entry = first_entry
-            rec.last_exit = last_exit
-            rec.status = status
-            rec.updated_at = datetime.utcnow()
+        per_user = bounds.setdefault(user_id, {})
+        prev = per_user.get(d)
+        per_user[d] = (min(prev[0], t_min), max(prev[1], t_max)) if prev else (t_min, t_max)
+    return bounds
+
+
+def _merge_bounds(*pairs):
+    pairs = [p for p in pairs if p]
+    if not pairs:
+        return None
+    return min(p[0] for p in pairs), max(p[1] for p in pairs)
+
+
+def _staff_row(staff_id, date_obj, b, now):
+    """Bitta xodimning kunlik qatori – b: daily_log_bounds dagi {'IN'|'OUT'|'OTHER': (min, max)} yoki None."""
+    work_start_dt = datetime.combine(date_obj, WORK_START)
+    # IN va noma'lum yo'nalish – kirish
+    ins = _merge_bounds(b.get('IN'), b.get('OTHER')) if b else None
+    outs = b.get('OUT') if b else None
+
+    first_entry = ins[0] if ins else None
+    # last_exit: oxirgi OUT yoki agar OUT bo'lmasa oxirgi IN
+    last_exit = None
+    if outs:
+        last_exit = outs[1]
+    elif ins:
+        last_exit = ins[1]
+
+    late_minutes = 0
+    status = STAFF_STATUS_ABSENT
+    kpi_score = KPI_ABSENT
+
+    if first_entry:
+        work_duration = None
+        if last_exit:
+            work_duration = int((last_exit - first_entry).total_seconds() / 60)
+
+        if first_entry.time() <= WORK_START:
+            status = STAFF_STATUS_ON_TIME
+            kpi_score = KPI_ON_TIME
         else:
-            rec = StudentAttendanceDaily(
-                student_id=student_id,
-                date=date_obj,
-                first_entry=first_entry,
-                last_exit=last_exit,
-                status=status,
-            )
-            db.session.add(rec)
+            delta = first_entry - work_start_dt
+            late_minutes = max(0, int(delta.total_seconds() / 60))
+            if late_minutes <= LATE_THRESHOLD_MIN:
+                status = STAFF_STATUS_LATE
+                kpi_score = KPI_LATE
+            else:
+                status = STAFF_STATUS_SERIOUS_LATE
+                kpi_score = KPI_SERIOUS
+
+        return {
+            'staff_id': staff_id, 'date': date_obj,
+            'first_entry': first_entry, 'last_exit': last_exit,
+            'late_minutes': late_minutes, 'work_duration': work_duration,
+            'status': status, 'kpi_score': kpi_score, 'updated_at': now,
+        }
+    return {
+        'staff_id': staff_id, 'date': date_obj,
+        'first_entry': None, 'last_exit': None,
+        'late_minutes': 0, 'work_duration': None,
+        'status': STAFF_STATUS_ABSENT, 'kpi_score': KPI_ABSENT, 'updated_at': now,
+    }
+
+
+def compute_staff_daily(date_obj, resolver=None, bounds=None):
+    """
+    Kun uchun barcha staff ning davomatini hisoblab StaffAttendanceDaily ga yozadi.
+    Birinchi IN / oxirgi OUT SQL da guruhlab olinadi (daily_log_bounds); direction bo'lmasa IN.
+    """
+    if resolver is None:
+        resolver = UserResolver.load()
+    if bounds is None:
+        bounds = daily_log_bounds(date_obj, resolver)
 
-    db.session.commit()
+    staff_ids = {uid for (uid,) in db.session.query(UserRole.user_id).filter(UserRole.role.in_(STAFF_ROLES))}
 
+    now = datetime.utcnow()
+    daily_rows = [_staff_row(staff_id, date_obj, bounds.get(staff_id) if resolver.is_staff(staff_id) else None, now)
+                  for staff_id in staff_ids]
 
-def compute_daily_attendance(date_obj=None):
+    upsert_daily_rows(StaffAttendanceDaily, 'staff_id', date_obj, daily_rows)
+    refresh_kpi_rollups([date_obj])
+
+
+def _student_row(student_id, date_obj, b, now):
+    """Bitta talabaning kunlik qatori – kamida 1 ta IN bo'lsa Present."""
+    ins = (b or {}).get('IN')
+    return {
+        'student_id': student_id, 'date': date_obj,
+        'first_entry': ins[0] if ins else None, 'last_exit': ins[1] if ins else None,
+        'status': STUDENT_STATUS_PRESENT if ins else STUDENT_STATUS_ABSENT, 'updated_at': now,
+    }
+
+
+def compute_student_daily(date_obj, resolver=None, bounds=None):
+    """Talabalar uchun kunlik davomat – kamida 1 ta IN bo'lsa Present."""
+    if resolver is None:
+        resolver = UserResolver.load()
+    if bounds is None:
+        bounds = daily_log_bounds(date_obj, resolver)
+
+    student_ids = {uid for (uid,) in db.session.query(UserRole.user_id).filter(UserRole.role == 'student')}
+    # Eski role ustuniga ham qarab
+    student_ids.update(uid for (uid,) in db.session.query(User.id).filter(User.role == 'student'))
+
+    now = datetime.utcnow()
+    daily_rows = [_student_row(student_id, date_obj, bounds.get(student_id) if resolver.is_student(student_id) else None, now)
+                  for student_id in student_ids]
+
+    upsert_daily_rows(StudentAttendanceDaily, 'student_id', date_obj, daily_rows)
+
+
+def compute_daily_attendance(date_obj=None, resolver=None):
     """Berilgan kun uchun staff va student davomatini hisoblash. Default: kecha."""
     if date_obj is None:
         date_obj = date.today() - timedelta(days=1)
-    compute_staff_daily(date_obj)
-    compute_student_daily(date_obj)
+    if resolver is None:
+        resolver = UserResolver.load()
+    bounds = daily_log_bounds(date_obj, resolver)
+    compute_staff_daily(date_obj, resolver, bounds)
+    compute_student_daily(date_obj, resolver, bounds)
+
+
+def materialize_logs(log_rows, resolver=None):
+    """
+    Yangi face loglar bo'yicha shu kishilarning kunlik qatorlarini darhol yangilash (near-real-time).
+    Har (kishi, kun) uchun qator shu kishining o'sha kundagi barcha loglaridan qayta hisoblanadi –
+    idempotent va loglar tartibiga bog'liq emas. Kelmaganlar (Absent) qatorlari va boshqa
+    farqlar tungi compute_daily_attendance (reconciliation) da to'ldiriladi.
+    log_rows: device_employee_id, event_time bo'lgan dict yoki FaceLog lar. Qaytaradi: yangilangan qatorlar soni.
+    """
+    if resolver is None:
+        resolver = get_user_resolver()
+    staff_ids = resolver.staff_ids()
+    affected = {}  # date -> {user_id}
+    for r in log_rows:
+        get = r.get if isinstance(r, dict) else (lambda k, _r=r: getattr(_r, k, None))
+        event_time = get('event_time')
+        user_id = resolver.resolve(get('device_employee_id'))
+        if event_time is None or user_id is None:
+            continue
+        if user_id in staff_ids or resolver.is_student(user_id):
+            affected.setdefault(event_time.date(), set()).add(user_id)
+
+    now = datetime.utcnow()
+    written = 0
+    for day, user_ids in affected.items():
+        device_ids = set()
+        for uid in user_ids:
+            device_ids |= resolver.device_ids_for(uid)
+        bounds = daily_log_bounds(day, resolver, device_ids=device_ids)
+        staff_rows = [_staff_row(uid, day, bounds.get(uid), now) for uid in user_ids if uid in staff_ids]
+        student_rows = [_student_row(uid, day, bounds.get(uid), now) for uid in user_ids if resolver.is_student(uid)]
+        written += upsert_daily_rows(StaffAttendanceDaily, 'staff_id', day, staff_rows)
+        written += upsert_daily_rows(StudentAttendanceDaily, 'student_id', day, student_rows)
+        if staff_rows:
+            refresh_kpi_rollups([day], staff_ids=[r['staff_id'] for r in staff_rows])
+    return written
+
+
+def on_face_logs_committed(app, rows):
+    """face_log_writer listener: batch commit dan keyin davomat qatorlarini yangilash."""
+    if not app.config.get('ATTENDANCE_LIVE_MATERIALIZE', True):
+        return
+    with app.app_context():
+        try:
+            materialize_logs(rows)
+        except Exception as e:
+            db.session.rollback()
+            logger.warning("Davomat materializatsiyasi xatosi (tungi hisoblashda tuzatiladi): %s", e)
+
+
+def recompute_range(app, date_from, date_to, workers=4, on_day_done=None):
+    """
+    date_from..date_to oralig'idagi har kun uchun compute_daily_attendance – kunlar parallel
+    (har thread o'z app context va sessiyasi bilan), resolver hammasi uchun bitta.
+    Qaytaradi: {date: None yoki xato matni}.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    days = []
+    d = date_from
+    while d <= date_to:
+        days.append(d)
+        d += timedelta(days=1)
+    with app.app_context():
+        resolver = UserResolver.load()
+
+    def _one(day):
+        with app.app_context():
+            try:
+                compute_daily_attendance(day, resolver)
+                return None
+            except Exception as e:
+                db.session.rollback()
+                return str(e)
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(_one, day): day for day in days}
+        for fut in as_completed(futures):
+            day = futures[fut]
+            results[day] = fut.result()
+            if on_day_done:
+                on_day_done(day, results[day])
+    return results
+
+
+def benchmark_resolver(sizes=(1000, 5000, 20000), legacy_max=5000, seed=1):
+    """
+    Loglarni user ga bog'lash vaqti: eski usul (_device_id_to_user + get_roles har log uchun)
+    va UserResolver. Sintetik device ID lar bazadagi employee_code/id/login/student_id dan olinadi
+    (10% – noma'lum ID). Hech narsa yozilmaydi. Qaytaradi: [{logs, legacy_ms, resolver_ms, load_ms}].
+    """
+    rng = random.Random(seed)
+    users = db.session.query(User.id, User.employee_code, User.login, User.student_id).all()
+    pool = []
+    for uid, code, login, sid in users:
+        pool.extend(v for v in (code, str(uid), login, sid) if v)
+    if not pool:
+        pool = ['1']
+    results = []
+    for n in sizes:
+        ids = [rng.choice(pool) if rng.random() < 0.9 else 'X%d' % rng.randint(1, 10 ** 6) for _ in range(n)]
+        legacy_ms = None
+        if n <= legacy_max:
+            started = _time.perf_counter()
+            for dev_id in ids:
+                user = _device_id_to_user(dev_id)
+                if user:
+                    _is_staff(user)
+                    _is_student(user)
+            legacy_ms = round((_time.perf_counter() - started) * 1000, 1)
+            db.session.rollback()
+        started = _time.perf_counter()
+        resolver = UserResolver.load()
+        load_ms = (_time.perf_counter() - started) * 1000
+        for dev_id in ids:
+            uid = resolver.resolve(dev_id)
+            resolver.is_staff(uid)
+            resolver.is_student(uid)
+        resolver_ms = (_time.perf_counter() - started) * 1000
+        results.append({
+            'logs': n, 'legacy_ms': legacy_ms,
+            'resolver_ms': round(resolver_ms, 1), 'load_ms': round(load_ms, 1),
+        })
+    return results
+
+
+def benchmark_compute(date_obj):
+    """Bitta kun uchun compute_daily_attendance vaqti va log soni (haqiqiy yozuv bilan)."""
+    day_start = datetime.combine(date_obj, time.min)
+    day_end = datetime.combine(date_obj, time(23, 59, 59))
+    n_logs = FaceLog.query.filter(
+        FaceLog.event_time >= day_start, FaceLog.event_time <= day_end,
+    ).count()
+    started = _time.perf_counter()
+    compute_daily_attendance(date_obj)
+    return {'date': date_obj.isoformat(), 'logs': n_logs, 'compute_ms': round((_time.perf_counter() - started) * 1000, 1)}
+
+
+def _month_start(d):
+    return d.replace(day=1)
+
+
+def _next_month(d):
+    d = _month_start(d)
+    return date(d.year + 1, 1, 1) if d.month == 12 else date(d.year, d.month + 1, 1)
+
+
+def refresh_kpi_rollups(dates, staff_ids=None):
+    """
+    dates tushgan oylar uchun StaffKpiMonthly ni StaffAttendanceDaily dan qayta hisoblash
+    (har oy uchun bitta GROUP BY). staff_ids berilsa – faqat shu xodimlar.
+    """
+    now = datetime.utcnow()
+    for month in sorted({_month_start(d) for d in dates}):
+        q = db.session.query(
+            StaffAttendanceDaily.staff_id,
+            func.sum(StaffAttendanceDaily.kpi_score),
+            func.count(StaffAttendanceDaily.id),
+        ).filter(
+            StaffAttendanceDaily.date >= month,
+            StaffAttendanceDaily.date < _next_month(month),
+        )
+        if staff_ids is not None:
+            q = q.filter(StaffAttendanceDaily.staff_id.in_(list(staff_ids)))
+        rows = [
+            {'staff_id': sid, 'month': month, 'total_kpi': int(total or 0), 'days_count': cnt, 'updated_at': now}
+            for sid, total, cnt in q.group_by(StaffAttendanceDaily.staff_id).all()
+        ]
+        upsert_daily_rows(StaffKpiMonthly, 'staff_id', month, rows, date_col='month')
+
+
+_kpi_rollups_checked = False
+
+
+def _ensure_kpi_rollups():
+    """
+    Jarayonda bir marta: oylik yig'indilar kunlik qatorlar soniga mos kelmasa (eski baza yoki
+    yangilanishdan oldingi ma'lumot) – barcha oylar kunlik qatorlardan qayta to'ldiriladi.
+    """
+    global _kpi_rollups_checked
+    if _kpi_rollups_checked:
+        return
+    daily_count = db.session.query(func.count(StaffAttendanceDaily.id)).scalar() or 0
+    rolled_count = db.session.query(func.sum(StaffKpiMonthly.days_count)).scalar() or 0
+    if daily_count != rolled_count:
+        first, last = db.session.query(func.min(StaffAttendanceDaily.date), func.max(StaffAttendanceDaily.date)).one()
+        if first and last:
+            months = []
+            m = _month_start(first)
+            while m <= last:
+                months.append(m)
+                m = _next_month(m)
+            logger.info("KPI oylik yig'indilari qayta to'ldirilmoqda: %d oy", len(months))
+            refresh_kpi_rollups(months)
+    _kpi_rollups_checked = True
 
 
 def get_kpi_summary(start_date, end_date):
-    """Staff KPI bo'yicha hisobot – davr uchun o'rtacha/yig'indi."""
+    """
+    Staff KPI bo'yicha hisobot – davr uchun o'rtacha/yig'indi. To'liq oylar StaffKpiMonthly dan,
+    chetdagi qisman oylar kunlik qatorlardan; ism bilan bitta join so'rov.
+    """
+    _ensure_kpi_rollups()
+    S = StaffAttendanceDaily
+    full_from = start_date if start_date.day == 1 else _next_month(start_date)
+    full_to = _month_start(end_date + timedelta(days=1))  # shu sanadan oldingi oylar to'liq
+    parts = []
+    if full_from < full_to:
+        parts.append(select(
+            StaffKpiMonthly.staff_id.label('staff_id'),
+            StaffKpiMonthly.total_kpi.label('kpi'),
+            StaffKpiMonthly.days_count.label('days'),
+        ).where(StaffKpiMonthly.month >= full_from, StaffKpiMonthly.month < full_to))
+        daily_filter = or_(
+            and_(S.date >= start_date, S.date < full_from),
+            and_(S.date >= full_to, S.date <= end_date),
+        )
+    else:
+        daily_filter = and_(S.date >= start_date, S.date <= end_date)
+    parts.append(select(
+        S.staff_id.label('staff_id'),
+        S.kpi_score.label('kpi'),
+        literal(1).label('days'),
+    ).where(daily_filter))
+    u = union_all(*parts).subquery()
+
     rows = db.session.query(
-        StaffAttendanceDaily.staff_id,
-        func.sum(StaffAttendanceDaily.kpi_score).label('total_kpi'),
-        func.count(StaffAttendanceDaily.id).label('days_count'),
-    ).filter(
-        StaffAttendanceDaily.date >= start_date,
-        StaffAttendanceDaily.date <= end_date,
-    ).group_by(StaffAttendanceDaily.staff_id).all()
+        u.c.staff_id,
+        User.full_name,
+        func.sum(u.c.kpi).label('total_kpi'),
+        func.sum(u.c.days).label('days_count'),
+    ).join(User, User.id == u.c.staff_id).group_by(u.c.staff_id, User.full_name).all()
 
     result = []
     for r in rows:
-        user = User.query.get(r.staff_id)
-        if user:
-            result.append({
-                'staff_id': r.staff_id,
-                'full_name': user.full_name or '-',
-                'total_kpi': r.total_kpi or 0,
-                'days_count': r.days_count or 0,
-                'avg_kpi': round((r.total_kpi or 0) / max(1, r.days_count or 1), 2),
-            })
+        result.append({
+            'staff_id': r.staff_id,
+            'full_name': r.full_name or '-',
+            'total_kpi': r.total_kpi or 0,
+            'days_count': r.days_count or 0,
+            'avg_kpi': round((r.total_kpi or 0) / max(1, r.days_count or 1), 2),
+        })
     return sorted(result, key=lambda x: -x['total_kpi'])
@@ -0,0 +1,22 @@
+"""
+create_app bosqichlari vaqti. mark(nom) – oldingi belgidan beri o'tgan vaqt shu bosqichga yoziladi.
+app.extensions['boot_profile'] da saqlanadi; flask startup-profile chiqaradi.
+"""
+import time
+
+
+class BootProfile:
+
+    def __init__(self):
+        self.started = self._last = time.perf_counter()
+        self.phases = []  # [(nom, soniya), ...]
+        self.notes = {}
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    @property
+    def total(self):
+        return self._last - self.started
@@ -9,11 +9,34 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-# Kesh – markazga har soatda yoki o'zgarishda yangilanadi
+# Kesh – stale-while-revalidate: so'rov threadi keshni darhol oladi, eskirgan bo'lsa
+# bitta fon thread markazdan yangilaydi (sekin markaz request threadlarini to'xtatmaydi).
+# Jarayon ishga tushganda kesh instance/central_status.json dagi oxirgi ma'lum holatdan olinadi
+# (bloklangan institut qayta ishga tushgandan keyin ham bloklangan qoladi); u ham yo'q bo'lsa –
+# birinchi javob kelguncha blok yo'q (CENTRAL_STATUS_FAIL_CLOSED=1 bo'lsa – holat noma'lum, 503).
 _status_cache = {}
 _cache_lock = threading.Lock()
 _cache_updated_at = 0
+_refreshing = False
+_known = False
+_saved_checked = False
+_saved_path = None
 CACHE_TTL = 60  # soniya – bloklanish tekshiruvi har minutda
+FETCH_TIMEOUT = 10
+STATUS_FILENAME = 'central_status.json'
+
+_stats = {
+    'refreshes': 0,
+    'failures': 0,
+    'pushes_applied': 0,
+    'last_latency_ms': None,
+    'max_latency_ms': 0.0,
+    'last_success_at': None,
+    'last_failure_at': None,
+    'last_error': None,
+}
+
+_DEFAULT_STATUS = {'blocked': False, 'permissions': [], 'block_reason': None}
 
 
 def get_central_url():
@@ -42,67 +65,266 @@ def is_central_enabled():
     return bool(url and url.startswith(('http://', 'https://')))
 
 
+def _fetch(url, inst_id, timeout=FETCH_TIMEOUT):
+    """Markazdan institut holati; xato bo'lsa exception."""
+    from app.services import http_client
+    r = http_client.get(
+        f'{url}/api/institution/{inst_id}/status',
+        timeout=timeout,
+        headers={'Accept': 'application/json'}
+    )
+    if r.status_code != 200:
+        raise RuntimeError('HTTP %s' % r.status_code)
+    status = r.json()
+    if not isinstance(status, dict):
+        raise ValueError("Noto'g'ri javob")
+    return status
+
+
 def fetch_status():
     """Markazdan institut holatini olish (HTTP so'rov)."""
-    import requests
     url = get_central_url().rstrip('/')
     inst_id = get_institution_id()
     if not url or not inst_id:
-        return {'blocked': False, 'permissions': [], 'block_reason': None}
+        return dict(_DEFAULT_STATUS)
 
     try:
-        r = requests.get(
-            f'{url}/api/institution/{inst_id}/status',
-            timeout=10,
-            headers={'Accept': 'application/json'}
-        )
-        if r.status_code == 200:
-            return r.json()
+        return _fetch(url, inst_id)
     except Exception as e:
         logger.warning("Markazdan status olishda xato: %s", e)
 
-    return {'blocked': False, 'permissions': [], 'block_reason': None}
+    return dict(_DEFAULT_STATUS)
+
+
+def _status_path():
+    """instance/central_status.json – app context bo'lsa aniqlanadi, fon threadlar uchun eslab qolinadi."""
+    global _saved_path
+    if _saved_path is None:
+        try:
+            import os
+            from flask import current_app
+            _saved_path = os.path.join(current_app.instance_path, STATUS_FILENAME)
+        except Exception:
+            return None
+    return _saved_path
+
+
+def _save(status):
+    """Oxirgi ma'lum holatni diskka (qayta ishga tushganda markaz javob bermasa ham bloklanish saqlansin)."""
+    import os
+    path = _status_path()
+    if not path:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = '%s.%d.tmp' % (path, os.getpid())
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'institution_id': get_institution_id(), 'status': status, 'saved_at': time.time()}, f)
+        os.replace(tmp, path)
+    except Exception as e:
+        logger.warning("Markaz holatini diskka yozib bo'lmadi: %s", e)
+
+
+def _load_saved():
+    """Diskdagi oxirgi ma'lum holatni keshga (eskirgan deb – fonda yangilanadi). Qaytaradi: True/False."""
+    global _known, _cache_updated_at
+    path = _status_path()
+    if not path:
+        return False
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(saved, dict) or str(saved.get('institution_id') or '') != get_institution_id() \
+            or not isinstance(saved.get('status'), dict):
+        return False
+    with _cache_lock:
+        if _known:
+            return True
+        _store(saved['status'])
+        _cache_updated_at = 0
+        _known = True
+    logger.info("Markaz holati diskdan olindi (oxirgi ma'lum holat), fonda yangilanadi")
+    return True
+
+
+def _store(status):
+    """Keshga yozish (_cache_lock ushlangan holda); holat shundan keyin ma'lum hisoblanadi."""
+    global _status_cache, _cache_updated_at, _known
+    _status_cache = dict(status)
+    _status_cache.setdefault('permissions', [])
+    _status_cache.setdefault('block_reason', None)
+    _cache_updated_at = time.time()
+    _known = True
+
+
+def refresh_status(url=None, inst_id=None, timeout=FETCH_TIMEOUT):
+    """
+    Markazdan holatni sinxron yangilash. Xato bo'lsa oxirgi ma'lum holat saqlanadi (hali bo'lmasa –
+    kesh bo'sh qoladi). Qaytaradi: True/False.
+    """
+    global _cache_updated_at
+    url = (url if url is not None else get_central_url()).rstrip('/')
+    inst_id = inst_id if inst_id is not None else get_institution_id()
+    _status_path()
+    if not url or not inst_id:
+        with _cache_lock:
+            _store(_DEFAULT_STATUS)
+        return True
+    started = time.perf_counter()
+    try:
+        status = _fetch(url, inst_id, timeout=timeout)
+    except Exception as e:
+        latency = round((time.perf_counter() - started) * 1000, 1)
+        logger.warning("Markazdan status olishda xato (%.0f ms): %s", latency, e)
+        with _cache_lock:
+            _stats['failures'] += 1
+            _stats['last_latency_ms'] = latency
+            _stats['last_failure_at'] = time.time()
+            _stats['last_error'] = str(e)[:200]
+            # Oxirgi ma'lum holat (yoki default) qoladi; keyingi urinish CACHE_TTL dan keyin
+            _cache_updated_at = time.time()
+        return False
+    latency = round((time.perf_counter() - started) * 1000, 1)
+    with _cache_lock:
+        _store(status)
+        saved = _status_cache.copy()
+        _stats['refreshes'] += 1
+        _stats['last_latency_ms'] = latency
+        _stats['max_latency_ms'] = max(_stats['max_latency_ms'], latency)
+        _stats['last_success_at'] = time.time()
+    _save(saved)
+    return True
+
+
+def _refresh_in_background():
+    """Bitta fon thread (allaqachon ishlayotgan bo'lsa – yangisi ochilmaydi)."""
+    global _refreshing
+    url, inst_id = get_central_url(), get_institution_id()
+    with _cache_lock:
+        if _refreshing:
+            return
+        _refreshing = True
+
+    def _run():
+        global _refreshing
+        try:
+            refresh_status(url, inst_id)
+        except Exception as e:
+            logger.warning("Markaz holatini yangilashda xato: %s", e)
+        finally:
+            with _cache_lock:
+                _refreshing = False
+
+    threading.Thread(target=_run, daemon=True, name='central-status-refresh').start()
+
+
+def _fail_closed():
+    try:
+        from flask import current_app
+        return bool(current_app.config.get('CENTRAL_STATUS_FAIL_CLOSED'))
+    except Exception:
+        return False
+
+
+def _unknown_status():
+    """Holat hali ma'lum emas: default (blok yo'q) yoki CENTRAL_STATUS_FAIL_CLOSED da {'unknown': True}."""
+    if _fail_closed():
+        return dict(_DEFAULT_STATUS, unknown=True)
+    return dict(_DEFAULT_STATUS)
 
 
 def get_status(use_cache=True):
     """
     Institut holati – bloklangan yoki yo'q, ruxsatlar.
-    Kesh orqali – markazga har CACHE_TTL soniyada so'rov.
+    use_cache=True: kesh darhol qaytariladi; CACHE_TTL dan eski bo'lsa fonda yangilanadi.
+    Jarayonda hali holat bo'lmasa – diskdagi oxirgi ma'lum holat (bir marta o'qiladi), u ham yo'q bo'lsa
+    _unknown_status() va fonda yangilash.
+    use_cache=False: markazdan sinxron so'rov.
     """
+    global _saved_checked
     if not is_central_enabled():
-        return {'blocked': False, 'permissions': [], 'block_reason': None}
+        return dict(_DEFAULT_STATUS)
 
-    global _status_cache, _cache_updated_at
-    now = time.time()
+    if not use_cache:
+        refresh_status()
+        with _cache_lock:
+            return _status_cache.copy() if _known else _unknown_status()
+
+    if not _known and not _saved_checked:
+        _saved_checked = True
+        _load_saved()
 
     with _cache_lock:
-        if use_cache and _status_cache and (now - _cache_updated_at) < CACHE_TTL:
-            return _status_cache.copy()
+        status = _status_cache.copy() if _known else None
+        stale = (time.time() - _cache_updated_at) >= CACHE_TTL
+    if stale:
+        _refresh_in_background()
+    return status if status is not None else _unknown_status()
+
 
-        status = fetch_status()
-        _status_cache = status.copy()
-        _status_cache.setdefault('permissions', [])
-        _status_cache.setdefault('block_reason', None)
-        _cache_updated_at = now
-        return _status_cache.copy()
+def apply_institution_update(data):
+    """
+    SSE 'institution_updated' ({'institutions': [...]}) ni keshga to'g'ridan-to'g'ri qo'llash.
+    Institut ro'yxatda bo'lmasa yoki ruxsatlar berilmagan bo'lsa – fonda to'liq yangilanadi.
+    Qaytaradi: True – kesh yangilandi.
+    """
+    inst_id = get_institution_id()
+    institutions = (data or {}).get('institutions') if isinstance(data, dict) else None
+    if not inst_id or not isinstance(institutions, list):
+        invalidate_cache()
+        return False
+    inst = next((i for i in institutions if isinstance(i, dict) and str(i.get('id')) == inst_id), None)
+    complete = inst is not None and 'permissions' in inst
+    with _cache_lock:
+        was_known = _known
+        status = dict(_status_cache) if _status_cache else dict(_DEFAULT_STATUS)
+        status['blocked'] = bool(inst.get('blocked', False)) if inst else False
+        status['block_reason'] = (inst.get('block_reason') or '') if inst else None
+        if complete:
+            status['permissions'] = inst.get('permissions') or []
+        stored = was_known or complete
+        if stored:
+            _store(status)
+            status = _status_cache.copy()
+        _stats['pushes_applied'] += 1
+    if stored:
+        _save(status)
+    if not complete:
+        invalidate_cache()
+    return True
 
 
 def invalidate_cache():
-    """Keshni tozalash – markazda o'zgarish bo'lganda chaqiriladi."""
-    global _status_cache, _cache_updated_at
+    """Keshni eskirgan deb belgilash – keyingi get_status fonda yangilaydi (oxirgi holat shu paytgacha xizmat qiladi)."""
+    global _cache_updated_at
     with _cache_lock:
-        _status_cache = {}
         _cache_updated_at = 0
 
 
+def get_refresh_stats():
+    """Yangilash hisoblagichlari: muvaffaqiyatli/xato soni, kechikish, kesh yoshi."""
+    with _cache_lock:
+        out = dict(_stats)
+        out['cache_age_sec'] = round(time.time() - _cache_updated_at, 1) if _status_cache else None
+        out['known'] = _known
+        out['refreshing'] = _refreshing
+        out['blocked'] = bool(_status_cache.get('blocked')) if _status_cache else None
+    return out
+
+
 def is_blocked():
     """Institut bloklanganmi."""
     return bool(get_status().get('blocked', False))
 
 
 def has_permission(permission):
-    """Berilgan ruxsat bormi."""
-    perms = get_status().get('permissions', [])
+    """Berilgan ruxsat bormi (holat noma'lum bo'lsa – yo'q)."""
+    status = get_status()
+    if status.get('unknown'):
+        return False
+    perms = status.get('permissions', [])
     if not perms:
         return True
     return permission in perms or 'admin' in perms
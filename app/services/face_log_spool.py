@@ -0,0 +1,280 @@
+"""
+Face log spool – qurilmalardan kelgan loglar uchun diskdagi navbat (instance/face_log_spool.db).
+receive() logni shu yerga yozadi, bitta consumer (lease egasi) uni face_logs ga ko'chiradi.
+SQLite WAL + synchronous=NORMAL: har yozuv jurnalga tushadi (os._exit da yo'qolmaydi),
+fsync esa har commit da emas, checkpoint da bir yo'la bajariladi.
+Gunicorn ning bir nechta workeri bitta faylni bo'lishadi; consumer faqat lease egasi.
+Yozilmagan yozuv spool da qoladi (attempts +1); FACE_LOG_MAX_ATTEMPTS dan keyin dead_letter jadvaliga
+ko'chadi va flask face-log-requeue bilan qaytariladi – hech bir log jim o'chirilmaydi.
+"""
+import hashlib
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SPOOL_FILENAME = 'face_log_spool.db'
+LEASE_NAME = 'face_log_consumer'
+LEASE_TTL_SEC = 30
+BUSY_TIMEOUT_MS = 5000
+
+_spool_path = None
+_local = threading.local()
+_owner_id = '%s:%d:%s' % (socket.gethostname(), os.getpid(), uuid.uuid4().hex[:8])
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS spool (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        dedupe_key TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        attempts INTEGER NOT NULL DEFAULT 0
+    )""",
+    """CREATE TABLE IF NOT EXISTS dead_letter (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        dedupe_key TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        attempts INTEGER NOT NULL,
+        last_error TEXT,
+        failed_at REAL NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS consumer_lease (
+        name TEXT PRIMARY KEY,
+        owner TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    )""",
+)
+
+
+def init_spool(instance_path, path=None):
+    """Spool fayl manzilini o'rnatish va jadvallarni yaratish."""
+    global _spool_path
+    p = Path(path) if path else Path(instance_path) / SPOOL_FILENAME
+    p.parent.mkdir(parents=True, exist_ok=True)
+    _spool_path = str(p)
+    conn = _connection()
+    for stmt in _SCHEMA:
+        conn.execute(stmt)
+    # Eski spool fayllarida attempts ustuni yo'q
+    if 'attempts' not in {row[1] for row in conn.execute('PRAGMA table_info(spool)')}:
+        conn.execute('ALTER TABLE spool ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0')
+    return _spool_path
+
+
+def is_initialized():
+    return _spool_path is not None
+
+
+def _connection():
+    """Har thread uchun alohida ulanish (sqlite3 ulanishi threadlar orasida bo'linmaydi)."""
+    conn = getattr(_local, 'conn', None)
+    if conn is not None and getattr(_local, 'path', None) == _spool_path:
+        return conn
+    if _spool_path is None:
+        raise RuntimeError("Face log spool ishga tushirilmagan (init_spool)")
+    conn = sqlite3.connect(_spool_path, timeout=BUSY_TIMEOUT_MS / 1000.0, isolation_level=None, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA busy_timeout=%d' % BUSY_TIMEOUT_MS)
+    _local.conn = conn
+    _local.path = _spool_path
+    return conn
+
+
+def make_dedupe_key(entry_dict):
+    """
+    Exactly-once kaliti: qurilma + voqea vaqti + xodim ID. Qurilma bir voqeani qayta yuborsa ham bitta yozuv.
+    Xodim ID yoki vaqt bo'lmasa (buzilgan so'rov) – har yozuv uchun yagona kalit.
+    """
+    emp = (entry_dict.get('device_employee_id') or '').strip()
+    et = entry_dict.get('event_time')
+    if not emp or et is None:
+        return uuid.uuid4().hex
+    et_s = et.isoformat() if isinstance(et, datetime) else str(et)
+    raw = '%s|%s|%s' % ((entry_dict.get('device_ip') or '').strip(), et_s, emp)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def _encode(entry_dict):
+    out = {}
+    for k, v in entry_dict.items():
+        out[k] = v.isoformat() if isinstance(v, datetime) else v
+    return json.dumps(out, ensure_ascii=False)
+
+
+def _decode(payload):
+    data = json.loads(payload)
+    for k in ('event_time', 'received_at'):
+        v = data.get(k)
+        if isinstance(v, str) and v:
+            try:
+                data[k] = datetime.fromisoformat(v)
+            except ValueError:
+                data[k] = None
+    return data
+
+
+def append(entry_dict):
+    """Logni spool ga yozish (commit bilan). dedupe_key entry_dict ga ham qo'yiladi."""
+    entry_dict.setdefault('dedupe_key', make_dedupe_key(entry_dict))
+    conn = _connection()
+    conn.execute(
+        'INSERT INTO spool (dedupe_key, payload, created_at) VALUES (?, ?, ?)',
+        (entry_dict['dedupe_key'], _encode(entry_dict), time.time()),
+    )
+
+
+def fetch_pending(limit):
+    """Eng eski yozuvlar: [(spool_id, created_at, entry_dict), ...]."""
+    conn = _connection()
+    rows = conn.execute(
+        'SELECT id, created_at, payload FROM spool ORDER BY id LIMIT ?', (int(limit),)
+    ).fetchall()
+    out = []
+    for sid, created_at, payload in rows:
+        try:
+            out.append((sid, created_at, _decode(payload)))
+        except (ValueError, TypeError) as e:
+            logger.error("Spool yozuvi o'qilmadi (id=%s), o'tkazib yuboriladi: %s", sid, e)
+            out.append((sid, created_at, None))
+    return out
+
+
+def ack(spool_ids):
+    """face_logs ga yozilgan (yoki dublikat) yozuvlarni spool dan o'chirish."""
+    if not spool_ids:
+        return
+    conn = _connection()
+    for chunk in _chunks(spool_ids):
+        conn.execute('DELETE FROM spool WHERE id IN (%s)' % ','.join('?' * len(chunk)), chunk)
+
+
+def _chunks(ids, size=500):
+    ids = list(ids)
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
+def bury(spool_ids, error=None):
+    """Yozuvlarni dead_letter jadvaliga ko'chirish (o'chirilmaydi – requeue_dead_letters bilan qaytariladi)."""
+    if not spool_ids:
+        return 0
+    conn = _connection()
+    moved = 0
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        for chunk in _chunks(spool_ids):
+            marks = ','.join('?' * len(chunk))
+            moved += conn.execute(
+                'INSERT INTO dead_letter (dedupe_key, payload, created_at, attempts, last_error, failed_at) '
+                'SELECT dedupe_key, payload, created_at, attempts, ?, ? FROM spool WHERE id IN (%s) ORDER BY id' % marks,
+                [(str(error) if error else None), time.time()] + chunk,
+            ).rowcount
+            conn.execute('DELETE FROM spool WHERE id IN (%s)' % marks, chunk)
+        conn.execute('COMMIT')
+    except sqlite3.Error:
+        conn.execute('ROLLBACK')
+        raise
+    return moved
+
+
+def bury_entry(entry_dict, attempts, error=None):
+    """Spool ga tushmagan (xotiradagi) yozuvni to'g'ridan-to'g'ri dead_letter ga yozish."""
+    entry_dict.setdefault('dedupe_key', make_dedupe_key(entry_dict))
+    now = time.time()
+    _connection().execute(
+        'INSERT INTO dead_letter (dedupe_key, payload, created_at, attempts, last_error, failed_at) '
+        'VALUES (?, ?, ?, ?, ?, ?)',
+        (entry_dict['dedupe_key'], _encode(entry_dict), now, int(attempts), (str(error) if error else None), now),
+    )
+
+
+def fail(spool_ids, error=None, max_attempts=5):
+    """
+    Yozilmagan yozuvlar: spool da qoladi, attempts +1. max_attempts ga yetganlari dead_letter ga ko'chiriladi.
+    Qaytaradi: dead_letter ga tushganlar soni.
+    """
+    if not spool_ids:
+        return 0
+    conn = _connection()
+    exhausted = []
+    for chunk in _chunks(spool_ids):
+        marks = ','.join('?' * len(chunk))
+        conn.execute('UPDATE spool SET attempts = attempts + 1 WHERE id IN (%s)' % marks, chunk)
+        exhausted.extend(sid for (sid,) in conn.execute(
+            'SELECT id FROM spool WHERE id IN (%s) AND attempts >= ?' % marks, chunk + [int(max_attempts)]))
+    return bury(exhausted, error) if exhausted else 0
+
+
+def dead_letter_count():
+    try:
+        return _connection().execute('SELECT COUNT(*) FROM dead_letter').fetchone()[0]
+    except Exception:
+        return None
+
+
+def requeue_dead_letters():
+    """dead_letter dagi barcha yozuvlarni spool ga qaytarish (attempts 0 dan). Qaytaradi: soni."""
+    conn = _connection()
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        moved = conn.execute(
+            'INSERT INTO spool (dedupe_key, payload, created_at, attempts) '
+            'SELECT dedupe_key, payload, created_at, 0 FROM dead_letter ORDER BY id').rowcount
+        conn.execute('DELETE FROM dead_letter')
+        conn.execute('COMMIT')
+    except sqlite3.Error:
+        conn.execute('ROLLBACK')
+        raise
+    return moved
+
+
+def pending_count():
+    try:
+        return _connection().execute('SELECT COUNT(*) FROM spool').fetchone()[0]
+    except Exception:
+        return None
+
+
+def acquire_consumer_lease(ttl=LEASE_TTL_SEC):
+    """Consumer lease ni olish yoki uzaytirish. True – shu jarayon spool ni face_logs ga ko'chiradi."""
+    conn = _connection()
+    now = time.time()
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        row = conn.execute('SELECT owner, expires_at FROM consumer_lease WHERE name = ?', (LEASE_NAME,)).fetchone()
+        if row is None or row[0] == _owner_id or row[1] < now:
+            conn.execute(
+                'INSERT OR REPLACE INTO consumer_lease (name, owner, expires_at) VALUES (?, ?, ?)',
+                (LEASE_NAME, _owner_id, now + ttl),
+            )
+            conn.execute('COMMIT')
+            return True
+        conn.execute('COMMIT')
+        return False
+    except sqlite3.Error as e:
+        try:
+            conn.execute('ROLLBACK')
+        except sqlite3.Error:
+            pass
+        logger.warning("Spool lease olinmadi: %s", e)
+        return False
+
+
+def release_consumer_lease():
+    """Jarayon to'xtaganda lease ni bo'shatish – boshqa worker darhol consumer bo'ladi."""
+    if _spool_path is None:
+        return
+    try:
+        _connection().execute('DELETE FROM consumer_lease WHERE name = ? AND owner = ?', (LEASE_NAME, _owner_id))
+    except sqlite3.Error as e:
+        logger.debug("Spool lease bo'shatilmadi: %s", e)
@@ -0,0 +1,386 @@
+"""
+Face log yozuvchi – qurilmalardan kelgan loglarni spool dan batch qilib DB ga yozish.
+receive() logni diskdagi spool ga qo'yadi (app/services/face_log_spool.py); consumer lease egasi bo'lgan
+bitta jarayon har siklda FACE_LOG_BATCH_SIZE tagacha yoki FACE_LOG_FLUSH_INTERVAL_MS ichida yig'ilgan
+loglarni bitta bulk insert va bitta commit bilan yozadi. Ishga tushganda spool da qolganlar qayta yoziladi,
+dedupe_key (qurilma + voqea vaqti + xodim ID) tufayli har log face_logs ga faqat bir marta tushadi.
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from app.services import face_log_spool as spool
+from app.utils.face_log_parser import parse_face_log_fields
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL_MS = 500
+QUEUE_WARN_DEPTH = 500
+RATE_WINDOW_SEC = 60  # rows/sec shu oraliqdagi flushlar bo'yicha
+DB_RETRY_SEC = 5      # DB umuman yozilmasa, spool saqlanadi va shuncha kutiladi
+DEFAULT_MAX_ATTEMPTS = 5  # alohida yozilmagan log shuncha urinishdan keyin dead_letter ga
+
+# Spool ga yozib bo'lmasa (disk xatosi) – xotiradagi zaxira navbat, shu jarayonning o'zi yozadi
+_fallback_queue = queue.Queue()
+
+_app = None
+_worker_started = False
+_worker_lock = threading.Lock()
+_drain_lock = threading.Lock()  # worker va shutdown flush bir vaqtda spool ni ko'chirmasin
+_is_consumer = False
+
+_metrics_lock = threading.Lock()
+_metrics = {
+    'rows_written': 0,
+    'rows_duplicate': 0,
+    'rows_failed': 0,
+    'rows_dead_letter': 0,
+    'batches': 0,
+    'last_batch_size': 0,
+    'last_flush_ms': 0.0,
+    'max_flush_ms': 0.0,
+    'max_queue_depth': 0,
+    'last_flush_at': None,
+}
+_recent_flushes = deque()  # (time.monotonic(), rows)
+_commit_listeners = []  # fn(app) – yangi loglar face_logs ga commit qilingandan keyin
+
+
+def _batch_settings(app):
+    batch_size = int(app.config.get('FACE_LOG_BATCH_SIZE') or DEFAULT_BATCH_SIZE)
+    interval_ms = int(app.config.get('FACE_LOG_FLUSH_INTERVAL_MS') or DEFAULT_FLUSH_INTERVAL_MS)
+    return max(1, batch_size), max(10, interval_ms) / 1000.0
+
+
+def _max_attempts(app):
+    return max(1, int(app.config.get('FACE_LOG_MAX_ATTEMPTS') or DEFAULT_MAX_ATTEMPTS))
+
+
+def _ensure_spool(app):
+    if not spool.is_initialized():
+        spool.init_spool(app.instance_path, app.config.get('FACE_LOG_SPOOL_PATH') or None)
+
+
+def _row_from_entry(entry_dict):
+    """Navbat yozuvini face_logs jadvali qatoriga o'girish; raw_data dagi maydonlar shu yerda bir marta ajratiladi."""
+    row = parse_face_log_fields(entry_dict.get('raw_data'))
+    row.update({
+        'device_employee_id': entry_dict.get('device_employee_id'),
+        'person_name': entry_dict.get('person_name'),
+        'event_time': entry_dict.get('event_time'),
+        'direction': entry_dict.get('direction') or 'IN',
+        'device_ip': entry_dict.get('device_ip') or '',
+        'raw_data': entry_dict.get('raw_data'),
+        'picture_path': entry_dict.get('picture_path'),
+        'dedupe_key': entry_dict.get('dedupe_key') or spool.make_dedupe_key(entry_dict),
+        'created_at': entry_dict.get('received_at') or datetime.utcnow(),
+    })
+    return row
+
+
+def _existing_dedupe_keys(keys):
+    from app import db
+    from app.models import FaceLog
+
+    found = set()
+    keys = list(keys)
+    for i in range(0, len(keys), 500):
+        chunk = keys[i:i + 500]
+        found.update(k for (k,) in db.session.query(FaceLog.dedupe_key).filter(FaceLog.dedupe_key.in_(chunk)))
+    return found
+
+
+def _insert_rows(rows):
+    """
+    Qatorlarni bitta INSERT (executemany) va bitta commit bilan yozish; xato bo'lsa alohida-alohida.
+    Qaytaradi: (written, duplicate, failed) – failed: yozilmagan qatorlarning rows dagi indekslari.
+    """
+    from sqlalchemy.exc import IntegrityError
+    from app import db
+    from app.models import FaceLog
+
+    seen = _existing_dedupe_keys(r['dedupe_key'] for r in rows)
+    fresh = []
+    for i, r in enumerate(rows):
+        if r['dedupe_key'] in seen:
+            continue
+        seen.add(r['dedupe_key'])
+        fresh.append((i, r))
+    duplicate = len(rows) - len(fresh)
+    if not fresh:
+        return 0, duplicate, []
+    try:
+        db.session.execute(db.insert(FaceLog), [r for _, r in fresh])
+        db.session.commit()
+        return len(fresh), duplicate, []
+    except Exception as e:
+        db.session.rollback()
+        logger.warning("Face log batch yozilmadi (%d ta), alohida yoziladi: %s", len(fresh), e)
+    written, failed = 0, []
+    for i, row in fresh:
+        try:
+            db.session.execute(db.insert(FaceLog), [row])
+            db.session.commit()
+            written += 1
+        except IntegrityError:
+            db.session.rollback()
+            duplicate += 1
+        except Exception as e:
+            db.session.rollback()
+            failed.append(i)
+            logger.exception("Face log yozishda xato: %s", e)
+    return written, duplicate, failed
+
+
+def _record_flush(rows, written, duplicate, failed, elapsed_ms):
+    now = time.monotonic()
+    with _metrics_lock:
+        _metrics['rows_written'] += written
+        _metrics['rows_duplicate'] += duplicate
+        _metrics['rows_failed'] += len(failed)
+        _metrics['batches'] += 1
+        _metrics['last_batch_size'] = rows
+        _metrics['last_flush_ms'] = round(elapsed_ms, 2)
+        _metrics['max_flush_ms'] = max(_metrics['max_flush_ms'], round(elapsed_ms, 2))
+        _metrics['last_flush_at'] = datetime.utcnow().isoformat() + 'Z'
+        _recent_flushes.append((now, written))
+        while _recent_flushes and now - _recent_flushes[0][0] > RATE_WINDOW_SEC:
+            _recent_flushes.popleft()
+
+
+def _write_entries(app, entries):
+    """Yozuvlarni DB ga yozish. Qaytaradi: (written, duplicate, failed) – failed: entries dagi indekslar."""
+    started = time.perf_counter()
+    written, duplicate, failed = 0, 0, list(range(len(entries)))
+    rows = []
+    try:
+        with app.app_context():
+            rows = [_row_from_entry(e) for e in entries]
+            written, duplicate, failed = _insert_rows(rows)
+    except Exception as e:
+        logger.exception("Face log batch yozishda xato: %s", e)
+    _record_flush(len(entries), written, duplicate, failed, (time.perf_counter() - started) * 1000)
+    if written:
+        _notify_commit(app, rows)
+    return written, duplicate, failed
+
+
+def add_commit_listener(fn):
+    """
+    Batch commit qilingandan keyin chaqiriladigan funksiya fn(app, rows) – dashboard holati, davomat va h.k.
+    rows – batch dagi qatorlar (dublikatlar ham bo'lishi mumkin, listener idempotent bo'lishi kerak).
+    """
+    if fn not in _commit_listeners:
+        _commit_listeners.append(fn)
+
+
+def _notify_commit(app, rows):
+    for fn in list(_commit_listeners):
+        try:
+            fn(app, rows)
+        except Exception as e:
+            logger.warning("Face log commit listener xatosi: %s", e)
+
+
+def _drain_fallback(app, batch_size):
+    batch = []
+    while len(batch) < batch_size:
+        try:
+            batch.append(_fallback_queue.get_nowait())
+        except queue.Empty:
+            break
+    if not batch:
+        return 0
+    written, duplicate, failed = _write_entries(app, batch)
+    # Yozilmaganlar navbatga qaytadi; boshqa qatorlar yozilgan bo'lsa (DB ishlayapti) urinish sanaladi va
+    # FACE_LOG_MAX_ATTEMPTS dan keyin spool ning dead_letter jadvaliga o'tkaziladi
+    partial = bool(written or duplicate)
+    max_attempts = _max_attempts(app)
+    for i in failed:
+        entry = batch[i]
+        if partial:
+            entry['_attempts'] = entry.get('_attempts', 0) + 1
+        if entry.get('_attempts', 0) >= max_attempts and _bury_fallback_entry(entry):
+            continue
+        _fallback_queue.put_nowait(entry)
+    return len(batch) - len(failed)
+
+
+def _bury_fallback_entry(entry):
+    """Xotiradagi yozuvni spool orqali dead_letter ga; spool hali ishlamasa False (navbatda qoladi)."""
+    try:
+        _ensure_spool(_app)
+        spool.bury_entry(dict(entry), entry.get('_attempts', 0), 'insert failed')
+    except Exception as e:
+        logger.warning("Face log dead_letter ga yozilmadi, navbatda qoladi: %s", e)
+        return False
+    with _metrics_lock:
+        _metrics['rows_dead_letter'] += 1
+    logger.error("Face log %d urinishdan keyin dead_letter ga o'tkazildi: %s", entry.get('_attempts', 0),
+                 entry.get('dedupe_key'))
+    return True
+
+
+def _drain_spool_once(app, batch_size, flush_interval, wait=True):
+    """
+    Spool dan bitta batch ni face_logs ga ko'chirish. Batch to'lmagan bo'lsa, eng eski yozuv
+    flush_interval dan yosh bo'lsa kutib, qo'shimcha yozuvlarni yig'adi.
+    """
+    pending = spool.fetch_pending(batch_size)
+    if not pending:
+        return 0
+    if wait and len(pending) < batch_size:
+        age = time.time() - pending[0][1]
+        if age < flush_interval:
+            time.sleep(flush_interval - age)
+            pending = spool.fetch_pending(batch_size)
+    broken = [sid for sid, _, e in pending if e is None]
+    if broken:
+        spool.bury(broken, "payload o'qilmadi")
+    pending = [(sid, e) for sid, _, e in pending if e is not None]
+    if not pending:
+        return len(broken)
+    written, duplicate, failed = _write_entries(app, [e for _, e in pending])
+    if failed and not (written or duplicate):
+        # DB ga umuman yozib bo'lmadi – spool da qoladi (urinish sanalmaydi), keyinroq qayta urinish
+        time.sleep(DB_RETRY_SEC)
+        return len(broken)
+    failed_ids = [pending[i][0] for i in failed]
+    failed_set = set(failed_ids)
+    spool.ack([sid for sid, _ in pending if sid not in failed_set])
+    if failed_ids:
+        # Qolganlari yozildi – bu yozuvlarning o'zida muammo (yoki vaqtinchalik qulf): spool da qoladi
+        buried = spool.fail(failed_ids, 'insert failed', _max_attempts(app))
+        if buried:
+            with _metrics_lock:
+                _metrics['rows_dead_letter'] += buried
+            logger.error("Face log: %d ta yozuv %d urinishdan keyin dead_letter ga o'tkazildi",
+                         buried, _max_attempts(app))
+    return len(broken) + len(pending) - len(failed_ids)
+
+
+def _update_depth_metric():
+    depth = (spool.pending_count() or 0) + _fallback_queue.qsize()
+    with _metrics_lock:
+        if depth > _metrics['max_queue_depth']:
+            _metrics['max_queue_depth'] = depth
+    if depth > QUEUE_WARN_DEPTH:
+        logger.warning("Face log navbati o'smoqda: %d ta", depth)
+
+
+def start_face_log_worker(app):
+    """Spool ni DB ga batch qilib yozadigan worker ni ishga tushirish (bir marta). Spool da qolganlar qayta yoziladi."""
+    global _app, _worker_started
+    with _worker_lock:
+        if _worker_started:
+            return
+        _worker_started = True
+        _app = app
+
+    _ensure_spool(app)
+    batch_size, flush_interval = _batch_settings(app)
+    lease_every = spool.LEASE_TTL_SEC / 3.0
+
+    def _worker():
+        global _is_consumer
+        last_lease = 0.0
+        while True:
+            try:
+                if time.monotonic() - last_lease >= lease_every:
+                    _is_consumer = spool.acquire_consumer_lease()
+                    last_lease = time.monotonic()
+                    _update_depth_metric()
+                with _drain_lock:
+                    moved = _drain_fallback(app, batch_size)
+                    if _is_consumer:
+                        moved += _drain_spool_once(app, batch_size, flush_interval)
+                if not moved:
+                    time.sleep(flush_interval)
+            except Exception as e:
+                logger.exception("Face log worker xatosi: %s", e)
+                time.sleep(1)
+
+    threading.Thread(target=_worker, daemon=True, name='face-log-writer').start()
+    atexit.register(flush_face_log_queue)
+    try:
+        from app.services.updater import register_shutdown_hook
+        register_shutdown_hook(flush_face_log_queue)
+    except Exception:
+        pass
+    logger.info(
+        "Face log worker ishga tushdi (batch=%d, interval=%d ms, spool=%s ta)",
+        batch_size, int(flush_interval * 1000), spool.pending_count(),
+    )
+
+
+def enqueue_face_log(entry_dict):
+    """Logni diskdagi spool ga qo'shish; so'rov tez qaytadi, DB yozuvi keyinroq worker tomonidan."""
+    entry_dict.setdefault('received_at', datetime.utcnow())
+    try:
+        if not spool.is_initialized():
+            from flask import current_app
+            _ensure_spool(current_app._get_current_object())
+        spool.append(entry_dict)
+    except Exception as e:
+        logger.error("Face log spool ga yozilmadi, xotiradagi navbatga qo'yildi: %s", e)
+        entry_dict.setdefault('dedupe_key', spool.make_dedupe_key(entry_dict))
+        _fallback_queue.put_nowait(entry_dict)
+
+
+def flush_face_log_queue(timeout=10.0):
+    """
+    To'xtash oldidan: xotiradagi zaxira navbatni va (consumer bo'lsa) spool ni yozish, lease ni bo'shatish.
+    Spool diskda saqlangani uchun yozilmay qolganlar keyingi ishga tushishda yoziladi.
+    """
+    app = _app
+    if app is None:
+        return 0
+    batch_size, flush_interval = _batch_settings(app)
+    deadline = time.monotonic() + timeout
+    moved = 0
+    if not _drain_lock.acquire(timeout=timeout):
+        return 0
+    try:
+        while time.monotonic() < deadline:
+            n = _drain_fallback(app, batch_size)
+            if _is_consumer or spool.acquire_consumer_lease():
+                n += _drain_spool_once(app, batch_size, flush_interval, wait=False)
+            if not n:
+                break
+            moved += n
+        spool.release_consumer_lease()
+    finally:
+        _drain_lock.release()
+    if moved:
+        logger.info("Face log navbati to'xtash oldidan yozildi: %d ta", moved)
+    return moved
+
+
+def get_face_log_metrics():
+    """Back-pressure ko'rsatkichlari: navbat chuqurligi, flush kechikishi, rows/sec."""
+    now = time.monotonic()
+    with _metrics_lock:
+        out = dict(_metrics)
+        recent = [(ts, n) for ts, n in _recent_flushes if now - ts <= RATE_WINDOW_SEC]
+    if recent:
+        span = max(1.0, now - recent[0][0])
+        out['rows_per_sec'] = round(sum(n for _, n in recent) / span, 2)
+    else:
+        out['rows_per_sec'] = 0.0
+    pending = spool.pending_count() if spool.is_initialized() else None
+    out['spool_pending'] = pending
+    out['fallback_depth'] = _fallback_queue.qsize()
+    out['dead_letter'] = spool.dead_letter_count() if spool.is_initialized() else None
+    out['queue_depth'] = (pending or 0) + out['fallback_depth']
+    out['worker_running'] = _worker_started
+    out['is_consumer'] = _is_consumer
+    if _app is not None:
+        batch_size, flush_interval = _batch_settings(_app)
+        out['batch_size'] = batch_size
+        out['flush_interval_ms'] = int(flush_interval * 1000)
+    return out
@@ -0,0 +1,142 @@
+"""
+Tashqi HTTP so'rovlar uchun umumiy klient – har host (scheme://host:port) uchun bitta requests.Session.
+Keep-alive pool (TCP/TLS ulanish qayta ishlatiladi), idempotent so'rovlar uchun backoff bilan qayta
+urinish (502/503/504 va ulanish xatolari) va host bo'yicha ulanish timeouti.
+Chaqiruvchining timeout qiymati o'qish (read) timeouti sifatida saqlanadi.
+"""
+import logging
+import os
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'HTTP_POOL_MAXSIZE': 10,
+    'HTTP_RETRIES': 2,
+    'HTTP_RETRY_BACKOFF': 0.5,
+    'HTTP_CONNECT_TIMEOUT': 5.0,
+    'HTTP_HOST_TIMEOUTS': '',
+}
+RETRY_STATUSES = (502, 503, 504)
+
+_sessions = {}   # 'https://host:port' -> Session
+_lock = threading.Lock()
+_settings = None
+
+
+def _load_settings():
+    try:
+        from flask import current_app
+        cfg = current_app.config
+        get = lambda k: cfg.get(k, os.environ.get(k))
+    except RuntimeError:
+        get = os.environ.get
+    out = {}
+    for key, default in DEFAULTS.items():
+        raw = get(key)
+        try:
+            out[key] = type(default)(raw) if raw not in (None, '') else default
+        except (TypeError, ValueError):
+            out[key] = default
+    host_timeouts = {}
+    for item in (out['HTTP_HOST_TIMEOUTS'] or '').split(','):
+        host, _, sec = item.partition('=')
+        try:
+            if host.strip() and sec.strip():
+                host_timeouts[host.strip().lower()] = float(sec)
+        except ValueError:
+            logger.warning("HTTP_HOST_TIMEOUTS noto'g'ri qiymat: %s", item)
+    out['host_timeouts'] = host_timeouts
+    return out
+
+
+def _get_settings():
+    global _settings
+    if _settings is None:
+        _settings = _load_settings()
+    return _settings
+
+
+def _origin(url):
+    parts = urlsplit(url)
+    return '%s://%s' % (parts.scheme.lower(), parts.netloc.lower()), (parts.hostname or '').lower()
+
+
+def _new_session(settings):
+    retry = Retry(
+        total=settings['HTTP_RETRIES'],
+        connect=settings['HTTP_RETRIES'],
+        read=0,  # javob kelmay qolgan so'rov qayta yuborilmaydi (uzoq yuklab olish, SSE)
+        status=settings['HTTP_RETRIES'],
+        backoff_factor=settings['HTTP_RETRY_BACKOFF'],
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,  # POST qayta yuborilmaydi (Zoom meeting ikki marta yaratilmasin)
+        raise_on_status=False,  # urinishlar tugasa oxirgi javob qaytadi – chaqiruvchi status_code ni tekshiradi
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings['HTTP_POOL_MAXSIZE'], max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_session(url):
+    """URL host i uchun umumiy Session (birinchi chaqiruvda yaratiladi)."""
+    key, _ = _origin(url)
+    session = _sessions.get(key)
+    if session is None:
+        with _lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = _new_session(_get_settings())
+                _sessions[key] = session
+    return session
+
+
+def _timeout(host, timeout):
+    """(connect, read): connect – host bo'yicha, read – chaqiruvchi bergan qiymat."""
+    if isinstance(timeout, tuple):
+        return timeout
+    settings = _get_settings()
+    connect = settings['host_timeouts'].get(host, settings['HTTP_CONNECT_TIMEOUT'])
+    read = timeout if timeout is not None else 30
+    return (min(connect, read), read)
+
+
+def request(method, url, timeout=None, **kwargs):
+    """requests.request bilan bir xil, lekin host Session i orqali."""
+    _, host = _origin(url)
+    return get_session(url).request(method, url, timeout=_timeout(host, timeout), **kwargs)
+
+
+def get(url, **kwargs):
+    return request('GET', url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request('POST', url, **kwargs)
+
+
+def close_all():
+    """Barcha Session larni yopish (sozlamalar qayta o'qiladi)."""
+    global _settings
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+        _settings = None
+    for s in sessions:
+        try:
+            s.close()
+        except Exception:
+            pass
+
+
+def get_pool_stats():
+    """Ochiq Session lar (host bo'yicha) – diagnostika uchun."""
+    with _lock:
+        return sorted(_sessions.keys())
@@ -0,0 +1,95 @@
+"""
+Rol ruxsatlari matritsasi – rol -> frozenset(ruxsatlar), role_permission jadvalidan bir marta tuziladi.
+DB da yozuvi bo'lmagan rol uchun DEFAULT_PERMISSIONS ishlatiladi; '__configured__' belgisi
+"rol sozlangan, ruxsat yo'q" degani. Rollar sozlamasi saqlanganda invalidate() versiya belgisini
+(instance/role_permissions.version) yangilaydi, boshqa workerlar uni soniyasiga bir marta tekshiradi.
+"""
+import threading
+import time
+
+from app.services.settings_cache import VERSION_CHECK_SEC, read_version_token, write_version_token
+
+VERSION_FILENAME = 'role_permissions.version'
+CONFIGURED_MARKER = '__configured__'
+
+# Rol uchun DB da yozuv bo'lmaganda ishlatiladigan ruxsatlar
+DEFAULT_PERMISSIONS = {
+    'admin': ['view_admin_panel', 'view_users', 'create_user', 'edit_user', 'delete_user', 'toggle_user', 'reset_user_password',
+              'view_staff', 'create_staff', 'edit_staff', 'delete_staff', 'view_students', 'create_student', 'edit_student', 'delete_student',
+              'view_faculties', 'create_faculty', 'edit_faculty', 'delete_faculty', 'view_directions', 'create_direction', 'edit_direction', 'delete_direction',
+              'manage_groups', 'create_group', 'edit_group', 'delete_group', 'view_subjects', 'create_subject', 'edit_subject', 'delete_subject',
+              'view_curriculum', 'edit_curriculum', 'view_schedule', 'create_schedule', 'edit_schedule', 'delete_schedule',
+              'view_reports', 'view_grade_scale', 'manage_grade_scale', 'view_teachers', 'assign_teachers',
+              'export_subjects', 'import_subjects', 'import_schedule', 'import_students', 'import_staff',
+              'view_announcements', 'send_message', 'view_messages', 'view_departments', 'create_department', 'edit_department', 'delete_department'],
+    'dean': ['view_dean_panel', 'view_subjects', 'view_students', 'view_teachers', 'view_reports',
+             'create_announcement', 'manage_groups', 'assign_teachers',
+             'dean_manage_students', 'dean_manage_directions', 'dean_manage_groups',
+             'dean_manage_curriculum', 'dean_manage_teachers', 'dean_manage_schedule',
+             'view_announcements', 'send_message', 'view_messages'],
+    'edu_dept': ['view_directions', 'view_curriculum', 'edit_curriculum',
+                 'view_subjects', 'create_subject'],
+    'department_head': ['view_admin_panel', 'view_subjects',
+                       'create_subject', 'view_teachers', 'assign_teachers'],
+    'teacher': ['view_subjects', 'view_students', 'create_lesson', 'edit_lesson', 'delete_lesson',
+                'create_assignment', 'edit_assignment', 'delete_assignment',
+                'grade_students', 'view_submissions', 'create_announcement',
+                'view_announcements', 'send_message', 'view_messages'],
+    'student': ['view_subjects', 'view_lessons', 'submit_assignment', 'view_grades', 'view_announcements', 'send_message', 'view_messages'],
+    'accounting': ['view_accounting', 'view_students', 'view_reports', 'manage_payments', 'manage_contracts', 'view_contract_amounts', 'import_payments',
+                  'view_announcements', 'send_message', 'view_messages'],
+    'xodim': ['view_subjects', 'view_students', 'create_lesson', 'edit_lesson', 'delete_lesson',
+              'create_assignment', 'edit_assignment', 'delete_assignment',
+              'grade_students', 'view_submissions', 'create_announcement',
+              'view_announcements', 'send_message', 'view_messages'],
+}
+
+_DEFAULT_MATRIX = {role: frozenset(perms) for role, perms in DEFAULT_PERMISSIONS.items()}
+_EMPTY = frozenset()
+
+_matrix = None         # {role: frozenset}
+_matrix_token = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def _load():
+    from app import db
+    from app.models import RolePermission
+    configured = {}
+    for role, perm in db.session.query(RolePermission.role, RolePermission.permission).all():
+        perms = configured.setdefault(role, set())
+        if perm and perm != CONFIGURED_MARKER:
+            perms.add(perm)
+    matrix = dict(_DEFAULT_MATRIX)
+    matrix.update({role: frozenset(perms) for role, perms in configured.items()})
+    return matrix
+
+
+def get_matrix():
+    """Rol -> frozenset(ruxsatlar). Versiya belgisi VERSION_CHECK_SEC da bir marta tekshiriladi."""
+    global _matrix, _matrix_token, _checked_at
+    now = time.monotonic()
+    with _lock:
+        if _matrix is not None and now - _checked_at < VERSION_CHECK_SEC:
+            return _matrix
+        token = read_version_token(VERSION_FILENAME)
+        _checked_at = now
+        if _matrix is not None and token == _matrix_token:
+            return _matrix
+        _matrix = _load()
+        _matrix_token = token
+        return _matrix
+
+
+def get_role_permissions(role):
+    """Rol ruxsatlari (frozenset); noma'lum rol uchun bo'sh to'plam."""
+    return get_matrix().get(role, _EMPTY)
+
+
+def invalidate():
+    """Rol ruxsatlari o'zgardi – barcha workerlarda matritsa qayta tuziladi."""
+    global _matrix
+    with _lock:
+        _matrix = None
+    write_version_token(VERSION_FILENAME)
@@ -0,0 +1,71 @@
+"""
+Asosiy so'rovlar indeks ishlatishini tekshirish (SQLite: EXPLAIN QUERY PLAN).
+Har tekshiruv – sahifalardagi haqiqiy so'rov shakli va kutilgan indeks nomi.
+flask query-plan-check orqali ishga tushiriladi; indeks yo'qolsa yoki so'rov o'zgarib
+indeksdan foydalanmay qolsa – xato bilan tugaydi.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _checks():
+    """(nom, so'rov, kutilgan indeks) ro'yxati."""
+    from app.models import (Message, TeacherSubject, Lesson, LessonView, Submission,
+                            DirectionCurriculum, StudentPayment, User)
+    return (
+        ('chat_thread',
+         Message.query.filter(
+             ((Message.sender_id == 1) & (Message.receiver_id == 2)) |
+             ((Message.sender_id == 2) & (Message.receiver_id == 1))
+         ).order_by(Message.created_at.asc()),
+         'ix_message_sender_receiver_created'),
+        ('unread_messages',
+         Message.query.filter(Message.receiver_id == 1, Message.is_read == False),
+         'ix_message_receiver_read'),
+        ('teacher_subject_lookup',
+         TeacherSubject.query.filter(TeacherSubject.subject_id == 1, TeacherSubject.group_id == 2,
+                                     TeacherSubject.lesson_type == 'amaliyot'),
+         'ix_teacher_subject_subject_group_type'),
+        ('lessons_by_direction',
+         Lesson.query.filter_by(subject_id=1, direction_id=2).order_by(Lesson.order),
+         'ix_lesson_subject_direction_type_order'),
+        ('lesson_view_lookup',
+         LessonView.query.filter_by(lesson_id=1, student_id=2),
+         'ix_lesson_view_lesson_student'),
+        ('submission_lookup',
+         Submission.query.filter_by(student_id=1, assignment_id=2),
+         'ix_submission_student_assignment'),
+        ('curriculum_for_group',
+         DirectionCurriculum.query.filter(DirectionCurriculum.direction_id == 1, DirectionCurriculum.semester == 2),
+         'ix_direction_curriculum_dir_sem_year_type'),
+        ('student_payments',
+         StudentPayment.query.filter_by(student_id=1),
+         'ix_student_payment_student'),
+        ('group_students',
+         User.query.filter_by(role='student', group_id=1).order_by(User.full_name),
+         'ix_user_role_group'),
+    )
+
+
+def explain(conn, query):
+    """So'rov rejasi: detail qatorlari ro'yxati."""
+    sql = str(query.statement.compile(dialect=conn.dialect, compile_kwargs={'literal_binds': True}))
+    return [row[-1] for row in conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + sql)]
+
+
+def check_query_plans():
+    """
+    Qaytaradi: [{'name', 'index', 'ok', 'plan'}, ...]; SQLite bo'lmasa – None.
+    ok – rejada kutilgan indeks ishlatilgan.
+    """
+    from app import db
+    if db.engine.dialect.name != 'sqlite':
+        return None
+    results = []
+    with db.engine.connect() as conn:
+        for name, query, index in _checks():
+            plan = explain(conn, query)
+            ok = any(index in line for line in plan)
+            results.append({'name': name, 'index': index, 'ok': ok, 'plan': plan})
+    return results
@@ -87,10 +87,10 @@ def update_version_json(app, version: str, zip_filename: str):
 
 def trigger_update_broadcast(app):
     """Markazda trigger-update ni chaqiradi – barcha SSE ulangan institutlar xabar oladi."""
-    import requests
+    from app.services import http_client
     url = 'http://127.0.0.1/central-api/api/trigger-update'
     try:
-        r = requests.post(url, timeout=10)
+        r = http_client.post(url, timeout=10)
         if r.status_code == 200:
             logger.info("Institutlarga yangilanish xabari yuborildi")
         else:
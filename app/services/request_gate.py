@@ -0,0 +1,194 @@
+"""
+Yagona before_request darvozasi: qayta ishga tushirish belgisi, markaz bloki, markazdan blok va ruxsat.
+Rejim (central / institute / standalone) ishga tushishda bir marta aniqlanadi. Markaz bloki xotirada
+(central_api.get_center_block_cached), RESTART_REQUIRED esa updater o'rnatadigan restart_requested
+orqali; boshqa jarayon (flask run-update) yozgan fayl RESTART_POLL_SEC da bir marta tekshiriladi.
+"""
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+from flask import Response, request
+
+MODE_CENTRAL = 'central'
+MODE_INSTITUTE = 'institute'
+MODE_STANDALONE = 'standalone'
+
+RESTART_POLL_SEC = 5.0
+
+CENTER_ALLOW_PATHS = ('/static', '/central-api', '/admin/update', '/auth/login', '/auth/logout', '/.well-known')
+INSTITUTE_SKIP_PATHS = ('/static', '/face-api/receive', '/face-api/receive.php', '/face-api/ping', '/.well-known', '/central-api')
+# CENTRAL_STATUS_FAIL_CLOSED da holat noma'lum bo'lsa ham ochiq – kirish va yangilash (URL ni tuzatish)
+STATUS_PENDING_ALLOW_PATHS = ('/login', '/logout', '/forgot-password', '/reset-password', '/admin/update')
+
+_PAGE_STYLE = '''<style>body{font-family:sans-serif;text-align:center;padding:80px;background:#f5f5f5;}
+.box{background:#fff;padding:40px;border-radius:8px;max-width:500px;margin:0 auto;box-shadow:0 2px 10px rgba(0,0,0,0.1);}
+h1{color:%s;}p{color:#666;}</style>'''
+
+
+def _restart_page(version):
+    html = f'''<!DOCTYPE html><html><head><meta charset="utf-8"><meta http-equiv="refresh" content="5;url=/"><title>Yangilanish</title>
+{_PAGE_STYLE % '#0a0'}</head><body>
+<div class="box"><h1>Yangilanish mavjud</h1><p>Versiya: {version}</p><p>Qayta ishga tushirilmoqda (5 soniya)...</p></div></body></html>'''
+    return Response(html, status=200, mimetype='text/html; charset=utf-8')
+
+
+def _blocked_page(reason, extra=''):
+    html = f'''<!DOCTYPE html><html><head><meta charset="utf-8"><title>Tizim bloklangan</title>
+{_PAGE_STYLE % '#c00'}</head><body>
+<div class="box"><h1>Tizim bloklangan</h1><p>{reason}</p>
+<p>Tizim Administratorlari bilan bog'laning.</p>{extra}</div></body></html>'''
+    return Response(html, status=403, mimetype='text/html; charset=utf-8')
+
+
+def _status_pending_page():
+    html = f'''<!DOCTYPE html><html><head><meta charset="utf-8"><meta http-equiv="refresh" content="10"><title>Tekshirilmoqda</title>
+{_PAGE_STYLE % '#c80'}</head><body>
+<div class="box"><h1>Tizim holati tekshirilmoqda</h1><p>Markaziy server bilan aloqa o'rnatilmoqda.</p>
+<p>Bir necha soniyadan keyin sahifa yangilanadi.</p></div></body></html>'''
+    resp = Response(html, status=503, mimetype='text/html; charset=utf-8')
+    resp.headers['Retry-After'] = '10'
+    return resp
+
+
+def resolve_mode(config):
+    """Konfiguratsiyadan rejim: markaz, institut (markazga ulangan) yoki mustaqil."""
+    url = (config.get('CENTRAL_API_URL') or '').strip()
+    if config.get('IS_CENTRAL_SERVER'):
+        return MODE_CENTRAL
+    if url.startswith(('http://', 'https://')):
+        return MODE_INSTITUTE
+    return MODE_STANDALONE
+
+
+class RequestGate:
+    """app.before_request(RequestGate(app)) – eski uchta hook o'rniga."""
+
+    def __init__(self, app):
+        from app.services import updater
+        self.app = app
+        self.updater = updater
+        url = (app.config.get('CENTRAL_API_URL') or '').strip()
+        self.mode = resolve_mode(app.config)
+        # Markaz bloki: markaz serveri va CENTRAL_API_URL umuman berilmagan o'rnatish (eski xatti-harakat)
+        self.check_center_block = bool(app.config.get('IS_CENTRAL_SERVER')) or not url
+        self.check_institute = self.mode == MODE_INSTITUTE
+        self.central_host = urlparse(url).netloc.split(':')[0].lower() if self.check_institute else ''
+        self.restart_flag = Path(app.root_path).resolve().parent / updater.RESTART_FLAG
+        self._restart_checked_at = 0.0
+
+    def __call__(self):
+        resp = self._check_restart()
+        if resp is None and self.check_center_block:
+            resp = self._check_center_block()
+        if resp is None and self.check_institute:
+            resp = self._check_institute()
+        return resp
+
+    def _restart_pending(self):
+        if self.updater.restart_requested.is_set():
+            return True
+        now = time.monotonic()
+        if now - self._restart_checked_at < RESTART_POLL_SEC:
+            return False
+        self._restart_checked_at = now
+        return self.restart_flag.exists()
+
+    def _check_restart(self):
+        if not self._restart_pending():
+            return None
+        self.updater.restart_requested.clear()
+        try:
+            version = self.restart_flag.read_text(encoding='utf-8').strip()
+        except Exception:
+            version = ''
+        try:
+            self.restart_flag.unlink()
+        except Exception:
+            pass
+        self.updater.schedule_restart()
+        return _restart_page(version)
+
+    def _check_center_block(self):
+        try:
+            from app.central_api import get_center_block_cached
+            st = get_center_block_cached()
+        except Exception:
+            return None
+        if not st.get('blocked'):
+            return None
+        path = (request.path or '').rstrip('/')
+        if path.startswith(CENTER_ALLOW_PATHS):
+            return None
+        reason = st.get('block_reason') or 'Markaz vaqtincha bloklangan.'
+        return _blocked_page(reason, '<p><a href="/admin/update">Tizim yangilanishi (blokni olish)</a></p>')
+
+    def _check_institute(self):
+        # CENTRAL_API_URL o'zimizga qaraydi – markaz rejimi, bloklanmaydi
+        request_host = (request.host or '').split(':')[0].lower()
+        if self.central_host and request_host == self.central_host:
+            return None
+        path = (request.path or '').rstrip('/')
+        if path.startswith(INSTITUTE_SKIP_PATHS):
+            return None
+        from app.services.central_client import get_status, check_blueprint_permission
+        status = get_status(use_cache=True)
+        if status.get('unknown'):
+            # CENTRAL_STATUS_FAIL_CLOSED: markazdan hali javob yo'q va saqlangan holat ham yo'q
+            if path.startswith(STATUS_PENDING_ALLOW_PATHS):
+                return None
+            return _status_pending_page()
+        if status.get('blocked'):
+            return _blocked_page(status.get('block_reason') or 'Tizim vaqtincha bloklangan.')
+        # Ruxsat tekshiruvi – blueprint bo'yicha
+        bp = request.blueprint
+        if bp and not check_blueprint_permission(bp):
+            from flask import redirect, url_for
+            try:
+                return redirect(url_for('main.dashboard'))
+            except Exception:
+                from flask import abort
+                abort(403)
+        return None
+
+
+def _legacy_checks(app):
+    """Eski uchta hook ning har so'rovdagi ishi (faqat benchmark uchun, javob qaytarmaydi)."""
+    from app.services.updater import RESTART_FLAG
+    from app.services.central_client import is_central_enabled, get_status, check_blueprint_permission
+    (Path(app.root_path).resolve().parent / RESTART_FLAG).exists()
+    url = (app.config.get('CENTRAL_API_URL') or '').strip()
+    is_central = app.config.get('IS_CENTRAL_SERVER') or not url
+    if is_central:
+        from app.central_api import get_center_block_status
+        get_center_block_status()
+    if not is_central_enabled():
+        return
+    if not is_central and url:
+        central_host = urlparse(url).netloc.split(':')[0].lower()
+        request_host = (request.host or '').split(':')[0].lower()
+        if central_host and request_host and central_host == request_host:
+            is_central = True
+    if is_central:
+        return
+    path = (request.path or '').rstrip('/')
+    if any(path.startswith(p) for p in INSTITUTE_SKIP_PATHS):
+        return
+    if not get_status(use_cache=True).get('blocked') and request.blueprint:
+        check_blueprint_permission(request.blueprint)
+
+
+def benchmark(app, path='/dashboard', iterations=20000):
+    """Har so'rovga qo'shimcha vaqt (mikrosoniya): eski hooklar va RequestGate. Qaytaradi: dict."""
+    gate = RequestGate(app)
+    if gate._restart_pending():
+        raise RuntimeError("RESTART_REQUIRED mavjud – benchmark darvozani ishga tushirsa jarayon qayta ishga tushadi")
+    result = {'mode': gate.mode, 'path': path, 'iterations': iterations}
+    with app.test_request_context(path):
+        for name, fn in (('legacy_us', lambda: _legacy_checks(app)), ('gate_us', gate)):
+            fn()  # isitish (kesh, importlar)
+            started = time.perf_counter()
+            for _ in range(iterations):
+                fn()
+            result[name] = round((time.perf_counter() - started) * 1e6 / iterations, 2)
+    return result
@@ -0,0 +1,168 @@
+"""
+Rejalashtirilgan ishlar – bitta jarayonda (lider). Har worker create_app da start_scheduler chaqiradi,
+lekin BackgroundScheduler faqat instance/scheduler.lock fayl qulfini olgan jarayonda ishlaydi.
+Qolganlar SCHEDULER_LEADER_RETRY_SEC da bir qulfni qayta tekshiradi: lider jarayon to'xtasa
+(qulfni OS bo'shatadi) boshqasi o'rnini egallaydi.
+
+Ishlar register_job bilan ro'yxatga olinadi (davomat, keyinchalik log tozalash, yig'ma hisoblar);
+oxirgi ishga tushish vaqti, davomiyligi va natijasi instance/scheduler_state.json da – istalgan jarayon
+(flask scheduler-status) o'qiy oladi.
+"""
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+LOCK_FILENAME = 'scheduler.lock'
+STATE_FILENAME = 'scheduler_state.json'
+
+_jobs = {}              # job_id -> {'func', 'trigger', 'trigger_args', 'description'}
+_state_lock = threading.Lock()
+_leader = {'lock': None, 'scheduler': None, 'watcher': None}
+
+
+def register_job(job_id, func, trigger='cron', description='', **trigger_args):
+    """
+    Ish qo'shish. func(app) – app context ichida chaqiriladi; trigger/trigger_args – APScheduler
+    add_job bilan bir xil (masalan trigger='cron', hour=0, minute=5 yoki trigger='interval', hours=6).
+    """
+    _jobs[job_id] = {'func': func, 'trigger': trigger, 'trigger_args': trigger_args, 'description': description}
+
+
+def registered_jobs():
+    return dict(_jobs)
+
+
+def _run_daily_attendance(app):
+    from datetime import date, timedelta
+    from app.services.attendance_service import compute_daily_attendance
+    yesterday = date.today() - timedelta(days=1)
+    compute_daily_attendance(yesterday)
+    app.logger.info("Daily attendance computed for %s", yesterday)
+
+
+def register_default_jobs():
+    # Davomat – loglar kelishi bilan yangilanadi (attendance_service.materialize_logs);
+    # har kuni 00:05 da kechagi kun to'liq qayta hisoblanadi (kelmaganlar, reconciliation)
+    register_job('daily_attendance', _run_daily_attendance, 'cron', hour=0, minute=5,
+                 description="Kechagi kun davomatini qayta hisoblash")
+
+
+def _state_path(app):
+    return os.path.join(app.instance_path, STATE_FILENAME)
+
+
+def read_state(app):
+    try:
+        with open(_state_path(app), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'leader': None, 'jobs': {}}
+
+
+def _update_state(app, **changes):
+    """state faylini o'qib-yozish (faqat lider yozadi; ichki threadlar orasida _state_lock)."""
+    with _state_lock:
+        state = read_state(app)
+        jobs = changes.pop('jobs', None)
+        state.update(changes)
+        if jobs:
+            state.setdefault('jobs', {}).update(jobs)
+        path = _state_path(app)
+        tmp = '%s.%d.tmp' % (path, os.getpid())
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, indent=1)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("Scheduler holatini yozib bo'lmadi: %s", e)
+
+
+def run_job(app, job_id):
+    """Ishni hozir bajarish (app context, vaqt va natija state ga yoziladi). Qaytaradi: natija dict."""
+    job = _jobs[job_id]
+    started_at = datetime.now().isoformat(timespec='seconds')
+    started = time.monotonic()
+    result = {'last_run_at': started_at, 'status': 'ok', 'error': None, 'pid': os.getpid()}
+    with app.app_context():
+        try:
+            job['func'](app)
+        except Exception as e:
+            result.update(status='error', error=str(e)[:300])
+            app.logger.exception("Rejalashtirilgan ish %s xatosi: %s", job_id, e)
+            try:
+                from app import db
+                db.session.rollback()
+            except Exception:
+                pass
+    result['duration_sec'] = round(time.monotonic() - started, 3)
+    _update_state(app, jobs={job_id: result})
+    return result
+
+
+def _start_leader(app, lock_file):
+    from apscheduler.schedulers.background import BackgroundScheduler
+    scheduler = BackgroundScheduler()
+    for job_id, job in _jobs.items():
+        scheduler.add_job(run_job, job['trigger'], args=(app, job_id), id=job_id, name=job_id,
+                          max_instances=1, coalesce=True,
+                          misfire_grace_time=int(app.config.get('SCHEDULER_MISFIRE_GRACE_SEC') or 3600),
+                          **job['trigger_args'])
+    scheduler.start()
+    _leader.update(lock=lock_file, scheduler=scheduler)
+    _update_state(app, leader={'pid': os.getpid(), 'host': socket.gethostname(),
+                               'since': datetime.now().isoformat(timespec='seconds')})
+    logger.info("Scheduler lider (pid %s): %s", os.getpid(), ', '.join(sorted(_jobs)) or '-')
+
+
+def _try_become_leader(app):
+    from app.utils.file_lock import acquire
+    lock_file = acquire(os.path.join(app.instance_path, LOCK_FILENAME), timeout=0)
+    if lock_file is None:
+        return False
+    try:
+        _start_leader(app, lock_file)
+    except Exception:
+        from app.utils.file_lock import release
+        release(lock_file)
+        raise
+    return True
+
+
+def _watch_for_leadership(app, interval):
+    while _leader['scheduler'] is None:
+        time.sleep(interval)
+        try:
+            if _try_become_leader(app):
+                return
+        except Exception as e:
+            logger.warning("Scheduler liderligini olishda xato: %s", e)
+
+
+def start_scheduler(app):
+    """
+    create_app dan chaqiriladi. Qaytaradi: 'leader', 'follower' yoki 'disabled'.
+    """
+    if not app.config.get('SCHEDULER_ENABLED', True):
+        return 'disabled'
+    if _leader['scheduler'] is not None:
+        return 'leader'
+    os.makedirs(app.instance_path, exist_ok=True)
+    if _try_become_leader(app):
+        return 'leader'
+    if _leader['watcher'] is None:
+        interval = float(app.config.get('SCHEDULER_LEADER_RETRY_SEC') or 30)
+        watcher = threading.Thread(target=_watch_for_leadership, args=(app, interval), daemon=True,
+                                   name='scheduler-leader-watch')
+        watcher.start()
+        _leader['watcher'] = watcher
+    return 'follower'
+
+
+def is_leader():
+    return _leader['scheduler'] is not None
@@ -0,0 +1,117 @@
+"""
+Baza sxemasi – Alembic migratsiyalari (migrations/versions).
+Ishga tushishda faqat "baza head da?" tekshiriladi (alembic_version dan bitta SELECT). Head da bo'lmasa
+bitta worker fayl qulfi (instance/schema_migrate.lock) ostida bo'sh bazani yaratadi (create_all + stamp head)
+yoki upgrade qiladi; qolgan workerlar qulfni kutib, tayyor sxema bilan davom etadi.
+"""
+import logging
+import os
+import re
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# alembic_version jadvali yo'q eski bazalar (create_all + startup ALTER lar bilan yaratilgan) shu reviziyadan boshlanadi
+BASELINE_REVISION = '076d59e9faea'
+LOCK_FILENAME = 'schema_migrate.lock'
+
+STATE_CURRENT = 'current'
+STATE_CREATED = 'created'
+STATE_UPGRADED = 'upgraded'
+
+_heads = None
+
+
+def migrations_dir(app):
+    return Path(app.root_path).resolve().parent / 'migrations'
+
+
+def alembic_config(app):
+    config = app.extensions['migrate'].migrate.get_config(str(migrations_dir(app)))
+    # env.py logging ni qayta sozlamasin (ilova loggerlari o'chib qolmasin)
+    config.attributes['configure_logger'] = False
+    return config
+
+
+_REVISION_RE = re.compile(r"^revision\s*=\s*['\"]([0-9a-zA-Z_]+)['\"]", re.M)
+_DOWN_REVISION_RE = re.compile(r"^down_revision\s*=\s*(.+)$", re.M)
+
+
+def _scan_heads(versions_dir):
+    """
+    Reviziya fayllaridan head lar (revision/down_revision qatorlari bo'yicha) – ScriptDirectory
+    yuklashdan ancha tez. Fayllarni o'qib bo'lmasa None.
+    """
+    revisions, parents = set(), set()
+    for path in versions_dir.glob('*.py'):
+        source = path.read_text(encoding='utf-8')
+        rev = _REVISION_RE.search(source)
+        down = _DOWN_REVISION_RE.search(source)
+        if not rev or not down:
+            return None
+        revisions.add(rev.group(1))
+        parents.update(re.findall(r"['\"]([0-9a-zA-Z_]+)['\"]", down.group(1)))
+    heads = revisions - parents
+    return tuple(sorted(heads)) if heads else None
+
+
+def head_revisions(app):
+    """Migratsiya fayllaridagi head(lar) – jarayonda bir marta o'qiladi."""
+    global _heads
+    if _heads is None:
+        heads = _scan_heads(migrations_dir(app) / 'versions')
+        if heads is None:
+            from alembic.script import ScriptDirectory
+            heads = tuple(sorted(ScriptDirectory.from_config(alembic_config(app)).get_heads()))
+        _heads = heads
+    return _heads
+
+
+def current_revisions():
+    """Bazadagi alembic_version; jadval yo'q bo'lsa None."""
+    from sqlalchemy import text
+    from sqlalchemy.exc import DBAPIError
+    from app import db
+    with db.engine.connect() as conn:
+        try:
+            return tuple(sorted(row[0] for row in conn.execute(text('SELECT version_num FROM alembic_version'))))
+        except DBAPIError:
+            return None
+
+
+def is_at_head(app):
+    return current_revisions() == head_revisions(app)
+
+
+def ensure_schema(app):
+    """
+    Sxemani head ga keltirish (app context ichida). Qaytaradi: 'current', 'created' yoki 'upgraded'.
+    """
+    if is_at_head(app):
+        return STATE_CURRENT
+    from alembic import command
+    from alembic.script import ScriptDirectory
+    from sqlalchemy import inspect
+    from app import db
+    from app.utils.file_lock import exclusive_lock
+    os.makedirs(app.instance_path, exist_ok=True)
+    with exclusive_lock(os.path.join(app.instance_path, LOCK_FILENAME)):
+        current = current_revisions()
+        if current == head_revisions(app):
+            return STATE_CURRENT  # boshqa worker yangilab bo'ldi
+        config = alembic_config(app)
+        tables = set(inspect(db.engine).get_table_names()) - {'alembic_version'}
+        if not tables:
+            from app import models  # noqa: F401 – barcha jadvallar metadata da bo'lsin
+            db.create_all()
+            command.stamp(config, 'head')
+            logger.info("Yangi baza yaratildi, sxema: %s", ', '.join(head_revisions(app)))
+            return STATE_CREATED
+        known = {script.revision for script in ScriptDirectory.from_config(config).walk_revisions()}
+        if not current or any(rev not in known for rev in current):
+            logger.warning("Baza migratsiya versiyasi noma'lum (%s) – %s dan boshlab yangilanadi",
+                           ', '.join(current or ()) or 'yo\'q', BASELINE_REVISION)
+            command.stamp(config, BASELINE_REVISION, purge=True)
+        command.upgrade(config, 'head')
+        logger.info("Baza sxemasi yangilandi: %s -> %s", ', '.join(current or ()) or '-', ', '.join(head_revisions(app)))
+        return STATE_UPGRADED
@@ -0,0 +1,128 @@
+"""
+SiteSetting va flash xabar (ticker) keshi.
+site_settings jadvali to'liq xotiraga (dict) yuklanadi; SiteSetting.set versiya belgisini
+(instance/site_settings.version) yangilaydi, boshqa workerlar uni soniyasiga ko'pi bilan bir marta
+o'qib, o'zgargan bo'lsa jadvalni qayta yuklaydi. Flash xabarlar ham shunday (flash_messages.version),
+qo'shimcha ravishda sana almashganda (muddat filtri) qayta hisoblanadi.
+Barqaror holatda sahifa chizishda bu jadvallar uchun SQL so'rov bo'lmaydi.
+"""
+import logging
+import os
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+VERSION_FILENAME = 'site_settings.version'
+FLASH_VERSION_FILENAME = 'flash_messages.version'
+VERSION_CHECK_SEC = 1.0
+
+_cache = None          # {key: value}
+_cache_token = None    # yuklangan paytdagi versiya belgisi
+_checked_at = 0.0
+_lock = threading.Lock()
+
+_ticker = None         # {'day': date, 'token': str, 'items': {lang: [item, ...]}}
+_ticker_checked_at = 0.0
+
+
+def _version_path(filename=VERSION_FILENAME):
+    from flask import current_app
+    return os.path.join(current_app.instance_path, filename)
+
+
+def read_version_token(filename=VERSION_FILENAME):
+    try:
+        with open(_version_path(filename), 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return ''
+
+
+def write_version_token(filename):
+    try:
+        path = _version_path(filename)
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(uuid.uuid4().hex)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("Kesh versiyasi yozilmadi (%s): %s", filename, e)
+
+
+def _load():
+    from app.models import SiteSetting
+    return {key: value for key, value in SiteSetting.query.with_entities(SiteSetting.key, SiteSetting.value).all()}
+
+
+def get_settings():
+    """Barcha sozlamalar (dict). Versiya belgisi VERSION_CHECK_SEC da bir marta tekshiriladi."""
+    global _cache, _cache_token, _checked_at
+    now = time.monotonic()
+    with _lock:
+        if _cache is not None and now - _checked_at < VERSION_CHECK_SEC:
+            return _cache
+        token = read_version_token()
+        _checked_at = now
+        if _cache is not None and token == _cache_token:
+            return _cache
+        _cache = _load()
+        _cache_token = token
+        return _cache
+
+
+def invalidate():
+    """Shu jarayon keshini tashlab yuborish (keyingi o'qishda qayta yuklanadi)."""
+    global _cache
+    with _lock:
+        _cache = None
+
+
+def bump_version():
+    """Sozlama o'zgardi – barcha workerlar uchun versiya belgisini yangilash."""
+    invalidate()
+    write_version_token(VERSION_FILENAME)
+
+
+def _load_ticker(today):
+    """Bugun ko'rinadigan yoqilgan flash xabarlar – har til uchun tayyor ro'yxat (sort_order, id tartibida)."""
+    from app.models import FlashMessage
+    items = {}
+    fm_list = FlashMessage.query.filter_by(enabled=True).order_by(FlashMessage.sort_order.asc(), FlashMessage.id.asc()).all()
+    for fm in fm_list:
+        if not fm.is_in_date_range(today):
+            continue
+        for lang in ('uz', 'ru', 'en'):
+            txt = fm.get_text(lang)
+            if txt:
+                items.setdefault(lang, []).append({
+                    'text': txt,
+                    'url': (fm.url or '').strip(),
+                    'text_color': (fm.text_color or 'white').strip().lower()
+                })
+    return items
+
+
+def get_flash_ticker(lang):
+    """Tanlangan til uchun faol flash xabarlar (nusxa). Tahrir yoki sana almashganda qayta yuklanadi."""
+    global _ticker, _ticker_checked_at
+    from datetime import date
+    today = date.today()
+    now = time.monotonic()
+    with _lock:
+        if _ticker is None or _ticker['day'] != today or now - _ticker_checked_at >= VERSION_CHECK_SEC:
+            token = read_version_token(FLASH_VERSION_FILENAME)
+            _ticker_checked_at = now
+            if _ticker is None or _ticker['day'] != today or _ticker['token'] != token:
+                _ticker = {'day': today, 'token': token, 'items': _load_ticker(today)}
+        items = _ticker['items'].get(lang if lang in ('uz', 'ru', 'en') else 'uz', [])
+    return list(items)
+
+
+def invalidate_flash_ticker():
+    """Flash xabar qo'shildi/o'zgardi/o'chirildi – barcha workerlarda ticker qayta yuklanadi."""
+    global _ticker
+    with _lock:
+        _ticker = None
+    write_version_token(FLASH_VERSION_FILENAME)
@@ -0,0 +1,216 @@
+"""
+SQLite ishlab chiqarish profili – har yangi ulanishda (engine 'connect' hodisasi) PRAGMA lar:
+journal_mode=WAL (o'quvchilar yozuvchini kutmaydi), synchronous=NORMAL (fsync har commit da emas,
+checkpoint da), busy_timeout (qulf band bo'lsa darhol "database is locked" emas, kutish),
+mmap_size, cache_size va ixtiyoriy foreign_keys. Qiymatlar config.py dagi SQLITE_* kalitlaridan.
+PostgreSQL/MySQL va :memory: bazalarda hech narsa qilinmaydi.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+SYNCHRONOUS_MODES = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+JOURNAL_MODES = ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')
+
+
+def profile_from_config(config):
+    """config (dict yoki app.config) dan PRAGMA lar ro'yxati: [(nom, qiymat), ...]."""
+    journal = (config.get('SQLITE_JOURNAL_MODE') or '').strip().upper()
+    synchronous = (config.get('SQLITE_SYNCHRONOUS') or '').strip().upper()
+    pragmas = []
+    if journal:
+        if journal not in JOURNAL_MODES:
+            raise ValueError("SQLITE_JOURNAL_MODE noto'g'ri: %s" % journal)
+        pragmas.append(('journal_mode', journal))
+    if synchronous:
+        if synchronous not in SYNCHRONOUS_MODES:
+            raise ValueError("SQLITE_SYNCHRONOUS noto'g'ri: %s" % synchronous)
+        pragmas.append(('synchronous', synchronous))
+    pragmas.append(('busy_timeout', int(config.get('SQLITE_BUSY_TIMEOUT_MS') or 0)))
+    if config.get('SQLITE_MMAP_SIZE_MB'):
+        pragmas.append(('mmap_size', int(config['SQLITE_MMAP_SIZE_MB']) * 1024 * 1024))
+    if config.get('SQLITE_CACHE_SIZE_KB'):
+        # Manfiy qiymat – KiB da (musbat bo'lsa sahifalar soni bo'lardi)
+        pragmas.append(('cache_size', -int(config['SQLITE_CACHE_SIZE_KB'])))
+    pragmas.append(('foreign_keys', 'ON' if config.get('SQLITE_FOREIGN_KEYS') else 'OFF'))
+    return pragmas
+
+
+def apply_pragmas(dbapi_connection, pragmas):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas:
+            try:
+                cursor.execute('PRAGMA %s = %s' % (name, value))
+            except Exception as e:
+                # journal_mode ni boshqa jarayon ochiq tranzaksiyasi paytida o'zgartirib bo'lmasligi mumkin –
+                # WAL baza faylida saqlanadi, keyingi ulanishda qayta urinib ko'riladi
+                logger.warning("SQLite PRAGMA %s = %s bajarilmadi: %s", name, value, e)
+    finally:
+        cursor.close()
+
+
+def attach(engine, pragmas):
+    """engine ga 'connect' tinglovchisini qo'shish. sqlite bo'lmasa yoki :memory: bo'lsa False."""
+    from sqlalchemy import event
+    if engine.dialect.name != 'sqlite' or engine.url.database in (None, '', ':memory:'):
+        return False
+    pragmas = list(pragmas)
+
+    @event.listens_for(engine, 'connect')
+    def _on_connect(dbapi_connection, connection_record):
+        apply_pragmas(dbapi_connection, pragmas)
+
+    return True
+
+
+def apply_sqlite_profile(app, engine):
+    """create_app dan (db.init_app dan keyin, birinchi ulanishdan oldin). Qaytaradi: qo'llangan PRAGMA lar yoki None."""
+    if not app.config.get('SQLITE_PROFILE_ENABLED', True):
+        return None
+    pragmas = profile_from_config(app.config)
+    if not attach(engine, pragmas):
+        return None
+    return pragmas
+
+
+def current_pragmas(connection):
+    """Ulanishdagi amaldagi qiymatlar (flask sqlite-benchmark / tekshiruv uchun)."""
+    from sqlalchemy import text
+    names = ('journal_mode', 'synchronous', 'busy_timeout', 'mmap_size', 'cache_size', 'foreign_keys')
+    return {name: connection.execute(text('PRAGMA %s' % name)).scalar() for name in names}
+
+
+# --- Benchmark: o'quvchilar + face log yozuvchi ---
+
+def _bench_setup(path, rows):
+    import sqlite3
+    from datetime import datetime, timedelta
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE face_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            device_employee_id VARCHAR(50),
+            event_time DATETIME,
+            direction VARCHAR(10),
+            dedupe_key VARCHAR(64) UNIQUE,
+            device_name VARCHAR(150),
+            similarity INTEGER
+        );
+        CREATE INDEX ix_bench_event ON face_logs (event_time, device_employee_id, direction);
+    """)
+    start = datetime(2026, 9, 1, 8, 0)
+    conn.executemany(
+        'INSERT INTO face_logs (device_employee_id, event_time, direction, dedupe_key, device_name, similarity) '
+        'VALUES (?, ?, ?, ?, ?, ?)',
+        (('E%04d' % (i % 500), (start + timedelta(seconds=i * 7)).isoformat(' '), 'IN' if i % 2 else 'OUT',
+          'seed-%d' % i, 'Gate %d' % (i % 8), 80 + i % 20) for i in range(rows)))
+    conn.commit()
+    conn.close()
+
+
+def _bench_run(path, pragmas, readers, duration, batch):
+    """Bitta profil bilan: readers ta o'quvchi thread + bitta yozuvchi (face_log_writer kabi batch INSERT + commit)."""
+    import threading
+    import time
+    import uuid
+    from datetime import datetime
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.exc import OperationalError
+
+    # Tayyorlangan bazani stock (rollback journal) holatiga qaytarish
+    import sqlite3
+    raw = sqlite3.connect(path)
+    raw.execute('PRAGMA journal_mode = DELETE')
+    raw.close()
+
+    # stock – hozirgi holat: rollback journal, pysqlite ning 5 s timeout i
+    engine = create_engine('sqlite:///' + path, pool_size=readers + 1)
+    attach(engine, pragmas)
+    stop = threading.Event()
+    lock = threading.Lock()
+    stats = {'reads': 0, 'read_errors': 0, 'read_wait': [], 'writes': 0, 'write_errors': 0, 'write_wait': []}
+
+    def reader(n):
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text(
+                        'SELECT device_employee_id, COUNT(*) FROM face_logs WHERE event_time >= :since '
+                        'GROUP BY device_employee_id'), {'since': '2026-09-01 %02d:00:00' % (8 + n % 4)}).all()
+                    conn.execute(text('SELECT * FROM face_logs ORDER BY id DESC LIMIT 50')).all()
+                with lock:
+                    stats['reads'] += 1
+                    stats['read_wait'].append(time.perf_counter() - started)
+            except OperationalError:
+                with lock:
+                    stats['read_errors'] += 1
+
+    def writer():
+        while not stop.is_set():
+            now = datetime.now().isoformat(' ')
+            rows = [{'emp': 'E%04d' % (i % 500), 't': now, 'd': 'IN', 'k': uuid.uuid4().hex, 'n': 'Gate 1', 's': 90}
+                    for i in range(batch)]
+            started = time.perf_counter()
+            try:
+                with engine.begin() as conn:
+                    conn.execute(text(
+                        'INSERT INTO face_logs (device_employee_id, event_time, direction, dedupe_key, device_name, '
+                        'similarity) VALUES (:emp, :t, :d, :k, :n, :s)'), rows)
+                with lock:
+                    stats['writes'] += 1
+                    stats['write_wait'].append(time.perf_counter() - started)
+            except OperationalError:
+                with lock:
+                    stats['write_errors'] += 1
+            time.sleep(0.005)
+
+    threads = [threading.Thread(target=reader, args=(i,), daemon=True) for i in range(readers)]
+    threads.append(threading.Thread(target=writer, daemon=True))
+    for t in threads:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    engine.dispose()
+    return stats
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100.0))]
+
+
+def benchmark(pragmas, readers=8, duration=5.0, batch=200, rows=50000):
+    """
+    Vaqtinchalik bazada stock (PRAGMA siz) va berilgan profilni solishtirish.
+    Qaytaradi: {'stock': natija, 'profile': natija}; natija – o'qish/yozish soni, xatolar (database is locked),
+    p50/p95 kutish (ms).
+    """
+    import os
+    import shutil
+    import tempfile
+    tmpdir = tempfile.mkdtemp(prefix='sqlite-bench-')
+    try:
+        seed = os.path.join(tmpdir, 'seed.db')
+        _bench_setup(seed, rows)
+        results = {}
+        for label, profile in (('stock', []), ('profile', pragmas)):
+            path = os.path.join(tmpdir, '%s.db' % label)
+            shutil.copyfile(seed, path)
+            stats = _bench_run(path, profile, readers, duration, batch)
+            results[label] = {
+                'reads': stats['reads'], 'read_errors': stats['read_errors'],
+                'read_p50_ms': round(_percentile(stats['read_wait'], 50) * 1000, 2),
+                'read_p95_ms': round(_percentile(stats['read_wait'], 95) * 1000, 2),
+                'writes': stats['writes'], 'write_errors': stats['write_errors'],
+                'write_p50_ms': round(_percentile(stats['write_wait'], 50) * 1000, 2),
+                'write_p95_ms': round(_percentile(stats['write_wait'], 95) * 1000, 2),
+            }
+        return results
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
@@ -141,7 +141,7 @@ def _version_check_loop(app):
 def _sse_loop(app):
     """SSE ulanish va xabarlarni qabul qilish."""
     global _running
-    import requests
+    from app.services import http_client
     with app.app_context():
         url = get_central_url().rstrip('/')
         inst_id = get_institution_id()
@@ -153,36 +153,40 @@ def _sse_loop(app):
                 if not url or not inst_id:
                     time.sleep(30)
                     continue
-                r = requests.get(stream_url, stream=True, timeout=60)
-                r.raise_for_status()
-                for line in r.iter_lines(decode_unicode=True):
-                    if not _running:
-                        break
-                    if line and line.startswith('data:'):
-                        data_str = line[5:].strip()
-                        if not data_str:
-                            continue
-                        try:
-                            msg = json.loads(data_str)
-                            evt = msg.get('type', '')
-                            if evt == 'update':
-                                logger.info("Yangilanish xabari qabul qilindi")
-                                from app.services.central_client import invalidate_cache
-                                invalidate_cache()
-                                if _is_institute(app) and not _is_update_window():
-                                    logger.info("Institut: yangilanish 00:00–06:00 da amalga oshiriladi (kunduzi o'tkazilmaydi)")
-                                    continue
-                                from app.services.updater import run_update, schedule_restart
-                                try:
-                                    if run_update():
-                                        schedule_restart()
-                                except Exception as e:
-                                    logger.exception("Yangilanishda xato: %s", e)
-                            elif evt == 'institution_updated':
-                                from app.services.central_client import invalidate_cache
-                                invalidate_cache()
-                        except json.JSONDecodeError:
-                            pass
+                with http_client.get(stream_url, stream=True, timeout=60) as r:
+                    r.raise_for_status()
+                    # Uzilish paytida o'zgarishlar o'tkazib yuborilgan bo'lishi mumkin – holat fonda yangilanadi
+                    from app.services.central_client import invalidate_cache
+                    invalidate_cache()
+                    for line in r.iter_lines(decode_unicode=True):
+                        if not _running:
+                            break
+                        if line and line.startswith('data:'):
+                            data_str = line[5:].strip()
+                            if not data_str:
+                                continue
+                            try:
+                                msg = json.loads(data_str)
+                                evt = msg.get('type', '')
+                                if evt == 'update':
+                                    logger.info("Yangilanish xabari qabul qilindi")
+                                    from app.services.central_client import invalidate_cache
+                                    invalidate_cache()
+                                    if _is_institute(app) and not _is_update_window():
+                                        logger.info("Institut: yangilanish 00:00–06:00 da amalga oshiriladi (kunduzi o'tkazilmaydi)")
+                                        continue
+                                    from app.services.updater import run_update, schedule_restart
+                                    try:
+                                        if run_update():
+                                            schedule_restart()
+                                    except Exception as e:
+                                        logger.exception("Yangilanishda xato: %s", e)
+                                elif evt == 'institution_updated':
+                                    # Ro'yxat xabarning o'zida – keshga darhol qo'llanadi (markazga qayta so'rovsiz)
+                                    from app.services.central_client import apply_institution_update
+                                    apply_institution_update(msg.get('data'))
+                            except json.JSONDecodeError:
+                                pass
         except Exception as e:
             if _running:
                 logger.warning("SSE ulanishda xato (qayta urinadi): %s", e)
@@ -190,6 +194,16 @@ def _sse_loop(app):
             time.sleep(5)
 
 
+def _prime_central_status(app):
+    try:
+        with app.app_context():
+            from app.services.central_client import is_central_enabled, refresh_status
+            if is_central_enabled():
+                refresh_status()
+    except Exception as e:
+        logger.warning("Markaz holatini yuklashda xato: %s", e)
+
+
 def start_sse_client(app):
     """SSE clientni boshlash: ishga tushganda darhol + har 10 daqiqada versiya tekshiruvi."""
     global _running, _thread, _version_thread
@@ -205,6 +219,8 @@ def start_sse_client(app):
     _version_thread.start()
     # Ishga tushganda darhol so'nggi versiyani tekshirish (markaz: version.json, institut: API)
     threading.Thread(target=lambda: _run_single_version_check(app), daemon=True).start()
+    # Markaz holatini oldindan yuklash – birinchi so'rovlar bo'sh kesh bilan kelmasin
+    threading.Thread(target=lambda: _prime_central_status(app), daemon=True).start()
     logger.info("SSE client yoqildi (ishga tushganda + har 10 min versiya tekshiruvi)")
 
 
@@ -0,0 +1,122 @@
+"""
+Superadmin hisobini config (SUPERADMIN_LOGIN / SUPERADMIN_PASSWORD) ga moslashtirish.
+Parol xeshi (scrypt/pbkdf2) har ishga tushishda qayta hisoblanmaydi: oxirgi tekshiruvdan keyin
+instance/superadmin.stamp ga HMAC(SECRET_KEY; login, saqlangan xesh, config paroli, werkzeug versiyasi)
+yoziladi. Belgi mos kelsa – bitta SELECT, xesh hisobi va yozuv yo'q. Aks holda (parol config da yoki
+UI orqali o'zgargan, werkzeug yangilangan) fayl qulfi ostida bitta worker tekshiradi va kerak bo'lsa yangilaydi.
+"""
+import hashlib
+import hmac
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+STAMP_FILENAME = 'superadmin.stamp'
+LOCK_FILENAME = 'superadmin.lock'
+
+STATE_CREATED = 'created'
+STATE_UNCHANGED = 'unchanged'
+STATE_UPDATED = 'updated'
+
+
+def _werkzeug_version():
+    try:
+        from importlib.metadata import version
+        return version('werkzeug')
+    except Exception:
+        return ''
+
+
+def _stamp(app, login, password_hash, password):
+    key = (app.config.get('SECRET_KEY') or '').encode('utf-8')
+    msg = '\0'.join((login, password_hash or '', password, _werkzeug_version())).encode('utf-8')
+    return hmac.new(key, msg, hashlib.sha256).hexdigest()
+
+
+def _read_stamp(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return ''
+
+
+def _write_stamp(path, value):
+    try:
+        tmp = '%s.%d.tmp' % (path, os.getpid())
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(value)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("Superadmin belgisini yozib bo'lmadi: %s", e)
+
+
+def _hash_method(password_hash):
+    return (password_hash or '').split('$', 1)[0]
+
+
+def _sync_password(user, password):
+    """Xeshni tekshirish; parol mos kelmasa yoki xesh parametrlari eskirgan bo'lsa qayta xeshlash. True – o'zgardi."""
+    from werkzeug.security import generate_password_hash
+    if not user.password_hash or not user.check_password(password):
+        user.set_password(password)
+        return True
+    fresh = generate_password_hash(password)
+    if _hash_method(fresh) != _hash_method(user.password_hash):
+        user.password_hash = fresh
+        return True
+    return False
+
+
+def _sync_flags(user):
+    changed = False
+    if not user.is_active:
+        user.is_active = True
+        changed = True
+    if not user.superadmin_flag:
+        user.superadmin_flag = True
+        changed = True
+    return changed
+
+
+def ensure_superadmin(app, login, password):
+    """App context ichida. Qaytaradi: 'created', 'unchanged' yoki 'updated'."""
+    from app import db
+    from app.models import User, UserRole
+    from app.utils.file_lock import exclusive_lock
+    stamp_path = os.path.join(app.instance_path, STAMP_FILENAME)
+
+    user = User.query.filter_by(login=login).first()
+    if user and _read_stamp(stamp_path) == _stamp(app, login, user.password_hash, password):
+        if _sync_flags(user):
+            db.session.commit()
+            return STATE_UPDATED
+        return STATE_UNCHANGED
+
+    os.makedirs(app.instance_path, exist_ok=True)
+    with exclusive_lock(os.path.join(app.instance_path, LOCK_FILENAME)):
+        # Qulfni kutgan paytda boshqa worker yangilagan bo'lishi mumkin
+        db.session.rollback()
+        user = User.query.filter_by(login=login).first()
+        if not user:
+            user = User(login=login, full_name='Superadmin', role='admin', is_active=True, superadmin_flag=True)
+            user.set_password(password)
+            db.session.add(user)
+            db.session.flush()
+            if not UserRole.query.filter_by(user_id=user.id, role='admin').first():
+                db.session.add(UserRole(user_id=user.id, role='admin'))
+            db.session.commit()
+            state = STATE_CREATED
+        elif _read_stamp(stamp_path) == _stamp(app, login, user.password_hash, password):
+            state = STATE_UPDATED if _sync_flags(user) else STATE_UNCHANGED
+            if state == STATE_UPDATED:
+                db.session.commit()
+        else:
+            changed = _sync_password(user, password)
+            changed = _sync_flags(user) or changed
+            if changed:
+                db.session.commit()
+            state = STATE_UPDATED if changed else STATE_UNCHANGED
+        _write_stamp(stamp_path, _stamp(app, login, user.password_hash, password))
+    return state
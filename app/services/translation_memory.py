@@ -0,0 +1,176 @@
+"""
+Tarjima xotirasi – mashina tarjimasidan oldin translation_memory jadvali tekshiriladi
+(kalit: matn sha256 + manba til + maqsad til). Topilmaganlari backend orqali, ko'p bo'lsa
+TRANSLATION_MAX_WORKERS parallel so'rov bilan tarjima qilinib xotiraga yoziladi.
+
+Backend – config TRANSLATION_BACKEND: 'google' (deep_translator), 'stub' (tarmoqsiz, test uchun)
+yoki 'modul.yoli:funksiya'; funksiya imzosi fn(text, source_lang, target_lang) -> str.
+Xotira kesh: yozishda xato bo'lsa tarjima baribir qaytariladi.
+"""
+import hashlib
+import importlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+LOOKUP_CHUNK = 500
+MAX_TEXT_LEN = 5000
+
+_backends = {}
+_override = None  # set_backend() – testlarda config dan ustun
+
+
+def _google(text, source_lang, target_lang):
+    from deep_translator import GoogleTranslator
+    return GoogleTranslator(source=source_lang, target=target_lang).translate(text) or ''
+
+
+def _stub(text, source_lang, target_lang):
+    """Tarmoqsiz deterministik tarjima (testlar uchun)."""
+    return '[%s] %s' % (target_lang, text)
+
+
+def register_backend(name, fn):
+    _backends[name] = fn
+
+
+register_backend('google', _google)
+register_backend('stub', _stub)
+
+
+def set_backend(fn_or_name):
+    """Backendni dastur ichidan almashtirish (None – config ga qaytish)."""
+    global _override
+    _override = fn_or_name
+
+
+def _resolve_backend():
+    spec = _override
+    if spec is None:
+        try:
+            from flask import current_app
+            spec = current_app.config.get('TRANSLATION_BACKEND') or 'google'
+        except RuntimeError:
+            spec = 'google'
+    if callable(spec):
+        return getattr(spec, '__name__', 'custom'), spec
+    if spec in _backends:
+        return spec, _backends[spec]
+    module_name, _, attr = spec.partition(':')
+    fn = getattr(importlib.import_module(module_name), attr)
+    register_backend(spec, fn)
+    return spec, fn
+
+
+def _key(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _lookup(texts, source_lang, target_lang):
+    """Xotiradan: {text: tarjima}. Alohida ulanish – chaqiruvchi sessiyasiga ta'sir qilmaydi."""
+    from app import db
+    from app.models import TranslationMemory
+    table = TranslationMemory.__table__
+    by_hash = {_key(t): t for t in texts}
+    found = {}
+    hashes = list(by_hash)
+    with db.engine.connect() as conn:
+        for i in range(0, len(hashes), LOOKUP_CHUNK):
+            chunk = hashes[i:i + LOOKUP_CHUNK]
+            rows = conn.execute(
+                table.select().with_only_columns(table.c.source_hash, table.c.source_text, table.c.translated_text)
+                .where(table.c.source_hash.in_(chunk), table.c.source_lang == source_lang, table.c.target_lang == target_lang)
+            ).all()
+            for h, src, translated in rows:
+                if by_hash.get(h) == src:
+                    found[src] = translated
+    return found
+
+
+def _store(pairs, source_lang, target_lang, backend_name):
+    """Yangi tarjimalarni yozish (mavjud kalitlar o'tkazib yuboriladi)."""
+    from datetime import datetime
+    from app import db
+    from app.models import TranslationMemory
+    table = TranslationMemory.__table__
+    rows = [{
+        'source_hash': _key(src), 'source_lang': source_lang, 'target_lang': target_lang,
+        'source_text': src, 'translated_text': translated, 'backend': backend_name[:30],
+        'created_at': datetime.utcnow(),
+    } for src, translated in pairs.items() if translated]
+    if not rows:
+        return
+    try:
+        dialect = db.engine.dialect.name
+        with db.engine.begin() as conn:
+            if dialect in ('sqlite', 'postgresql'):
+                if dialect == 'sqlite':
+                    from sqlalchemy.dialects.sqlite import insert
+                else:
+                    from sqlalchemy.dialects.postgresql import insert
+                conn.execute(insert(table).on_conflict_do_nothing(
+                    index_elements=['source_hash', 'source_lang', 'target_lang']), rows)
+            else:
+                from sqlalchemy.exc import IntegrityError
+                for row in rows:
+                    try:
+                        with conn.begin_nested():
+                            conn.execute(table.insert(), row)
+                    except IntegrityError:
+                        pass
+    except Exception as e:
+        logger.warning("Tarjima xotirasiga yozilmadi: %s", e)
+
+
+def translate_many(texts, source_lang, target_lang, max_workers=None):
+    """
+    Bir nechta matnni tarjima qilish: {matn: tarjima}. Avval xotira (bitta so'rov), qolganlari
+    backend orqali parallel. Tarjima qilinmaganlar natijada bo'lmaydi.
+    """
+    texts = {(t or '').strip()[:MAX_TEXT_LEN] for t in texts}
+    texts.discard('')
+    if not texts:
+        return {}
+    if source_lang == target_lang:
+        return {t: t for t in texts}
+    try:
+        result = _lookup(texts, source_lang, target_lang)
+    except Exception as e:
+        logger.warning("Tarjima xotirasini o'qishda xato: %s", e)
+        result = {}
+    missing = [t for t in texts if t not in result]
+    if not missing:
+        return result
+    backend_name, backend = _resolve_backend()
+
+    def _one(text):
+        try:
+            return text, (backend(text, source_lang, target_lang) or '').strip()
+        except Exception as e:
+            logger.warning("Tarjima xatosi (%s -> %s): %s", source_lang, target_lang, e)
+            return text, ''
+
+    if max_workers is None:
+        try:
+            from flask import current_app
+            max_workers = int(current_app.config.get('TRANSLATION_MAX_WORKERS') or 4)
+        except RuntimeError:
+            max_workers = 4
+    if len(missing) == 1 or max_workers <= 1:
+        fetched = dict(_one(t) for t in missing)
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing)), thread_name_prefix='translate') as pool:
+            fetched = dict(pool.map(_one, missing))
+    fetched = {src: tr for src, tr in fetched.items() if tr}
+    _store(fetched, source_lang, target_lang, backend_name)
+    result.update(fetched)
+    return result
+
+
+def translate(text, source_lang, target_lang):
+    """Bitta matn; tarjima qilinmasa ''."""
+    text = (text or '').strip()
+    if not text:
+        return ''
+    return translate_many([text], source_lang, target_lang).get(text[:MAX_TEXT_LEN], '')
@@ -19,6 +19,12 @@ RESTART_FLAG = 'RESTART_REQUIRED'
 # Yangilanmaydigan papka va fayllar (ma'lumot saqlanadi)
 PROTECTED = {'instance', 'uploads', 'logs', '.well-known', '.env', 'eduspace.db', '*.db'}
 
+# os._exit dan oldin chaqiriladigan funksiyalar (atexit os._exit da ishlamaydi)
+_shutdown_hooks = []
+
+# run_update RESTART_REQUIRED yozganda o'rnatiladi – request darvozasi har so'rovda faylni tekshirmaydi
+restart_requested = threading.Event()
+
 
 def get_project_root():
     """Loyiha ildiz papkasi."""
@@ -79,6 +85,7 @@ def fetch_version():
     Qaytaradi: (data_dict yoki None, error_dict yoki None). error_dict = {'key': '...', 'url': '...', 'code': ...}
     """
     import requests
+    from app.services import http_client
     base = get_central_url()
     if not base:
         return None, {'key': 'update_center_not_configured', 'url': None}
@@ -88,7 +95,7 @@ def fetch_version():
         url = f'{base.rstrip("/")}/central-api/api/version'
     try:
         headers = {'Cache-Control': 'no-cache', 'Pragma': 'no-cache'}
-        r = requests.get(url, headers=headers, timeout=15)
+        r = http_client.get(url, headers=headers, timeout=15)
         if r.status_code == 200:
             return r.json(), None
         return None, {'key': 'update_center_bad_response', 'url': url, 'code': r.status_code}
@@ -165,9 +172,9 @@ def run_update(force=False):
         return False
 
     try:
-        import requests
+        from app.services import http_client
         logger.info("Yangilanish yuklanmoqda: %s", version)
-        r = requests.get(url, timeout=300, stream=True)
+        r = http_client.get(url, timeout=300, stream=True)
         r.raise_for_status()
 
         with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp:
@@ -228,6 +235,7 @@ def run_update(force=False):
 
         # Qayta ishga tushirish belgisi
         (root / RESTART_FLAG).write_text(version, encoding='utf-8')
+        restart_requested.set()
         logger.info("Yangilanish tugadi. Qayta ishga tushirish kerak.")
         return True
 
@@ -241,10 +249,26 @@ def check_restart_flag():
     return (get_project_root() / RESTART_FLAG).exists()
 
 
+def register_shutdown_hook(fn):
+    """Qayta ishga tushirishdan oldin bajariladigan funksiyani ro'yxatga olish (masalan, navbatni yozib qo'yish)."""
+    if fn not in _shutdown_hooks:
+        _shutdown_hooks.append(fn)
+
+
+def run_shutdown_hooks():
+    """Ro'yxatdagi barcha funksiyalarni bajarish; xato boshqalarini to'xtatmaydi."""
+    for fn in list(_shutdown_hooks):
+        try:
+            fn()
+        except Exception as e:
+            logger.warning("Shutdown hook xatosi (%s): %s", getattr(fn, '__name__', fn), e)
+
+
 def schedule_restart():
     """5 soniyadan keyin qayta ishga tushirish (os._exit)."""
     def _exit():
         time.sleep(5)
+        run_shutdown_hooks()
         os._exit(0)
 
     threading.Thread(target=_exit, daemon=True).start()
@@ -0,0 +1,145 @@
+"""
+Import qilingan dars jadvallari uchun Zoom meetinglarni fonda yaratish.
+So'rov darhol qaytadi; koordinator thread meetinglarni ZOOM_MAX_CONCURRENCY parallel so'rov bilan
+(soniyasiga ZOOM_REQUESTS_PER_SEC dan oshmasdan) yaratadi va har natija kelishi bilan Schedule.link ni yozadi.
+DB ga faqat koordinator yozadi (SQLite da parallel yozuvchilar bo'lmasin).
+"""
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+logger = logging.getLogger(__name__)
+
+MAX_KEPT_JOBS = 20
+
+_jobs = OrderedDict()  # job_id -> holat dict
+_jobs_lock = threading.Lock()
+_job_ids = itertools.count(1)
+
+
+class _RateLimiter:
+    """So'rovlar orasida kamida 1/rate soniya (barcha worker threadlar uchun umumiy)."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self.next_at = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_at)
+            self.next_at = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _update_job(job_id, **changes):
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+        if job is None:
+            return
+        for key, value in changes.items():
+            if key in ('done', 'failed'):
+                job[key] += value
+            else:
+                job[key] = value
+
+
+def get_job(job_id):
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+        return dict(job) if job else None
+
+
+def _meeting_params(schedule_ids):
+    """Linki bo'sh jadvallar uchun meeting parametrlari (koordinator threadida, app context ichida)."""
+    from app.models import Schedule, Subject, Group
+    from app import db
+    rows = (db.session.query(Schedule.id, Schedule.day_of_week, Schedule.start_time, Schedule.lesson_type,
+                             Subject.name, Group.name)
+            .outerjoin(Subject, Subject.id == Schedule.subject_id)
+            .outerjoin(Group, Group.id == Schedule.group_id)
+            .filter(Schedule.id.in_(schedule_ids))
+            .filter((Schedule.link == None) | (Schedule.link == ''))
+            .all())
+    return [{
+        'schedule_id': sid, 'date_code': day, 'start_time': start or '09:00', 'lesson_type': lesson_type or '',
+        'subject_name': subject_name or '', 'group_name': group_name or '',
+    } for sid, day, start, lesson_type, subject_name, group_name in rows]
+
+
+def _run_job(app, job_id, schedule_ids):
+    from app import db
+    from app.models import Schedule
+    from app.services.zoom_service import create_schedule_meeting, zoom_config
+    started = time.monotonic()
+    with app.app_context():
+        try:
+            params = _meeting_params(schedule_ids)
+            config = zoom_config(app.config)
+            workers = max(1, int(app.config.get('ZOOM_MAX_CONCURRENCY') or 4))
+            limiter = _RateLimiter(float(app.config.get('ZOOM_REQUESTS_PER_SEC') or 0))
+            _update_job(job_id, total=len(params), status='running')
+
+            def _create(p):
+                limiter.wait()
+                return create_schedule_meeting(
+                    subject_name=p['subject_name'], group_name=p['group_name'], lesson_type=p['lesson_type'],
+                    date_code=p['date_code'], start_time=p['start_time'], config=config,
+                )
+
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='zoom-meeting') as pool:
+                futures = {pool.submit(_create, p): p['schedule_id'] for p in params}
+                for fut in as_completed(futures):
+                    sid = futures[fut]
+                    try:
+                        link = fut.result()
+                    except Exception as e:
+                        logger.warning("Zoom meeting (schedule %s) xatosi: %s", sid, e)
+                        link = None
+                    if not link:
+                        _update_job(job_id, failed=1)
+                        continue
+                    # Foydalanuvchi shu orada link qo'ygan bo'lsa – ustidan yozilmaydi
+                    Schedule.query.filter(Schedule.id == sid).filter(
+                        (Schedule.link == None) | (Schedule.link == '')
+                    ).update({'link': link[:500]}, synchronize_session=False)
+                    db.session.commit()
+                    _update_job(job_id, done=1)
+            _update_job(job_id, status='finished')
+        except Exception as e:
+            db.session.rollback()
+            logger.exception("Zoom meeting navbati xatosi: %s", e)
+            _update_job(job_id, status='error', error=str(e)[:200])
+        finally:
+            _update_job(job_id, elapsed_sec=round(time.monotonic() - started, 2))
+            db.session.remove()
+    job = get_job(job_id) or {}
+    logger.info("Zoom navbati #%s: %s/%s yaratildi, %s xato, %.1f s", job_id, job.get('done'), job.get('total'),
+                job.get('failed'), job.get('elapsed_sec') or 0)
+
+
+def enqueue_schedule_meetings(app, schedule_ids):
+    """
+    Jadvallar uchun Zoom meetinglarni fonda yaratish. Zoom sozlanmagan yoki ro'yxat bo'sh bo'lsa None,
+    aks holda job_id (get_job bilan holatini ko'rish mumkin).
+    """
+    from app.services.zoom_service import zoom_config, is_configured
+    schedule_ids = [sid for sid in schedule_ids if sid]
+    if not schedule_ids or not is_configured(zoom_config(app.config)):
+        return None
+    job_id = next(_job_ids)
+    with _jobs_lock:
+        _jobs[job_id] = {'id': job_id, 'status': 'queued', 'total': len(schedule_ids), 'done': 0, 'failed': 0,
+                         'error': None, 'elapsed_sec': None, 'created_at': time.time()}
+        while len(_jobs) > MAX_KEPT_JOBS:
+            _jobs.popitem(last=False)
+    threading.Thread(target=_run_job, args=(app, job_id, list(schedule_ids)), daemon=True,
+                     name='zoom-job-%d' % job_id).start()
+    return job_id
@@ -5,10 +5,12 @@ Dars jadvali qo'shilganda avtomatik Zoom meeting yaratish uchun.
 """
 import base64
 import logging
+import threading
+import time
 from datetime import datetime
 from typing import Optional
 
-import requests
+from app.services import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -16,17 +18,73 @@ ZOOM_TOKEN_URL = "https://zoom.us/oauth/token"
 ZOOM_API_BASE = "https://api.zoom.us/v2"
 ZOOM_SCOPES = "meeting:write:admin"  # Meeting yaratish uchun
 
+TOKEN_EARLY_REFRESH_SEC = 300  # token tugashidan 5 daqiqa oldin yangilanadi
+MAX_RATE_LIMIT_RETRIES = 3     # 429 javobida Retry-After bo'yicha qayta urinish
 
-def get_access_token(account_id: str, client_id: str, client_secret: str) -> Optional[str]:
+# (token_url, account_id, client_id) -> (access_token, expires_at, fetched_at) – monotonic soniyalar
+_token_cache = {}
+_token_lock = threading.Lock()
+_token_fetch_lock = threading.Lock()
+
+
+def zoom_config(app_config) -> dict:
+    """app.config dan create_schedule_meeting uchun Zoom sozlamalari."""
+    keys = ('ZOOM_ACCOUNT_ID', 'ZOOM_CLIENT_ID', 'ZOOM_CLIENT_SECRET', 'ZOOM_DURATION_MINUTES',
+            'ZOOM_TIMEZONE', 'ZOOM_TOKEN_URL', 'ZOOM_API_BASE')
+    return {k: app_config.get(k) for k in keys}
+
+
+def is_configured(config: dict) -> bool:
+    return all(config.get(k) for k in ('ZOOM_ACCOUNT_ID', 'ZOOM_CLIENT_ID', 'ZOOM_CLIENT_SECRET'))
+
+
+def invalidate_token(account_id: str = None, client_id: str = None):
+    """Keshdagi tokenni tashlash (401 javobidan keyin); argumentsiz – hammasi."""
+    with _token_lock:
+        if account_id is None:
+            _token_cache.clear()
+            return
+        for key in [k for k in _token_cache if k[1] == account_id and k[2] == client_id]:
+            _token_cache.pop(key, None)
+
+
+def get_access_token(account_id: str, client_id: str, client_secret: str,
+                     token_url: str = None, force_refresh: bool = False) -> Optional[str]:
     """
     Zoom Server-to-Server OAuth orqali access token olish.
-    Token 1 soat amal qiladi.
+    Token 1 soat amal qiladi – keshda saqlanadi va tugashidan TOKEN_EARLY_REFRESH_SEC oldin yangilanadi.
     """
+    token_url = token_url or ZOOM_TOKEN_URL
+    key = (token_url, account_id, client_id)
+    requested_at = time.monotonic()
+    cached = _cached_token(key)
+    if cached and not force_refresh:
+        return cached
+    # Bir vaqtda bir nechta thread token so'ramasin – biri oladi, qolganlari keshdan
+    with _token_fetch_lock:
+        cached_entry = _token_cache.get(key)
+        if cached_entry and (not force_refresh or cached_entry[2] > requested_at):
+            cached = _cached_token(key)
+            if cached:
+                return cached
+        return _fetch_access_token(account_id, client_id, client_secret, token_url)
+
+
+def _cached_token(key):
+    with _token_lock:
+        cached = _token_cache.get(key)
+    if cached and cached[1] - TOKEN_EARLY_REFRESH_SEC > time.monotonic():
+        return cached[0]
+    return None
+
+
+def _fetch_access_token(account_id, client_id, client_secret, token_url):
     try:
         credentials = f"{client_id}:{client_secret}"
         encoded = base64.b64encode(credentials.encode()).decode()
-        response = requests.post(
-            ZOOM_TOKEN_URL,
+        started = time.monotonic()
+        response = http_client.post(
+            token_url,
             params={"grant_type": "account_credentials", "account_id": account_id},
             headers={
                 "Authorization": f"Basic {encoded}",
@@ -36,12 +94,28 @@ def get_access_token(account_id: str, client_id: str, client_secret: str) -> Opt
         )
         response.raise_for_status()
         data = response.json()
-        return data.get("access_token")
+        token = data.get("access_token")
+        if token:
+            expires_in = int(data.get("expires_in") or 3600)
+            with _token_lock:
+                _token_cache[(token_url, account_id, client_id)] = (token, started + expires_in, started)
+        return token
     except Exception as e:
         logger.exception("Zoom access token olishda xato: %s", e)
         return None
 
 
+def _retry_after(response, attempt):
+    try:
+        return min(float(response.headers.get("Retry-After") or 0), 60.0) or 2 ** attempt
+    except (TypeError, ValueError):
+        return 2 ** attempt
+
+
+class ZoomAuthError(Exception):
+    """Zoom API 401 qaytardi."""
+
+
 def create_meeting(
     access_token: str,
     topic: str,
@@ -49,6 +123,7 @@ def create_meeting(
     duration_minutes: int = 90,
     timezone: str = "Asia/Tashkent",
     password: Optional[str] = None,
+    api_base: str = None,
 ) -> Optional[dict]:
     """
     Zoom meeting yaratish.
@@ -60,13 +135,17 @@ def create_meeting(
         duration_minutes: Davomiylik (daqiqalar)
         timezone: Vaqt zonası (default: Asia/Tashkent)
         password: Meeting paroli (ixtiyoriy)
+        api_base: Zoom API manzili (default: ZOOM_API_BASE)
     
     Returns:
         meeting_data: join_url, start_url, meeting_id va boshqalar
         None: xato bo'lsa
+    
+    Raises:
+        ZoomAuthError: token yaroqsiz (401) – chaqiruvchi tokenni yangilab qayta urinadi
     """
     try:
-        url = f"{ZOOM_API_BASE}/users/me/meetings"
+        url = f"{(api_base or ZOOM_API_BASE).rstrip('/')}/users/me/meetings"
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
@@ -80,9 +159,20 @@ def create_meeting(
         }
         if password:
             body["password"] = str(password)[:10]
-        response = requests.post(url, headers=headers, json=body, timeout=15)
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            response = http_client.post(url, headers=headers, json=body, timeout=15)
+            if response.status_code == 429 and attempt < MAX_RATE_LIMIT_RETRIES:
+                wait = _retry_after(response, attempt)
+                logger.info("Zoom rate limit (429), %.1f s kutiladi", wait)
+                time.sleep(wait)
+                continue
+            break
+        if response.status_code == 401:
+            raise ZoomAuthError("Zoom token yaroqsiz")
         response.raise_for_status()
         return response.json()
+    except ZoomAuthError:
+        raise
     except Exception as e:
         logger.exception("Zoom meeting yaratishda xato: %s", e)
         return None
@@ -125,7 +215,9 @@ def create_schedule_meeting(
         logger.debug("Zoom sozlamalari to'liq emas, meeting yaratilmaydi")
         return None
 
-    token = get_access_token(account_id, client_id, client_secret)
+    token_url = config.get("ZOOM_TOKEN_URL") or ZOOM_TOKEN_URL
+    api_base = config.get("ZOOM_API_BASE") or ZOOM_API_BASE
+    token = get_access_token(account_id, client_id, client_secret, token_url=token_url)
     if not token:
         return None
 
@@ -144,13 +236,24 @@ def create_schedule_meeting(
     duration = config.get("ZOOM_DURATION_MINUTES") or config.get("zoom_duration_minutes") or 90
     timezone = config.get("ZOOM_TIMEZONE") or config.get("zoom_timezone") or "Asia/Tashkent"
 
-    meeting = create_meeting(
-        access_token=token,
-        topic=topic,
-        start_time=start_iso,
-        duration_minutes=duration,
-        timezone=timezone,
-    )
+    meeting = None
+    for attempt in range(2):
+        try:
+            meeting = create_meeting(
+                access_token=token,
+                topic=topic,
+                start_time=start_iso,
+                duration_minutes=duration,
+                timezone=timezone,
+                api_base=api_base,
+            )
+            break
+        except ZoomAuthError:
+            # Token muddatidan oldin bekor qilingan – bir marta yangilab qayta urinish
+            token = get_access_token(account_id, client_id, client_secret, token_url=token_url, force_refresh=True) if attempt == 0 else None
+            if not token:
+                logger.warning("Zoom token yaroqsiz, meeting yaratilmadi")
+                break
 
     if meeting and meeting.get("join_url"):
         return meeting["join_url"]
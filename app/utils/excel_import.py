@@ -1396,9 +1396,9 @@ def generate_subjects_sample_file(lang='uz'):
     return output
 
 
-def _translate_subject_name(text, source_lang, target_lang):
+def _translate_subject_name(text, source_lang, target_lang, prefetched=None):
     """Bir tildan boshqasiga tarjima (fan nomi uchun)."""
-    return _translate_department_name(text, source_lang, target_lang)
+    return _translate_department_name(text, source_lang, target_lang, prefetched)
 
 
 def import_subjects_from_excel(file, source_lang='uz'):
@@ -1422,6 +1422,7 @@ def import_subjects_from_excel(file, source_lang='uz'):
         max_row = ws.max_row
         if max_row < header_row + 1:
             return {'success': True, 'imported': 0, 'updated': 0, 'errors': []}
+        prefetched = _prefetch_name_translations(ws, header_row, max_row, source_lang)
 
         for row_num in range(header_row + 1, max_row + 1):
             try:
@@ -1446,9 +1447,9 @@ def import_subjects_from_excel(file, source_lang='uz'):
                     single = name_uz or name_ru or name_en
                     if not single:
                         continue
-                    name_uz = single if source_lang == 'uz' else _translate_subject_name(single, source_lang, 'uz')
-                    name_ru = single if source_lang == 'ru' else _translate_subject_name(single, source_lang, 'ru')
-                    name_en = single if source_lang == 'en' else _translate_subject_name(single, source_lang, 'en')
+                    name_uz = single if source_lang == 'uz' else _translate_subject_name(single, source_lang, 'uz', prefetched)
+                    name_ru = single if source_lang == 'ru' else _translate_subject_name(single, source_lang, 'ru', prefetched)
+                    name_en = single if source_lang == 'en' else _translate_subject_name(single, source_lang, 'en', prefetched)
 
                 name = name_uz or name_ru or name_en
                 if not name:
@@ -1606,17 +1607,43 @@ def generate_departments_sample_file(lang='uz'):
     return output
 
 
-def _translate_department_name(text, source_lang, target_lang):
-    """Bir tildan boshqasiga tarjima (deep_translator)."""
+def _translate_department_name(text, source_lang, target_lang, prefetched=None):
+    """Bir tildan boshqasiga tarjima (tarjima xotirasi orqali). prefetched – _prefetch_name_translations natijasi."""
     if not text or source_lang == target_lang:
         return text or ''
+    if prefetched is not None:
+        found = prefetched.get(target_lang, {}).get(text.strip())
+        if found:
+            return found
     try:
-        from deep_translator import GoogleTranslator
-        return GoogleTranslator(source=source_lang, target=target_lang).translate(text) or ''
+        from app.services.translation_memory import translate
+        return translate(text, source_lang, target_lang)
     except Exception:
         return ''
 
 
+def _prefetch_name_translations(ws, header_row, max_row, source_lang):
+    """
+    A/B/C ustunlarda faqat bitta til berilgan qatorlar nomlarini oldindan, har til uchun bitta
+    translate_many bilan tarjima qilish: {target_lang: {matn: tarjima}}.
+    """
+    singles = set()
+    for row_num in range(header_row + 1, max_row + 1):
+        values = [ws.cell(row=row_num, column=col).value for col in (1, 2, 3)]
+        names = [str(v).strip() if v else '' for v in values]
+        if all(names) or not any(names):
+            continue
+        singles.add(names[0] or names[1] or names[2])
+    if not singles:
+        return {}
+    try:
+        from app.services.translation_memory import translate_many
+        return {target: translate_many(singles, source_lang, target)
+                for target in ('uz', 'ru', 'en') if target != source_lang}
+    except Exception:
+        return {}
+
+
 def import_departments_from_excel(file, source_lang='uz'):
     """Excel fayldan kafedralarni import qilish.
     - A/B/C ustunlar: kafedra nomlari (O'z, Ru, En)
@@ -1638,6 +1665,7 @@ def import_departments_from_excel(file, source_lang='uz'):
         max_row = ws.max_row
         if max_row < header_row + 1:
             return {'success': True, 'imported': 0, 'updated': 0, 'errors': []}
+        prefetched = _prefetch_name_translations(ws, header_row, max_row, source_lang)
 
         for row_num in range(header_row + 1, max_row + 1):
             try:
@@ -1672,9 +1700,9 @@ def import_departments_from_excel(file, source_lang='uz'):
                     single = (str(val_a).strip() or str(val_b).strip() or str(val_c).strip())
                     if not single:
                         continue
-                    name_uz = single if source_lang == 'uz' else _translate_department_name(single, source_lang, 'uz')
-                    name_ru = single if source_lang == 'ru' else _translate_department_name(single, source_lang, 'ru')
-                    name_en = single if source_lang == 'en' else _translate_department_name(single, source_lang, 'en')
+                    name_uz = single if source_lang == 'uz' else _translate_department_name(single, source_lang, 'uz', prefetched)
+                    name_ru = single if source_lang == 'ru' else _translate_department_name(single, source_lang, 'ru', prefetched)
+                    name_en = single if source_lang == 'en' else _translate_department_name(single, source_lang, 'en', prefetched)
 
                 existing = Department.query.filter(
                     (Department.name_uz == name_uz) | (Department.name == name_uz)
@@ -2193,6 +2221,7 @@ def import_schedule_from_excel(file):
         
         success_count = 0
         errors = []
+        without_link = []
         
         # Sarlavha qatorini topish (Header Row)
         header_row_index = None
@@ -2353,16 +2382,22 @@ def import_schedule_from_excel(file):
                     link=link_val
                 )
                 db.session.add(schedule)
+                if not link_val:
+                    without_link.append(schedule)
                 success_count += 1
                 
             except Exception as e:
                 errors.append(f"Qator {row[0].row}: Xatolik - {str(e)}")
                 
+        db.session.flush()
+        schedule_ids = [sch.id for sch in without_link]
         db.session.commit()
         return {
             'success': True,
             'imported': success_count,
-            'errors': errors
+            'errors': errors,
+            # Linki bo'sh jadvallar – Zoom meeting fonda yaratiladi (zoom_jobs)
+            'schedule_ids': schedule_ids,
         }
         
     except Exception as e:
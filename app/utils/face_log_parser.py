@@ -0,0 +1,174 @@
+"""
+Face log raw_data (Hikvision/Dahua JSON yoki multipart) dan ko'rsatish uchun maydonlarni ajratish.
+Ingestion paytida bir marta chaqiriladi va natija face_logs ustunlariga yoziladi;
+o'qish yo'lida (dashboard, loglar) raw_data qayta parse qilinmaydi.
+"""
+import json
+import re
+from datetime import datetime
+
+_DATE_TIME_RE = re.compile(r'"dateTime"\s*:\s*"([^"]+)"')
+_DATE_TIME_ALT_RE = re.compile(r'"date_time"\s*:\s*"([^"]+)"')
+_IP_RE = re.compile(r'"ipAddress"\s*:\s*"([^"]+)"')
+_IP_ALT_RE = re.compile(r'"ip_address"\s*:\s*"([^"]+)"')
+_DEVICE_NAME_RE = re.compile(r'"deviceName"\s*:\s*"([^"]+)"')
+_DEVICE_NAME_ALT_RE = re.compile(r'"device_name"\s*:\s*"([^"]+)"')
+
+
+def extract_event_log_from_multipart(raw_str):
+    """Hikvision multipart/form-data dan event_log qismidagi JSON ni ajratib oladi."""
+    try:
+        idx = raw_str.find('name="event_log"')
+        if idx == -1:
+            idx = raw_str.find("name='event_log'")
+        if idx == -1:
+            return None
+        rest = raw_str[idx:]
+        start = rest.find('{')
+        if start == -1:
+            return None
+        depth = 0
+        for i, c in enumerate(rest[start:], start):
+            if c == '{':
+                depth += 1
+            elif c == '}':
+                depth -= 1
+                if depth == 0:
+                    return rest[start:i + 1]
+        return None
+    except Exception:
+        return None
+
+
+def _load_json_dict(s):
+    if not s or not s.startswith('{'):
+        return None
+    try:
+        data = json.loads(s)
+    except (ValueError, TypeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _parse_device_dt(s):
+    """'2026-02-25T09:04:14+05:00' -> qurilma mahalliy vaqti (naive)."""
+    s = str(s).strip()
+    if len(s) < 16:
+        return None
+    part = s.split('+')[0].split('Z')[0].strip()[:19]
+    try:
+        if 'T' in part:
+            return datetime.strptime(part, '%Y-%m-%dT%H:%M:%S')
+        if ' ' in part:
+            return datetime.strptime(part, '%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        pass
+    return None
+
+
+def parse_device_time(raw, data=None):
+    """Raw dagi dateTime – qurilma yuborgan vaqt (JSON yoki multipart)."""
+    m = _DATE_TIME_RE.search(raw) or _DATE_TIME_ALT_RE.search(raw)
+    if m:
+        dt = _parse_device_dt(m.group(1))
+        if dt is not None:
+            return dt
+    if data is None:
+        data = _load_json_dict(raw.strip())
+    if data:
+        for key in ('dateTime', 'date_time', 'eventTime', 'event_time', 'EventTime', 'DateTime'):
+            val = data.get(key)
+            if val:
+                dt = _parse_device_dt(val)
+                if dt is not None:
+                    return dt
+    return None
+
+
+def parse_device_local_ip(raw, event_data=None):
+    """Qurilmaning lokal IP si (ipAddress) – tashqi IP emas, raw ichidagi qiymat."""
+    if event_data:
+        v = str(event_data.get('ipAddress') or event_data.get('ip_address') or '').strip()
+        if v:
+            return v
+    m = _IP_RE.search(raw) or _IP_ALT_RE.search(raw)
+    if m:
+        return m.group(1).strip() or None
+    return None
+
+
+def parse_device_name(raw, data=None):
+    """Qurilma nomi (deviceName)."""
+    if data:
+        v = str(data.get('deviceName') or data.get('device_name') or '').strip()
+        if v:
+            return v
+    m = _DEVICE_NAME_RE.search(raw) or _DEVICE_NAME_ALT_RE.search(raw)
+    if m:
+        return m.group(1).strip() or None
+    return None
+
+
+def parse_raw_extra(raw_data):
+    """raw_data (JSON) dan dashboard uchun qo'shimcha maydonlarni ajratib oladi."""
+    out = {'role': None, 'department': None, 'attendanceStatus': 'present', 'kpiScore': None, 'similarity': None}
+    if not raw_data or not isinstance(raw_data, str):
+        return out
+    try:
+        if 'event_log' in raw_data and '{' in raw_data:
+            json_str = extract_event_log_from_multipart(raw_data) or raw_data
+        else:
+            json_str = raw_data.strip()
+        data = _load_json_dict(json_str)
+        if data is None:
+            return out
+        out['role'] = (data.get('role') or data.get('userType') or '').strip() or None
+        out['department'] = (data.get('department') or data.get('group') or data.get('departmentName') or '').strip() or None
+        out['attendanceStatus'] = (data.get('attendanceStatus') or data.get('status') or 'present')
+        if isinstance(out['attendanceStatus'], str):
+            out['attendanceStatus'] = out['attendanceStatus'].strip().lower().replace(' ', '_')
+        out['kpiScore'] = data.get('kpiScore') or data.get('kpi')
+        out['similarity'] = data.get('similarity') or data.get('faceMatch')
+        return out
+    except Exception:
+        return out
+
+
+def _to_percent(value):
+    if value is None:
+        return None
+    try:
+        return min(100, max(0, int(float(value))))
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_face_log_fields(raw_data):
+    """
+    raw_data dan face_logs ning pre-parse ustunlari uchun qiymatlar (bir marta, ingestion paytida).
+    Qaytaradi: device_time, device_local_ip, device_name, role, department, similarity,
+    kpi_score, attendance_status va raw_parsed=True.
+    """
+    out = {
+        'device_time': None, 'device_local_ip': None, 'device_name': None,
+        'role': None, 'department': None, 'similarity': None, 'kpi_score': None,
+        'attendance_status': None, 'raw_parsed': True,
+    }
+    if not raw_data or not isinstance(raw_data, str):
+        return out
+    raw = raw_data.strip()
+    data = _load_json_dict(raw)
+    event_data = data
+    if 'event_log' in raw and '{' in raw:
+        event_data = _load_json_dict(extract_event_log_from_multipart(raw)) or data
+    out['device_time'] = parse_device_time(raw, data)
+    out['device_local_ip'] = (parse_device_local_ip(raw, event_data) or '')[:50] or None
+    out['device_name'] = (parse_device_name(raw, data) or '')[:150] or None
+    extra = parse_raw_extra(raw_data)
+    out['role'] = (extra.get('role') or '')[:100] or None
+    out['department'] = (extra.get('department') or '')[:150] or None
+    status = extra.get('attendanceStatus')
+    out['attendance_status'] = (str(status)[:30] if status is not None else None) or None
+    out['similarity'] = _to_percent(extra.get('similarity'))
+    out['kpi_score'] = _to_percent(extra.get('kpiScore'))
+    return out
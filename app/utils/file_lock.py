@@ -0,0 +1,64 @@
+"""Jarayonlar orasidagi eksklyuziv fayl qulfi (gunicorn/waitress workerlari uchun): POSIX – fcntl.flock, Windows – msvcrt."""
+import os
+import time
+from contextlib import contextmanager
+
+
+def _try_lock(f):
+    if os.name == 'nt':
+        import msvcrt
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def _unlock(f):
+    if os.name == 'nt':
+        import msvcrt
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def acquire(path, timeout=None, poll=0.1):
+    """
+    Qulfni olish. Qaytaradi: ochiq fayl (release() ga beriladi) yoki timeout tugasa None.
+    timeout=None – kutib turadi, 0 – bir marta urinadi.
+    Qulf jarayon tugaganda (hatto kutilmaganda) OS tomonidan bo'shatiladi.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    f = open(path, 'a+')
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        try:
+            _try_lock(f)
+            return f
+        except OSError:
+            if deadline is not None and time.monotonic() >= deadline:
+                f.close()
+                return None
+            time.sleep(poll)
+
+
+def release(f):
+    try:
+        _unlock(f)
+    except OSError:
+        pass
+    finally:
+        f.close()
+
+
+@contextmanager
+def exclusive_lock(path, timeout=None):
+    """with exclusive_lock(path) as locked: ... – locked False bo'lsa qulf olinmadi (timeout)."""
+    f = acquire(path, timeout=timeout)
+    try:
+        yield f is not None
+    finally:
+        if f is not None:
+            release(f)
@@ -0,0 +1,5991 @@
+# Translation dictionary for 3 languages: Uzbek, Russian, English
+# Complete translations including base UI elements and all flash messages
+#
+# Tarjimalar manbasi – shu yerda tahrirlanadi. Ish vaqtida bu modul import qilinmaydi:
+# app.utils.translations har til uchun kompilyatsiya qilingan katalogni (instance/translations/<til>.cat)
+# kerak bo'lganda yuklaydi; manba o'zgarsa katalog avtomatik qayta yaratiladi.
+
+TRANSLATIONS = {
+    'uz': {
+        # ============================================
+        # SITE INFO
+        # ============================================
+        'site_name': '"Toshkent irrigatsiya va qishloq xo\'jaligini mexanizatsiyalash muhandislari instituti" Milliy Tadqiqot Universiteti LMS',
+        'site_name_short': '"TIQXMMI" MTU LMS',
+        'site_tagline': 'Masofaviy ta\'lim platformasi',
+        'university_name': '"Toshkent irrigatsiya va qishloq xo\'jaligini mexanizatsiyalash muhandislari instituti" Milliy Tadqiqot Universiteti',
+        
+        # ============================================
+        # COMMON UI ELEMENTS
+        # ============================================
+        'dashboard': 'Bosh sahifa',
+        'logout': 'Chiqish',
+        'login': 'Login',
+        'register': "Ro'yxatdan o'tish",
+        'settings': 'Sozlamalar',
+        'search': 'Qidirish',
+        'save': "Saqlash",
+        'cancel': 'Bekor qilish',
+        'delete': "O'chirish",
+        'not_found': "Topilmadi",
+        'edit': "Tahrirlash",
+        'copy_text': "Nusxa olish",
+        'more_options': "Boshqa",
+        'reply': "Javob",
+        'pin': "Qilish",
+        'unpin': "Qilishni bekor qilish",
+        'forward': "Uzatish",
+        'select': "Tanlash",
+        'selected': "tanlangan",
+        'translate': "Tarjima",
+        'create': 'Yaratish',
+        'back': 'Orqaga',
+        'next': 'Keyingi',
+        'previous': 'Oldingi',
+        'submit': 'Yuborish',
+        'close': 'Yopish',
+        'yes': 'Ha',
+        'no': "Yo'q",
+        'actions': 'Amallar',
+        'status': 'Holat',
+        'date': 'Sana',
+        'name': 'Ism',
+        'email': 'Email',
+        'phone': 'Telefon',
+        'password': 'Parol',
+        'confirm_password': 'Parolni tasdiqlash',
+        'role': 'Rol',
+        'active': 'Faol',
+        'inactive': 'Nofaol',
+        
+        # ============================================
+        # NAVIGATION & MENU
+        # ============================================
+        'institution_name': '"TIQXMMI" MTU',
+        'remote_education_platform': "Masofaviy ta'lim platformasi",
+        'payment_info': "To'lov ma'lumotlari",
+        'accounting': 'Buxgalteriya',
+        'admin_panel': 'Admin panel',
+        'staff_database': 'Xodimlar bazasi',
+        'students_database': 'Talabalar bazasi',
+        'subjects_database': 'Fanlar bazasi',
+        'department_head_subjects_subtitle': "O'z kafedrasi fanlarini boshqarish",
+        'department_head_resources_subtitle': "Kafedra fan resurslari va o'qituvchilar",
+        'no_department_assigned': "Sizga hech qanday kafedra biriktirilmagan",
+        'assign_teachers_menu': "O'qituvchi biriktirish",
+        'assign_teachers_subtitle': "Faol semestrlardagi yo'nalish va guruhlarga o'qituvchi biriktirish",
+        'teacher_assigned_success': "O'qituvchi muvaffaqiyatli biriktirildi",
+        'teacher_removed_success': "O'qituvchi muvaffaqiyatli olib tashlandi",
+        'assign_teacher': "O'qituvchi biriktirish",
+        'select_subject': "Fan tanlang",
+        'select_teacher': "O'qituvchi tanlang",
+        'select_group': "Guruh tanlang",
+        'select_lesson_type': "Dars turini tanlang",
+        'assign': "Biriktirish",
+        'assignment_already_exists': "Bu biriktirish allaqachon mavjud",
+        'teacher_assigned_successfully': "O'qituvchi muvaffaqiyatli biriktirildi",
+        'change_teacher': "O'qituvchini almashtirish",
+        'new_teacher': "Yangi o'qituvchi",
+        'assignment_not_found': "Biriktirish topilmadi",
+        'teacher_changed_successfully': "O'qituvchi muvaffaqiyatli almashtirildi",
+        'plan_hours': "Reja (soat)",
+        'all_lesson_types': "Barcha dars turlari",
+        'all_progress': "Barcha",
+        'total_rows': "Jami qatorlar",
+        'subjects_database_subtitle': 'O\'quv rejaga biriktirilgan fanlar (yo\'nalish, guruh, o\'qituvchi, fan)',
+        'subject_resources': 'Fan resurslari',
+        'subject_resources_subtitle': "O'qituvchi–fan–guruh bo'yicha to'liq ro'yxat va filtrlash",
+        'search_resources_placeholder': "O'qituvchi, fan, guruh bo'yicha qidirish...",
+        'dashboard_zero_percent_only': "Asosan 0% resurslar (to'liq ro'yxat Fan resurslari bo'limida)",
+        'total_rows': "Jami qatorlar",
+        'filters': 'Filtrlar',
+        'all': 'Barcha',
+        'all_faculties': 'Barcha fakultetlar',
+        'all_courses': 'Barcha kurslar',
+        'all_academic_years': "Barcha o'quv yillari",
+        'all_semesters': 'Barcha semestrlar',
+        'all_education_types': 'Barcha shakllar',
+        'all_directions': 'Barcha yo\'nalishlar',
+        'all_groups': 'Barcha guruhlar',
+        'search_placeholder_curriculum': 'Fan nomi, qabul yili, yo\'nalish nomi/kodi, guruh nomi, o\'qituvchi, ta\'lim shakli bo\'yicha qidirish...',
+        'subject_count': 'fan',
+        'credit': 'kredit',
+        'no_description': 'Tavsif mavjud emas',
+        'lecture': 'Maruza',
+        'practice': 'Amaliyot',
+        'lab': 'Lab',
+        'seminar': 'Seminar',
+        'course_work': 'Kurs ishi',
+        'available': 'bor',
+        'independent': 'Mustaqil',
+        'hour': 'soat',
+        'subjects_not_found': 'Fanlar topilmadi',
+        'subjects_for_group': "Sizning guruhingizga biriktirilgan fanlar",
+        'subjects_assigned_to_you': "Sizga biriktirilgan fanlar",
+        'subject_search_placeholder': "Fanni qidirish",
+        'curriculum_not_completed': "O'quv reja to'liq bajarilmagan:",
+        'curriculum_warning_no_topics': "{name}: Kamida 1 ta mavzu yaratilishi kerak, lekin hali yaratilmagan",
+        'curriculum_warning_missing': "{name}: {hours} soat uchun {required} para mavzu kerak, lekin {actual} para kiritilgan (kam: {missing} para)",
+        'lessons_unit': "dars",
+        'assignments_unit': "topshiriq",
+        'no_group_assigned': "Sizga hali guruh biriktirilmagan",
+        'change_search_query': "Qidiruv so'zini o'zgartiring",
+        'prev_page': "Oldingi",
+        'next_page': "Keyingi",
+        'change_search': 'Qidiruvni o\'zgartiring.',
+        'dean_office': 'Dekanat',
+        'dean_panel': 'Dekan paneli',
+        'dean_control': 'Dekanat nazorati',
+        'student_groups': "O'quv guruhlari",
+        'academic_subjects': "O'quv fanlari",
+        'faculty_students': 'Fakultet talabalari',
+        'total_teachers_label': "Jami o'qituvchilar",
+        'education_directions': "Ta'lim yo'nalishlari",
+        'reports': 'Hisobotlar',
+        'system_reports': 'Tizim hisobotlari',
+        'general_statistics': 'Umumiy statistika va ma\'lumotlar',
+        'total_users': 'Jami foydalanuvchilar',
+        'active_users': 'Faol foydalanuvchilar',
+        'students_excel': 'Talabalar Excel',
+        'schedule_excel': 'Dars jadvali Excel',
+        'by_faculties': 'Fakultetlar bo\'yicha',
+        'students_by_groups': 'Guruhlar bo\'yicha talabalar',
+        'no_faculties': 'Fakultetlar mavjud emas',
+        'no_groups': 'Guruhlar mavjud emas',
+        'student_count': 'talaba',
+        'grading_system': 'Baholash tizimi',
+        'role_settings': "Rollar sozlamalari",
+        'site_settings': "Sayt sozlamalari",
+        'site_settings_description': "Platforma nomi, qisqacha nomi, tagline va logoni o'zgartiring.",
+        'site_settings_general': "Umumiy ma'lumotlar",
+        'site_settings_institution_name': "Muassasa (platforma) to'liq nomi",
+        'site_settings_short_name': "Qisqacha nom (sarlavha uchun)",
+        'site_settings_short_name_hint': "Brauzer tab va sahifa sarlavhasida ko'rinadi",
+        'site_settings_tagline': "Tagline (slogan)",
+        'site_settings_logo': "Logo",
+        'site_settings_current_logo': "Joriy logo",
+        'site_settings_click_to_enlarge': "Ko'rish uchun bosing",
+        'site_settings_no_logo': "Logo yuklanmagan (standart logo ishlatiladi)",
+        'site_settings_upload_logo': "Yangi logo yuklash",
+        'site_settings_logo_hint': "PNG, JPG, GIF, WebP yoki SVG. Bo'sh qoldirsangiz joriy logo saqlanadi.",
+        'site_settings_remove_logo': "Logoni o'chirish",
+        'site_settings_logo_upload_error': "Logo yuklanmadi. Fayl hajmi yoki ruxsatlarni tekshiring.",
+        'site_settings_logo_format_error': "Logo formati qabul qilinmaydi. Ruxsat etilgan: PNG, JPG, GIF, WebP, SVG.",
+        'site_settings_saved': "Sayt sozlamalari saqlandi.",
+        'site_settings_reset_to_default': "Bosh holatga qaytarish",
+        'site_settings_reset_confirm': "Barcha sayt sozlamalari (nomlar, tagline, logolar) tozalanadi. Davom etasizmi?",
+        'site_settings_reset_done': "Sayt sozlamalari bosh holatga qaytarildi.",
+        'grade_scale_settings': 'Ballik tizim sozlamalari',
+        'reset_to_default': 'Standartga qaytarish',
+        'new_grade': 'Yangi baho',
+        'about_grading_system': 'Baholash tizimi haqida',
+        'grading_system_description': 'Bu yerda talabalar baholarini hisoblash uchun ishlatiladigan ballik tizimni sozlashingiz mumkin. Har bir baho uchun minimal va maksimal ball oralig\'ini, GPA qiymatini va boshqa parametrlarni belgilang.',
+        'grades_table': 'Baholar jadvali',
+        'order': 'Tartib',
+        'grade': 'Baho',
+        'name': 'Nomi',
+        'score_range': 'Ball oralig\'i',
+        'status': 'Holat',
+        'actions': 'Amallar',
+        'passed': 'O\'tdi',
+        'failed': 'O\'tmadi',
+        'no_grades': 'Baholar yo\'q',
+        'grading_system_not_configured': 'Hali baholash tizimi sozlanmagan',
+        'add_new_grade': 'Yangi baho qo\'shish',
+        'visual_appearance': 'Vizual ko\'rinish',
+        'confirm_reset_grades': 'Haqiqatan ham standart holatga qaytarishni xohlaysizmi?',
+        'confirm_delete_grade': 'Haqiqatan ham o\'chirmoqchimisiz?',
+        
+        # ============================================
+        # PAGE TITLES & HEADERS
+        # ============================================
+        'home_page': 'Bosh sahifa',
+        'admin_control_panel': 'Admin boshqaruv paneli',
+        'system_management_monitoring': 'Tizimni boshqarish va monitoring',
+        'all_users_list': "Barcha foydalanuvchilar ro'yxati",
+        'all_students_list': "Barcha talabalar ro'yxati",
+        'all_faculties_list': "Barcha fakultetlar ro'yxati",
+        'all_subjects_list': "Barcha fanlar ro'yxati",
+        'all_lessons_list': "Barcha darslar ro'yxati",
+        'all_staff_list': "Barcha xodimlar ro'yxati",
+        'all_teachers_list': "Barcha o'qituvchilar ro'yxati",
+        
+        # ============================================
+        # BUTTONS & ACTIONS
+        # ============================================
+        'new_user': 'Yangi foydalanuvchi',
+        'add_user': "Foydalanuvchi qo'shish",
+        'new_student': 'Yangi talaba',
+        'new_subject': 'Yangi fan',
+        'new_faculty': 'Yangi fakultet',
+        'create_subject': 'Fan yaratish',
+        'create_group': 'Guruh yaratish',
+        'new_staff': 'Yangi xodim',
+        'create_staff_title': 'Yangi xodim yaratish',
+        'create_staff_button': 'Xodim yaratish',
+        'edit_staff_title': 'Xodimni tahrirlash',
+        'basic_info': "Asosiy ma'lumotlar",
+        'academic_info': "Akademik ma'lumotlar",
+        'create_student_title': "Yangi talaba yaratish",
+        'create_student_subtitle': "Talaba ma'lumotlarini kiriting va guruhga biriktiring",
+        'student_id_label': "Talaba ID",
+        'passport_label': "Pasport",
+        'enrollment_year': "Qabul yili",
+        'select_course_placeholder': "Kursni tanlang",
+        'select_semester_placeholder': "Semestrni tanlang",
+        'select_education_type_placeholder': "Ta'lim shaklini tanlang",
+        'select_direction_placeholder': "Yo'nalishni tanlang",
+        'select_group_placeholder': "Guruhni tanlang",
+        'select_education_type_placeholder': "Ta'lim shaklini tanlang",
+        'create_student_button': "Talaba yaratish",
+        'group_name_placeholder': "Guruh nomi",
+        'create_group_title': "Yangi guruh yaratish",
+        'create_group_page_title': "Yangi guruh",
+        'group_name_placeholder_example': "Masalan: DI-21",
+        'edit_student_title': "Talabani tahrirlash",
+        'edit_student_subtitle': "Ma'lumotlarini o'zgartirish",
+        'edit_group_title': "Guruhni tahrirlash",
+        'group_name_label': "Guruh nomi *",
+        'faculty_auto_selected': "Fakultet avtomatik tanlangan",
+        'update': "Yangilash",
+        'update_page_title': "Tizim yangilanishi",
+        'update_page_description': "Platforma versiyasini tekshiring va qo'lda yangilang (institutda avtomatik yangilanish 00:00–06:00 da).",
+        'update_check_btn': "Yangilanishni tekshirish",
+        'update_run_btn': "Yangilashni o'rnatish",
+        'update_current_version': "Joriy versiya",
+        'update_latest_version': "So'nggi versiya",
+        'update_available': "Yangilanish mavjud.",
+        'update_up_to_date': "Platforma joriy.",
+        'update_not_available': "Yangilanish mavjud emas.",
+        'update_center_timeout': "Markazga ulanish vaqti tugadi — {url}",
+        'update_center_connection_error': "Markazga ulanish xato (manzil yoki tarmoq) — {url}",
+        'update_center_not_configured': "CENTRAL_API_URL sozlanmagan",
+        'update_center_bad_response': "Markaz javobi: {code} — {url}",
+        'update_version_failed': "So'nggi versiya olinmadi",
+        'update_center_no_connection': "Markazga ulanish yo'q (CENTRAL_API_URL)",
+        'error': "Xato",
+        'update_disabled_note': "Markazga ulanish yo'q (CENTRAL_API_URL sozlanmagan).",
+        'update_installed_restart': "Yangilanish o'rnatildi. Tizim tez orada qayta ishga tushadi.",
+        'update_not_applied': "Yangilanish o'tkazilmadi (so'nggi versiya o'rnatilgan yoki xato).",
+        'update_broadcast_sent': "Yangilanish xabari barcha institutlarga yuborildi.",
+        'update_broadcast_error': "Xabar yuborishda xato.",
+        'institutions_updated': "Institutlar ro'yxati yangilandi.",
+        'update_institutions_section_title': "Markazga ulangan institutlar",
+        'update_trigger_btn': "Yangilanishni barcha institutlarga yuborish",
+        'center_block_status': "Markaz holati",
+        'center_blocked': "Markaz bloklangan",
+        'center_not_blocked': "Markaz bloklanmagan",
+        'center_block_btn': "Markazni bloklash",
+        'center_unblock_btn': "Markaz blokini olish",
+        'institutions_connected': "Ulangan",
+        'institutions_blocked': "Bloklangan",
+        'institution_edit': "Tahrirlash",
+        'institution_block': "Bloklash",
+        'institution_unblock': "Blokni olish",
+        'institution_name_label': "Institut nomi",
+        'institution_id_label': "Institut ID",
+        'institution_block_reason': "Bloklash sababi",
+        'institution_deleted': "Institut ro'yxatdan o'chirildi.",
+        'confirm_delete_institution': "Ushbu institutni ro'yxatdan o'chirishni xohlaysizmi?",
+        'institution_id_exists': "Bunday ID mavjud. Boshqa ID kiriting.",
+        'add_institution': "Institut qo'shish",
+        'faollik': "Faollik",
+        'description_short_placeholder': "Qisqacha ma'lumot...",
+        'passport_info': "Pasport ma'lumotlari",
+        'passport_series_number': 'Pasport seriyasi va raqami',
+        'pinfl': 'JSHSHIR',
+        'used_as_password': 'Bu parol sifatida ishlatiladi',
+        'birth_date': "Tug'ilgan sana",
+        'name_placeholder': 'Ism Familiya',
+        'staff_description_placeholder': "Xodim haqida qisqacha ma'lumot...",
+        'multiple_roles_can_select': "Bir nechta rol tanlash mumkin",
+        'role_optional_default_xodim': "Rol ixtiyoriy; tanlanmasa «Xodim» deb ko'rsatiladi.",
+        'role_optional_no_xodim_role': "Xodim roli alohida yo'q; hech qanday rol tanlanmasa «Xodim» deb saqlanadi.",
+        'staff_fid': "F.ID",
+        'staff_fid_placeholder': "Qurilmadagi xodim ID",
+        'student_fid_placeholder': "Qurilmadagi talaba ID",
+        'staff_role_xodim': "Xodim",
+        'select_faculty_placeholder': "Fakultetni tanlang...",
+        'dean_must_select_faculty': "Dekan roli uchun fakultet tanlash majburiy",
+        'accountant': 'Buxgalter',
+        'new_lesson': 'Yangi dars',
+        'new_account': 'Yangi hisob',
+        'add_faculty': "Fakultet qo'shish",
+        'add_subject': "Fan qo'shish",
+        'create_faculty': 'Fakultet yaratish',
+        'import_from_excel': 'Excel dan import',
+        'export_to_excel': 'Excel yuklab olish',
+        'export': 'Export',
+        'import': 'Import',
+        'clear': 'Tozalash',
+        'ok': 'OK',
+        'all_subjects': "Barcha fanlar",
+        'view_all': "Barchasini ko'rish",
+        'block': 'Bloklash',
+        'activate': 'Faollashtirish',
+        'reset_password': 'Parolni qaytarish',
+        'edit_info': "Ma'lumotlarni tahrirlash",
+        
+        # ============================================
+        # TABLE HEADERS & LABELS
+        # ============================================
+        'additional': "Qo'shimcha",
+        'full_name_student_id': "To'liq ism / Talaba ID",
+        'full_name_login': "To'liq ism / Login",
+        'passport_pinfl': 'Pasport raqami / JSHSHIR',
+        'phone_email': 'Telefon / Email',
+        'group_direction': "Guruh / Yo'nalish",
+        'responsible_deans': 'Masul dekanlar',
+        'no_responsible_dean': 'Masul dekan belgilanmagan',
+        
+        # ============================================
+        # FILTERS & OPTIONS
+        # ============================================
+        'all_roles': 'Barcha rollar',
+        'all_faculties': 'Barcha fakultetlar',
+        'all_courses': 'Barcha kurslar',
+        'all_academic_years': "Barcha o'quv yillari",
+        'all_semesters': 'Barcha semestrlar',
+        'all_types': 'Barcha shakllar',
+        'all_directions': "Barcha yo'nalishlar",
+        'all_groups': 'Barcha guruhlar',
+        'course_suffix': '-kurs',
+        'semester_suffix': '-semestr',
+        'education_type': "Ta'lim shakli",
+        'education_type_kunduzgi': 'Kunduzgi',
+        'education_type_sirtqi': 'Sirtqi',
+        'education_type_kechki': 'Kechki',
+        'education_type_masofaviy': 'Masofaviy',
+        'course_year_option': '{n}-kurs',
+        'select_option_choose': 'Tanlang',
+        'create_group_mode': 'Guruh yaratish',
+        'switch_back_to_select': "Tanlashga qaytish",
+        'please_enter_group_name': "Iltimos, guruh nomini kiriting!",
+        
+        # ============================================
+        # STATUS & MESSAGES
+        # ============================================
+        'blocked': 'Bloklangan',
+        'group_not_assigned': 'Guruh belgilanmagan',
+        'description': 'Tavsif',
+        'no_description': "Tavsif yo'q",
+        'users_not_found': 'Foydalanuvchilar topilmadi',
+        'students_not_found': 'Talabalar topilmadi',
+        'teachers_not_found': "O'qituvchilar topilmadi",
+        'no_faculties': 'Fakultetlar mavjud emas',
+        'no_users': 'Foydalanuvchilar mavjud emas',
+        'no_subjects': 'Fanlar mavjud emas',
+        'no_active_groups': 'Faol guruhlar topilmadi',
+        'groups_empty_hint': "Talabasi bor guruhlar shu yerda ko'rsatiladi. Qidiruvni o'zgartiring yoki yangi guruh yarating.",
+        'direction_not_assigned': "Yo'nalish biriktirilmagan",
+        'lessons_no_content_warning': "Darslar mavjud, lekin videolar/fayllar yo'q",
+        'description_not_available': "Tavsif mavjud emas",
+        'taught_courses_label': "Kurslar",
+        'search_result_empty': "Qidiruv natijasi bo'sh",
+        'start_creating_faculty': 'Yangi fakultet yaratishni boshlang',
+        'start_creating_subject': "Yangi fan yaratishni boshlang",
+        'loading': 'Yuklanmoqda…',
+        'load_error': "Yuklashda xatolik. Sahifani yangilab ko'ring.",
+        
+        # ============================================
+        # PAGINATION
+        # ============================================
+        'first': 'Birinchi',
+        'last': 'Oxirgi',
+        'total_items': 'jami',
+        'pagination_range': '{start}-{end} / jami {total} ta',
+        
+        # ============================================
+        # STATS & COUNTS
+        # ============================================
+        'total': 'Jami',
+        'admins': 'Adminlar',
+        'deans': 'Dekanlar',
+        'teachers': "O'qituvchilar",
+        'students': 'Talabalar',
+        'staff': 'Xodimlar',
+        'all_users': 'Barcha foydalanuvchilar',
+        'all_staff': 'Barcha xodimlar',
+        'student_count': 'Talabalar soni',
+        'available': 'Mavjud',
+        'taught_subjects': "O'qitiladigan fanlar",
+        'items_count': "elementlari",
+        'with_assignments': "biriktirilgan",
+        'groups_with_students': "talabali guruhlar",
+        'system_members': "Tizim a'zolari",
+        
+        # ============================================
+        # SEARCH & PLACEHOLDERS
+        # ============================================
+        'search_name_email': 'Qidirish (ism, email)...',
+        'search_name_email_role': 'Qidirish (ism, email, rol)...',
+        'search_name_code': 'Qidirish (nomi, kodi)...',
+        'search_student_fields': 'Qidirish (ism, login, pasport, JSHSHIR, telefon, email)...',
+        'search_direction_placeholder': "Qabul yili, kod, nom, ta'lim shakli...",
+        'search_group_placeholder': "Guruh nomi, yo'nalish bo'yicha qidirish...",
+        'search_subject_placeholder': "Fan nomi yoki tavsif bo'yicha qidirish...",
+        'search_teacher_placeholder': "O'qituvchini qidirish",
+        'search_name_placeholder': "Nomi yoki tavsif bo'yicha qidirish...",
+        'search_department_name_or_head_placeholder': "Kafedra nomi yoki kafedra mudiri bo'yicha qidirish...",
+        
+        # ============================================
+        # CONFIRMATION MESSAGES
+        # ============================================
+        'confirm_delete_user': "Bu foydalanuvchini o'chirmoqchimisiz?",
+        'confirm_delete_student': "Bu talabani o'chirmoqchimisiz?",
+        'confirm_delete_faculty': "Bu fakultetni o'chirmoqchimisiz? Barcha guruhlar, fanlar va ma'lumotlar o'chib ketadi.",
+        'confirm_delete_subject': "Bu fanni o'chirmoqchimisiz?",
+        'confirm_delete_group': "Bu guruhni o'chirmoqchimisiz? Ichidagi talabalar ham o'chib ketishi mumkin.",
+        'confirm_delete_direction': "Yo'nalishni o'chirishni tasdiqlaysizmi?",
+        'confirm_reset_password': "Parolni boshlang'ich holatga qaytarmoqchimisiz?",
+        
+        # ============================================
+        # OTHER COMMON
+        # ============================================
+        'today_overview': "Bugungi kunning umumiy ko'rinishi",
+        'recent_users': "So'nggi foydalanuvchilar",
+        'new_members': "Yangi a'zolar",
+        'no_announcements_found': "Hech qanday e'lon topilmadi",
+        'create_announcement_label': "E'lon berish",
+        'important_label': "Muhim",
+        'quick_actions': 'Tezkor amallar',
+        'my_subjects': "Mening fanlarim",
+        'assigned_subjects': "Biriktirilgan fanlar",
+        'assigned_groups_count': "Guruhlar soni",
+        'subject_assignments_count': "Fanlar topshiriqlari",
+        'unchecked': "Tekshirilmagan",
+        'students_awaiting_grading': "Baholashni kutmoqda",
+        'search_subjects_placeholder': "Fanlarni qidirish...",
+        'search_assignments_placeholder': "Topshiriqlarni qidirish...",
+        'resources_available': "resurs mavjud",
+        'resources': "Resurslar",
+        'resource': "Resurs",
+        'no_assigned_subjects': "Sizga biriktirilgan fanlar mavjud emas",
+        'all_assignments': "Barcha topshiriqlar",
+        'new_count_suffix': "ta yangi",
+        'new_short': "yangi",
+        'no_deadline': "Muddatsiz",
+        'no_new_answers': "Yangi javoblar yo'q",
+        'all_checked': "Barchasi tekshirilgan!",
+        'no_pending_to_check': "Sizda tekshirilmagan yangi topshiriqlar mavjud emas.",
+        'assignments_not_found': "Topshiriqlar topilmadi",
+        'resubmit_count': "ta qayta urinish",
+        'assigned': "Biriktirilgan",
+        'not_assigned': "Biriktirilmagan",
+        'roles': 'Rollar',
+        'profile_settings': 'Profil sozlamalari',
+        'settings_subtitle': "Hisobingiz sozlamalarini boshqaring",
+        'profile_info': "Profil ma'lumotlari",
+        'new_password_confirm_label': "Yangi parolni tasdiqlash",
+        'min_8_chars': "Kamida 8 ta belgi",
+        'additional_info': "Qo'shimcha ma'lumotlar",
+        'registered_at': "Ro'yxatdan o'tgan",
+        'last_login': "So'nggi kirish",
+        'session_timeout_message': "Xavfsizlik uchun 30 daqiqada avtomatik chiqasiz",
+        'course': 'Kurs',
+        'administrator': 'Administrator',
+        
+        # ============================================
+        # ROLES
+        # ============================================
+        'admin': 'Administrator',
+        'dean': 'Dekan',
+        'edu_dept': "O'quv bo'limi",
+        'department_head': 'Kafedra mudiri',
+        'teacher': "O'qituvchi",
+        'student': 'Talaba',
+        'superadmin': 'Superadmin',
+        
+        # ============================================
+        # DASHBOARD ELEMENTS
+        # ============================================
+        'welcome': 'Xush kelibsiz',
+        'good_morning': 'Xayrli tong',
+        'good_afternoon': 'Xayrli kun',
+        'good_evening': 'Xayrli kech',
+        'good_night': 'Xayrli tun',
+        'today': 'Bugun',
+        'total_users': 'Jami foydalanuvchilar',
+        'total_students': 'Jami talabalar',
+        'total_teachers': "Jami o'qituvchilar",
+        'total_faculties': 'Jami fakultetlar',
+        'total_groups': 'Jami guruhlar',
+        'total_subjects': 'Jami fanlar',
+        'active_groups_count': 'Aktiv guruhlar soni',
+        'active_by_faculty': "Fakultet bo'yicha",
+        'available_subjects': 'Mavjud fanlar',
+        'recent_announcements': "So'nggi e'lonlar",
+        'important': 'Muhim',
+        'view_all': 'Barchasi',
+        
+        # ============================================
+        # SUBJECTS
+        # ============================================
+        'subjects': 'Fanlar',
+        'subject': 'Fan',
+        'subject_name': 'Fan nomi',
+        'subject_code': 'Fan kodi',
+        'subject_name_placeholder': 'Dasturlash asoslari',
+        'course_name_label': 'Kurs nomi',
+        'create_course_title': "Yangi kurs yaratish",
+        'create_course_subtitle': "Kurs ma'lumotlarini kiriting",
+        'image_url_optional': "Rasm URL (ixtiyoriy)",
+        'course_title_placeholder': 'Masalan: Dasturlash asoslari',
+        'course_description_placeholder': "Kurs haqida qisqacha ma'lumot...",
+        'category_label': 'Kategoriya',
+        'subject_description_placeholder': 'Fan haqida qisqacha ma\'lumot...',
+        'create_new_subject': 'Yangi fan yaratish',
+        'credits': 'Kredit',
+        'semester': 'Semestr',
+        'lessons': 'Darslar',
+        'lesson': 'Dars',
+        'assignments': 'Topshiriqlar',
+        'assignment': 'Topshiriq',
+        'grades': 'Baholar',
+        'grade': 'Baho',
+        'grades_subtitle': "Sizning akademik natijalaringiz (ballik tizim)",
+        'teacher_grades_subtitle': "Fanlar va guruhlar bo'yicha talaba baholari",
+        'no_subjects_assigned_to_you': "Hali sizga fan biriktirilmagan",
+        'overall_score': "Umumiy ball",
+        'subject_count_grades': "ta fan bo'yicha baho",
+        'assignment_count_grades': "ta topshiriq",
+        'mastered_label': "O'zlashtirilgan",
+        'subjects_by_grades': "Fanlar bo'yicha baholar",
+        'no_graded_assignments': "Hali baholangan topshiriqlar mavjud emas",
+        
+        # ============================================
+        # USERS
+        # ============================================
+        'users': 'Foydalanuvchilar',
+        'user': 'Foydalanuvchi',
+        'full_name': 'To\'liq ism',
+        'student_id': 'Talaba ID',
+        'group': 'Guruh',
+        'groups': 'Guruhlar',
+        'direction': "Yo'nalish",
+        'directions': "Yo'nalishlar",
+        'direction_count_label': "yo'nalish",
+        'group_count_label': "guruh",
+        'student_count_label': "talaba",
+        'year_suffix': "yil",
+        'curriculum_label': "O'quv reja",
+        'curriculum_subject_teachers': "Fan o'qituvchilari",
+        'curriculum_selected_count': "{count} tanlangan",
+        'curriculum_subject_search_placeholder': "Fanni qidirish",
+        'curriculum_total_workload': "Umumiy yuklama",
+        'curriculum_hours_unit': "soat",
+        'hours_plan': "Reja",
+        'hours_loaded': "Yuklangan",
+        'curriculum_credits_unit': "kredit",
+        'curriculum_semester_select_label': "Semestr tanlash",
+        'curriculum_add_to_semester': "Semestrga qo'shish",
+        'curriculum_semester_format': "{n}-semestr",
+        'curriculum_table_subjects': "FANLAR",
+        'curriculum_table_total': "JAMI",
+        'curriculum_table_credits': "KREDIT",
+        'curriculum_table_actions': "AMALLAR",
+        'curriculum_replace_subject_tooltip': "Fanni almashtirish",
+        'curriculum_no_subjects_in_semester': "Bu semestrda fanlar mavjud emas",
+        'curriculum_replace_modal_title': "Fanni almashtirish",
+        'curriculum_new_subject_label': "Yangi fan",
+        'curriculum_replace_btn': "Almashtirish",
+        'curriculum_confirm_delete_subject': "Bu fanni o'chirmoqchimisiz?",
+        'curriculum_please_select_subject': "Iltimos, kamida bitta fan tanlang!",
+        'curriculum_please_select_semester': "Iltimos, semestrni tanlang!",
+        'subject_count_unit': "fan",
+        'lesson_type': "Dars turi",
+        'hours': "Soat",
+        'lesson_type_maruza': "Ma'ruza",
+        'lesson_type_amaliyot': "Amaliyot",
+        'lesson_type_laboratoriya': "Laboratoriya",
+        'lesson_type_seminar': "Seminar",
+        'lesson_type_kurs_ishi': "Kurs ishi",
+        'lesson_type_mustaqil_talim': "Mustaqil ta'lim",
+        'lesson_type_short_m': "M",
+        'lesson_type_short_a': "A",
+        'lesson_type_short_l': "L",
+        'lesson_type_short_s': "S",
+        'lesson_type_short_k': "K",
+        'lesson_type_short_mt': "MT",
+        'select_teacher_placeholder': "O'qituvchini qidirish",
+        'back_to_subjects_list': "Fanlar ro'yxatiga qaytish",
+        'add_lesson': "Dars qo'shish",
+        'add_assignment': "Topshiriq qo'shish",
+        'add_test': "Test qo'shish",
+        'create_test_title': "Yangi test yaratish",
+        'add_test_to_subject': "{subject} faniga yangi test qo'shing",
+        'tests_coming_soon': "Testlar bo'limi keyingi yangilanishda qo'shiladi.",
+        'create_lesson_title': "Yangi dars qo'shish",
+        'edit_lesson_title': "Darsni tahrirlash",
+        'create_assignment_title': "Yangi topshiriq yaratish",
+        'edit_assignment_title': "Topshiriqni tahrirlash",
+        'add_assignment_to_subject': "{subject} faniga yangi topshiriq qo'shing",
+        'create_test_title': "Yangi test yaratish",
+        'add_test_to_subject': "{subject} faniga yangi test qo'shing",
+        'tests_coming_soon': "Testlar bo'limi tez orada qo'shiladi.",
+        'title': "Sarlavha",
+        'content': "Mazmun",
+        'title_placeholder_suffix': " – Test",
+        'test_create_content': "Test yaratish",
+        'test_content_placeholder': "Savol 1\n=====\nVariant 1\n=====\nVariant 2\n=====\n#Variant 3 to'g'ri\n=====\nVariant 4\n+++++\nSavol 2",
+        'test_format_hint': "Format: savol ===== variant1 ===== #to'g'ri variant ===== +++++ keyingi savol",
+        'view_preview': "Ko'rish",
+        'test_questions': "Test savollari",
+        'enter_test_questions_please': "Iltimos, kamida bitta savol kiriting!",
+        'enter_title_please': "Iltimos, sarlavhani kiriting!",
+        'test_created_success': "Test muvaffaqiyatli yaratildi.",
+        'preview_placeholder': "Ko'rish tugmasini bosing, ko'rinishni ko'ring.",
+        'edit_assignment_subtitle': "{subject} fanidagi topshiriqni tahrirlash",
+        'which_topics_related': "Qaysi mavzularga tegishli",
+        'select_lesson_type_first': "Iltimos, avval dars turini tanlang",
+        'select_related_topics_hint': "Ushbu topshiriq qaysi mavzularga tegishli ekanligini belgilang",
+        'no_topics_created_yet': "Ushbu yo'nalishda bu fan uchun hali mavzular yaratilmagan",
+        'no_topics_in_lesson_type': "Ushbu dars turida hali mavzular mavjud emas",
+        'file_upload_required': "Fayl yuklash majburiy",
+        'file_required_hint': "(Agar belgilansa, talabalar javob yuborishda fayl yuklashlari shart)",
+        'enter_description_please': "Iltimos, tavsifni kiriting!",
+        'select_at_least_one_topic': "Iltimos, kamida bitta mavzuni tanlang!",
+        'enter_deadline_please': "Iltimos, muddatni kiriting!",
+        'lesson_type_select': "Dars turini tanlang",
+        'lesson_type_not_available': "Dars turi mavjud emas",
+        'lesson_content_placeholder': "Dars mazmunini yozing...",
+        'score': "Ball",
+        'max_short': "Maks",
+        'assignment_name_label': "Topshiriq nomi",
+        'assignment_title_placeholder': "Masalan: Amaliy topshiriq #1",
+        'assignment_description_placeholder': "Topshiriq haqida batafsil ma'lumot...",
+        'back_to_lesson': "Darsga qaytish",
+        'next_lesson': "Keyingi dars",
+        'confirm_delete_short': "Haqiqatan ham o'chirmoqchimisiz?",
+        'add_lesson_to_subject': "{subject} faniga yangi dars qo'shing",
+        'edit_lesson_subtitle': "{subject} fanidagi darsni tahrirlash",
+        'no_lesson_type_assigned': "Sizga bu fanga (ushbu yo'nalishda) hech qanday dars turi biriktirilmagan",
+        'assignment_only_with_topics': "Faqatgina dars mavzusi mavjud bo'lgan dars turlari uchun topshiriq yaratish mumkin",
+        'topic_name_label': "Mavzu nomi",
+        'topic_name_placeholder': "Masalan: 1-mavzu: Kirish",
+        'video_url_youtube': "Video URL (faqat YouTube)",
+        'video_url_placeholder': "https://youtube.com/watch?v=... yoki https://youtu.be/...",
+        'only_youtube_supported': "Faqat YouTube videolar qo'llab-quvvatlanadi",
+        'or_separator': "— yoki —",
+        'video_upload_label': "Video fayl yuklash (maksimum 200 MB)",
+        'select_video_or_drop': "Video faylni tanlang yoki bu yerga tashlang",
+        'video_formats': "MP4, WebM, OGG formatlarida",
+        'file_url_cloud': "Fayl URL (online cloud xotira va boshqalar)",
+        'file_url_preview': "Tekshirilgan fayl",
+        'add_url': "URL qo'shish",
+        'check': "Tekshirish",
+        'file_url_optional_hint': "Agar fayl linkida fayl topilsa, fayl yuklash ixtiyoriy bo'ladi",
+        'file_upload_multiple': "Fayl yuklash (bir nechta fayl tanlash mumkin)",
+        'select_files_or_drop': "Fayllarni tanlang yoki bu yerga tashlang",
+        'file_formats_list': "PDF, DOC, DOCX, XLS, XLSX, PPT, PPTX, TXT, ZIP, RAR",
+        'checking': "Tekshirilmoqda...",
+        'file_too_large_200': "Fayl hajmi 200 MB dan oshmasligi kerak!",
+        'select_lesson_type_please': "Iltimos, dars turini tanlang!",
+        'video_required_for_lecture': "Maruza dars turi uchun video majburiy! Video fayl yuklang yoki video URL kiriting.",
+        'upload_topic_file_please': "Iltimos, mavzu faylini yuklang yoki fayl URL kiriting!",
+        'check_file_url_please': "Iltimos, fayl URL ni tekshirish tugmasini bosing!",
+        'file_not_found_upload': "Fayl URL da fayl topilmadi. Iltimos, fayl yuklang!",
+        'error_try_again': "Xatolik yuz berdi. Iltimos, qayta urinib ko'ring.",
+        'please_enter_url': "Iltimos, URL kiriting!",
+        'url_or_file_hint': "URL kiriting yoki faylni bu yerga tashlang",
+        'switch_to_url': "URL orqali kirish",
+        'upload_via_url': "URL orqali yuklash",
+        'video_url_preview': "Tekshirilgan video",
+        'video_url_playable': "Video URL tasdiqlandi. Biroq YouTube siyosati sabab ayrim videolar dars ichida ochilmasligi mumkin.",
+        'video_url_not_playable': "Video ko'rishga yaroqsiz yoki topilmadi.",
+        'video_url_check_error': "Video URL tekshirishda xatolik. Qayta urinib ko'ring.",
+        'check_video_url_please': "Iltimos, video URL ni tekshirish tugmasini bosing!",
+        'youtube_embed_fallback_hint': "Ba'zi videolar YouTube cheklovlari sabab sayt ichida ochilmasligi mumkin.",
+        'watch_on_youtube': "YouTube'da ko'rish",
+        'current_video': "Joriy video",
+        'current_files': "Joriy fayl(lar)",
+        'replace_existing_video_notice': "Yangi video yuklasangiz yoki URL kiritsangiz, eskisi o'chiriladi",
+        'replace_existing_file_notice': "Yangi fayl yuklasangiz yoki URL kiritsangiz, eski fayllar o'chiriladi",
+        'file_checking': "Fayl tekshirilmoqda...",
+        'google_link_detected_optional': "Google Drive/Sheets/Docs linki aniqlandi. Link mavjud deb hisoblanadi. Endi fayl yuklash ixtiyoriy bo'ldi.",
+        'file_found_upload_optional': "Fayl topildi! Endi fayl yuklash ixtiyoriy bo'ldi.",
+        'file_not_found_upload_required': "Fayl topilmadi. Fayl yuklash majburiy bo'ladi.",
+        'selected_files_count': "{count} ta fayl tanlandi",
+        'add_file': "+ Qo'shimcha fayl qo'shish",
+        'add_btn': "Qo'shish",
+        'about_subject': "Fan haqida",
+        'no_assignments': "Topshiriqlar yo'q",
+        'tests': "Testlar",
+        'take_test': "Test yechish",
+        'no_tests': "Testlar yo'q",
+        'questions': "savol",
+        'test_submitted_success': "Test muvaffaqiyatli topshirildi.",
+        'answers_sidebar': "Javoblar",
+'finish_test': "Yakunlash",
+            'confirm_finish_test': "Testni yakunlaysizmi?",
+            'confirm_leave_test': "Testni tark etasizmi? Belgilangan javoblar bekor qilinadi.",
+            'submit_test': "Yuborish",
+        'teacher_not_assigned': "O'qituvchi biriktirilmagan",
+        'select_group': "Guruhni tanlang",
+        'until_deadline': "23:59 ga qadar",
+        'deadline': "Muddat",
+        'graded': "Baholangan",
+        'not_graded': "Baholanmagan",
+        'resubmit_available': "Qayta topshirish mumkin",
+        'awaiting_grade': "Baholash kutilmoqda",
+        'not_submitted': "Topshirilmagan",
+        'submitted': "Topshirilgan",
+        'max_score': "Maksimal ball",
+        'submitted_count': "Topshirgan",
+        'student_answers': "Talaba javoblari",
+        'ungraded': "tekshirilmagan",
+        'assignment_description': "Topshiriq tavsifi",
+        'related_topics': "Tegishli mavzular:",
+        'submitted_students': "Topshirgan talabalar",
+        'student': "Talaba",
+        'submitted_at': "Topshirgan vaqti",
+        'grade': "Baho",
+        'feedback': "Izoh",
+        'actions': "Amallar",
+        'attempts': "Urinishlar",
+        'last': "So'nggi",
+        'no_answers': "Javoblar yo'q",
+        'no_submissions_yet': "Hali hech kim javob yubormagan",
+        'unsubmitted_students': "Topshirmagan talabalar",
+        'all_submitted': "Barcha talabalar topshirdi",
+        'student_submission': "Talaba javobi",
+        'all_attempts_history': "Barcha urinishlar tarixi",
+        'attempt': "Urinish",
+        'resubmitted': "Qayta yuborilgan",
+        'download': "Yuklab olish",
+        'file': "fayl",
+        'grading': "Baholash",
+        'grade_for_latest': "Baholash (So'nggi urinish uchun)",
+        'cancel': "Bekor qilish",
+        'comment_optional': "Izoh (ixtiyoriy)",
+        'leave_comment': "Izoh qoldiring...",
+        'save': "Saqlash",
+        'edit': "O'zgartirish",
+        'no_grade_permission': "Sizda ushbu topshiriqni baholash uchun ruxsat yo'q.",
+        'view': "Ko'rish",
+        'not_graded_yet': "Hali baholanmagan",
+        'answers_title': "Javoblar",
+        'received_answers': "Yollangan javoblar",
+        'deadline_by': "Muddat: {date}, Soat: 23:59 ga qadar",
+        'overdue': "Muddat o'tgan",
+        'assimilation': "O'zlashtirish",
+        'across_all_subjects': "Barcha fanlar bo'yicha",
+        'collected_points': "To'plangan ball",
+        'contract_payments': "Kontrakt to'lovlari",
+        'sum_currency': "so'm",
+        'paid_label': "To'lagan",
+        'remaining_label': "Qolgan",
+        'fully_paid': "To'liq to'landi",
+        'partially_paid': "Qisman to'langan",
+        'payment_required': "To'lov talab qilinadi",
+        'no_payment_info': "To'lov ma'lumotlari mavjud emas",
+        'accounting_must_add_payment_info': "Buxgalteriya bo'limi to'lov ma'lumotlarini qo'shishi kerak",
+        'contract_amount_total': "Kontrakt miqdori",
+        'period_range': "Muddat (dan – gacha)",
+        'remaining_payment': "Qolgan to'lov",
+        'overpayment_payment': "Ortiqcha to'lov",
+        'overpayment_label': "Ortiqcha to'langan",
+        'payment_history': "To'lov tarixi",
+        'contract_by_year_title': "O'quv yili bo'yicha kontrakt summasi",
+        'current_year_payment_title': "Joriy o'quv yili to'lovi",
+        'payment_amount_col': "To'lov miqdori",
+        'payment_date_col': "To'lov qilingan sana",
+        'custom_contract_badge': "Maxsus",
+        'contract_short': "Kontrakt",
+        'updated_at_label': "Yangilangan",
+        'percent_paid_suffix': "to'langan",
+        'view_all_subjects': "Barcha fanlarni ko'rish",
+        'upcoming_assignments': "Yonayotgan topshiriqlar",
+        'deadline_until': "23:59 ga qadar",
+        'deadline_label': "Muddat",
+        'time_label': "Soat",
+        'subjects_not_assigned': "Fanlar biriktirilmagan",
+        'all_filter': "Barchasi",
+        'time_left': "Qolgan vaqt:",
+        'deadline_passed_short': "Topshirilmadi",
+        'less_than_1_hour_left': "1 soatdan kam qoldi!",
+        'hours_left_suffix': "soat qoldi",
+        'due_tomorrow': "Ertaga muddat",
+        'days_left_suffix': "kun qoldi",
+        'due_today': "Bugun muddat!",
+        'description_label': "Tavsif",
+        'submissions_history': "Javoblar tarixi",
+        'grade_for_attempt': "Ushbu urinish uchun baho:",
+        'teacher_feedback': "O'qituvchi izohi:",
+        'this_attempt_pending': "Ushbu urinish hali tekshirilmagan...",
+        'edit_answer': "Tahrirlash",
+        'resubmit_answer': "Javobni qayta yuborish",
+        'submit_answer': "Javob yuborish",
+        'attempts_left': "{n} ta urinish qoldi",
+        'file_required': "Fayl majburiy",
+        'overdue_no_resubmit': "Topshiriq muddati o'tgan. Qayta topshirish mumkin emas.",
+        'max_attempts_reached': "Siz allaqachon 3 marta topshirdingiz. Qo'shimcha imkoniyat uchun o'qituvchi bilan bog'laning.",
+        'your_answer_optional': "Javobingiz (ixtiyoriy)",
+        'write_answer': "Javobingizni yozing...",
+        'upload_file': "Fayl yuklash",
+        'optional': "(ixtiyoriy)",
+        'select_file_or_drop': "Faylni tanlang yoki bu yerga tashlang",
+        'file_formats_hint': "PDF, DOC, DOCX, JPG, PNG va boshqalar (maks. 10 MB)",
+        'uploaded_file': "Yuklangan fayl",
+        'edit_answer_modal': "Javobni tahrirlash",
+        'your_answer': "Javobingiz",
+        'update_file_optional': "Faylni yangilash (ixtiyoriy)",
+        'resubmit_btn': "Qayta yuborish",
+        'submit_btn': "Yuborish",
+        'file_size_limit': "Fayl hajmi {max} MB dan oshmasligi kerak!",
+        'file_size_label': "Hajmi: {size} MB",
+        'grade_below_threshold_comment': "Baho o'tish balidan ({threshold}) past bo'lsa, izoh yozish majburiy!",
+        'answer': "javob",
+        'answers': "javob",
+        'locked': "Qulflangan",
+        'watch_previous_videos': "Avval oldingi videolarni to'liq ko'rib chiqing",
+        'video_lesson': "Video dars",
+        'topic_files': "Mavzu fayllari",
+        'topic_file': "Mavzu fayli",
+        'download_file': "Faylni yuklab olish",
+        'download_file_external': "Faylni yuklab olish (Tashqi manba)",
+        'lesson_content': "Dars mazmuni",
+        'video_locked': "Video dars qulflangan",
+        'video_watch_previous': "Avval oldingi video darslarni to'liq ko'rib chiqing",
+        'video_completed': "Video dars to'liq ko'rilgan!",
+        'video_completed_desc': "Siz ushbu video darsni muvaffaqiyatli tamomladingiz",
+        'watch_again': "Qayta ko'rish",
+        'watch_video_lesson': "Video darsni ko'rish",
+        'watch_video_and_checks': "Video darsni ko'ring va tekshiruvlardan o'ting",
+        'lesson_progress': "Dars progressi",
+        'check_label': "Tekshiruv",
+        'completed_at': "To'liq ko'rilgan",
+        'attention_check_title': "DIQQAT TEKSHIRUVI!",
+        'video_watching_question': "Video darsni ko'ryapsizmi?",
+        'video_restart_warning': "Aks holda video dars qaytadan boshlanadi!",
+        'answer_time': "Javob vaqti:",
+        'seconds_unit': "soniya",
+        'yes_watching': "Ha, ko'ryapman",
+        'congratulations': "Tabriklaymiz! 🎉",
+        'lesson_completed_success': "Siz darsni muvaffaqiyatli tamomladingiz va barcha tekshiruvlardan o'tdingiz",
+        'attention_check_failed': "Siz diqqat tekshiruvidan o'ta olmadingiz!",
+        'video_not_supported': "Brauzeringiz video tegini qo'llab-quvvatlamaydi.",
+        'material_studied': "Material o'rganildi",
+        'confirm_delete_lesson': "Dars mavzusini o'chirishni tasdiqlaysizmi?",
+        'confirm_delete_assignment': "Topshiriqni o'chirishni tasdiqlaysizmi?",
+        'confirm_delete': "Haqiqatan ham o'chirmoqchimisiz?",
+        'current_teacher': "Hozirgi",
+        'no_lessons_added_yet': "darslari hali qo'shilmagan",
+        'no_results': "Natija topilmadi",
+        'searching': "Qidirilmoqda...",
+        'create_direction_title': "Yo'nalish yaratish",
+        'create_direction_page_title': "Yangi yo'nalish",
+        'direction_code_max_hint': "Maksimal 15 ta raqam",
+        'direction_code_placeholder': "60410100",
+        'faculty_suffix': "fakulteti",
+        'no_groups': "Guruhlar mavjud emas",
+        'no_directions': "Yo'nalishlar mavjud emas",
+        'enrollment_year_not_set': "Qabul yili belgilanmagan",
+        'education_type_not_set': "Ta'lim shakli belgilanmagan",
+        'directions_count_ta': "ta yo'nalish",
+        'faculty_no_directions_groups': "Ushbu fakultetda hali guruhlar yoki yo'nalishlar mavjud emas",
+        'faculty': 'Fakultet',
+        'faculties': 'Fakultetlar',
+        'groups_title': 'Guruhlar',
+        'directions_title': "Yo'nalishlar",
+        'directions_page_subtitle': "Barcha fakultetlar • Qabul yili + Ta'lim shakli → Yo'nalish → Kurs → Semestr → Guruhlar",
+        'faculty_directions_subtitle': "Qabul yili + Ta'lim shakli → Yo'nalish → Kurs → Semestr → Guruhlar",
+        'groups_only_active_hint': "Faqat talabasi bor (faol) guruhlar",
+        'groups_page_subtitle': "Faqat talabasi bor (faol) guruhlar • Fakultet bo'yicha filtrlash",
+        'search_group_placeholder': "Guruh nomi, yo'nalish bo'yicha qidirish...",
+        'course_label': 'Kurs',
+        'semester_label': 'Semestr',
+        'direction_label': "Yo'nalish",
+        'search_label': 'Qidiruv',
+        'start_creating_group': "Yangi guruh yaratishni boshlang",
+        'group_description_placeholder': "Guruh haqida qisqacha tavsif (ixtiyoriy)",
+        'direction_name_placeholder': "Dasturiy injiniring",
+        'create_direction_button': "Yo'nalish yaratish",
+        'modal_groups_title': 'Guruhlar',
+        'groups_active': 'Guruhlar (faol)',
+        'groups_stats': "Guruhlar bo'yicha statistika",
+        'modal_directions_title': "Yo'nalishlar",
+        'directions_empty_hint': "Talabasi bor guruhlar bo'yicha yo'nalishlar shu yerda ko'rsatiladi. Fakultet yoki qidiruvni o'zgartiring.",
+        
+        # ============================================
+        # GROUP STUDENTS PAGE
+        # ============================================
+        'group_students_title': "{group_name} guruhi talabalari",
+        'group_students_page_title': "{group_name} talabalari",
+        'students_list': "Talabalar ro'yxati",
+        'select_all': "Barchasini tanlash",
+        'selected_count': "Tanlangan",
+        'remove_selected_from_group': "Tanlangan talabalarni guruhdan chiqarish",
+        'confirm_remove_students': "Tanlangan talabalarni guruhdan chiqarmoqchimisiz?",
+        'no_students_in_group': "Bu guruhda hali talabalar yo'q",
+        'add_student': "Talaba qo'shish",
+        'add_student_hint': "Bir nechta talabani belgilab qo'shishingiz mumkin",
+        'select_students': "Talabalarni tanlang",
+        'add_selected_students': "Tanlangan talabalarni qo'shish",
+        'no_available_students': "Guruhga qo'shish uchun bo'sh talabalar yo'q",
+        'student_unit': "talaba",
+        'education_suffix': "ta'lim",
+        
+        # ============================================
+        # MESSAGES
+        # ============================================
+        'messages': 'Xabarlar',
+        'messages_page_subtitle': "Suhbatlar va xabarlar",
+        'chat_title_with': 'bilan suhbat',
+        'chat_start_conversation': 'Suhbatni boshlang!',
+        'message_placeholder': 'Xabar yozing...',
+        'ai_advisor': 'AI Maslahatchi',
+        'new_conversation': 'Yangi suhbat',
+        'no_messages': "Xabarlar yo'q",
+        'no_conversations_yet': "Hali suhbatlar mavjud emas",
+        'new_conversation_modal_title': "Yangi suhbat boshlash",
+        'ai_advisor_modal_subtitle': "Masofaviy ta'lim bo'yicha maslahatchi",
+        'electronic_library': "Elektron kutubxona",
+        'electronic_library_subtitle': "Universitet elektron kutubxonasi — unilibrary.uz",
+        'electronic_library_lang_hint': "Tilni o'zgartirish uchun kutubxona sahifasidagi til tanlash tugmasidan foydalaning.",
+        'announcements': 'E\'lonlar',
+        'announcements_subtitle': "Muhim xabarlar va yangiliklar",
+        'delete_all_announcements': "Barcha e'lonlarni o'chirish",
+        'new_announcement': "Yangi e'lon",
+        'no_announcements': "E'lonlar yo'q",
+        'confirm_delete_announcement': "E'lonni o'chirishni tasdiqlaysizmi?",
+        'confirm_delete_all_announcements': "Barcha e'lonlarni o'chirishni tasdiqlaysizmi? Bu amalni qaytarib bo'lmaydi!",
+        'back_to_announcements': "E'lonlarga qaytish",
+        'create_announcement_title': "Yangi e'lon yaratish",
+        'create_announcement_subtitle': "Barcha foydalanuvchilarga e'lon yuboring",
+        'title_label': "Sarlavha",
+        'announcement_title_placeholder': "E'lon sarlavhasini kiriting",
+        'content_label': "Matn",
+        'announcement_content_placeholder': "E'lon matnini kiriting...",
+        'who_should_see': "Kimlar ko'rsin?",
+        'mark_as_important_announcement': "Muhim e'lon sifatida belgilash",
+        'publish_announcement': "E'lon qilish",
+        'reklamalar': "Reklamalar",
+        'reklamalar_description': "Flash xabarlar va reklamalar ro'yxati",
+        'face_logs_title': "Hikvision log",
+        'face_logs_description': "Hikvision qurilmalaridan kelgan yuz tanish loglari (faqat superadmin)",
+        'face_logs_device_employee_id': "Xodim ID",
+        'face_logs_device_name': "Qurilma nomi",
+        'face_logs_fid': "F.ID",
+        'face_logs_full_name': "To'liq ism",
+        'face_logs_day': "Kun",
+        'face_logs_time': "Vaqt",
+        'face_logs_person': "Shaxs",
+        'face_logs_picture': "Rasm",
+        'face_logs_event_time': "Voqea vaqti",
+        'face_logs_event_day': "Voqea kuni",
+        'face_logs_device_ip': "Qurilma IP",
+        'face_logs_external_ip': "Tashqi IP",
+        'face_logs_created': "Qabul qilingan",
+        'face_logs_raw': "Raw ma\u2019lumot",
+        'face_logs_raw_button': "Raw",
+        'face_logs_empty': "Loglar topilmadi",
+        'face_logs_search_placeholder': "Ism yoki F.ID bo'yicha qidirish...",
+        'face_logs_clear_btn': "Loglarni tozalash",
+        'face_logs_clear_confirm': "Barcha yuz tanish loglari o'chiriladi. Davom etasizmi?",
+        'face_logs_cleared': "Loglar tozalandi",
+        'face_logs_last_request': "So\u2019nggi qabul qilingan so\u2019rov",
+        'face_logs_diagnostic': "Diagnostika:",
+        'face_logs_no_request_yet': "Hali hech qanday so\u2019rov qabul qilinmagan. Serverni tekshiring:",
+        'face_logs_ping_link': "Ping",
+        'face_logs_check_device': "— agar ochilsa, qurilma sozlamalarida HTTP Notification / Linkage da yuz tanilash hodisasini ushbu URL ga ulang: .../face-api/receive yoki .../face-api/receive.php",
+        'face_logs_backfill': "Eski loglardan Xodim ID ni to\u2019ldirish",
+        'face_logs_table_created': "face_logs jadvali yaratildi; sahifani yangilang.",
+        'face_logs_query_error': "Loglarni o\u2019qishda xato (jadval mavjud emas?). Xato: %s",
+        'staff_attendance_title': "Xodimlar davomati",
+        'staff_attendance_description': "Hikvision face log asosida kunlik xodim davomati",
+        'student_attendance_title': "Talabalar davomati",
+        'student_attendance_description': "Hikvision face log asosida kunlik talaba davomati",
+        'kpi_report_title': "KPI hisoboti",
+        'kpi_report_description': "Xodimlar KPI bo'yicha hisobot",
+        'live_monitor_title': "Live monitor",
+        'live_monitor_description': "Real vaqtda davomat ko'rish",
+        'attendance_compute': "Davomat hisoblash",
+        'attendance_computed': "Davomat hisoblandi",
+        'staff_name': "Xodim",
+        'student_name': "Talaba",
+        'first_entry': "Birinchi kirish",
+        'last_exit': "Oxirgi chiqish",
+        'late_minutes': "Kechikish (min)",
+        'work_duration': "Ish vaqti",
+        'status': "Holat",
+        'kpi_score': "KPI",
+        'status_ontime': "Vaqtida",
+        'status_late': "Kech",
+        'status_serious_late': "Jiddiy kech",
+        'status_absent': "Yo'q",
+        'status_present': "Bor",
+        'days_count': "Kunlar",
+        'total_kpi': "Jami KPI",
+        'avg_kpi': "O'rtacha KPI",
+        'student_arrived': "Talaba keldi",
+        'live_monitor_waiting': "Hikvision qurilmadan log kutilmoqda...",
+        'live_monitor_connected': "Ulangan. Yangi loglar shu yerda ko'rsatiladi.",
+        'live_monitor_disconnected': "Ulanish uzildi.",
+        'live_monitor_no_socket': "WebSocket ulanmadi",
+        'filter': "Filtrlash",
+        'no_data': "Ma'lumotlar topilmadi",
+        'flash_xabar_qoshish': "Flash xabar qo'shish",
+        'flash_xabar_current': "Joriy flash xabar",
+        'flash_xabar_url': "Havola",
+        'flash_xabar_status': "Holat",
+        'enabled': "Yoqilgan",
+        'disabled': "O'chirilgan",
+        'flash_xabar_not_set': "Flash xabar o'rnatilmagan.",
+        'flash_xabar_settings': "Flash xabar sozlamalari",
+        'flash_xabar_text': "Xabar matni",
+        'flash_xabar_text_placeholder': "Flash xabar matnini kiriting...",
+        'flash_xabar_url_label': "Havola (ixtiyoriy)",
+        'flash_xabar_date_from': "Dan",
+        'flash_xabar_date_to': "Gacha",
+        'flash_xabar_date_hint': "Agar sanalar kiritilmasa, xabar muddatsiz ko'rsatiladi.",
+        'flash_xabar_color': "Matn rangi",
+        'flash_xabar_color_white': "Oq",
+        'flash_xabar_color_red': "Qizil",
+        'flash_xabar_enabled': "Faollashtirish",
+        'flash_xabar_saved': "Flash xabar saqlandi.",
+        'flash_xabar_deleted': "Flash xabar o'chirildi.",
+        'flash_xabar_confirm_delete': "Flash xabarni o'chirmoqchimisiz?",
+        'flash_xabar_toggle_off': "Ko'rsatishni to'xtatish",
+        'schedule': 'Dars jadvali',
+        'add_to_schedule': "Dars jadvaliga qo'shish",
+        'edit_schedule': "Dars jadvalini tahrirlash",
+        'select_faculty_placeholder': "Fakultetni tanlang...",
+        'select_course_placeholder': "Kursni tanlang...",
+        'select_semester_placeholder': "Semestrni tanlang...",
+        'select_direction_placeholder': "Yo'nalishni tanlang...",
+        'select_subject_placeholder': "Fanni tanlang...",
+        'select_teacher_placeholder': "O'qituvchini tanlang...",
+        'schedule_date_label': "Sana",
+        'start_time_label': "Boshlanish vaqti",
+        'online_link_label': "Online konsultatsiya uchun link",
+        'online_link_placeholder': "Zoom, Teams yoki boshqa link...",
+        'add_to_schedule_btn': "Jadvalga qo'shish",
+        'save_changes': "O'zgarishlarni saqlash",
+        'all_teachers': "Barcha o'qituvchilar",
+        'start_date': "Boshlanish sanasi",
+        'end_date': "Tugash sanasi",
+        'date_placeholder': "kk.oo.yyyy",
+        'confirm_delete_lesson': "Darsni o'chirmoqchimisiz?",
+        'unknown': "Noma'lum",
+        'group_label': "Guruh",
+        'type_label': "Turi",
+        'join_lesson': "Darsga kirish",
+        'month_1': "Yanvar",
+        'month_2': "Fevral",
+        'month_3': "Mart",
+        'month_4': "Aprel",
+        'month_5': "May",
+        'month_6': "Iyun",
+        'month_7': "Iyul",
+        'month_8': "Avgust",
+        'month_9': "Sentyabr",
+        'month_10': "Oktyabr",
+        'month_11': "Noyabr",
+        'month_12': "Dekabr",
+        'day_monday': "Dushanba",
+        'day_tuesday': "Seshanba",
+        'day_wednesday': "Chorshanba",
+        'day_thursday': "Payshanba",
+        'day_friday': "Juma",
+        'day_saturday': "Shanba",
+        'day_sunday': "Yakshanba",
+        'edit_announcement_title': "E'lonni tahrirlash",
+        'edit_announcement_subtitle': "E'lon ma'lumotlarini yangilang",
+        'edit_faculty_title': "Fakultetni tahrirlash",
+        'create_faculty_page_title': "Yangi fakultet yaratish",
+        'faculty_name_label': "Fakultet nomi *",
+        'faculty_name_placeholder': "Axborot texnologiyalari fakulteti",
+        'faculty_name_uz': "Fakultet nomi (o'zbekcha)",
+        'faculty_name_ru': "Fakultet nomi (ruscha)",
+        'faculty_name_en': "Fakultet nomi (inglizcha)",
+        'faculty_name_example_uz': "Masalan: Axborot texnologiyalari fakulteti",
+        'faculty_name_example_ru': "Например: Факультет информационных технологий",
+        'faculty_name_example_en': "e.g. Faculty of Information Technology",
+        'faculty_description_placeholder_uz': "Fakultet haqida qisqacha ma'lumot...",
+        'faculty_description_placeholder_ru': "Краткое описание факультета...",
+        'faculty_description_placeholder_en': "Brief description of the faculty...",
+        'faculty_sync_translate': "Boshqa tillarga tarjima qilish",
+        'faculty_sync_empty': "Avval ushbu maydonga matn kiriting",
+        'faculty_name_required': "Kamida bitta tilda fakultet nomi kiritilishi shart",
+        'faculty_name_all_languages_required': "Barcha tillarda (o'zbek, rus, ingliz) fakultet nomi kiritilishi shart",
+        'code_label': "Kod *",
+        'code_placeholder': "IT",
+        'code_short_hint': "Qisqa kod (avtomatik katta harflarga aylanadi)",
+        'faculty_description_placeholder': "Fakultet haqida qisqacha ma'lumot...",
+        'faculty_description_uz': "Tavsif (o'zbekcha)",
+        'faculty_description_ru': "Tavsif (ruscha)",
+        'faculty_description_en': "Tavsif (inglizcha)",
+        'faculty_dean_select_placeholder': "Dekanni tanlang...",
+        'faculty_dean_add_btn': "Dekan qo'shish",
+        'responsible_deans_select_hint': "Bir nechta dekan tanlash mumkin.",
+        'responsible_deans_multiple_hint': "Bir nechta dekan tanlash mumkin. Tanlanmagan dekanlar fakultetdan olib tashlanadi.",
+        'no_deans': "Dekanlar mavjud emas",
+        'edit_direction_title': "Yo'nalishni tahrirlash",
+        'faculty_label': "Fakultet *",
+        'direction_code_label': "Shifr (kod) *",
+        'direction_name_label': "Nomi *",
+        'direction_name_uz': "Yo'nalish nomi (o'zbekcha)",
+        'direction_name_ru': "Yo'nalish nomi (ruscha)",
+        'direction_name_en': "Yo'nalish nomi (inglizcha)",
+        'direction_description_uz': "Tavsif (o'zbekcha)",
+        'direction_description_ru': "Tavsif (ruscha)",
+        'direction_description_en': "Tavsif (inglizcha)",
+        'direction_sync_translate': "Boshqa tillarga tarjima qilish",
+        'direction_sync_empty': "Avval ushbu maydonga matn kiriting",
+        'direction_name_all_languages_required': "Barcha tillarda (o'zbek, rus, ingliz) yo'nalish nomi kiritilishi shart",
+        'edit_subject_title': "Fanni tahrirlash",
+        'subject_name_label': "Fan nomi *",
+        'subject_description_placeholder': "Fan haqida qisqacha ma'lumot...",
+        'edit_user_title': "Foydalanuvchini tahrirlash",
+        'full_name_label': "To'liq ism *",
+        'optional_short': "Ixtiyoriy",
+        'roles_label': "Rollar *",
+        'multiple_roles_hint': "Bir nechta rol tanlash mumkin",
+        'active_status': "Faol holat",
+        'student_info_section': "Talaba ma'lumotlari",
+        'teacher_info_section': "O'qituvchi ma'lumotlari",
+        'dean_info_section': "Dekan ma'lumotlari",
+        'change_password_section': "Parolni o'zgartirish",
+        'password_leave_blank_placeholder': "Bo'sh qoldiring agar o'zgartirmoqchi bo'lmasangiz",
+        'select_group_placeholder': "Guruhni tanlang...",
+        'enrollment_year_label': "Qabul yili",
+        'enrollment_year_placeholder': "Masalan: 2025",
+        'department_label': "Kafedra",
+        'departments': "Kafedralar",
+        'department': "Kafedra",
+        'select_department': "Kafedrani tanlang",
+        'select_departments': "Kafedralarni tanlang",
+        'select_multiple_departments_hint': "Bir nechta kafedrani tanlash mumkin",
+        'add_department': "Kafedra qo'shish",
+        'my_departments': "Mening kafedralarim",
+        'my_department': "Kafedra",
+        'no_subjects_found': "Fanlar topilmadi",
+        'department_subjects_teachers': "Kafedra fanlari va o'qituvchilari",
+        'all_departments': "Barcha kafedralar",
+        'search_subject': "Fanni qidirish",
+        'search_teacher': "O'qituvchini qidirish",
+        'no_teachers_found': "O'qituvchilar topilmadi",
+        'in_department': "Kafedrada",
+        'active_groups': "Faol guruhlar",
+        'teachers_count': "O'qituvchilar soni",
+        'subjects_count': "Fanlar soni",
+        'all_departments_list': "Barcha kafedralar ro'yxati",
+        'new_department': "Yangi kafedra",
+        'create_department_page_title': "Kafedra yaratish",
+        'edit_department_page_title': "Kafedrani tahrirlash",
+        'department_name_label': "Kafedra nomi",
+        'department_name_placeholder': "Masalan: Dasturiy injiniring",
+        'department_name_example_uz': "Masalan: Dasturiy injiniring",
+        'department_name_example_ru': "Например: Программная инженерия",
+        'department_name_example_en': "e.g. Software Engineering",
+        'department_name_uz': "Kafedra nomi (o'zbekcha)",
+        'department_name_ru': "Kafedra nomi (ruscha)",
+        'department_name_en': "Kafedra nomi (inglizcha)",
+        'department_name_all_languages_required': "Barcha tillarda kafedra nomi kiritilishi shart",
+        'department_sync_translate': "Boshqa tillarga tarjima qilish",
+        'department_sync_empty': "Avval ushbu maydonga matn kiriting",
+        'department_migration_required': "Kafedralar jadvali yangilanishi kerak. Loyiha ildizida 'flask db upgrade' buyrug'ini ishga tushiring.",
+        'department_description_placeholder': "Kafedra haqida qisqacha...",
+        'no_departments': "Kafedralar yo'q",
+        'start_creating_department': "Birinchi kafedrani yarating",
+        'items': "ta",
+        'add_teacher': "O'qituvchi qo'shish",
+        'please_select_subject': "Iltimos, fanni tanlang",
+        'please_select_teacher': "Iltimos, o'qituvchini tanlang",
+        'subject_added_to_department': "«{name}» kafedraga qo'shildi",
+        'subject_removed_from_department': "«{name}» kafedradan olib tashlandi",
+        'teacher_added_to_department': "«{name}» kafedraga qo'shildi",
+        'teacher_removed_from_department': "O'qituvchi kafedradan olib tashlandi",
+        'teacher_not_found': "O'qituvchi topilmadi",
+        'teacher_already_in_department': "O'qituvchi allaqachon kafedrada",
+        'confirm_remove_subject_from_department': "Bu fanni kafedradan olib tashlashni xohlaysizmi?",
+        'confirm_remove_teacher_from_department': "O'qituvchini kafedradan olib tashlashni xohlaysizmi?",
+        'no_subjects_in_department': "Kafedrada fanlar yo'q",
+        'no_teachers_in_department': "Kafedrada o'qituvchilar yo'q",
+        'department_created': "«{name}» kafedrasi yaratildi",
+        'department_updated': "Kafedra yangilandi",
+        'department_deleted': "«{name}» kafedrasi o'chirildi",
+        'confirm_delete_department': "Kafedrani o'chirishni xohlaysizmi?",
+        'add_subjects_teachers': "Fan / O'qituvchi qo'shish",
+        'assignments_saved': "Biriktirishlar saqlandi",
+        'select_department_placeholder': "Kafedrani tanlang...",
+        'department_heads_label': "Kafedra mudirlari",
+        'department_heads_placeholder': "Xodimlardan tanlang (bir nechta mumkin)",
+        'department_head_add_btn': "Kafedra mudiri qo'shish",
+        'staff_add_department_btn': "Kafedra qo'shish",
+        'staff_add_faculty_btn': "Fakultet qo'shish",
+        'department_head_select_placeholder': "Xodimni tanlang...",
+        'department_head_must_select_department': "Kafedra mudiri uchun kafedra tanlash majburiy",
+        'department_required_for_department_head': "Kafedra mudiri uchun kafedra tanlash majburiy",
+        'department_not_found': "Tanlangan kafedra topilmadi",
+        'position_label': "Lavozim",
+        'select_faculty_placeholder': "Fakultetni tanlang...",
+        'select_subject_placeholder': "Fanni tanlang...",
+        'select_teacher_placeholder': "O'qituvchini tanlang...",
+        'edit_schedule_title': "Darsni tahrirlash",
+        'edit_payment_title': "To'lov ma'lumotlarini tahrirlash",
+        'back_to_payments': "To'lov ma'lumotlariga qaytish",
+        'contract_amount_label': "Kontrakt miqdori (so'm) *",
+        'paid_amount_label': "To'lagan miqdor (so'm) *",
+        'academic_year_label': "O'quv yili",
+        'semester_1_2': "1-semestr",
+        'semester_2_2': "2-semestr",
+        'notes_label': "Qo'shimcha eslatmalar",
+        'notes_placeholder': "Qo'shimcha ma'lumotlar...",
+        'schedule_date_label': "Sana *",
+        'start_time_label': "Boshlanish vaqti *",
+        'online_consultation_link_placeholder': "Zoom, Teams yoki boshqa link...",
+        'online_consultation_link_label': "Online konsultatsiya uchun link",
+        
+        # ============================================
+        # AUTH PAGES (LOGIN, REGISTER, FORGOT, RESET)
+        # ============================================
+        'sign_in_to_account': "Hisobingizga kiring",
+        'login_talaba_email_label': 'Login / Talaba ID / Email',
+        'login_placeholder': 'Login, Talaba ID yoki Email',
+        'remember_me': 'Eslab qolish',
+        'forgot_password_link': "Parolni unutdingizmi?",
+        'register_title': "Ro'yxatdan o'tish",
+        'register_subtitle': "Yangi hisob yarating",
+        'create_account_button': "Ro'yxatdan o'tish",
+        'have_account': "Hisobingiz bormi?",
+        'sign_in_link': 'Kirish',
+        'forgot_password_title': "Parolni unutdingizmi?",
+        'forgot_password_subtitle': "Login, Talaba ID yoki email kiriting",
+        'only_teachers_students': "Faqat o'qituvchi va talabalar uchun",
+        'check_button': "Tekshirish",
+        'passport_series_label': "Pasport seriya raqami",
+        'passport_placeholder': 'AB1234567',
+        'enter_passport_series': "Pasport seriya raqamini kiriting",
+        'reset_to_initial_button': "Parolni boshlang'ich holatga qaytarish",
+        'back_to_login': "← Kirish sahifasiga qaytish",
+        'set_new_password_title': "Yangi parol o'rnating",
+        'set_new_password_for': "{full_name} uchun yangi parol kiriting",
+        'new_password_label': "Yangi parol",
+        'min_6_chars': "Kamida 6 ta belgi",
+        'change_password_button': "Parolni o'zgartirish",
+        
+        # ============================================
+        # GRADE SCALE
+        # ============================================
+        'grade_scale': 'Baholash tizimi',
+        'excellent': 'A\'lo',
+        'good': 'Yaxshi',
+        'satisfactory': 'Qoniqarli',
+        'poor': 'Past',
+        'failed': 'Yiqildi',
+        
+        # ============================================
+        # FLASH MESSAGES - AUTH
+        # ============================================
+        'no_access_permission': "Sizda bu sahifaga kirish huquqi yo'q",
+        'account_blocked': 'Sizning hisobingiz bloklangan',
+        'invalid_login_credentials': "Login, email, talaba ID yoki parol noto'g'ri",
+        'logout_success': "Tizimdan muvaffaqiyatli chiqdingiz",
+        'registration_closed': "Ro'yxatdan o'tish funksiyasi yopilgan. Iltimos, administrator bilan bog'laning.",
+        'login_required_input': "Iltimos, login, talaba ID yoki email kiriting",
+        'user_not_found_by_credentials': "Bu login, talaba ID yoki email bilan foydalanuvchi topilmadi",
+        'function_only_for_teachers_students': "Bu funksiya faqat o'qituvchi va talabalar uchun mavjud",
+        'passport_number_required_input': "Iltimos, pasport seriya raqamini kiriting",
+        'user_not_found': "Foydalanuvchi topilmadi",
+        'incorrect_passport_number': "Pasport seriya raqami noto'g'ri",
+        'passport_not_available': "Foydalanuvchida pasport seriya raqami mavjud emas",
+        'token_not_found_or_used': "Token topilmadi yoki allaqachon ishlatilgan",
+        'token_expired': "Token muddati tugagan. Iltimos, yangi so'rov yuboring",
+        'passwords_do_not_match': "Parollar mos kelmaydi",
+        'password_min_length': "Parol kamida 6 ta belgidan iborat bo'lishi kerak",
+        'password_min_length_8': "Parol kamida 8 ta belgidan iborat bo'lishi kerak",
+        'password_changed_success': "Parol muvaffaqiyatli o'zgartirildi! Endi tizimga kiring",
+        'password_changed_success_short': "Parol muvaffaqiyatli o'zgartirildi",
+        'password_reset_success': "Parol muvaffaqiyatli boshlang'ich holatga qaytarildi! Parol: {new_password}",
+        'user_password_reset': "{full_name} paroli boshlang'ich holatga qaytarildi. Yangi parol: {new_password}",
+        'student_password_reset': "{full_name} paroli boshlang'ich holatga qaytarildi. Yangi parol: {new_password}",
+        'no_permission_for_role': "Sizda bu rolga kirish huquqi yo'q",
+        
+        # ============================================
+        # FLASH MESSAGES - VALIDATION ERRORS
+        # ============================================
+        'login_required_field': "Login majburiy maydon",
+        'login_required_for_staff': "Login majburiy maydon (xodimlar uchun)",
+        'login_already_exists': "Bu login allaqachon mavjud",
+        'login_already_exists_other_user': "Bu login allaqachon boshqa foydalanuvchida mavjud",
+        'student_id_required': "Talaba ID majburiy maydon",
+        'student_id_required_for_students': "Talaba ID majburiy maydon (talabalar uchun)",
+        'student_id_already_exists': "Bu talaba ID allaqachon mavjud",
+        'student_id_already_exists_other_student': "Bu talaba ID allaqachon boshqa talabada mavjud",
+        'email_already_exists': "Bu email allaqachon mavjud",
+        'email_already_exists_other_user': "Bu email allaqachon boshqa foydalanuvchida mavjud",
+        'email_already_exists_other_student': "Bu email allaqachon boshqa talabada mavjud",
+        'email_used_by_another_user': "Bu email allaqachon boshqa foydalanuvchi tomonidan ishlatilmoqda",
+        'login_used_by_another_user': "Bu login allaqachon boshqa foydalanuvchi tomonidan ishlatilmoqda",
+        'passport_required': "Pasport seriyasi va raqami majburiy",
+        'initial_password_passport': "Boshlang'ich parol: pasport seriya raqami",
+        'passport_not_available_for_user': "Bu foydalanuvchida pasport seriya raqami mavjud emas",
+        'passport_not_available_for_student': "Bu talabada pasport seriya raqami mavjud emas",
+        'birthdate_invalid_format': "Tug'ilgan sana noto'g'ri formatda (yyyy-mm-dd)",
+        'date_invalid_format': "Sana noto'g'ri formatda",
+        'date_invalid_format_use_calendar': "Sana noto'g'ri formatda. Iltimos, kalendardan tanlang.",
+        'date_required': "Sana tanlanishi shart",
+        'date_required_select': "Sana tanlanishi shart.",
+        'all_required_fields': "Barcha majburiy maydonlar to'ldirilishi kerak",
+        'all_fields_required': "Barcha maydonlar to'ldirilishi kerak",
+        'at_least_one_role_required': "Kamida bitta rol tanlanishi kerak",
+        'code_already_exists': "Bu kod allaqachon mavjud",
+        'invalid_request': "Noto'g'ri murojaat",
+        'title_and_text_required': "Sarlavha va matn majburiy",
+        'message_cannot_be_empty': "Xabar bo'sh bo'lishi mumkin emas",
+        'new_passwords_do_not_match': "Yangi parollar mos kelmaydi",
+        
+        # ============================================
+        # FLASH MESSAGES - PERMISSION ERRORS
+        # ============================================
+        'no_permission_for_operation': "Sizda bu amal uchun ruxsat yo'q",
+        'no_permission_for_action': "Sizda bu amal uchun huquq yo'q",
+        'no_permission_to_edit_group': "Sizda bu guruhni tahrirlash huquqi yo'q",
+        'no_permission_to_delete_group': "Sizda bu guruhni o'chirish huquqi yo'q",
+        'no_permission_to_view_group': "Sizda bu guruhni ko'rish huquqi yo'q",
+        'no_permission_to_add_students_to_group': "Sizda bu guruhga talaba qo'shish huquqi yo'q",
+        'no_permission_to_edit_student': "Sizda bu talabani tahrirlash huquqi yo'q",
+        'no_permission_to_create_announcement': "Sizda e'lon yaratish huquqi yo'q",
+        'no_permission_to_edit_announcement': "Sizda bu e'lonni tahrirlash huquqi yo'q",
+        'no_permission_to_delete_announcement': "Sizda bu e'lonni o'chirish huquqi yo'q",
+        'no_permission_to_delete_all_announcements': "Sizda barcha e'lonlarni o'chirish huquqi yo'q",
+        'no_permission_to_chat': "Sizda ushbu foydalanuvchi bilan suhbatlashish uchun ruxsat yo'q",
+        'no_permission_to_view_course': "Sizda bu kursni ko'rish huquqi yo'q",
+        'no_permission_to_edit_course': "Sizda bu kursni tahrirlash huquqi yo'q",
+        'no_permission_to_delete_course': "Sizda bu kursni o'chirish huquqi yo'q",
+        'no_permission_to_view_lesson': "Sizda bu darsni ko'rish huquqi yo'q",
+        'no_permission_to_edit_lesson': "Sizda bu darsni tahrirlash huquqi yo'q",
+        'no_permission_to_delete_lesson': "Sizda bu darsni o'chirish huquqi yo'q",
+        'no_permission_to_view_assignment': "Sizda bu topshiriqni ko'rish huquqi yo'q",
+        'no_permission_to_edit_assignment': "Sizda bu topshiriqni tahrirlash huquqi yo'q",
+        'no_permission_to_delete_assignment': "Sizda bu topshiriqni o'chirish huquqi yo'q",
+        'no_permission_to_view_submission': "Sizda bu javobni ko'rish huquqi yo'q",
+        'no_permission_to_edit_submission': "Sizda bu javobni tahrirlash huquqi yo'q",
+        'no_permission_to_delete_submission': "Sizda bu javobni o'chirish huquqi yo'q",
+        'no_permission_to_view_grade': "Sizda bu bahoni ko'rish huquqi yo'q",
+        'no_permission_to_edit_grade': "Sizda bu bahoni tahrirlash huquqi yo'q",
+        'no_permission_to_delete_grade': "Sizda bu bahoni o'chirish huquqi yo'q",
+        
+        # ============================================
+        # FLASH MESSAGES - USER OPERATIONS
+        # ============================================
+        'user_created_with_role': "{role} muvaffaqiyatli yaratildi",
+        'user_status_changed': "Foydalanuvchi {status}",
+        'user_updated': "Foydalanuvchi muvaffaqiyatli yangilandi",
+        'user_deleted': "Foydalanuvchi o'chirildi",
+        'clear_staff': "Xodimlarni tozalash",
+        'confirm_clear_staff': "Barcha xodimlarni o'chirmoqchimisiz? Bu amalni qaytarib bo'lmaydi!",
+        'staff_cleared': "{count} ta xodim o'chirildi",
+        'clear_students': "Talabalarni tozalash",
+        'confirm_clear_students': "Barcha talabalarni o'chirmoqchimisiz? Bu amalni qaytarib bo'lmaydi!",
+        'students_cleared': "{count} ta talaba o'chirildi",
+        'clear_departments': "Kafedralarni tozalash",
+        'confirm_clear_departments': "Barcha kafedralarni o'chirmoqchimisiz? Bu amalni qaytarib bo'lmaydi!",
+        'departments_cleared': "{count} ta kafedra o'chirildi",
+        'clear_subjects': "Fanlarni tozalash",
+        'confirm_clear_subjects': "Barcha fanlarni o'chirmoqchimisiz? Bu amalni qaytarib bo'lmaydi!",
+        'subjects_cleared': "{count} ta fan o'chirildi",
+        'staff_deleted': "{staff_name} o'chirildi",
+        'staff_created': "Xodim {full_name} muvaffaqiyatli yaratildi",
+        'staff_create_error': "Xodimni saqlashda xatolik. Ma'lumotlarni tekshiring.",
+        'staff_updated': "Xodim {full_name} ma'lumotlari yangilandi",
+        'profile_updated': "Ma'lumotlar muvaffaqiyatli yangilandi",
+        'profile_role_changed': "Profil {role_name} roliga o'zgartirildi. Endi siz {role_name} sifatida ishlayapsiz.",
+        'cannot_block_yourself': "O'zingizni bloklashingiz mumkin emas",
+        'cannot_delete_yourself': "O'zingizni o'chirishingiz mumkin emas",
+        'cannot_delete_superadmin': "Superadmin hisobini o'chirish mumkin emas.",
+        'only_superadmin_can_modify': "Superadmin hisobini faqat superadmin tahrirlashi, faolligini o'zgartirishi yoki parolni tiklash mumkin.",
+        'user_not_staff': "Bu talaba, xodim emas",
+        'user_not_student': "Bu foydalanuvchi talaba emas",
+        'user_not_superadmin': "Bu foydalanuvchi superadmin emas",
+        'full_name_required': "To'liq ism majburiy",
+        'password_required': "Parol majburiy",
+        'email_already_used': "Bu email boshqa foydalanuvchi tomonidan ishlatilmoqda",
+        'superadmins_section': "Superadminlar",
+        'superadmins_database': "Superadminlar bazasi",
+        'all_superadmins_list': "Barcha superadminlar ro'yxati",
+        'new_superadmin': "Yangi superadmin",
+        'create_superadmin_title': "Yangi superadmin qo'shish",
+        'edit_superadmin_title': "Superadminni tahrirlash",
+        'superadmin_created': "Superadmin {full_name} muvaffaqiyatli qo'shildi",
+        'superadmin_updated': "Superadmin {full_name} ma'lumotlari yangilandi",
+        'superadmin_deleted': "Superadmin o'chirildi",
+        'config_superadmin_cannot_delete': "Config dagi asosiy superadmin hisobini o'chirib bo'lmaydi",
+        'cannot_delete_last_superadmin': "Oxirgi superadminni o'chirib bo'lmaydi (kamida bitta qolishi kerak)",
+        
+        # ============================================
+        # FLASH MESSAGES - FACULTY OPERATIONS
+        # ============================================
+        'faculty_created': "Fakultet muvaffaqiyatli yaratildi",
+        'faculty_updated': "Fakultet muvaffaqiyatli yangilandi",
+        'faculty_deleted': "Fakultet «{faculty_name}» va uning barcha yo'nalishlari, guruhlari o'chirildi",
+        'faculty_not_found': "Fakultet topilmadi",
+        'faculty_required': "Fakultet tanlash majburiy",
+        'faculty_selected_not_found': "Tanlangan fakultet topilmadi",
+        'faculty_incorrect_selection': "Fakultet noto'g'ri tanlangan",
+        'faculty_not_assigned': "Sizga fakultet biriktirilmagan",
+        'faculty_required_for_dean': "Dekan roli tanlangan bo'lsa, fakultet tanlash majburiy",
+        'faculty_has_students': "Fakultetda {students_count} ta talaba mavjud. Fakultetni o'chirish uchun avval talabalarni boshqa fakultetga ko'chiring yoki o'chiring",
+        'responsible_deans_changed': "Masul dekanlar muvaffaqiyatli o'zgartirildi",
+        
+        # ============================================
+        # FLASH MESSAGES - DIRECTION OPERATIONS
+        # ============================================
+        'direction_created': "Yo'nalish muvaffaqiyatli yaratildi",
+        'direction_updated': "Yo'nalish yangilandi",
+        'direction_deleted': "Yo'nalish o'chirildi",
+        'direction_required': "Yo'nalish tanlash majburiy",
+        'direction_incorrect_selection': "Noto'g'ri yo'nalish tanlandi",
+        'direction_name_and_code_required': "Yo'nalish nomi va kodi majburiy",
+        'direction_name_and_code_required_fill': "Yo'nalish nomi va kodi to'ldirilishi shart",
+        'direction_code_digits_only': "Yo'nalish kodi faqat raqamlardan iborat bo'lishi kerak",
+        'direction_already_exists': "Bu kod, kurs, semestr va ta'lim shakli bilan yo'nalish allaqachon mavjud",
+        'direction_code_already_exists': "Bu kod bilan yo'nalish allaqachon mavjud",
+        'direction_has_groups_and_students': "Yo'nalishda {groups_count} ta guruh va {total_students} ta talaba mavjud. O'chirish mumkin emas",
+        'direction_has_groups': "Yo'nalishda {groups_count} ta guruh mavjud. Avval guruhlarni o'chiring yoki boshqa yo'nalishga o'tkazing",
+        'direction_no_groups': "Yo'nalishda guruhlar mavjud emas",
+        'groups_assigned_to_direction': "Guruhlar yo'nalishga biriktirildi",
+        'directions_and_groups_imported': "{d_count} ta yo'nalish va {g_count} ta guruh import qilindi",
+        
+        # ============================================
+        # FLASH MESSAGES - GROUP OPERATIONS
+        # ============================================
+        'group_created': "Guruh muvaffaqiyatli yaratildi",
+        'group_updated': "Guruh yangilandi",
+        'group_deleted': "Guruh o'chirildi",
+        'group_name_required': "Guruh nomi majburiy",
+        'group_already_exists': "Bu yo'nalishda, kursda va semestrda bunday nomli guruh allaqachon mavjud",
+        'group_course_and_semester_required': "Kurs va semestr majburiy",
+        'group_all_fields_required': "Kurs, semestr va ta'lim shakli majburiy",
+        'group_has_students': "Guruhda talabalar bor. O'chirish mumkin emas",
+        'group_has_students_transfer_first': "Guruhda talabalar mavjud. Avval talabalarni boshqa guruhga o'tkazing",
+        'no_groups_for_year_education_type': "{year}-yil {education_type} ta'lim shakli bo'yicha guruhlar mavjud emas",
+        'no_active_groups_for_semester': "{semester}-semestrda faol guruhlar topilmadi",
+        
+        # ============================================
+        # FLASH MESSAGES - STUDENT OPERATIONS
+        # ============================================
+        'student_created': "{full_name} muvaffaqiyatli yaratildi",
+        'student_updated': "{full_name} ma'lumotlari yangilandi",
+        'student_deleted': "{student_name} o'chirildi",
+        'student_status_changed': "Talaba {full_name} {status}",
+        'students_added_to_group': "{added_count} ta talaba guruhga qo'shildi",
+        'student_removed_from_group': "{full_name} guruhdan chiqarildi",
+        'students_removed_from_group': "{count} ta talaba guruhdan chiqarildi",
+        'no_students_selected': "Hech qanday talaba tanlanmagan",
+        'no_students_added': "Hech qanday talaba qo'shilmadi. Tanlangan talabalar allaqachon boshqa guruhga biriktirilgan bo'lishi mumkin",
+        'no_students_removed': "Hech qanday talaba guruhdan chiqarilmadi",
+        
+        # ============================================
+        # FLASH MESSAGES - SUBJECT OPERATIONS
+        # ============================================
+        'subject_name_uz': "Fan nomi (o'zbekcha)",
+        'subject_name_ru': "Fan nomi (ruscha)",
+        'subject_name_en': "Fan nomi (inglizcha)",
+        'subject_description_uz': "Tavsif (o'zbekcha)",
+        'subject_description_ru': "Tavsif (ruscha)",
+        'subject_description_en': "Tavsif (inglizcha)",
+        'subject_sync_translate': "Boshqa tillarga tarjima qilish",
+        'subject_sync_empty': "Avval ushbu maydonga matn kiriting",
+        'subject_name_required': "Fan nomi majburiy maydon",
+        'subject_name_all_languages_required': "Barcha tillarda (o'zbek, rus, ingliz) fan nomi kiritilishi shart",
+        'subject_created': "Fan muvaffaqiyatli yaratildi",
+        'subject_updated': "Fan yangilandi",
+        'subject_deleted': "Fan o'chirildi",
+        'subject_not_in_curriculum': "Fan endi hech qanday o'quv rejada ishlatilmayapti. O'chirishingiz mumkin.",
+        'subject_removed_from_all_curriculums': "«{subject_name}» barcha o'quv rejalardan olib tashlandi ({deleted} ta yozuv). Endi fanni o'chirishingiz mumkin.",
+        'subject_not_found': "Tanlangan fan topilmadi",
+        'please_select_subject': "Iltimos, fanni tanlang",
+        'please_select_teacher': "Iltimos, o'qituvchini tanlang",
+        'teacher_not_found': "O'qituvchi topilmadi",
+        'teacher_already_in_department': "Bu o'qituvchi allaqachon kafedrada",
+        'subject_added_to_department': "«{name}» kafedraga qo'shildi",
+        'subject_removed_from_department': "«{name}» kafedradan olib tashlandi",
+        'teacher_added_to_department': "«{name}» kafedraga qo'shildi",
+        'teacher_removed_from_department': "O'qituvchi kafedradan olib tashlandi",
+        'confirm_remove_subject_from_department': "Bu fanni kafedradan olib tashlashni xohlaysizmi?",
+        'confirm_remove_teacher_from_department': "Bu o'qituvchini kafedradan olib tashlashni xohlaysizmi?",
+        'add_teacher': "O'qituvchi qo'shish",
+        'add': "Qo'shish",
+        'remove': "Olib tashlash",
+        
+        # ============================================
+        # FLASH MESSAGES - CURRICULUM OPERATIONS
+        # ============================================
+        'subjects_added_to_curriculum': "{added} ta fan o'quv rejaga qo'shildi",
+        'curriculum_updated': "{semester}-semestr o'quv rejasi yangilandi",
+        'subject_removed_from_curriculum': "Fan o'quv rejasidan o'chirildi",
+        'curriculum_import_success': "Muvaffaqiyatli! {imported} ta yangi qo'shildi, {updated} ta yangilandi.",
+        'curriculum_import_subjects_created': "{subjects_created} ta yangi fan yaratildi.",
+        'curriculum_import_errors': "{errors_count} ta xatolik yuz berdi.",
+        'subject_already_in_semester': "{subject_name} fani bu semestrda allaqachon mavjud",
+        'subject_replaced': "Fan {new_subject_name} ga almashtirildi",
+        'subject_and_semester_required': "Fan va semestr tanlash majburiy",
+        'new_subject_not_selected': "Yangi fan tanlanmagan",
+        'semester_not_selected': "Semestr tanlanmagan",
+        'semester_teachers_saved': "{semester}-semestr o'qituvchilari muvaffaqiyatli saqlandi",
+        
+        # ============================================
+        # FLASH MESSAGES - SCHEDULE OPERATIONS
+        # ============================================
+        'schedule_added': "Dars jadvaliga qo'shildi",
+        'schedule_updated': "Dars jadvali yangilandi",
+        'schedule_deleted': "Jadval o'chirildi",
+        'schedules_imported': "{count} ta dars jadvali muvaffaqiyatli import qilindi",
+        'zoom_links_queued': "{count} ta dars uchun Zoom havolalari fonda yaratilmoqda",
+        'teacher_not_assigned_to_lesson_type': "Ushbu o'qituvchiga bu guruh va fan uchun dars turi biriktirilmagan",
+        'lesson_already_exists_at_time': "Bu vaqtda ({start_time}) guruhda dars allaqachon mavjud: {existing_subject}",
+        
+        # ============================================
+        # FLASH MESSAGES - GRADING SYSTEM
+        # ============================================
+        'grade_letter_already_exists': "Bu baho harfi allaqachon mavjud",
+        'min_score_greater_than_max': "Minimal ball maksimaldan katta bo'lishi mumkin emas",
+        'grade_added': "Baho muvaffaqiyatli qo'shildi",
+        'grade_updated': "Baho yangilandi",
+        'grade_deleted': "Baho o'chirildi",
+        'grade_required': "Baho majburiy",
+        'grade_assigned': "Baho muvaffaqiyatli qo'yildi",
+        'grading_system_reset': "Baholash tizimi standart holatga qaytarildi",
+        
+        # ============================================
+        # FLASH MESSAGES - COURSE/LESSON/ASSIGNMENT
+        # ============================================
+        'course_name_required': "Kurs nomi majburiy",
+        'course_created': "Kurs muvaffaqiyatli yaratildi",
+        'course_updated': "Kurs yangilandi",
+        'course_deleted': "Kurs o'chirildi",
+        'lesson_name_required': "Dars nomi majburiy",
+        'lesson_created': "Dars muvaffaqiyatli yaratildi",
+        'lesson_created_for_groups': "Dars {created_count} ta guruh uchun muvaffaqiyatli qo'shildi",
+        'lesson_updated': "Dars yangilandi",
+        'lesson_deleted': "Dars o'chirildi",
+        'lesson_cannot_delete_has_assignments': "Bu mavzuni o'chirib bo'lmaydi! Quyidagi topshiriqlar bu mavzuga bog'langan: {assignments_list}",
+        'assignment_name_required': "Topshiriq nomi majburiy",
+        'assignment_created': "Topshiriq muvaffaqiyatli yaratildi",
+        'assignment_created_for_groups': "Topshiriq {created_count} ta guruh uchun muvaffaqiyatli yaratildi",
+        'assignment_updated': "Topshiriq yangilandi",
+        'assignment_deleted': "Topshiriq o'chirildi",
+        'submission_text_required': "Javob matni majburiy",
+        'submission_submitted': "Javob muvaffaqiyatli yuborildi",
+        'submission_resubmitted': "Javobingiz qayta yuborildi ({resubmission_count}/3)",
+        'submission_updated': "Javob yangilandi",
+        'submission_deleted': "Javob o'chirildi",
+        'submission_wait_for_grade': "O'qituvchi oldingi javobni baholaguniga qadar yangi javob yubora olmaysiz.",
+        'teacher_not_assigned_to_lesson_type_direction': "Siz tanlagan dars turiga ushbu yo'nalishda biriktirilmagansiz. Faqat o'zingizga biriktirilgan dars turlari uchun dars yarata olasiz.",
+        'teacher_not_assigned_to_new_lesson_type': "Siz ushbu yo'nalishda '{lesson_type}' dars turiga biriktirilmagansiz. Faqat o'zingizga biriktirilgan dars turlarini o'zgartira olasiz.",
+        'teacher_not_assigned_to_assignment_lesson_type': "Siz tanlagan dars turiga ushbu yo'nalishda biriktirilmagansiz.",
+        'teacher_not_assigned_for_grading': "Sizda ushbu yo'nalishda '{lesson_type}' dars turiga biriktirilganligi yo'q. Faqat o'zingizga biriktirilgan dars turlari uchun baho qo'yishingiz mumkin.",
+        
+        # ============================================
+        # FLASH MESSAGES - ANNOUNCEMENTS
+        # ============================================
+        'announcement_created': "E'lon muvaffaqiyatli yaratildi",
+        'announcement_updated': "E'lon muvaffaqiyatli yangilandi",
+        'announcement_deleted': "E'lon o'chirildi",
+        'all_announcements_deleted': "Barcha {count} ta e'lon o'chirildi",
+        
+        # ============================================
+        # FLASH MESSAGES - MESSAGING
+        # ============================================
+        'message_sent': "Xabar yuborildi",
+        
+        # ============================================
+        # FLASH MESSAGES - ACCOUNTING
+        # ============================================
+        'contract_not_found': "Kontrakt ma'lumotlari topilmadi",
+        'payment_info_updated': "To'lov ma'lumotlari yangilandi",
+        'payment_created_success': "To'lov ma'lumoti muvaffaqiyatli qo'shildi",
+        'payment_deleted': "To'lov yozuvi o'chirildi",
+        'confirm_delete_payment': "Bu to'lov yozuvini o'chirmoqchimisiz?",
+        'contract_amount_required': "Kontrakt miqdori majburiy",
+        'paid_amount_required': "To'lagan summa majburiy",
+        'create_payment_title': "To'lov qo'shish",
+        'add_payment': "To'lov qo'shish",
+        'custom_contract_label': "Talabaga faqatgina shu yil uchun amal qiladigan kontrakt summasi (ixtiyoriy)",
+        'custom_contract_hint': "Bo'sh qoldiring — yo'nalish bo'yicha standart summa qo'llanadi. Kiritilsa o'quv yili majburiy.",
+        'academic_year_required_with_contract': "Kontrakt summasi kiritilganda o'quv yili majburiy",
+        'contract_amounts_title': "To'lov summasi",
+        'contract_amounts_subtitle': "Yo'nalish va o'quv yili bo'yicha kontrakt summalari",
+        'contract_amounts_import_title': "To'lov summasini import qilish",
+        'contract_amounts_import_subtitle': "Excel fayldan yo'nalish bo'yicha kontrakt summalarini import qilish",
+        'add_contract_amount_btn': "Yangi kontrakt",
+        'add_custom_contract_btn': "Maxsus kontrakt qo'shish",
+        'edit_custom_contract_btn': "Maxsus kontraktni tahrirlash",
+        'col_faculty_desc': "Fakultet nomi",
+        'col_direction_code_desc': "Yo'nalish kodi (DI, AT, IQ)",
+        'col_direction_code_digits': "Faqat raqamlar (masalan: 5230100)",
+        'education_type_values': "kunduzgi, sirtqi, kechki, masofaviy",
+        'col_header_faculty': "Fakultet",
+        'col_header_direction_code': "Yo'nalish kodi",
+        'col_header_direction_name': "Yo'nalish nomi",
+        'col_header_education_type': "Ta'lim shakli",
+        'col_header_academic_year': "O'quv yili",
+        'col_header_contract_amount': "Kontrakt miqdori",
+        'col_year_example': "2025-2026",
+        'col_header_period_start': "Boshlanish",
+        'col_desc_period_start': "O'quv yili boshlanish sanasi (DD.MM.YYYY, masalan 02.09.2025)",
+        'col_header_period_end': "Tugash",
+        'col_desc_period_end': "O'quv yili tugash sanasi (DD.MM.YYYY, masalan 06.06.2026)",
+        'import_note_period_dates': "Boshlanish va Tugash sanalarini kiriting (02.09.2025 – 06.06.2026)",
+        'import_note_faculty_direction': "Fakultet va yo'nalish tizimda mavjud bo'lishi kerak",
+        'import_note_year_format': "O'quv yili: 2025-2026 ko'rinishida (barcha maydonlar majburiy)",
+        'import_note_existing_updated': "Mavjud yozuv yangilanadi",
+        'import_note_each_row_new_payment': "Har bir qator yangi to'lov yozuvini qo'shadi.",
+        'import_note_student_lookup': "Talaba_id yoki Ismi orqali talaba topiladi",
+        'import_note_contract_optional': "Kontrakt summasi ixtiyoriy. Bo'sh bo'lsa yo'nalish bo'yicha belgilangan summa qo'llanadi.",
+        'import_note_contract_year_required': "Kontrakt summasi kiritilganda O'quv yili majburiy — shu yil uchun kiritiladi, keyingi yillar yo'nalishdan olinadi.",
+        'import_note_contract_from_direction': "Kontrakt yo'nalish bo'yicha belgilangan summadan olinadi.",
+        'col_direction_name_desc': "Yo'nalish nomi",
+        'col_contract_amount_desc': "Kontrakt summasi (raqam)",
+        'sample_file': "Namuna Excel fayl",
+        'sample_file_desc': "To'g'ri formatni ko'rish uchun namuna faylni yuklab oling.",
+        'enrollment_year_label': "O'quv yili",
+        'select_academic_year': "O'quv yilini tanlang",
+        'period_start_label': "Boshlanish sanasi",
+        'period_end_label': "Tugash sanasi",
+        'period_start_hint': "Masalan: 02.09.2025",
+        'period_end_hint': "Masalan: 06.06.2026",
+        'period_dates_required': "Boshlanish va tugash sanalarini kiriting",
+        'period_end_must_be_after_start': "Tugash sanasi boshlanish sanasidan keyin bo'lishi kerak",
+        'contract_amount_created': "Kontrakt summa qo'shildi",
+        'contract_amount_updated': "Kontrakt summa yangilandi",
+        'contract_amount_deleted': "Kontrakt summa o'chirildi",
+        'clear_contract_amounts': "To'lov summalarini tozalash",
+        'confirm_clear_contract_amounts': "Barcha to'lov summalarini (kontrakt summalarini) o'chirmoqchimisiz? Bu amalni qaytarib bo'lmaydi!",
+        'contract_amounts_cleared': "{count} ta to'lov summasi o'chirildi",
+        'contract_amount_exists_for_direction_year': "Ushbu yo'nalish va o'quv yili uchun kontrakt summa allaqachon mavjud",
+        'fill_required_fields': "Majburiy maydonlarni to'ldiring",
+        'search_direction_placeholder': "Qabul yili, kod, nom, ta'lim shakli...",
+        
+        # ============================================
+        # ACCOUNTING PAGE
+        # ============================================
+        'accounting_page_title': "To'lov ma'lumotlari 💳",
+        'accounting_dean_title': "Fakultet moliyaviy nazorati 💰",
+        'accounting_page_subtitle': "Tizim bo'yicha to'lovlar tahlili",
+        'accounting_dean_subtitle': "Kontraktlar monitoringi",
+        'excel_import': 'Excel Import',
+        'export_excel': 'Export Excel',
+        'contract_badge': 'Kontrakt',
+        'total_contract_sum': "Jami shartnoma summasi (so'm)",
+        'paid_badge': "To'langan",
+        'debt_badge': 'Qarz',
+        'remaining_total_sum': "Qolgan umumiy to'lov (so'm)",
+        'analysis_by_courses': "Kurslar bo'yicha tahlil",
+        'analysis_by_faculties': "Fakultetlar bo'yicha tahlil",
+        'payment_status': "To'lov holati",
+        'course_students': "{course_year}-kurs talabalari",
+        'total_count': "Jami: {count} ta",
+        'paid_well': "Yaxshi to'laganlar",
+        'medium_paid': "O'rta",
+        'debts': "Qarzlar",
+        'search_student_id_name': "Talaba ID yoki ism bo'yicha qidirish...",
+        'filter_button': 'Filtrlash',
+        'clear_filters': 'Tozalash',
+        'student_and_group': 'Talaba va Guruh',
+        'contract_col': 'Kontrakt',
+        'paid_col': "To'langan",
+        'balance_col': 'Qoldiq',
+        'progress_col': 'Progress',
+        'no_id': "ID YO'Q",
+        'no_group': 'GURUHSiz',
+        'view_title': "Ko'rish",
+        'page_of': "Sahifa {page} / {pages}",
+        'no_data_found': "Ma'lumotlar topilmadi",
+        'no_payment_data_hint': "Qidiruv natijasida hech qanday to'lov ma'lumoti topilmadi. Iltimos, filtrlarni tekshirib ko'ring.",
+        'clear_filters_button': "Filtrlarni tozalash",
+        
+        # ============================================
+        # FLASH MESSAGES - IMPORT/EXPORT
+        # ============================================
+        'file_not_selected': "Fayl tanlanmagan",
+        'only_excel_files_allowed': "Faqat Excel fayllar (.xlsx, .xls) qo'llab-quvvatlanadi",
+        'only_xlsx_or_xls_allowed': "Faqat .xlsx yoki .xls formatidagi fayllar qabul qilinadi",
+        'only_xlsx_files_allowed': "Faqat .xlsx formatidagi fayllarni yuklash mumkin",
+        'no_changes_made': "Hech qanday o'zgarish kiritilmadi",
+        'no_students_imported': "Hech qanday talaba import qilinmadi",
+        'students_imported': "{imported_count} ta talaba muvaffaqiyatli import qilindi",
+        'no_subjects_imported': "Hech qanday fan import qilinmadi",
+        'subjects_imported': "{imported_count} ta fan muvaffaqiyatli import qilindi",
+        'subjects_migrated': "{count} ta fan ko'p tilli formatga o'tkazildi",
+        'no_subjects_to_migrate': "Barcha fanlar allaqachon ko'p tilli formatda",
+        'migrate_translations': "Tarjimalarni yangilash",
+        'confirm_migrate_translations': "Barcha fanlarni ko'p tilli formatga o'tkazish va tarjima qilishni xohlaysizmi?",
+        'subjects_updated': "{updated_count} ta fan yangilandi",
+        'no_users_imported': "Hech qanday foydalanuvchi import qilinmadi",
+        'users_imported': "{imported_count} ta foydalanuvchi muvaffaqiyatli import qilindi",
+        'no_records_imported': "Hech qanday yozuv import qilinmadi",
+        'records_imported': "{imported_count} ta yozuv muvaffaqiyatli import qilindi",
+        'openpyxl_not_installed': "Excel export funksiyasi ishlamayapti. Iltimos, 'pip install openpyxl' buyrug'ini bajaring.",
+        
+        # ============================================
+        # IMPORT STUDENTS PAGE
+        # ============================================
+        'import_students_title': "Talabalarni import qilish",
+        'import_students_subtitle': "Excel fayldan talabalar ro'yxatini import qilish",
+        'import_payments_title': "To'lov ma'lumotlarini import qilish",
+        'import_payments_subtitle': "Excel fayldan to'lov ma'lumotlarini import qilish",
+        'col_header_payment_talaba_id': "Talaba_id",
+        'col_desc_payment_talaba_id': "Talaba ID raqami",
+        'col_header_payment_ismi': "Ismi",
+        'col_desc_payment_ismi': "Talabaning to'liq ismi",
+        'col_header_payment_oquv_yili': "O'quv yili",
+        'col_desc_payment_oquv_yili': "O'quv yili (2024-2025). Kontrakt summasi kiritilganda majburiy — ushbu talabaning faqat shu o'quv yili uchun amal qiladi",
+        'col_header_payment_kontrakt': "Kontrakt summasi",
+        'col_desc_payment_kontrakt': "Talabaga faqatgina shu yil uchun amal qiladigan kontrakt summasi",
+        'col_header_payment_tolov': "To'lov miqdori",
+        'col_desc_payment_tolov': "To'langan summa (raqam)",
+        'col_header_payment_talab': "Kontrakt summasi",
+        'col_desc_payment_talab': "Kiritilsa ushbu summa qo'llanadi (yo'nalishdan emas). Tabaqalashtirilgan yoki qayta tiklash uchun.",
+        'col_header_payment_tolagani': "To'lov miqdori",
+        'col_desc_payment_tolagani': "To'langan summa (raqam)",
+        'col_header_payment_eslatmalar': "Eslatmalar",
+        'col_desc_payment_eslatmalar': "Qo'shimcha eslatmalar (matn)",
+        'excel_file_format': "Excel fayl format",
+        'excel_columns_required': "Excel faylda quyidagi ustunlar bo'lishi kerak:",
+        'column_name': "Ustun nomi",
+        'required_field': "Majburiy",
+        'optional_field': "Ixtiyoriy",
+        'required_if_contract_entered': "Kontrakt summasi kiritilganda majburiy",
+        'import_note_title': "Eslatma:",
+        'import_note_file_format': "Fayl .xlsx yoki .xls formatida bo'lishi kerak",
+        'import_note_required': "Majburiy maydonlar: To'liq ism, Talaba ID, Pasport seriya raqami",
+        'import_note_optional': "Ixtiyoriy maydonlar: Qolgan barcha maydonlar",
+        'import_note_auto_group': "Agar Fakultet, Kurs, Ta'lim shakli, Qabul yili va Guruh ma'lumotlari to'liq bo'lsa, talaba avtomatik guruhga qo'shiladi",
+        'import_note_enrollment': "Qabul yili yo'nalishga biriktirishda muhim (masalan: 2024, 2025)",
+        'import_note_group_name': "Guruh nomi to'g'ri yozilishi kerak (masalan: DI-21). Agar guruh mavjud bo'lmasa, yangi yaratiladi",
+        'import_note_unique': "Email va Talaba ID takrorlanmasligi kerak",
+        'import_note_password': "Yangi talabalar uchun boshlang'ich parol: Pasport seriya raqami",
+        'excel_upload_title': "Excel fayl yuklash",
+        'excel_file_label': "Excel fayl *",
+        'file_format_note': "Fayl formati: .xlsx yoki .xls",
+        'download_sample': "Namuna yuklab olish",
+        'import_button': "Import qilish",
+        'import_col_student_id': "Talaba ID (A)",
+        'import_desc_student_id': "Talaba ID raqami",
+        'import_col_full_name': "To'liq ism (B)",
+        'import_desc_full_name': "Talabaning to'liq ismi (Familiya Ism Sharif)",
+        'import_col_passport': "Pasport seriya raqami (C)",
+        'import_desc_passport': "Pasport seriya va raqami",
+        'import_col_pinfl': "PINFL (D)",
+        'import_desc_pinfl': "JSHSHIR kod (14 xonali)",
+        'import_col_birth_date': "Tug'ilgan sana (E)",
+        'import_desc_birth_date': "DD.MM.YYYY yoki YYYY-MM-DD formatida",
+        'import_col_phone': "Telefon (F)",
+        'import_desc_phone': "Telefon raqami",
+        'import_col_email': "Email (G)",
+        'import_desc_email': "Email manzil (takrorlanmasligi kerak)",
+        'import_col_faculty': "Fakultet (I)",
+        'import_desc_faculty': "Fakultet nomi (guruh biriktirish uchun)",
+        'import_col_course': "Kurs (J)",
+        'import_desc_course': "Kurs raqami (1-kurs, 2-kurs formatida)",
+        'import_col_semester': "Semestr (K)",
+        'import_desc_semester': "Semestr raqami (1-semestr, 2-semestr formatida)",
+        'import_col_education_type': "Ta'lim shakli (L)",
+        'import_desc_education_type': "Kunduzgi, Sirtqi, Kechki, Masofaviy (bosh harf katta)",
+        'import_col_enrollment_year': "Qabul yili (M)",
+        'import_desc_enrollment_year': "Qabul yili (masalan: 2024, 2025)",
+        'import_col_specialty_code': "Mutaxassislik kodi (N)",
+        'import_desc_specialty_code': "Yo'nalish kodi (masalan: DI)",
+        'import_col_specialty_name': "Mutaxassislik nomi (O)",
+        'import_desc_specialty_name': "Yo'nalish nomi (masalan: Dasturiy injiniring)",
+        'import_col_group': "Guruh (P)",
+        'import_desc_group': "Guruh nomi (masalan: DI-21)",
+        
+        # Sample file (talabalar import namuna)
+        'sample_students_title': "Talabalar import uchun namuna fayl",
+        'sample_requirements_title': "IMPORT TALABLARI:",
+        'sample_note_title': "ESLATMA:",
+        'sample_req_1': "1. Talaba ID - majburiy maydon, unikal bo'lishi kerak",
+        'sample_req_2': "2. To'liq ism - majburiy maydon",
+        'sample_req_3': "3. Pasport seriya raqami - majburiy maydon (masalan: AB1234567)",
+        'sample_req_4': "4. JSHSHIR - ixtiyoriy maydon (14 raqam)",
+        'sample_req_5': "5. Tug'ilgan sana - ixtiyoriy maydon (DD.MM.YYYY yoki YYYY-MM-DD formatida)",
+        'sample_req_6': "6. Telefon - ixtiyoriy maydon",
+        'sample_req_7': "7. Email - ixtiyoriy maydon, unikal bo'lishi kerak",
+        'sample_req_8': "8. Tavsif - ixtiyoriy maydon",
+        'sample_req_9_fid': "9. F.ID - ixtiyoriy maydon (qurilmadagi talaba identifikatori)",
+        'sample_req_9': "9. Fakultet - ixtiyoriy maydon (guruh biriktirish uchun)",
+        'sample_req_10': "10. Fakultet - ixtiyoriy maydon (guruh biriktirish uchun)",
+        'sample_req_11': "11. Kurs - ixtiyoriy maydon (1-kurs, 2-kurs formatida)",
+        'sample_req_12': "12. Semestr - ixtiyoriy maydon (1-semestr, 2-semestr formatida)",
+        'sample_req_13': "13. Ta'lim shakli - ixtiyoriy maydon (Kunduzgi, Sirtqi, Kechki, Masofaviy)",
+        'sample_req_14': "14. Qabul yili - ixtiyoriy maydon (masalan: 2024)",
+        'sample_req_15': "15. Mutaxassislik kodi - ixtiyoriy maydon (yo'nalish kodi)",
+        'sample_req_16': "16. Mutaxassislik nomi - ixtiyoriy maydon (yo'nalish nomi)",
+        'sample_req_17': "17. Guruh - ixtiyoriy maydon (mavjud bo'lsa qo'shiladi, aks holda yangi yaratiladi)",
+        'sample_filename_students': "talabalar_import_namuna",
+        'sample_staff_title': "Xodimlar import uchun namuna fayl",
+        'sample_filename_staff': "xodimlar_import_namuna",
+        
+        # ============================================
+        # IMPORT SUBJECTS PAGE
+        # ============================================
+        'import_subjects_title': "Fanlarni import qilish",
+        'import_subjects_subtitle': "Excel fayldan fanlar ro'yxatini import qilish",
+        'import_col_subject_name': "Fan nomi (A)",
+        'import_desc_subject_name': "Fanning to'liq nomi",
+        'import_col_subject_description': "Tavsif (B)",
+        'import_desc_subject_description': "Fan haqida qo'shimcha ma'lumot",
+        'import_subject_department_hint': "Kafedra nomi (bir nechta bo'lsa vergul bilan)",
+        'import_note_subject_department': "Kafedra ustunida yozilgan nom bo'yicha fan shu kafedraga biriktiriladi (bir nechta vergul bilan).",
+        'import_note_subject_name': "Fan nomi - majburiy maydon",
+        'import_note_subject_update': "Agar fan nomi mavjud bo'lsa, fan yangilanadi",
+        'import_note_subject_create': "Agar fan nomi yangi bo'lsa, yangi fan yaratiladi",
+        'import_note_subject_desc': "Tavsif - ixtiyoriy maydon",
+        'import_note_subject_department': "Kafedra ustunida yozilgan nom bo'yicha fan shu kafedraga biriktiriladi (bir nechta vergul bilan).",
+        'import_note_subjects_1col': "Agar faqat bitta til ustuni (A, B yoki C) to'ldirilgan bo'lsa, platforma tilida tarjima qilinadi",
+        'import_note_subjects_3col': "Barcha uch til ustuni to'ldirilsa, tarjima qilinmaydi",
+        'import_col_subject_uz': "Fan nomi (O'zbekcha)",
+        'import_col_subject_ru': "Fan nomi (Ruscha)",
+        'import_col_subject_en': "Fan nomi (Inglizcha)",
+        'import_desc_subject_uz': "Fan nomi o'zbekcha",
+        'import_desc_subject_ru': "Fan nomi ruscha",
+        'import_desc_subject_en': "Fan nomi inglizcha",
+        'import_subject_department_hint': "Kafedra nomi (bir nechta bo'lsa vergul bilan)",
+        'sample_subjects_title': "Fanlar import uchun namuna fayl",
+        
+        # IMPORT DEPARTMENTS (Kafedralar)
+        'import_departments_title': "Kafedralarni import qilish",
+        'import_departments_subtitle': "Excel fayldan kafedralar ro'yxatini import qilish (1 ustun – platforma tili va tarjima, yoki 3 ustun – O'z/Ru/En)",
+        'departments_imported': "{imported_count} ta kafedra qo'shildi",
+        'departments_updated': "{updated_count} ta kafedra yangilandi",
+        'no_data_imported': "Hech qanday ma'lumot import qilinmadi",
+        'import_col_department_uz': "Kafedra nomi (O'zbekcha) (A)",
+        'import_col_department_ru': "Kafedra nomi (Ruscha) (B)",
+        'import_col_department_en': "Kafedra nomi (Inglizcha) (C)",
+        'import_col_department_head': "Kafedra mudiri (D)",
+        'import_desc_department_uz': "Kafedra nomi o'zbekcha",
+        'import_desc_department_ru': "Kafedra nomi ruscha",
+        'import_desc_department_en': "Kafedra nomi inglizcha",
+        'import_desc_department_head': "Kafedra mudirining to'liq ismi (bazadagi xodim)",
+        'import_note_departments_1col': "Agar faqat bitta ustun to'ldirilsa – platforma tili hisoblanadi, qolgan tillar avtomatik tarjima qilinadi",
+        'import_note_departments_3col': "Agar A, B, C ustunlari to'ldirilgan bo'lsa – yozilgani bo'yicha qabul qilinadi (tarjima qilinmaydi). Mavjud kafedralar yangilanadi",
+        'sample_departments_title': "Kafedralar import uchun namuna fayl",
+        
+        'import_staff_title': "Xodimlarni import qilish",
+        'import_staff_subtitle': "Excel fayldan barcha foydalanuvchilarni import qiling",
+        'import_users_title': "Foydalanuvchilarni import qilish",
+        'import_col_full_name_a': "To'liq ism (A)",
+        'import_desc_full_name_staff': "Xodimning to'liq ismi (Familiya Ism Sharif)",
+        'import_col_login_b': "Login (B)",
+        'import_desc_login': "Login (takrorlanmasligi kerak)",
+        'import_col_passport_c': "Pasport seriya raqami (C)",
+        'import_col_pinfl_d': "JSHSHIR (D)",
+        'import_col_birth_date_e': "Tug'ilgan sana (E)",
+        'import_col_phone_f': "Telefon (F)",
+        'import_col_email_g': "Email (G)",
+        'import_col_description_h': "Tavsif (H)",
+        'import_desc_staff_description': "Xodim haqida qo'shimcha ma'lumot. Dekan roli bo'lsa, fakultet nomi yozilishi kerak (masalan: IT fakulteti dekani)",
+        'import_optional_dean_required': "Ixtiyoriy (Dekan roli uchun majburiy)",
+        'import_col_fid_i': "F.ID (I)",
+        'import_desc_fid': "Qurilmadagi xodim identifikatori (ixtiyoriy)",
+        'import_desc_fid_student': "Qurilmadagi talaba identifikatori (ixtiyoriy)",
+        'import_col_roles_j': "Rollar (J)",
+        'import_col_roles_i': "Rollar (I)",
+        'import_desc_roles_staff': "Vergul bilan ajratilgan: Administrator, Dekan, O'qituvchi, Buxgalter, Xodim. Bo'sh qoldirilsa «Xodim» deb saqlanadi",
+        'import_note_staff_file': "Fayl .xlsx yoki .xls formatida bo'lishi kerak",
+        'import_note_staff_required': "Majburiy maydonlar: To'liq ism, Login, Pasport seriya raqami. Rollar ixtiyoriy — bo'sh qoldirilsa «Xodim» deb saqlanadi",
+        'import_note_staff_dean': "Dekan roli tanlangan bo'lsa, Tavsif maydonida fakultet nomi ko'rsatilishi kerak (masalan: \"IT fakulteti dekani\")",
+        'import_note_staff_unique': "Login va Email takrorlanmasligi kerak",
+        'import_note_staff_password': "Yangi xodimlar uchun boshlang'ich parol: Pasport seriya raqami",
+        'sample_subjects_title': "Fanlar import uchun namuna fayl",
+        'sample_filename_subjects': "fanlar_import_namuna",
+        'sample_curriculum_title': "O'quv reja import uchun namuna fayl",
+        'sample_filename_curriculum': "oquv_reja_import_namuna",
+        'sample_schedule_title': "Dars jadvali import uchun namuna fayl",
+        'sample_filename_schedule': "dars_jadvali_namuna",
+        'sample_contracts_title': "Kontrakt import uchun namuna fayl",
+        'sample_filename_contracts': "kontrakt_namuna",
+        'contract_col_student_id': "Talaba_id",
+        'contract_col_name': "Ismi",
+        'contract_col_amount': "Kontrakt miqdori",
+        'contract_col_talab': "Kontrakt summasi",
+        'contract_col_paid': "To'lov miqdori",
+        'contract_col_notes': "Eslatmalar",
+        'contract_sample_note': "ESLATMA: Talaba_id yoki Ismi orqali talaba topiladi. Kontrakt miqdori majburiy.",
+        
+        # ============================================
+        # FLASH MESSAGES - ERROR MESSAGES
+        # ============================================
+        'error_occurred': "Xatolik yuz berdi: {error}",
+        'import_error': "Import xatosi: {error}",
+        'import_error_with_details': "Import xatosi: {errors}",
+        'import_error_joined': "Import qilishda xatolik: {errors}",
+        'export_error': "Export xatosi: {error}",
+        'export_grades_error': "Eksport qilishda xatolik yuz berdi: {error}",
+        'export_ungraded_blocked': "Eksport qilish mumkin emas: baholanmagan javoblar mavjud. Avval barcha javoblarni baholang.",
+        'role_permissions_saved': "Rollar ruxsatlari saqlandi.",
+        'reset_to_default': "Boshlang'ich holatga qaytarish",
+        'role_settings_reset_confirm': "Rollar sozlamalari boshlang'ich (default) holatga qaytariladi. Davom etasizmi?",
+        'role_settings_reset_to_default': "Rollar sozlamalari boshlang'ich holatga qaytarildi.",
+        'role_settings_description': "Har bir rol uchun ruxsatlarni belgilang yoki olib tashlang.",
+        'role_settings_all_permissions_note': "Quyidagi jadvalda tizimdagi barcha ko'rish, ruxsat va imkoniyatlar keltirilgan — har biri alohida belgilanishi mumkin.",
+        'role_settings_superadmin_only': "Bu bo'lim faqat superadmin uchun. Barcha rollar uchun ruxsatlarni checkbox orqali boshqarishingiz mumkin.",
+        'permission': "Ruxsat",
+        'perm_view_admin_panel': "Admin panelga kirish",
+        'perm_view_users': "Foydalanuvchilar ro'yxati",
+        'perm_create_user': "Foydalanuvchi qo'shish",
+        'perm_edit_user': "Foydalanuvchini tahrirlash",
+        'perm_delete_user': "Foydalanuvchini o'chirish",
+        'perm_toggle_user': "Foydalanuvchi faolligini o'zgartirish",
+        'perm_reset_user_password': "Parolni tiklash",
+        'perm_view_staff': "Xodimlar ro'yxati",
+        'perm_create_staff': "Xodim qo'shish",
+        'perm_edit_staff': "Xodimni tahrirlash",
+        'perm_delete_staff': "Xodimni o'chirish",
+        'perm_view_students': "Talabalar ro'yxati",
+        'perm_create_student': "Talaba qo'shish",
+        'perm_edit_student': "Talabani tahrirlash",
+        'perm_delete_student': "Talabani o'chirish",
+        'perm_view_faculties': "Fakultetlar",
+        'perm_create_faculty': "Fakultet qo'shish",
+        'perm_edit_faculty': "Fakultetni tahrirlash",
+        'perm_delete_faculty': "Fakultetni o'chirish",
+        'perm_view_directions': "Yo'nalishlar",
+        'perm_create_direction': "Yo'nalish qo'shish",
+        'perm_edit_direction': "Yo'nalishni tahrirlash",
+        'perm_delete_direction': "Yo'nalishni o'chirish",
+        'perm_manage_groups': "Guruhlarni boshqarish",
+        'perm_create_group': "Guruh qo'shish",
+        'perm_edit_group': "Guruhni tahrirlash",
+        'perm_delete_group': "Guruhni o'chirish",
+        'perm_view_subjects': "Fanlar",
+        'perm_create_subject': "Fan qo'shish",
+        'perm_edit_subject': "Fanni tahrirlash",
+        'perm_delete_subject': "Fanni o'chirish",
+        'perm_view_curriculum': "O'quv reja",
+        'perm_edit_curriculum': "O'quv rejani tahrirlash",
+        'perm_view_schedule': "Dars jadvali",
+        'perm_create_schedule': "Jadval qo'shish",
+        'perm_edit_schedule': "Jadvalni tahrirlash",
+        'perm_delete_schedule': "Jadvalni o'chirish",
+        'perm_view_reports': "Hisobotlar",
+        'perm_view_grade_scale': "Baholash tizimi",
+        'perm_manage_grade_scale': "Baholash tizimini boshqarish",
+        'perm_view_teachers': "O'qituvchilar ro'yxati",
+        'perm_assign_teachers': "O'qituvchi biriktirish",
+        'no_department_assigned': "Sizga hech qaysi kafedra biriktirilmagan",
+        'assign_teacher': "O'qituvchi biriktirish",
+        'teacher_assigned_successfully': "O'qituvchi muvaffaqiyatli biriktirildi",
+        'assignment_already_exists': "Bu biriktirish allaqachon mavjud",
+        'change_teacher': "O'qituvchini almashtirish",
+        'new_teacher': "Yangi o'qituvchi",
+        'teacher_changed_successfully': "O'qituvchi muvaffaqiyatli almashtirildi",
+        'assignment_not_found': "Biriktirish topilmadi",
+        'department_head_subjects_subtitle': "O'z kafedrasi fanlari va o'qituvchilari",
+        'department_head_resources_subtitle': "O'z kafedrasi fan resurslari",
+        'plan_hours': "Reja (soat)",
+        'all_lesson_types': "Barcha dars turlari",
+        'all_progress': "Barcha foizlar",
+        'total_rows': "Jami qatorlar",
+        'perm_export_subjects': "Fanlar eksport",
+        'perm_import_subjects': "Fanlar import",
+        'perm_import_schedule': "Dars jadvali import",
+        'perm_import_students': "Talabalar import",
+        'perm_import_staff': "Xodimlar import",
+        'perm_view_dean_panel': "Dekan panelga kirish",
+        'perm_dean_manage_students': "Dekan: talabalarni boshqarish",
+        'perm_dean_manage_directions': "Dekan: yo'nalishlarni boshqarish",
+        'perm_dean_manage_groups': "Dekan: guruhlarni boshqarish",
+        'perm_dean_manage_curriculum': "Dekan: o'quv reja",
+        'perm_dean_manage_teachers': "Dekan: o'qituvchilar",
+        'perm_dean_manage_schedule': "Dekan: dars jadvali",
+        'perm_create_lesson': "Dars yaratish",
+        'perm_edit_lesson': "Darsni tahrirlash",
+        'perm_delete_lesson': "Darsni o'chirish",
+        'perm_create_assignment': "Topshiriq yaratish",
+        'perm_edit_assignment': "Topshiriqni tahrirlash",
+        'perm_delete_assignment': "Topshiriqni o'chirish",
+        'perm_grade_students': "Javoblarni baholash",
+        'perm_view_submissions': "Javoblarni ko'rish",
+        'perm_create_announcement': "E'lon yaratish",
+        'perm_view_lessons': "Darslarni ko'rish",
+        'perm_submit_assignment': "Topshiriq yuborish",
+        'perm_view_grades': "Baho ko'rish",
+        'perm_view_accounting': "Buxgalteriya bo'limiga kirish",
+        'perm_manage_payments': "To'lovlarni boshqarish",
+        'perm_manage_contracts': "Kontraktlarni boshqarish",
+        'perm_view_contract_amounts': "Kontrakt summalarini ko'rish",
+        'perm_import_payments': "To'lovlarni import qilish",
+        'perm_view_announcements': "E'lonlarni ko'rish",
+        'perm_send_message': "Xabar yuborish",
+        'perm_view_messages': "Xabarlarni ko'rish",
+        'excel_import_not_working': "Excel import funksiyasi ishlamayapti: {error}",
+        'template_file_creation_error': "Namuna fayl yaratishda xatolik: {error}",
+        'template_file_download_error': "Namuna fayl yuklab olishda xatolik: {error}",
+        'announcement_delete_error': "E'lonni o'chirishda xatolik yuz berdi: {error}",
+        'announcements_delete_error': "E'lonlarni o'chirishda xatolik yuz berdi: {error}",
+        'invalid_file_format': "Ruxsat berilmagan fayl formati: {filename}. Ruxsatli formatlar: PDF, DOC, DOCX, XLS, XLSX, PPT, PPTX, TXT, ZIP, RAR",
+        'file_size_limit': "Fayl hajmi {max} MB dan oshmasligi kerak",
+    },
+    'ru': {
+        # ============================================
+        # SITE INFO
+        # ============================================
+        'site_name': '«Ташкентский институт инженеров ирригации и механизации сельского хозяйства» Национальный исследовательский университет LMS',
+        'site_name_short': '«ТИИИМСХ» НИУ LMS',
+        'site_tagline': 'Платформа дистанционного обучения',
+        'university_name': '«Ташкентский институт инженеров ирригации и механизации сельского хозяйства» Национальный исследовательский университет',
+        
+        # ============================================
+        # COMMON UI ELEMENTS
+        # ============================================
+        'dashboard': 'Главная',
+        'logout': 'Выход',
+        'login': 'Логин',
+        'register': 'Регистрация',
+        'settings': 'Настройки',
+        'search': 'Поиск',
+        'save': 'Сохранить',
+        'cancel': 'Отмена',
+        'delete': 'Удалить',
+        'not_found': 'Не найдено',
+        'edit': 'Редактировать',
+        'copy_text': 'Копировать',
+        'more_options': 'Ещё',
+        'reply': 'Ответить',
+        'forward': 'Переслать',
+        'select': 'Выбрать',
+        'selected': 'выбрано',
+        'translate': 'Перевести',
+        'create': 'Создать',
+        'back': 'Назад',
+        'next': 'Следующий',
+        'previous': 'Предыдущий',
+        'submit': 'Отправить',
+        'close': 'Закрыть',
+        'yes': 'Да',
+        'no': 'Нет',
+        'actions': 'Действия',
+        'status': 'Статус',
+        'date': 'Дата',
+        'name': 'Имя',
+        'email': 'Email',
+        'phone': 'Телефон',
+        'password': 'Пароль',
+        'confirm_password': 'Подтвердить пароль',
+        'role': 'Роль',
+        'active': 'Активный',
+        'inactive': 'Неактивный',
+        
+        # ============================================
+        # NAVIGATION & MENU
+        # ============================================
+        'institution_name': '«ТИИИМСХ» НИУ',
+        'remote_education_platform': 'Платформа дистанционного обучения',
+        'payment_info': 'Платежная информация',
+        'accounting': 'Бухгалтерия',
+        'admin_panel': 'Панель администратора',
+        'staff_database': 'База сотрудников',
+        'students_database': 'База студентов',
+        'subjects_database': 'База предметов',
+        'department_head_subjects_subtitle': "Управление предметами своей кафедры",
+        'department_head_resources_subtitle': "Ресурсы предметов и преподаватели кафедры",
+        'no_department_assigned': "Вам не назначена ни одна кафедра",
+        'assign_teachers_menu': "Назначение преподавателей",
+        'assign_teachers_subtitle': "Назначение преподавателей на направления и группы активных семестров",
+        'teacher_assigned_success': "Преподаватель успешно назначен",
+        'teacher_removed_success': "Преподаватель успешно удалён",
+        'assign_teacher': "Назначить преподавателя",
+        'select_subject': "Выберите предмет",
+        'select_teacher': "Выберите преподавателя",
+        'select_group': "Выберите группу",
+        'select_lesson_type': "Выберите тип занятия",
+        'assign': "Назначить",
+        'assignment_already_exists': "Это назначение уже существует",
+        'teacher_assigned_successfully': "Преподаватель успешно назначен",
+        'change_teacher': "Сменить преподавателя",
+        'new_teacher': "Новый преподаватель",
+        'assignment_not_found': "Назначение не найдено",
+        'teacher_changed_successfully': "Преподаватель успешно изменён",
+        'plan_hours': "План (часов)",
+        'all_lesson_types': "Все типы занятий",
+        'all_progress': "Все",
+        'total_rows': "Всего строк",
+        'subjects_database_subtitle': 'Предметы, привязанные к учебному плану (направление, группа, преподаватель, предмет)',
+        'subject_resources': 'Ресурсы предметов',
+        'subject_resources_subtitle': 'Полный список по преподавателю–предмету–группе с фильтрами',
+        'search_resources_placeholder': 'Поиск по преподавателю, предмету, группе...',
+        'dashboard_zero_percent_only': 'В основном 0% ресурсов (полный список в разделе Ресурсы предметов)',
+        'total_rows': 'Всего строк',
+        'filters': 'Фильтры',
+        'all': 'Все',
+        'all_faculties': 'Все факультеты',
+        'all_courses': 'Все курсы',
+        'all_academic_years': 'Все учебные годы',
+        'all_semesters': 'Все семестры',
+        'all_education_types': 'Все формы',
+        'all_directions': 'Все направления',
+        'all_groups': 'Все группы',
+        'search_placeholder_curriculum': 'Поиск по названию предмета, году набора, названию/коду направления, группе, преподавателю, форме обучения...',
+        'subject_count': 'предмет',
+        'credit': 'кредит',
+        'no_description': 'Описание отсутствует',
+        'lecture': 'Лекция',
+        'practice': 'Практика',
+        'lab': 'Лаб',
+        'seminar': 'Семинар',
+        'course_work': 'Курсовая',
+        'available': 'есть',
+        'independent': 'Самост.',
+        'hour': 'час',
+        'subjects_not_found': 'Предметы не найдены',
+        'subjects_for_group': 'Предметы, назначенные вашей группе',
+        'subjects_assigned_to_you': 'Ваши назначенные предметы',
+        'subject_search_placeholder': 'Поиск предмета...',
+        'curriculum_not_completed': 'Учебный план выполнен не полностью:',
+        'curriculum_warning_no_topics': '{name}: Необходимо создать минимум 1 тему, но темы ещё не созданы',
+        'curriculum_warning_missing': '{name}: Для {hours} ч требуется {required} тем, введено {actual} (не хватает: {missing})',
+        'lessons_unit': 'занятие',
+        'assignments_unit': 'задание',
+        'no_group_assigned': 'Вам пока не назначена группа',
+        'change_search_query': 'Измените поисковый запрос',
+        'prev_page': 'Назад',
+        'next_page': 'Вперёд',
+        'change_search': 'Измените параметры поиска.',
+        'dean_office': 'Деканат',
+        'dean_panel': 'Панель декана',
+        'dean_control': 'Контроль деканата',
+        'student_groups': 'Учебные группы',
+        'academic_subjects': 'Учебные предметы',
+        'faculty_students': 'Студенты факультета',
+        'total_teachers_label': 'Всего преподавателей',
+        'education_directions': 'Направления обучения',
+        'reports': 'Отчеты',
+        'system_reports': 'Системные отчеты',
+        'general_statistics': 'Общая статистика и данные',
+        'total_users': 'Всего пользователей',
+        'active_users': 'Активные пользователи',
+        'students_excel': 'Студенты Excel',
+        'schedule_excel': 'Расписание Excel',
+        'by_faculties': 'По факультетам',
+        'students_by_groups': 'Студенты по группам',
+        'no_faculties': 'Факультеты отсутствуют',
+        'no_groups': 'Группы отсутствуют',
+        'student_count': 'студент',
+        'grading_system': 'Система оценивания',
+        'role_settings': 'Настройки ролей',
+        'site_settings': 'Настройки сайта',
+        'site_settings_description': 'Измените название платформы, краткое название, слоган и логотип.',
+        'site_settings_general': 'Общая информация',
+        'site_settings_institution_name': 'Полное название учреждения (платформы)',
+        'site_settings_short_name': 'Краткое название (для заголовка)',
+        'site_settings_short_name_hint': 'Отображается во вкладке браузера и заголовке страницы',
+        'site_settings_tagline': 'Слоган',
+        'site_settings_logo': 'Логотип',
+        'site_settings_current_logo': 'Текущий логотип',
+        'site_settings_click_to_enlarge': 'Нажмите для просмотра',
+        'site_settings_no_logo': 'Логотип не загружен (используется стандартный)',
+        'site_settings_upload_logo': 'Загрузить новый логотип',
+        'site_settings_logo_hint': 'PNG, JPG, GIF, WebP или SVG. Оставьте пустым, чтобы сохранить текущий.',
+        'site_settings_remove_logo': 'Удалить логотип',
+        'site_settings_logo_upload_error': 'Логотип не загружен. Проверьте размер файла и права доступа.',
+        'site_settings_logo_format_error': 'Формат логотипа не поддерживается. Допустимы: PNG, JPG, GIF, WebP, SVG.',
+        'site_settings_saved': 'Настройки сайта сохранены.',
+        'site_settings_reset_to_default': 'Сбросить в начальное состояние',
+        'site_settings_reset_confirm': 'Все настройки сайта (названия, слоган, логотипы) будут очищены. Продолжить?',
+        'site_settings_reset_done': 'Настройки сайта сброшены в начальное состояние.',
+        'grade_scale_settings': 'Настройки балльной системы',
+        'reset_to_default': 'Сбросить к стандарту',
+        'new_grade': 'Новая оценка',
+        'about_grading_system': 'О системе оценивания',
+        'grading_system_description': 'Здесь вы можете настроить балльную систему, используемую для расчета оценок студентов. Для каждой оценки установите минимальный и максимальный диапазон баллов, значение GPA и другие параметры.',
+        'grades_table': 'Таблица оценок',
+        'order': 'Порядок',
+        'grade': 'Оценка',
+        'name': 'Название',
+        'score_range': 'Диапазон баллов',
+        'status': 'Статус',
+        'actions': 'Действия',
+        'passed': 'Сдал',
+        'failed': 'Не сдал',
+        'no_grades': 'Нет оценок',
+        'grading_system_not_configured': 'Система оценивания еще не настроена',
+        'add_new_grade': 'Добавить новую оценку',
+        'visual_appearance': 'Визуальное представление',
+        'confirm_reset_grades': 'Вы действительно хотите вернуться к стандартным настройкам?',
+        'confirm_delete_grade': 'Вы действительно хотите удалить?',
+        
+        # ============================================
+        # PAGE TITLES & HEADERS
+        # ============================================
+        'home_page': 'Главная страница',
+        'admin_control_panel': 'Панель управления администратора',
+        'system_management_monitoring': 'Управление и мониторинг системы',
+        'all_users_list': 'Список всех пользователей',
+        'all_students_list': 'Список всех студентов',
+        'all_faculties_list': 'Список всех факультетов',
+        'all_subjects_list': 'Список всех предметов',
+        'all_lessons_list': 'Список всех занятий',
+        'all_staff_list': 'Список всех сотрудников',
+        'all_teachers_list': 'Список всех преподавателей',
+        'directions_page_subtitle': 'Все факультеты • Год + Форма обучения → Направление → Курс → Семестр → Группы',
+        'faculty_directions_subtitle': 'Год набора + Форма обучения → Направление → Курс → Семестр → Группы',
+        'groups_page_subtitle': 'Только группы с студентами (активные) • Фильтр по факультету',
+        
+        # ============================================
+        # BUTTONS & ACTIONS
+        # ============================================
+        'new_user': 'Новый пользователь',
+        'add_user': 'Добавить пользователя',
+        'new_student': 'Новый студент',
+        'new_subject': 'Новый предмет',
+        'new_faculty': 'Новый факультет',
+        'create_subject': 'Создать предмет',
+        'create_group': 'Создать группу',
+        'new_account': 'Новый аккаунт',
+        'add_faculty': 'Добавить факультет',
+        'new_staff': 'Новый сотрудник',
+        'create_staff_title': 'Создать нового сотрудника',
+        'create_staff_button': 'Создать сотрудника',
+        'edit_staff_title': 'Редактировать сотрудника',
+        'basic_info': 'Основная информация',
+        'academic_info': 'Академическая информация',
+        'create_student_title': 'Создать студента',
+        'create_student_subtitle': 'Введите данные студента и назначьте группу',
+        'student_id_label': 'ID студента',
+        'passport_label': 'Паспорт',
+        'enrollment_year': 'Год набора',
+        'select_course_placeholder': 'Выберите курс',
+        'select_semester_placeholder': 'Выберите семестр',
+        'select_education_type_placeholder': 'Выберите форму обучения',
+        'select_direction_placeholder': 'Выберите направление',
+        'select_group_placeholder': 'Выберите группу',
+        'select_education_type_placeholder': 'Выберите форму обучения',
+        'create_student_button': 'Создать студента',
+        'group_name_placeholder': 'Название группы',
+        'create_group_title': 'Создать новую группу',
+        'create_group_page_title': 'Новая группа',
+        'group_name_placeholder_example': 'Например: DI-21',
+        'edit_student_title': 'Редактировать студента',
+        'edit_group_title': 'Редактировать группу',
+        'group_name_label': 'Название группы *',
+        'faculty_auto_selected': 'Факультет выбран автоматически',
+        'update': 'Обновить',
+        'update_page_title': 'Обновление системы',
+        'update_page_description': 'Проверьте версию платформы и обновите вручную (автообновление в институтах 00:00–06:00).',
+        'update_check_btn': 'Проверить наличие обновлений',
+        'update_run_btn': 'Установить обновление',
+        'update_current_version': 'Текущая версия',
+        'update_latest_version': 'Последняя версия',
+        'update_available': 'Доступно обновление.',
+        'update_up_to_date': 'Платформа актуальна.',
+        'update_not_available': 'Обновление недоступно.',
+        'update_center_timeout': 'Время подключения к центру истекло — {url}',
+        'update_center_connection_error': 'Ошибка подключения к центру (адрес или сеть) — {url}',
+        'update_center_not_configured': 'CENTRAL_API_URL не задан',
+        'update_center_bad_response': 'Ответ центра: {code} — {url}',
+        'update_version_failed': 'Не удалось получить последнюю версию',
+        'update_center_no_connection': 'Нет подключения к центру (CENTRAL_API_URL)',
+        'error': 'Ошибка',
+        'update_disabled_note': 'Нет подключения к центру (CENTRAL_API_URL не задан).',
+        'update_installed_restart': 'Обновление установлено. Система перезапустится через несколько секунд.',
+        'update_not_applied': 'Обновление не применено (уже установлено или ошибка).',
+        'update_broadcast_sent': 'Сообщение об обновлении отправлено всем институтам.',
+        'update_broadcast_error': 'Ошибка отправки сообщения.',
+        'institutions_updated': 'Список институтов обновлён.',
+        'update_institutions_section_title': 'Институты, подключённые к центру',
+        'update_trigger_btn': 'Отправить обновление всем институтам',
+        'center_block_status': 'Состояние центра',
+        'center_blocked': 'Центр заблокирован',
+        'center_not_blocked': 'Центр не заблокирован',
+        'center_block_btn': 'Заблокировать центр',
+        'center_unblock_btn': 'Разблокировать центр',
+        'institutions_connected': 'Подключён',
+        'institutions_blocked': 'Заблокирован',
+        'institution_edit': 'Редактировать',
+        'institution_block': 'Заблокировать',
+        'institution_unblock': 'Разблокировать',
+        'institution_name_label': 'Название института',
+        'institution_id_label': 'ID института',
+        'institution_block_reason': 'Причина блокировки',
+        'institution_deleted': 'Институт удалён из списка.',
+        'confirm_delete_institution': 'Удалить этот институт из списка?',
+        'institution_id_exists': 'Институт с таким ID уже есть. Введите другой ID.',
+        'add_institution': 'Добавить институт',
+        'faollik': 'Активность',
+        'description_short_placeholder': 'Краткая информация...',
+        'passport_info': 'Паспортные данные',
+        'passport_series_number': 'Серия и номер паспорта',
+        'pinfl': 'ПИНФЛ',
+        'pinfl': 'ПИНФЛ',
+        'used_as_password': 'Будет использоваться как пароль',
+        'birth_date': 'Дата рождения',
+        'name_placeholder': 'Имя Фамилия',
+        'staff_description_placeholder': 'Краткая информация о сотруднике...',
+        'multiple_roles_can_select': 'Можно выбрать несколько ролей',
+        'role_optional_default_xodim': 'Роль необязательна; если не выбрана, отображается «Сотрудник».',
+        'role_optional_no_xodim_role': 'Отдельной роли «Сотрудник» нет; если не выбрана ни одна роль, сохраняется как «Сотрудник».',
+        'staff_fid': 'F.ID',
+        'staff_fid_placeholder': 'ID сотрудника в устройстве',
+        'student_fid_placeholder': 'ID студента в устройстве',
+        'staff_role_xodim': 'Сотрудник',
+        'select_faculty_placeholder': 'Выберите факультет...',
+        'dean_must_select_faculty': 'Для роли декана выбор факультета обязателен',
+        'accountant': 'Бухгалтер',
+        'new_lesson': 'Новый урок',
+        'add_subject': 'Добавить предмет',
+        'create_faculty': 'Создать факультет',
+        'import_from_excel': 'Импорт из Excel',
+        'export_to_excel': 'Экспорт в Excel',
+        'export': 'Экспорт',
+        'import': 'Импорт',
+        'clear': 'Очистить',
+        'ok': 'OK',
+        'all_subjects': 'Все предметы',
+        'view_all': 'Посмотреть все',
+        'block': 'Заблокировать',
+        'activate': 'Активировать',
+        'reset_password': 'Сбросить пароль',
+        'edit_info': 'Редактировать информацию',
+        
+        # ============================================
+        # TABLE HEADERS & LABELS
+        # ============================================
+        'additional': 'Дополнительно',
+        'full_name_student_id': 'Полное имя / ID студента',
+        'full_name_login': 'Полное имя / Логин',
+        'passport_pinfl': 'Серия и номер паспорта / ПИНФЛ',
+        'phone_email': 'Телефон / Email',
+        'group_direction': 'Группа / Направление',
+        'responsible_deans': 'Ответственные деканы',
+        'no_responsible_dean': 'Ответственный декан не назначен',
+        
+        # ============================================
+        # FILTERS & OPTIONS
+        # ============================================
+        'all_roles': 'Все роли',
+        'all_faculties': 'Все факультеты',
+        'all_courses': 'Все курсы',
+        'all_academic_years': 'Все учебные годы',
+        'all_semesters': 'Все семестры',
+        'all_types': 'Все формы',
+        'all_directions': 'Все направления',
+        'all_groups': 'Все группы',
+        'course_suffix': '-курс',
+        'semester_suffix': '-семестр',
+        'education_type': 'Форма обучения',
+        'education_type_kunduzgi': 'Очный',
+        'education_type_sirtqi': 'Заочная',
+        'education_type_kechki': 'Вечерняя',
+        'education_type_masofaviy': 'Дистанционная',
+        'course_year_option': '{n}-курс',
+        'select_option_choose': 'Выберите',
+        'create_group_mode': 'Создать группу',
+        'switch_back_to_select': 'Вернуться к выбору',
+        'please_enter_group_name': 'Пожалуйста, введите название группы!',
+        
+        # ============================================
+        # STATUS & MESSAGES
+        # ============================================
+        'blocked': 'Заблокирован',
+        'group_not_assigned': 'Группа не назначена',
+        'description': 'Описание',
+        'no_description': 'Нет описания',
+        'users_not_found': 'Пользователи не найдены',
+        'students_not_found': 'Студенты не найдены',
+        'no_faculties': 'Факультеты отсутствуют',
+        'no_users': 'Пользователи отсутствуют',
+        'no_subjects': 'Предметы отсутствуют',
+        'no_active_groups': 'Активные группы не найдены',
+        'groups_empty_hint': 'Здесь отображаются группы с студентами. Измените фильтры или создайте новую группу.',
+        'direction_not_assigned': 'Направление не назначено',
+        'lessons_no_content_warning': 'Есть занятия, но нет видео/файлов',
+        'description_not_available': 'Описание отсутствует',
+        'teachers_not_found': 'Преподаватели не найдены',
+        'taught_courses_label': 'Курсы',
+        'search_result_empty': 'Результат поиска пустой',
+        'start_creating_faculty': 'Начните создавать новый факультет',
+        'start_creating_subject': 'Начните создавать новый предмет',
+        'loading': 'Загрузка…',
+        'load_error': 'Ошибка загрузки. Обновите страницу.',
+        
+        # ============================================
+        # PAGINATION
+        # ============================================
+        'first': 'Первая',
+        'last': 'Последняя',
+        'total_items': 'всего',
+        'pagination_range': '{start}-{end} из {total}',
+        
+        # ============================================
+        # STATS & COUNTS
+        # ============================================
+        'total': 'Всего',
+        'admins': 'Администраторы',
+        'deans': 'Деканы',
+        'teachers': 'Преподаватели',
+        'students': 'Студенты',
+        'staff': 'Сотрудники',
+        'all_users': 'Все пользователи',
+        'all_staff': 'Все сотрудники',
+        'student_count': 'Количество студентов',
+        'available': 'Доступно',
+        'taught_subjects': 'Преподаваемые предметы',
+        'items_count': 'элементов',
+        'with_assignments': 'с назначениями',
+        'groups_with_students': 'группы с студентами',
+        'system_members': 'Члены системы',
+        
+        # ============================================
+        # SEARCH & PLACEHOLDERS
+        # ============================================
+        'search_name_email': 'Поиск (имя, email)...',
+        'search_name_email_role': 'Поиск (имя, email, роль)...',
+        'search_name_code': 'Поиск (название, код)...',
+        'search_student_fields': 'Поиск (имя, логин, паспорт, ПИНФЛ, телефон, email)...',
+        'search_direction_placeholder': 'Год набора, код, название, форма обучения...',
+        'search_group_placeholder': 'Название группы, направление...',
+        'search_subject_placeholder': 'Поиск по названию или описанию предмета...',
+        'search_teacher_placeholder': 'Поиск преподавателя',
+        'search_name_placeholder': 'Поиск по названию или описанию...',
+        'search_department_name_or_head_placeholder': 'Поиск по названию кафедры или зав. кафедрой...',
+        
+        # ============================================
+        # CONFIRMATION MESSAGES
+        # ============================================
+        'confirm_delete_user': 'Вы хотите удалить этого пользователя?',
+        'confirm_delete_student': 'Вы хотите удалить этого студента?',
+        'confirm_delete_faculty': 'Вы хотите удалить этот факультет? Все группы, предметы и данные будут удалены.',
+        'confirm_delete_subject': 'Вы хотите удалить этот предмет?',
+        'confirm_delete_group': 'Вы хотите удалить эту группу? Студенты в ней также могут быть удалены.',
+        'confirm_delete_direction': 'Вы уверены, что хотите удалить это направление?',
+        'confirm_reset_password': 'Вы хотите сбросить пароль?',
+        
+        # ============================================
+        # OTHER COMMON
+        # ============================================
+        'today_overview': 'Общий обзор на сегодня',
+        'recent_users': 'Последние пользователи',
+        'new_members': 'Новые участники',
+        'no_announcements_found': 'Объявления не найдены',
+        'create_announcement_label': 'Опубликовать объявление',
+        'important_label': 'Важно',
+        'quick_actions': 'Быстрые действия',
+        'my_subjects': 'Мои предметы',
+        'assigned_subjects': 'Назначенные предметы',
+        'assigned_groups_count': 'Количество групп',
+        'subject_assignments_count': 'Задания по предметам',
+        'unchecked': 'Не проверено',
+        'students_awaiting_grading': 'Ожидают оценки',
+        'search_subjects_placeholder': 'Поиск предметов...',
+        'search_assignments_placeholder': 'Поиск заданий...',
+        'resources_available': 'ресурсов доступно',
+        'resources': 'Ресурсы',
+        'resource': 'Ресурс',
+        'no_assigned_subjects': 'Вам не назначены предметы',
+        'all_assignments': 'Все задания',
+        'new_count_suffix': 'новых',
+        'no_deadline': 'Без срока',
+        'no_new_answers': 'Нет новых ответов',
+        'all_checked': 'Всё проверено!',
+        'no_pending_to_check': 'У вас нет невыполненных заданий для проверки.',
+        'assignments_not_found': 'Задания не найдены',
+        'resubmit_count': 'повторных попыток',
+        'new_short': 'новых',
+        'assigned': 'Назначено',
+        'not_assigned': 'Не назначено',
+        'roles': 'Роли',
+        'profile_settings': 'Настройки профиля',
+        'settings_subtitle': 'Управление настройками вашей учётной записи',
+        'profile_info': 'Данные профиля',
+        'new_password_confirm_label': 'Подтвердите новый пароль',
+        'min_8_chars': 'Минимум 8 символов',
+        'additional_info': 'Дополнительная информация',
+        'registered_at': 'Зарегистрирован',
+        'last_login': 'Последний вход',
+        'session_timeout_message': 'Для безопасности вы автоматически выйдете через 30 минут',
+        'course': 'Курс',
+        'administrator': 'Администратор',
+        
+        # ============================================
+        # ROLES
+        # ============================================
+        'admin': 'Администратор',
+        'dean': 'Декан',
+        'edu_dept': 'Учебный отдел',
+        'department_head': 'Зав. кафедрой',
+        'teacher': 'Преподаватель',
+        'student': 'Студент',
+        'superadmin': 'Суперандмин',
+        
+        # ============================================
+        # DASHBOARD ELEMENTS
+        # ============================================
+        'welcome': 'Добро пожаловать',
+        'good_morning': 'Доброе утро',
+        'good_afternoon': 'Добрый день',
+        'good_evening': 'Добрый вечер',
+        'good_night': 'Доброй ночи',
+        'today': 'Сегодня',
+        'total_users': 'Всего пользователей',
+        'total_students': 'Всего студентов',
+        'total_teachers': 'Всего преподавателей',
+        'total_faculties': 'Всего факультетов',
+        'total_groups': 'Всего групп',
+        'total_subjects': 'Всего предметов',
+        'active_groups_count': 'Активные группы',
+        'active_by_faculty': 'По факультету',
+        'available_subjects': 'Доступные предметы',
+        'recent_announcements': 'Последние объявления',
+        'important': 'Важно',
+        'view_all': 'Всё',
+        
+        # ============================================
+        # SUBJECTS
+        # ============================================
+        'subjects': 'Предметы',
+        'subject': 'Предмет',
+        'subject_name': 'Название предмета',
+        'subject_code': 'Код предмета',
+        'subject_name_placeholder': 'Основы программирования',
+        'course_name_label': 'Название курса',
+        'create_course_title': 'Создать новый курс',
+        'create_course_subtitle': 'Введите данные курса',
+        'image_url_optional': 'URL изображения (необязательно)',
+        'course_title_placeholder': 'Например: Основы программирования',
+        'course_description_placeholder': 'Краткая информация о курсе...',
+        'category_label': 'Категория',
+        'subject_description_placeholder': 'Краткая информация о предмете...',
+        'create_new_subject': 'Создать новый предмет',
+        'credits': 'Кредиты',
+        'semester': 'Семестр',
+        'lessons': 'Уроки',
+        'lesson': 'Урок',
+        'assignments': 'Задания',
+        'assignment': 'Задание',
+        'grades': 'Оценки',
+        'grade': 'Оценка',
+        'grades_subtitle': 'Ваши академические результаты (балльная система)',
+        'teacher_grades_subtitle': 'Оценки студентов по предметам и группам',
+        'no_subjects_assigned_to_you': 'Вам пока не назначены предметы',
+        'overall_score': 'Общий балл',
+        'subject_count_grades': 'оценок по предметам',
+        'assignment_count_grades': 'заданий',
+        'mastered_label': 'Освоено',
+        'subjects_by_grades': 'Оценки по предметам',
+        'no_graded_assignments': 'Пока нет оцененных заданий',
+        
+        # ============================================
+        # USERS
+        # ============================================
+        'users': 'Пользователи',
+        'user': 'Пользователь',
+        'full_name': 'Полное имя',
+        'student_id': 'ID студента',
+        'group': 'Группа',
+        'groups': 'Группы',
+        'direction': 'Направление',
+        'directions': 'Направления',
+        'direction_count_label': 'направлений',
+        'group_count_label': 'групп',
+        'student_count_label': 'студентов',
+        'year_suffix': 'год',
+        'curriculum_label': 'Учебный план',
+        'curriculum_subject_teachers': 'Преподаватели предметов',
+        'curriculum_selected_count': '{count} выбрано',
+        'curriculum_subject_search_placeholder': 'Поиск предмета',
+        'curriculum_total_workload': 'Общая нагрузка',
+        'curriculum_hours_unit': 'час',
+        'hours_plan': 'план',
+        'hours_loaded': 'загружено',
+        'curriculum_credits_unit': 'кредит',
+        'curriculum_semester_select_label': 'Выберите семестр',
+        'curriculum_add_to_semester': 'Добавить в семестр',
+        'curriculum_semester_format': '{n}-семестр',
+        'curriculum_table_subjects': 'ПРЕДМЕТЫ',
+        'curriculum_table_total': 'ВСЕГО',
+        'curriculum_table_credits': 'КРЕДИТ',
+        'curriculum_table_actions': 'ДЕЙСТВИЯ',
+        'curriculum_replace_subject_tooltip': 'Заменить предмет',
+        'curriculum_no_subjects_in_semester': 'В этом семестре нет предметов',
+        'curriculum_replace_modal_title': 'Заменить предмет',
+        'curriculum_new_subject_label': 'Новый предмет',
+        'curriculum_replace_btn': 'Заменить',
+        'curriculum_confirm_delete_subject': 'Удалить этот предмет из плана?',
+        'curriculum_please_select_subject': 'Выберите хотя бы один предмет!',
+        'curriculum_please_select_semester': 'Выберите семестр!',
+        'subject_count_unit': 'предмет',
+        'lesson_type': 'Тип занятия',
+        'hours': 'Часы',
+        'lesson_type_maruza': 'Лекция',
+        'lesson_type_amaliyot': 'Практика',
+        'lesson_type_laboratoriya': 'Лабораторная',
+        'lesson_type_seminar': 'Семинар',
+        'lesson_type_kurs_ishi': 'Курсовая работа',
+        'lesson_type_mustaqil_talim': 'Самостоятельное обучение',
+        'lesson_type_short_m': "Л",
+        'lesson_type_short_a': "П",
+        'lesson_type_short_l': "Лб",
+        'lesson_type_short_s': "С",
+        'lesson_type_short_k': "КР",
+        'lesson_type_short_mt': "СО",
+        'select_teacher_placeholder': 'Поиск преподавателя...',
+        'select_subject_placeholder': 'Выберите предмет...',
+        'back_to_subjects_list': 'Вернуться к списку предметов',
+        'add_lesson': 'Добавить занятие',
+        'add_assignment': 'Добавить задание',
+        'add_test': 'Добавить тест',
+        'create_lesson_title': 'Добавить новое занятие',
+        'edit_lesson_title': 'Редактировать занятие',
+        'create_assignment_title': 'Создать новое задание',
+        'edit_assignment_title': 'Редактировать задание',
+        'add_assignment_to_subject': 'Добавить новое задание к предмету {subject}',
+        'edit_assignment_subtitle': 'Редактировать задание по предмету {subject}',
+        'create_test_title': 'Создать новый тест',
+        'add_test_to_subject': 'Добавить новый тест к предмету {subject}',
+        'tests_coming_soon': 'Раздел тестов будет добавлен в ближайшее время.',
+        'title': 'Название',
+        'content': 'Содержание',
+        'title_placeholder_suffix': ' – Тест',
+        'test_create_content': 'Создание теста',
+        'test_content_placeholder': "Вопрос 1\n=====\nВариант 1\n=====\nВариант 2\n=====\n#Вариант 3 правильный\n=====\nВариант 4\n+++++\nВопрос 2",
+        'test_format_hint': 'Формат: вопрос ===== вариант1 ===== #правильный вариант ===== +++++ следующий вопрос',
+        'view_preview': 'Просмотр',
+        'test_questions': 'Вопросы теста',
+        'enter_test_questions_please': 'Пожалуйста, введите хотя бы один вопрос!',
+        'enter_title_please': 'Пожалуйста, введите название!',
+        'test_created_success': 'Тест успешно создан.',
+        'preview_placeholder': 'Нажмите кнопку «Просмотр», чтобы увидеть результат.',
+        'which_topics_related': 'К каким темам относится',
+        'select_lesson_type_first': 'Сначала выберите тип занятия',
+        'select_related_topics_hint': 'Укажите, к каким темам относится это задание',
+        'no_topics_created_yet': 'Темы по этому предмету и направлению ещё не созданы',
+        'no_topics_in_lesson_type': 'Для этого типа занятия темы ещё не созданы',
+        'file_upload_required': 'Загрузка файла обязательна',
+        'file_required_hint': '(Если отмечено, студенты должны загрузить файл при ответе)',
+        'enter_description_please': 'Пожалуйста, введите описание!',
+        'select_at_least_one_topic': 'Пожалуйста, выберите хотя бы одну тему!',
+        'enter_deadline_please': 'Пожалуйста, укажите срок!',
+        'lesson_type_select': 'Выберите тип занятия',
+        'lesson_type_not_available': 'Тип занятия недоступен',
+        'lesson_content_placeholder': 'Введите содержание занятия...',
+        'score': 'Балл',
+        'max_short': 'Макс',
+        'assignment_name_label': 'Название задания',
+        'assignment_title_placeholder': 'Например: Практическое задание #1',
+        'assignment_description_placeholder': 'Подробная информация о задании...',
+        'back_to_lesson': 'Вернуться к занятию',
+        'next_lesson': 'Следующее занятие',
+        'confirm_delete_short': 'Вы действительно хотите удалить?',
+        'add_lesson_to_subject': 'Добавить новый урок к предмету {subject}',
+        'edit_lesson_subtitle': 'Редактировать урок по предмету {subject}',
+        'no_lesson_type_assigned': 'Вам не назначен тип занятия для этого предмета (в этом направлении)',
+        'assignment_only_with_topics': 'Задания можно создавать только для типов занятий, у которых есть темы',
+        'topic_name_label': 'Название темы',
+        'topic_name_placeholder': 'Например: Тема 1: Введение',
+        'video_url_youtube': 'URL видео (только YouTube)',
+        'video_url_placeholder': 'https://youtube.com/watch?v=... или https://youtu.be/...',
+        'only_youtube_supported': 'Поддерживаются только видео YouTube',
+        'or_separator': '— или —',
+        'video_upload_label': 'Загрузить видеофайл (максимум 200 МБ)',
+        'select_video_or_drop': 'Выберите видео или перетащите сюда',
+        'video_formats': 'Форматы MP4, WebM, OGG',
+        'file_url_cloud': 'URL файла (облачное хранилище и т.д.)',
+        'file_url_preview': 'Проверенный файл',
+        'add_url': 'Добавить URL',
+        'check': 'Проверить',
+        'file_url_optional_hint': 'Если по ссылке найден файл, загрузка файла необязательна',
+        'file_upload_multiple': 'Загрузить файл (можно выбрать несколько)',
+        'select_files_or_drop': 'Выберите файлы или перетащите сюда',
+        'file_formats_list': 'PDF, DOC, DOCX, XLS, XLSX, PPT, PPTX, TXT, ZIP, RAR',
+        'checking': 'Проверка...',
+        'file_too_large_200': 'Размер файла не должен превышать 200 МБ!',
+        'select_lesson_type_please': 'Пожалуйста, выберите тип занятия!',
+        'video_required_for_lecture': 'Для лекции видео обязательно! Загрузите видеофайл или введите URL видео.',
+        'upload_topic_file_please': 'Пожалуйста, загрузите файл темы или введите URL файла!',
+        'check_file_url_please': 'Пожалуйста, нажмите кнопку проверки URL файла!',
+        'file_not_found_upload': 'Файл по URL не найден. Пожалуйста, загрузите файл!',
+        'error_try_again': 'Произошла ошибка. Пожалуйста, попробуйте снова.',
+        'please_enter_url': 'Пожалуйста, введите URL!',
+        'url_or_file_hint': 'Введите URL или перетащите файл сюда',
+        'switch_to_url': 'Ввести по URL',
+        'upload_via_url': 'Загрузить по URL',
+        'video_url_preview': 'Проверенное видео',
+        'video_url_playable': 'URL видео проверен. Из-за ограничений YouTube некоторые видео могут не открываться внутри урока.',
+        'video_url_not_playable': 'Видео недоступно для просмотра или не найдено.',
+        'video_url_check_error': 'Ошибка при проверке URL видео. Попробуйте снова.',
+        'check_video_url_please': 'Пожалуйста, нажмите кнопку проверки URL видео!',
+        'youtube_embed_fallback_hint': 'Некоторые видео из-за ограничений YouTube могут не открываться внутри сайта.',
+        'watch_on_youtube': 'Смотреть на YouTube',
+        'current_video': 'Текущее видео',
+        'current_files': 'Текущие файлы',
+        'replace_existing_video_notice': 'Если загрузите новое видео или введете URL, текущее будет заменено',
+        'replace_existing_file_notice': 'Если загрузите новый файл или введете URL, текущие файлы будут заменены',
+        'file_checking': 'Проверка файла...',
+        'google_link_detected_optional': 'Обнаружена ссылка Google Drive/Sheets/Docs. Ссылка считается доступной. Теперь загрузка файла необязательна.',
+        'file_found_upload_optional': 'Файл найден! Теперь загрузка файла необязательна.',
+        'file_not_found_upload_required': 'Файл не найден. Загрузка файла будет обязательной.',
+        'selected_files_count': 'Выбрано файлов: {count}',
+        'add_file': '+ Добавить дополнительный файл',
+        'add_btn': 'Добавить',
+        'about_subject': 'О предмете',
+        'no_assignments': 'Нет заданий',
+        'tests': 'Тесты',
+        'take_test': 'Пройти тест',
+        'no_tests': 'Нет тестов',
+        'questions': 'вопросов',
+        'test_submitted_success': 'Тест успешно отправлен.',
+        'answers_sidebar': 'Ответы',
+        'finish_test': 'Завершить',
+        'confirm_finish_test': 'Завершить тест?',
+        'confirm_leave_test': 'Покинуть тест? Выбранные ответы будут отменены.',
+        'submit_test': 'Отправить',
+        'teacher_not_assigned': 'Преподаватель не назначен',
+        'select_group': 'Выберите группу',
+        'until_deadline': 'до 23:59',
+        'deadline': 'Срок',
+        'graded': 'Оценено',
+        'not_graded': 'Не оценено',
+        'resubmit_available': 'Можно отправить повторно',
+        'awaiting_grade': 'Ожидает оценки',
+        'not_submitted': 'Не отправлено',
+        'submitted': 'Отправлено',
+        'max_score': 'Максимальный балл',
+        'submitted_count': 'Сдано',
+        'student_answers': 'Ответы студентов',
+        'ungraded': 'не проверено',
+        'assignment_description': 'Описание задания',
+        'related_topics': 'Связанные темы:',
+        'submitted_students': 'Сдавшие студенты',
+        'student': 'Студент',
+        'submitted_at': 'Время сдачи',
+        'feedback': 'Комментарий',
+        'actions': 'Действия',
+        'attempts': 'Попытки',
+        'last': 'Последний',
+        'no_answers': 'Нет ответов',
+        'no_submissions_yet': 'Пока никто не отправил ответ',
+        'unsubmitted_students': 'Не сдавшие студенты',
+        'all_submitted': 'Все студенты сдали',
+        'student_submission': 'Ответ студента',
+        'all_attempts_history': 'История всех попыток',
+        'attempt': 'Попытка',
+        'resubmitted': 'Отправлено повторно',
+        'download': 'Скачать',
+        'file': 'файл',
+        'grading': 'Оценивание',
+        'grade_for_latest': 'Оценить (последняя попытка)',
+        'cancel': 'Отмена',
+        'comment_optional': 'Комментарий (необязательно)',
+        'leave_comment': 'Оставьте комментарий...',
+        'save': 'Сохранить',
+        'edit': 'Изменить',
+        'no_grade_permission': 'У вас нет прав оценивать это задание.',
+        'view': 'Просмотр',
+        'not_graded_yet': 'Еще не оценено',
+        'answers_title': 'Ответы',
+        'received_answers': 'Полученные ответы',
+        'deadline_by': 'Срок: {date}, до 23:59',
+        'overdue': 'Срок истек',
+        'assimilation': 'Усвоение',
+        'across_all_subjects': 'По всем предметам',
+        'collected_points': 'Набранные баллы',
+        'contract_payments': 'Платежи по контракту',
+        'sum_currency': 'сум',
+        'paid_label': 'Оплачено',
+        'remaining_label': 'Осталось',
+        'fully_paid': 'Полностью оплачено',
+        'partially_paid': 'Частично оплачено',
+        'payment_required': 'Требуется оплата',
+        'no_payment_info': 'Нет платежной информации',
+        'accounting_must_add_payment_info': 'Бухгалтерия должна добавить платежную информацию',
+        'contract_amount_total': 'Сумма контракта',
+        'period_range': "Период (с – по)",
+        'remaining_payment': 'Остаток к оплате',
+        'overpayment_payment': 'Переплата',
+        'overpayment_label': 'Переплата',
+        'payment_history': 'История платежей',
+        'contract_by_year_title': "Сумма контракта по учебному году",
+        'current_year_payment_title': "Оплата за текущий учебный год",
+        'payment_amount_col': "Сумма оплаты",
+        'payment_date_col': "Дата оплаты",
+        'custom_contract_badge': "Индивид.",
+        'contract_short': 'Контракт',
+        'updated_at_label': 'Обновлено',
+        'percent_paid_suffix': 'оплачено',
+        'view_all_subjects': 'Просмотр всех предметов',
+        'upcoming_assignments': 'Предстоящие задания',
+        'deadline_until': 'до 23:59',
+        'deadline_label': 'Срок',
+        'time_label': 'Время',
+        'subjects_not_assigned': 'Предметы не назначены',
+        'all_filter': 'Все',
+        'time_left': 'Осталось времени:',
+        'deadline_passed_short': 'Не сдано',
+        'less_than_1_hour_left': 'Меньше 1 часа!',
+        'hours_left_suffix': 'часов осталось',
+        'due_tomorrow': 'Завтра срок',
+        'days_left_suffix': 'дней осталось',
+        'due_today': 'Сегодня срок!',
+        'description_label': 'Описание',
+        'submissions_history': 'История ответов',
+        'grade_for_attempt': 'Оценка за эту попытку:',
+        'teacher_feedback': 'Комментарий преподавателя:',
+        'this_attempt_pending': 'Эта попытка еще не проверена...',
+        'edit_answer': 'Редактировать',
+        'resubmit_answer': 'Отправить ответ повторно',
+        'submit_answer': 'Отправить ответ',
+        'attempts_left': 'Осталось {n} попыток',
+        'file_required': 'Файл обязателен',
+        'overdue_no_resubmit': 'Срок задания истек. Повторная отправка невозможна.',
+        'max_attempts_reached': 'Вы уже отправили 3 раза. Для дополнительной возможности свяжитесь с преподавателем.',
+        'your_answer_optional': 'Ваш ответ (необязательно)',
+        'write_answer': 'Напишите ваш ответ...',
+        'upload_file': 'Загрузить файл',
+        'optional': '(необязательно)',
+        'select_file_or_drop': 'Выберите файл или перетащите сюда',
+        'file_formats_hint': 'PDF, DOC, DOCX, JPG, PNG и др. (макс. 10 МБ)',
+        'uploaded_file': 'Загруженный файл',
+        'edit_answer_modal': 'Редактировать ответ',
+        'your_answer': 'Ваш ответ',
+        'update_file_optional': 'Обновить файл (необязательно)',
+        'resubmit_btn': 'Отправить повторно',
+        'submit_btn': 'Отправить',
+        'file_size_limit': 'Размер файла не должен превышать {max} МБ!',
+        'file_size_label': 'Размер: {size} МБ',
+        'grade_below_threshold_comment': 'При оценке ниже проходного балла ({threshold}) комментарий обязателен!',
+        'answer': 'ответ',
+        'answers': 'ответ',
+        'locked': 'Заблокировано',
+        'watch_previous_videos': 'Сначала полностью просмотрите предыдущие видео',
+        'video_lesson': 'Видеоурок',
+        'topic_files': 'Файлы темы',
+        'topic_file': 'Файл темы',
+        'download_file': 'Скачать файл',
+        'download_file_external': 'Скачать файл (внешний источник)',
+        'lesson_content': 'Содержание урока',
+        'video_locked': 'Видео занятие заблокировано',
+        'video_watch_previous': 'Сначала полностью просмотрите предыдущие видео',
+        'video_completed': 'Видео занятие просмотрено!',
+        'video_completed_desc': 'Вы успешно завершили это видео занятие',
+        'watch_again': 'Смотреть снова',
+        'watch_video_lesson': 'Смотреть видео',
+        'watch_video_and_checks': 'Посмотрите видео и пройдите проверки',
+        'lesson_progress': 'Прогресс урока',
+        'check_label': 'Проверка',
+        'completed_at': 'Завершено',
+        'attention_check_title': 'ВНИМАНИЕ! ПРОВЕРКА!',
+        'video_watching_question': 'Вы смотрите видеоурок?',
+        'video_restart_warning': 'Иначе видео начнётся заново!',
+        'answer_time': 'Время на ответ:',
+        'seconds_unit': 'сек',
+        'yes_watching': 'Да, смотрю',
+        'congratulations': 'Поздравляем! 🎉',
+        'lesson_completed_success': 'Вы успешно завершили урок и прошли все проверки',
+        'attention_check_failed': 'Вы не прошли проверку внимания!',
+        'video_not_supported': 'Ваш браузер не поддерживает видео.',
+        'material_studied': 'Материал изучен',
+        'confirm_delete': 'Вы действительно хотите удалить?',
+        'current_teacher': 'Текущий',
+        'no_lessons_added_yet': 'занятия еще не добавлены',
+        'no_results': 'Результаты не найдены',
+        'searching': 'Поиск...',
+        'create_direction_title': 'Создать направление',
+        'create_direction_page_title': 'Новое направление',
+        'direction_code_max_hint': 'Максимум 15 цифр',
+        'direction_code_placeholder': '60410100',
+        'faculty_suffix': 'факультет',
+        'no_groups': 'Нет групп',
+        'no_directions': 'Нет направлений',
+        'enrollment_year_not_set': 'Год набора не указан',
+        'education_type_not_set': 'Форма обучения не указана',
+        'directions_count_ta': 'направлений',
+        'faculty_no_directions_groups': 'В этом факультете пока нет направлений или групп',
+        'faculty': 'Факультет',
+        'faculties': 'Факультеты',
+        'groups_title': 'Группы',
+        'directions_title': 'Направления',
+        'groups_only_active_hint': 'Только группы с студентами (активные)',
+        'course_label': 'Курс',
+        'semester_label': 'Семестр',
+        'direction_label': 'Направление',
+        'search_label': 'Поиск',
+        'start_creating_group': 'Начните создание новой группы',
+        'group_description_placeholder': 'Краткое описание группы (необязательно)',
+        'direction_name_placeholder': 'Программная инженерия',
+        'create_direction_button': 'Создать направление',
+        'modal_groups_title': 'Группы',
+        'groups_active': 'Группы (активные)',
+        'groups_stats': 'Статистика по группам',
+        'modal_directions_title': 'Направления',
+        'directions_empty_hint': 'Направления с группами отображаются здесь. Измените факультет или поиск.',
+        
+        # ============================================
+        # GROUP STUDENTS PAGE
+        # ============================================
+        'group_students_title': "Студенты группы {group_name}",
+        'group_students_page_title': "Студенты {group_name}",
+        'students_list': "Список студентов",
+        'select_all': "Выбрать все",
+        'selected_count': "Выбрано",
+        'remove_selected_from_group': "Удалить выбранных из группы",
+        'confirm_remove_students': "Вы действительно хотите удалить выбранных студентов из группы?",
+        'no_students_in_group': "В этой группе пока нет студентов",
+        'add_student': "Добавить студента",
+        'add_student_hint': "Вы можете выбрать несколько студентов",
+        'select_students': "Выберите студентов",
+        'add_selected_students': "Добавить выбранных студентов",
+        'no_available_students': "Нет доступных студентов для добавления",
+        'student_unit': "студент",
+        'education_suffix': "обучение",
+        
+        # ============================================
+        # MESSAGES
+        # ============================================
+        'messages': 'Сообщения',
+        'messages_page_subtitle': 'Разговоры и сообщения',
+        'chat_title_with': 'Чат с',
+        'chat_start_conversation': 'Начните разговор!',
+        'message_placeholder': 'Напишите сообщение...',
+        'ai_advisor': 'ИИ-консультант',
+        'new_conversation': 'Новый разговор',
+        'no_messages': 'Нет сообщений',
+        'no_conversations_yet': 'Пока нет разговоров',
+        'new_conversation_modal_title': 'Начать новый разговор',
+        'ai_advisor_modal_subtitle': 'Консультант по дистанционному обучению',
+        'electronic_library': 'Электронная библиотека',
+        'electronic_library_subtitle': 'Университетская электронная библиотека — unilibrary.uz',
+        'electronic_library_lang_hint': 'Для смены языка используйте переключатель языка на странице библиотеки.',
+        'announcements': 'Объявления',
+        'announcements_subtitle': 'Важные сообщения и новости',
+        'delete_all_announcements': 'Удалить все объявления',
+        'new_announcement': 'Новое объявление',
+        'no_announcements': 'Нет объявлений',
+        'confirm_delete_announcement': 'Вы уверены, что хотите удалить это объявление?',
+        'confirm_delete_all_announcements': 'Вы уверены, что хотите удалить все объявления? Это действие нельзя отменить!',
+        'back_to_announcements': 'Вернуться к объявлениям',
+        'create_announcement_title': 'Создать новое объявление',
+        'create_announcement_subtitle': 'Отправить объявление всем пользователям',
+        'title_label': 'Заголовок',
+        'announcement_title_placeholder': 'Введите заголовок объявления',
+        'content_label': 'Текст',
+        'announcement_content_placeholder': 'Введите текст объявления...',
+        'who_should_see': 'Кто должен видеть?',
+        'mark_as_important_announcement': 'Отметить как важное объявление',
+        'publish_announcement': 'Опубликовать',
+        'reklamalar': 'Рекламы',
+        'reklamalar_description': 'Список всплывающих сообщений и реклам',
+        'face_logs_title': 'Hikvision log',
+        'face_logs_description': 'Логи с устройств Hikvision (только суперадмин)',
+        'face_logs_device_employee_id': 'ID сотрудника',
+        'face_logs_device_name': 'Название устройства',
+        'face_logs_fid': 'F.ID',
+        'face_logs_full_name': 'Полное имя',
+        'face_logs_day': 'День',
+        'face_logs_time': 'Время',
+        'face_logs_person': 'Лицо',
+        'face_logs_picture': 'Фото',
+        'face_logs_event_time': 'Время события',
+        'face_logs_event_day': 'День события',
+        'face_logs_device_ip': 'IP устройства',
+        'face_logs_external_ip': 'Внешний IP',
+        'face_logs_created': 'Получено',
+        'face_logs_raw': 'Сырые данные',
+        'face_logs_raw_button': 'Raw',
+        'face_logs_empty': 'Логов не найдено',
+        'face_logs_search_placeholder': 'Поиск по имени или F.ID...',
+        'face_logs_clear_btn': 'Очистить логи',
+        'face_logs_clear_confirm': 'Все логи распознавания лиц будут удалены. Продолжить?',
+        'face_logs_cleared': 'Логи очищены',
+        'face_logs_last_request': 'Последний полученный запрос',
+        'face_logs_diagnostic': 'Диагностика:',
+        'face_logs_no_request_yet': 'Пока запросов не было. Проверьте сервер:',
+        'face_logs_ping_link': 'Ping',
+        'face_logs_check_device': '— если открывается, в настройках устройства в HTTP Notification / Linkage привяжите событие распознавания лица к URL: .../face-api/receive или .../face-api/receive.php',
+        'face_logs_backfill': 'Заполнить ID сотрудников из старых логов',
+        'face_logs_table_created': 'Таблица face_logs создана; обновите страницу.',
+        'face_logs_query_error': 'Ошибка чтения логов (таблица отсутствует?). Ошибка: %s',
+        'staff_attendance_title': 'Посещаемость сотрудников',
+        'staff_attendance_description': 'Ежедневная посещаемость по Hikvision face log',
+        'student_attendance_title': 'Посещаемость студентов',
+        'student_attendance_description': 'Ежедневная посещаемость студентов',
+        'kpi_report_title': 'Отчёт KPI',
+        'kpi_report_description': 'Отчёт KPI сотрудников',
+        'live_monitor_title': 'Live monitor',
+        'live_monitor_description': 'Просмотр посещаемости в реальном времени',
+        'attendance_compute': 'Рассчитать посещаемость',
+        'attendance_computed': 'Посещаемость рассчитана',
+        'staff_name': 'Сотрудник',
+        'student_name': 'Студент',
+        'first_entry': 'Первый вход',
+        'last_exit': 'Последний выход',
+        'late_minutes': 'Опоздание (мин)',
+        'work_duration': 'Рабочее время',
+        'status': 'Статус',
+        'kpi_score': 'KPI',
+        'status_ontime': 'Вовремя',
+        'status_late': 'Опоздание',
+        'status_serious_late': 'Серьёзное опоздание',
+        'status_absent': 'Отсутствует',
+        'status_present': 'Присутствует',
+        'days_count': 'Дни',
+        'total_kpi': 'Всего KPI',
+        'avg_kpi': 'Средний KPI',
+        'student_arrived': 'Студент пришёл',
+        'live_monitor_waiting': 'Ожидание логов от Hikvision...',
+        'live_monitor_connected': 'Подключено. Новые логи отображаются здесь.',
+        'live_monitor_disconnected': 'Соединение разорвано.',
+        'live_monitor_no_socket': 'WebSocket не подключен',
+        'filter': 'Фильтр',
+        'no_data': 'Данные не найдены',
+        'flash_xabar_qoshish': 'Добавить всплывающее сообщение',
+        'flash_xabar_current': 'Текущее сообщение',
+        'flash_xabar_url': 'Ссылка',
+        'flash_xabar_status': 'Статус',
+        'enabled': 'Включено',
+        'disabled': 'Выключено',
+        'flash_xabar_not_set': 'Всплывающее сообщение не настроено.',
+        'flash_xabar_settings': 'Настройки всплывающего сообщения',
+        'flash_xabar_text': 'Текст сообщения',
+        'flash_xabar_text_placeholder': 'Введите текст сообщения...',
+        'flash_xabar_url_label': 'Ссылка (необязательно)',
+        'flash_xabar_date_from': 'С',
+        'flash_xabar_date_to': 'По',
+        'flash_xabar_date_hint': 'Если даты не указаны, сообщение показывается без ограничения по сроку.',
+        'flash_xabar_color': 'Цвет текста',
+        'flash_xabar_color_white': 'Белый',
+        'flash_xabar_color_red': 'Красный',
+        'flash_xabar_enabled': 'Активировать',
+        'flash_xabar_saved': 'Всплывающее сообщение сохранено.',
+        'flash_xabar_deleted': 'Всплывающее сообщение удалено.',
+        'flash_xabar_confirm_delete': 'Удалить всплывающее сообщение?',
+        'flash_xabar_toggle_off': 'Скрыть',
+        'edit_announcement_title': 'Редактировать объявление',
+        'edit_announcement_subtitle': 'Обновите данные объявления',
+        'schedule': 'Расписание',
+        'add_to_schedule': 'Добавить в расписание',
+        'edit_schedule': 'Редактировать расписание',
+        'select_faculty_placeholder': 'Выберите факультет...',
+        'select_course_placeholder': 'Выберите курс...',
+        'select_semester_placeholder': 'Выберите семестр...',
+        'select_direction_placeholder': 'Выберите направление...',
+        'select_subject_placeholder': 'Выберите предмет...',
+        'select_teacher_placeholder': 'Выберите преподавателя...',
+        'schedule_date_label': 'Дата',
+        'start_time_label': 'Время начала',
+        'online_link_label': 'Ссылка на онлайн консультацию',
+        'online_link_placeholder': 'Ссылка Zoom, Teams или другая...',
+        'add_to_schedule_btn': 'Добавить в расписание',
+        'save_changes': 'Сохранить изменения',
+        'all_teachers': 'Все преподаватели',
+        'start_date': 'Дата начала',
+        'end_date': 'Дата окончания',
+        'date_placeholder': 'дд.мм.гггг',
+        'confirm_delete_lesson': 'Вы уверены, что хотите удалить эту тему урока?',
+        'confirm_delete_assignment': 'Вы уверены, что хотите удалить это задание?',
+        'unknown': 'Неизвестно',
+        'group_label': 'Группа',
+        'type_label': 'Тип',
+        'join_lesson': 'Войти на урок',
+        'month_1': 'Январь',
+        'month_2': 'Февраль',
+        'month_3': 'Март',
+        'month_4': 'Апрель',
+        'month_5': 'Май',
+        'month_6': 'Июнь',
+        'month_7': 'Июль',
+        'month_8': 'Август',
+        'month_9': 'Сентябрь',
+        'month_10': 'Октябрь',
+        'month_11': 'Ноябрь',
+        'month_12': 'Декабрь',
+        'day_monday': 'Понедельник',
+        'day_tuesday': 'Вторник',
+        'day_wednesday': 'Среда',
+        'day_thursday': 'Четверг',
+        'day_friday': 'Пятница',
+        'day_saturday': 'Суббота',
+        'day_sunday': 'Воскресенье',
+        'edit_faculty_title': 'Редактировать факультет',
+        'create_faculty_page_title': 'Создание факультета',
+        'faculty_name_label': 'Название факультета *',
+        'faculty_name_placeholder': 'Факультет информационных технологий',
+        'faculty_name_uz': 'Название факультета (узб.)',
+        'faculty_name_ru': 'Название факультета (рус.)',
+        'faculty_name_en': 'Название факультета (англ.)',
+        'faculty_name_example_uz': "Masalan: Axborot texnologiyalari fakulteti",
+        'faculty_name_example_ru': 'Например: Факультет информационных технологий',
+        'faculty_name_example_en': 'e.g. Faculty of Information Technology',
+        'faculty_description_placeholder_uz': "Fakultet haqida qisqacha ma'lumot...",
+        'faculty_description_placeholder_ru': "Краткое описание факультета...",
+        'faculty_description_placeholder_en': "Brief description of the faculty...",
+        'faculty_sync_translate': 'Перевести на другие языки',
+        'faculty_sync_empty': 'Сначала введите текст в это поле',
+        'faculty_name_required': 'Введите название факультета хотя бы на одном языке',
+        'faculty_name_all_languages_required': 'Введите название факультета на всех языках (узб., рус., англ.)',
+        'code_label': 'Код *',
+        'code_placeholder': 'ИТ',
+        'code_short_hint': 'Краткий код (автоматически в верхнем регистре)',
+        'faculty_description_placeholder': 'Краткое описание факультета...',
+        'faculty_description_uz': 'Описание (узб.)',
+        'faculty_description_ru': 'Описание (рус.)',
+        'faculty_description_en': 'Описание (англ.)',
+        'faculty_dean_select_placeholder': 'Выберите декана...',
+        'faculty_dean_add_btn': 'Добавить декана',
+        'responsible_deans_select_hint': 'Можно выбрать несколько деканов.',
+        'responsible_deans_multiple_hint': 'Можно выбрать несколько деканов. Неназначенные деканы будут откреплены от факультета.',
+        'no_deans': 'Нет деканов',
+        'edit_direction_title': 'Редактировать направление',
+        'faculty_label': 'Факультет *',
+        'direction_code_label': 'Шифр (код) *',
+        'direction_name_label': 'Название *',
+        'direction_name_uz': 'Название направления (узб.)',
+        'direction_name_ru': 'Название направления (рус.)',
+        'direction_name_en': 'Название направления (англ.)',
+        'direction_description_uz': 'Описание (узб.)',
+        'direction_description_ru': 'Описание (рус.)',
+        'direction_description_en': 'Описание (англ.)',
+        'direction_sync_translate': 'Перевести на другие языки',
+        'direction_sync_empty': 'Сначала введите текст в это поле',
+        'direction_name_all_languages_required': 'Введите название направления на всех языках (узб., рус., англ.)',
+        'edit_subject_title': 'Редактировать предмет',
+        'subject_name_label': 'Название предмета *',
+        'subject_description_placeholder': 'Краткое описание предмета...',
+        'edit_user_title': 'Редактировать пользователя',
+        'full_name_label': 'Полное имя *',
+        'optional_short': 'Необязательно',
+        'roles_label': 'Роли *',
+        'multiple_roles_hint': 'Можно выбрать несколько ролей',
+        'active_status': 'Активный статус',
+        'student_info_section': 'Данные студента',
+        'teacher_info_section': 'Данные преподавателя',
+        'dean_info_section': 'Данные декана',
+        'change_password_section': 'Изменить пароль',
+        'password_leave_blank_placeholder': 'Оставьте пустым, если не хотите менять',
+        'select_group_placeholder': 'Выберите группу...',
+        'enrollment_year_label': 'Год поступления',
+        'enrollment_year_placeholder': 'Например: 2025',
+        'department_label': 'Кафедра',
+        'departments': 'Кафедры',
+        'department': 'Кафедра',
+        'select_department': 'Выберите кафедру',
+        'select_departments': 'Выберите кафедры',
+        'select_multiple_departments_hint': 'Можно выбрать несколько кафедр',
+        'add_department': 'Добавить кафедру',
+        'add_department': 'Добавить кафедру',
+        'my_departments': 'Мои кафедры',
+        'my_department': 'Моя кафедра',
+        'no_subjects_found': 'Предметы не найдены',
+        'department_subjects_teachers': 'Дисциплины и преподаватели кафедры',
+        'all_departments': 'Все кафедры',
+        'search_subject': 'Поиск предмета',
+        'search_teacher': 'Поиск преподавателя',
+        'no_teachers_found': 'Преподаватели не найдены',
+        'in_department': 'На кафедре',
+        'active_groups': 'Активные группы',
+        'teachers_count': 'Количество преподавателей',
+        'subjects_count': 'Количество предметов',
+        'all_departments_list': 'Список всех кафедр',
+        'new_department': 'Новая кафедра',
+        'create_department_page_title': 'Создать кафедру',
+        'edit_department_page_title': 'Редактировать кафедру',
+        'department_name_label': 'Название кафедры',
+        'department_name_placeholder': 'Например: Программная инженерия',
+        'department_name_example_uz': "Masalan: Dasturiy injiniring",
+        'department_name_example_ru': "Например: Программная инженерия",
+        'department_name_example_en': "e.g. Software Engineering",
+        'department_name_uz': 'Название кафедры (узб.)',
+        'department_name_ru': 'Название кафедры (рус.)',
+        'department_name_en': 'Название кафедры (англ.)',
+        'department_name_all_languages_required': 'Введите название кафедры на всех языках',
+        'department_sync_translate': 'Перевести на другие языки',
+        'department_sync_empty': 'Сначала введите текст в это поле',
+        'department_migration_required': 'Требуется обновление таблицы кафедр. Выполните в корне проекта: flask db upgrade',
+        'department_description_placeholder': 'Кратко о кафедре...',
+        'no_departments': 'Нет кафедр',
+        'start_creating_department': 'Создайте первую кафедру',
+        'items': 'шт.',
+        'add_teacher': 'Добавить преподавателя',
+        'please_select_subject': 'Выберите предмет',
+        'please_select_teacher': 'Выберите преподавателя',
+        'subject_added_to_department': '«{name}» добавлен на кафедру',
+        'subject_removed_from_department': '«{name}» удалён с кафедры',
+        'teacher_added_to_department': '«{name}» добавлен на кафедру',
+        'teacher_removed_from_department': 'Преподаватель удалён с кафедры',
+        'teacher_not_found': 'Преподаватель не найден',
+        'teacher_already_in_department': 'Преподаватель уже на кафедре',
+        'confirm_remove_subject_from_department': 'Удалить этот предмет с кафедры?',
+        'confirm_remove_teacher_from_department': 'Удалить преподавателя с кафедры?',
+        'no_subjects_in_department': 'На кафедре нет предметов',
+        'no_teachers_in_department': 'На кафедре нет преподавателей',
+        'department_created': 'Кафедра «{name}» создана',
+        'department_updated': 'Кафедра обновлена',
+        'department_deleted': 'Кафедра «{name}» удалена',
+        'confirm_delete_department': 'Удалить кафедру?',
+        'add_subjects_teachers': 'Добавить предмет / преподавателя',
+        'assignments_saved': 'Назначения сохранены',
+        'select_department_placeholder': 'Выберите кафедру...',
+        'department_heads_label': 'Заведующие кафедрой',
+        'department_heads_placeholder': 'Выберите сотрудников (можно несколько)',
+        'department_head_add_btn': 'Добавить заведующего',
+        'staff_add_department_btn': 'Добавить кафедру',
+        'staff_add_faculty_btn': 'Добавить факультет',
+        'department_head_select_placeholder': 'Выберите сотрудника...',
+        'department_head_must_select_department': 'Зав. кафедрой должен выбрать кафедру',
+        'department_required_for_department_head': 'Для зав. кафедрой выбор кафедры обязателен',
+        'department_not_found': 'Выбранная кафедра не найдена',
+        'position_label': 'Должность',
+        'select_faculty_placeholder': 'Выберите факультет...',
+        'edit_schedule_title': 'Редактировать занятие',
+        'edit_payment_title': 'Редактировать платёж',
+        'back_to_payments': 'Вернуться к платежам',
+        'contract_amount_label': 'Сумма контракта (сум) *',
+        'paid_amount_label': 'Оплаченная сумма (сум) *',
+        'academic_year_label': 'Учебный год',
+        'semester_1_2': '1-й семестр',
+        'semester_2_2': '2-й семестр',
+        'notes_label': 'Дополнительные заметки',
+        'notes_placeholder': 'Дополнительная информация...',
+        'schedule_date_label': 'Дата *',
+        'start_time_label': 'Время начала *',
+        'online_consultation_link_placeholder': 'Ссылка Zoom, Teams или другая...',
+        'online_consultation_link_label': 'Ссылка для онлайн-консультации',
+        
+        # ============================================
+        # AUTH PAGES (LOGIN, REGISTER, FORGOT, RESET)
+        # ============================================
+        'sign_in_to_account': 'Войдите в свой аккаунт',
+        'login_talaba_email_label': 'Логин / ID студента / Email',
+        'login_placeholder': 'Логин, ID студента или Email',
+        'remember_me': 'Запомнить',
+        'forgot_password_link': 'Забыли пароль?',
+        'register_title': 'Регистрация',
+        'register_subtitle': 'Создайте новый аккаунт',
+        'create_account_button': 'Зарегистрироваться',
+        'have_account': 'Уже есть аккаунт?',
+        'sign_in_link': 'Вход',
+        'forgot_password_title': 'Забыли пароль?',
+        'forgot_password_subtitle': 'Введите логин, ID студента или email',
+        'only_teachers_students': 'Только для преподавателей и студентов',
+        'check_button': 'Проверить',
+        'passport_series_label': 'Серия и номер паспорта',
+        'passport_placeholder': 'AB1234567',
+        'enter_passport_series': 'Введите серию и номер паспорта',
+        'reset_to_initial_button': 'Сбросить пароль на начальный',
+        'back_to_login': '← Вернуться на страницу входа',
+        'set_new_password_title': 'Установите новый пароль',
+        'set_new_password_for': 'Введите новый пароль для {full_name}',
+        'new_password_label': 'Новый пароль',
+        'min_6_chars': 'Минимум 6 символов',
+        'change_password_button': 'Изменить пароль',
+        
+        # ============================================
+        # GRADE SCALE
+        # ============================================
+        'grade_scale': 'Система оценивания',
+        'excellent': 'Отлично',
+        'good': 'Хорошо',
+        'satisfactory': 'Удовлетворительно',
+        'poor': 'Плохо',
+        'failed': 'Неудовлетворительно',
+        
+        # ============================================
+        # FLASH MESSAGES - AUTH
+        # ============================================
+        'no_access_permission': "У вас нет прав доступа к этой странице",
+        'account_blocked': 'Ваш аккаунт заблокирован',
+        'invalid_login_credentials': "Неверный логин, email, ID студента или пароль",
+        'logout_success': "Вы успешно вышли из системы",
+        'registration_closed': "Регистрация закрыта. Пожалуйста, свяжитесь с администратором.",
+        'login_required_input': "Пожалуйста, введите логин, ID студента или email",
+        'user_not_found_by_credentials': "Пользователь с таким логином, ID студента или email не найден",
+        'function_only_for_teachers_students': "Эта функция доступна только для преподавателей и студентов",
+        'passport_number_required_input': "Пожалуйста, введите серию и номер паспорта",
+        'user_not_found': "Пользователь не найден",
+        'incorrect_passport_number': "Неверная серия и номер паспорта",
+        'passport_not_available': "У пользователя нет серии и номера паспорта",
+        'token_not_found_or_used': "Токен не найден или уже использован",
+        'token_expired': "Срок действия токена истек. Пожалуйста, отправьте новый запрос",
+        'passwords_do_not_match': "Пароли не совпадают",
+        'password_min_length': "Пароль должен содержать минимум 6 символов",
+        'password_min_length_8': "Пароль должен содержать минимум 8 символов",
+        'password_changed_success': "Пароль успешно изменен! Теперь войдите в систему",
+        'password_changed_success_short': "Пароль успешно изменен",
+        'password_reset_success': "Пароль успешно сброшен! Пароль: {new_password}",
+        'user_password_reset': "Пароль {user.full_name} сброшен. Новый пароль: {new_password}",
+        'student_password_reset': "Пароль {student.full_name} сброшен. Новый пароль: {new_password}",
+        'no_permission_for_role': "У вас нет доступа к этой роли",
+        
+        # ============================================
+        # FLASH MESSAGES - VALIDATION ERRORS
+        # ============================================
+        'login_required_field': "Логин обязательное поле",
+        'login_required_for_staff': "Логин обязательное поле (для сотрудников)",
+        'login_already_exists': "Этот логин уже существует",
+        'login_already_exists_other_user': "Этот логин уже существует у другого пользователя",
+        'student_id_required': "ID студента обязательное поле",
+        'student_id_required_for_students': "ID студента обязательное поле (для студентов)",
+        'student_id_already_exists': "Этот ID студента уже существует",
+        'student_id_already_exists_other_student': "Этот ID студента уже существует у другого студента",
+        'email_already_exists': "Этот email уже существует",
+        'email_already_exists_other_user': "Этот email уже существует у другого пользователя",
+        'email_already_exists_other_student': "Этот email уже существует у другого студента",
+        'email_used_by_another_user': "Этот email уже используется другим пользователем",
+        'login_used_by_another_user': "Этот логин уже используется другим пользователем",
+        'passport_required': "Серия и номер паспорта обязательны",
+        'initial_password_passport': "Начальный пароль: серия и номер паспорта",
+        'passport_not_available_for_user': "У этого пользователя нет серии и номера паспорта",
+        'passport_not_available_for_student': "У этого студента нет серии и номера паспорта",
+        'birthdate_invalid_format': "Неверный формат даты рождения (yyyy-mm-dd)",
+        'date_invalid_format': "Неверный формат даты",
+        'date_invalid_format_use_calendar': "Неверный формат даты. Пожалуйста, выберите из календаря.",
+        'date_required': "Дата обязательна для выбора",
+        'date_required_select': "Дата обязательна для выбора.",
+        'all_required_fields': "Все обязательные поля должны быть заполнены",
+        'all_fields_required': "Все поля должны быть заполнены",
+        'at_least_one_role_required': "Необходимо выбрать хотя бы одну роль",
+        'code_already_exists': "Этот код уже существует",
+        'invalid_request': "Неверный запрос",
+        'title_and_text_required': "Заголовок и текст обязательны",
+        'message_cannot_be_empty': "Сообщение не может быть пустым",
+        'new_passwords_do_not_match': "Новые пароли не совпадают",
+        
+        # ============================================
+        # FLASH MESSAGES - PERMISSION ERRORS
+        # ============================================
+        'no_permission_for_operation': "У вас нет разрешения на эту операцию",
+        'no_permission_for_action': "У вас нет прав на это действие",
+        'no_permission_to_edit_group': "У вас нет прав на редактирование этой группы",
+        'no_permission_to_delete_group': "У вас нет прав на удаление этой группы",
+        'no_permission_to_view_group': "У вас нет прав на просмотр этой группы",
+        'no_permission_to_add_students_to_group': "У вас нет прав на добавление студентов в эту группу",
+        'no_permission_to_edit_student': "У вас нет прав на редактирование этого студента",
+        'no_permission_to_create_announcement': "У вас нет прав на создание объявления",
+        'no_permission_to_edit_announcement': "У вас нет прав на редактирование этого объявления",
+        'no_permission_to_delete_announcement': "У вас нет прав на удаление этого объявления",
+        'no_permission_to_delete_all_announcements': "У вас нет прав на удаление всех объявлений",
+        'no_permission_to_chat': "У вас нет разрешения на чат с этим пользователем",
+        'no_permission_to_view_course': "У вас нет прав на просмотр этого курса",
+        'no_permission_to_edit_course': "У вас нет прав на редактирование этого курса",
+        'no_permission_to_delete_course': "У вас нет прав на удаление этого курса",
+        'no_permission_to_view_lesson': "У вас нет прав на просмотр этого урока",
+        'no_permission_to_edit_lesson': "У вас нет прав на редактирование этого урока",
+        'no_permission_to_delete_lesson': "У вас нет прав на удаление этого урока",
+        'no_permission_to_view_assignment': "У вас нет прав на просмотр этого задания",
+        'no_permission_to_edit_assignment': "У вас нет прав на редактирование этого задания",
+        'no_permission_to_delete_assignment': "У вас нет прав на удаление этого задания",
+        'no_permission_to_view_submission': "У вас нет прав на просмотр этого ответа",
+        'no_permission_to_edit_submission': "У вас нет прав на редактирование этого ответа",
+        'no_permission_to_delete_submission': "У вас нет прав на удаление этого ответа",
+        'no_permission_to_view_grade': "У вас нет прав на просмотр этой оценки",
+        'no_permission_to_edit_grade': "У вас нет прав на редактирование этой оценки",
+        'no_permission_to_delete_grade': "У вас нет прав на удаление этой оценки",
+        
+        # ============================================
+        # FLASH MESSAGES - USER OPERATIONS
+        # ============================================
+        'user_created_with_role': "{role} успешно создан",
+        'user_status_changed': "Пользователь {status}",
+        'user_updated': "Пользователь успешно обновлен",
+        'user_deleted': "Пользователь удален",
+        'clear_staff': "Очистить сотрудников",
+        'confirm_clear_staff': "Удалить всех сотрудников? Это действие нельзя отменить!",
+        'staff_cleared': "Удалено сотрудников: {count}",
+        'clear_students': "Очистить студентов",
+        'confirm_clear_students': "Удалить всех студентов? Это действие нельзя отменить!",
+        'students_cleared': "Удалено студентов: {count}",
+        'clear_departments': "Очистить кафедры",
+        'confirm_clear_departments': "Удалить все кафедры? Это действие нельзя отменить!",
+        'departments_cleared': "Удалено кафедр: {count}",
+        'clear_subjects': "Очистить предметы",
+        'confirm_clear_subjects': "Удалить все предметы? Это действие нельзя отменить!",
+        'subjects_cleared': "Удалено предметов: {count}",
+        'staff_deleted': "{staff_name} удален",
+        'staff_created': "Сотрудник {full_name} успешно создан",
+        'staff_create_error': "Ошибка при сохранении сотрудника. Проверьте данные.",
+        'staff_updated': "Данные сотрудника {full_name} обновлены",
+        'profile_updated': "Данные успешно обновлены",
+        'profile_role_changed': "Профиль изменен на роль {role_name}. Теперь вы работаете как {role_name}.",
+        'cannot_block_yourself': "Вы не можете заблокировать себя",
+        'cannot_delete_yourself': "Вы не можете удалить себя",
+        'cannot_delete_superadmin': "Учетную запись суперадмина удалить нельзя.",
+        'only_superadmin_can_modify': "Учетную запись суперадмина может изменять, блокировать или сбрасывать пароль только суперадмин.",
+        'user_not_staff': "Это студент, а не сотрудник",
+        'user_not_student': "Этот пользователь не студент",
+        'user_not_superadmin': "Этот пользователь не суперадмин",
+        'full_name_required': "Полное имя обязательно",
+        'password_required': "Пароль обязателен",
+        'email_already_used': "Этот email уже используется",
+        'superadmins_section': "Суперадмины",
+        'superadmins_database': "База суперадминов",
+        'all_superadmins_list': "Список всех суперадминов",
+        'new_superadmin': "Новый суперадмин",
+        'create_superadmin_title': "Добавить суперадмина",
+        'edit_superadmin_title': "Редактировать суперадмина",
+        'superadmin_created': "Суперадмин {full_name} успешно добавлен",
+        'superadmin_updated': "Данные суперадмина {full_name} обновлены",
+        'superadmin_deleted': "Суперадмин удален",
+        'config_superadmin_cannot_delete': "Основную учетную запись суперадмина из конфига удалить нельзя",
+        'cannot_delete_last_superadmin': "Нельзя удалить последнего суперадмина (должен остаться хотя бы один)",
+        
+        # ============================================
+        # FLASH MESSAGES - FACULTY OPERATIONS
+        # ============================================
+        'faculty_created': "Факультет успешно создан",
+        'faculty_updated': "Факультет успешно обновлен",
+        'faculty_deleted': "Факультет «{faculty_name}» и все его направления, группы удалены",
+        'faculty_not_found': "Факультет не найден",
+        'faculty_required': "Выбор факультета обязателен",
+        'faculty_selected_not_found': "Выбранный факультет не найден",
+        'faculty_incorrect_selection': "Факультет выбран неверно",
+        'faculty_not_assigned': "Вам не назначен факультет",
+        'faculty_required_for_dean': "Если выбрана роль декана, выбор факультета обязателен",
+        'faculty_has_students': "На факультете {students_count} студентов. Для удаления факультета сначала переведите или удалите студентов",
+        'responsible_deans_changed': "Ответственные деканы успешно изменены",
+        
+        # ============================================
+        # FLASH MESSAGES - DIRECTION OPERATIONS
+        # ============================================
+        'direction_created': "Направление успешно создано",
+        'direction_updated': "Направление обновлено",
+        'direction_deleted': "Направление удалено",
+        'direction_required': "Выбор направления обязателен",
+        'direction_incorrect_selection': "Выбрано неверное направление",
+        'direction_name_and_code_required': "Название и код направления обязательны",
+        'direction_name_and_code_required_fill': "Название и код направления должны быть заполнены",
+        'direction_already_exists': "Направление с этим кодом, курсом, семестром и формой обучения уже существует",
+        'direction_code_already_exists': "Направление с этим кодом уже существует",
+        'direction_has_groups_and_students': "В направлении {groups_count} групп и {total_students} студентов. Удаление невозможно",
+        'direction_has_groups': "В направлении {groups_count} групп. Сначала удалите или переведите группы в другое направление",
+        'direction_no_groups': "В направлении нет групп",
+        'groups_assigned_to_direction': "Группы назначены направлению",
+        'directions_and_groups_imported': "{d_count} направлений и {g_count} групп импортировано",
+        
+        # ============================================
+        # FLASH MESSAGES - GROUP OPERATIONS
+        # ============================================
+        'group_created': "Группа успешно создана",
+        'group_updated': "Группа обновлена",
+        'group_deleted': "Группа удалена",
+        'group_name_required': "Название группы обязательно",
+        'group_already_exists': "Группа с таким названием уже существует в этом направлении, курсе и семестре",
+        'group_course_and_semester_required': "Курс и семестр обязательны",
+        'group_all_fields_required': "Курс, семестр и форма обучения обязательны",
+        'group_has_students': "В группе есть студенты. Удаление невозможно",
+        'group_has_students_transfer_first': "В группе есть студенты. Сначала переведите студентов в другую группу",
+        'no_groups_for_year_education_type': "Нет групп для {year} года по форме обучения {education_type}",
+        'no_active_groups_for_semester': "Не найдено активных групп для семестра {semester}",
+        
+        # ============================================
+        # FLASH MESSAGES - STUDENT OPERATIONS
+        # ============================================
+        'student_created': "{full_name} успешно создан",
+        'student_updated': "Данные {full_name} обновлены",
+        'student_deleted': "{student_name} удален",
+        'student_status_changed': "Студент {full_name} {status}",
+        'students_added_to_group': "{added_count} студентов добавлено в группу",
+        'student_removed_from_group': "{full_name} удален из группы",
+        'students_removed_from_group': "{count} студентов удалено из группы",
+        'no_students_selected': "Не выбрано ни одного студента",
+        'no_students_added': "Не добавлено ни одного студента. Выбранные студенты могут быть уже прикреплены к другой группе",
+        'no_students_removed': "Не удален ни один студент из группы",
+        
+        # ============================================
+        # FLASH MESSAGES - SUBJECT OPERATIONS
+        # ============================================
+        'subject_name_uz': 'Название предмета (узб.)',
+        'subject_name_ru': 'Название предмета (рус.)',
+        'subject_name_en': 'Название предмета (англ.)',
+        'subject_description_uz': 'Описание (узб.)',
+        'subject_description_ru': 'Описание (рус.)',
+        'subject_description_en': 'Описание (англ.)',
+        'subject_sync_translate': 'Перевести на другие языки',
+        'subject_sync_empty': 'Сначала введите текст в это поле',
+        'subject_name_required': "Название предмета обязательное поле",
+        'subject_name_all_languages_required': "Введите название предмета на всех языках (узб., рус., англ.)",
+        'subject_created': "Предмет успешно создан",
+        'subject_updated': "Предмет обновлен",
+        'subject_deleted': "Предмет удален",
+        'subject_not_in_curriculum': "Предмет больше не используется ни в одном учебном плане. Вы можете удалить его.",
+        'subject_removed_from_all_curriculums': "«{subject_name}» удален из всех учебных планов ({deleted} записей). Теперь вы можете удалить предмет.",
+        'subject_not_found': "Выбранный предмет не найден",
+        
+        # ============================================
+        # FLASH MESSAGES - CURRICULUM OPERATIONS
+        # ============================================
+        'subjects_added_to_curriculum': "{added} предметов добавлено в учебный план",
+        'curriculum_updated': "Учебный план {semester} семестра обновлен",
+        'subject_removed_from_curriculum': "Предмет удален из учебного плана",
+        'curriculum_import_success': "Успешно! {imported} новых добавлено, {updated} обновлено.",
+        'curriculum_import_subjects_created': "{subjects_created} новых предметов создано.",
+        'curriculum_import_errors': "{errors_count} ошибок произошло.",
+        'subject_already_in_semester': "Предмет {subject_name} уже существует в этом семестре",
+        'subject_replaced': "Предмет заменен на {new_subject_name}",
+        'subject_and_semester_required': "Выбор предмета и семестра обязателен",
+        'new_subject_not_selected': "Новый предмет не выбран",
+        'semester_not_selected': "Семестр не выбран",
+        'semester_teachers_saved': "Преподаватели семестра {semester} успешно сохранены",
+        
+        # ============================================
+        # FLASH MESSAGES - SCHEDULE OPERATIONS
+        # ============================================
+        'schedule_added': "Добавлено в расписание занятий",
+        'schedule_updated': "Расписание занятий обновлено",
+        'schedule_deleted': "Расписание удалено",
+        'schedules_imported': "{count} расписаний успешно импортировано",
+        'zoom_links_queued': "Ссылки Zoom для {count} занятий создаются в фоне",
+        'teacher_not_assigned_to_lesson_type': "Этому преподавателю не назначен тип занятия для этой группы и предмета",
+        'lesson_already_exists_at_time': "В это время ({start_time}) у группы уже есть занятие: {existing_subject}",
+        
+        # ============================================
+        # FLASH MESSAGES - GRADING SYSTEM
+        # ============================================
+        'grade_letter_already_exists': "Эта буква оценки уже существует",
+        'min_score_greater_than_max': "Минимальный балл не может быть больше максимального",
+        'grade_added': "Оценка успешно добавлена",
+        'grade_updated': "Оценка обновлена",
+        'grade_deleted': "Оценка удалена",
+        'grade_required': "Оценка обязательна",
+        'grade_assigned': "Оценка успешно выставлена",
+        'grading_system_reset': "Система оценивания возвращена к стандартному состоянию",
+        
+        # ============================================
+        # FLASH MESSAGES - COURSE/LESSON/ASSIGNMENT
+        # ============================================
+        'course_name_required': "Название курса обязательно",
+        'course_created': "Курс успешно создан",
+        'course_updated': "Курс обновлен",
+        'course_deleted': "Курс удален",
+        'lesson_name_required': "Название урока обязательно",
+        'lesson_created': "Урок успешно создан",
+        'lesson_created_for_groups': "Урок успешно добавлен для {created_count} групп",
+        'lesson_updated': "Урок обновлен",
+        'lesson_deleted': "Урок удален",
+        'lesson_cannot_delete_has_assignments': "Эту тему нельзя удалить! Следующие задания связаны с этой темой: {assignments_list}",
+        'assignment_name_required': "Название задания обязательно",
+        'assignment_created': "Задание успешно создано",
+        'assignment_created_for_groups': "Задание успешно создано для {created_count} групп",
+        'assignment_updated': "Задание обновлено",
+        'assignment_deleted': "Задание удалено",
+        'submission_text_required': "Текст ответа обязателен",
+        'submission_submitted': "Ответ успешно отправлен",
+        'submission_resubmitted': "Ваш ответ переотправлен ({resubmission_count}/3)",
+        'submission_updated': "Ответ обновлен",
+        'submission_deleted': "Ответ удален",
+        'submission_wait_for_grade': "Вы не можете отправить новый ответ, пока преподаватель не оценит предыдущий.",
+        'teacher_not_assigned_to_lesson_type_direction': "Вы не назначены на выбранный тип занятия в этом направлении. Вы можете создавать уроки только для назначенных вам типов занятий.",
+        'teacher_not_assigned_to_new_lesson_type': "Вы не назначены на тип занятия '{lesson_type}' в этом направлении. Вы можете изменять только назначенные вам типы занятий.",
+        'teacher_not_assigned_to_assignment_lesson_type': "Вы не назначены на выбранный тип занятия в этом направлении.",
+        'teacher_not_assigned_for_grading': "Вы не назначены на тип занятия '{lesson_type}' в этом направлении. Вы можете выставлять оценки только для назначенных вам типов занятий.",
+        
+        # ============================================
+        # FLASH MESSAGES - ANNOUNCEMENTS
+        # ============================================
+        'announcement_created': "Объявление успешно создано",
+        'announcement_updated': "Объявление успешно обновлено",
+        'announcement_deleted': "Объявление удалено",
+        'all_announcements_deleted': "Все {count} объявлений удалены",
+        
+        # ============================================
+        # FLASH MESSAGES - MESSAGING
+        # ============================================
+        'message_sent': "Сообщение отправлено",
+        
+        # ============================================
+        # FLASH MESSAGES - ACCOUNTING
+        # ============================================
+        'contract_not_found': "Данные контракта не найдены",
+        'payment_info_updated': "Платежная информация обновлена",
+        'payment_created_success': "Платежная информация успешно добавлена",
+        'payment_deleted': "Запись о платеже удалена",
+        'confirm_delete_payment': "Удалить эту запись о платеже?",
+        'contract_amount_required': "Сумма контракта обязательна",
+        'paid_amount_required': "Сумма оплаты обязательна",
+        'create_payment_title': "Добавить платеж",
+        'add_payment': "Добавить платеж",
+        'custom_contract_label': "Сумма контракта только для этого студента на указанный учебный год (необязательно)",
+        'custom_contract_hint': "Оставьте пустым — используется сумма по направлению. При указании учебный год обязателен.",
+        'academic_year_required_with_contract': "При указании суммы контракта учебный год обязателен",
+        'contract_amounts_title': "Сумма оплаты",
+        'contract_amounts_subtitle': "Суммы контрактов по направлению и году набора",
+        'contract_amounts_import_title': "Импорт сумм оплаты",
+        'contract_amounts_import_subtitle': "Импорт сумм контрактов по направлениям из Excel",
+        'add_contract_amount_btn': "Новый контракт",
+        'add_custom_contract_btn': "Добавить специальный контракт",
+        'edit_custom_contract_btn': "Редактировать специальный контракт",
+        'col_faculty_desc': "Название факультета",
+        'col_direction_code_desc': "Код направления",
+        'col_direction_code_digits': "Только цифры (например: 5230100)",
+        'education_type_values': "Дневная, заочная, вечерняя, дистанционная",
+        'col_header_faculty': "Факультет",
+        'col_header_direction_code': "Код направления",
+        'col_header_direction_name': "Название направления",
+        'col_header_education_type': "Форма обучения",
+        'col_header_academic_year': "Учебный год",
+        'col_header_contract_amount': "Сумма контракта",
+        'col_year_example': "2025-2026",
+        'col_header_period_start': "Начало",
+        'col_desc_period_start': "Дата начала учебного года (ДД.ММ.ГГГГ, напр. 02.09.2025)",
+        'col_header_period_end': "Конец",
+        'col_desc_period_end': "Дата окончания учебного года (ДД.ММ.ГГГГ, напр. 06.06.2026)",
+        'import_note_period_dates': "Укажите даты начала и окончания (02.09.2025 – 06.06.2026)",
+        'import_note_faculty_direction': "Факультет и направление должны существовать в системе",
+        'import_note_year_format': "Учебный год: 2025-2026 (все поля обязательны)",
+        'import_note_existing_updated': "Существующая запись будет обновлена",
+        'import_note_each_row_new_payment': "Каждая строка добавляет новую запись об оплате.",
+        'import_note_student_lookup': "Студент ищется по ID студента или имени",
+        'import_note_contract_optional': "Сумма контракта необязательна. Пусто — берётся сумма по направлению.",
+        'import_note_contract_year_required': "При указании суммы контракта учебный год обязателен — сумма вводится за этот год, последующие берутся по направлению.",
+        'import_note_contract_from_direction': "Контракт берётся по сумме, указанной для направления.",
+        'col_direction_name_desc': "Название направления",
+        'col_contract_amount_desc': "Сумма контракта (число)",
+        'sample_file': "Образец Excel файла",
+        'sample_file_desc': "Скачайте образец для правильного формата.",
+        'enrollment_year_label': "Год набора",
+        'enrollment_year_placeholder': 'Например: 2025',
+        'select_academic_year': "Выберите учебный год",
+        'period_start_label': "Дата начала",
+        'period_end_label': "Дата окончания",
+        'period_start_hint': "Например: 02.09.2025",
+        'period_end_hint': "Например: 06.06.2026",
+        'period_dates_required': "Укажите даты начала и окончания",
+        'period_end_must_be_after_start': "Дата окончания должна быть после даты начала",
+        'contract_amount_created': "Сумма контракта добавлена",
+        'contract_amount_updated': "Сумма контракта обновлена",
+        'contract_amount_deleted': "Сумма контракта удалена",
+        'clear_contract_amounts': "Очистить суммы оплаты",
+        'confirm_clear_contract_amounts': "Удалить все суммы оплаты (контрактов)? Это действие нельзя отменить!",
+        'contract_amounts_cleared': "Удалено сумм оплаты: {count}",
+        'contract_amount_exists_for_direction_year': "Сумма контракта для этого направления и года уже существует",
+        'fill_required_fields': "Заполните обязательные поля",
+        'search_direction_placeholder': "Год набора, код, название, форма обучения...",
+        
+        # ============================================
+        # ACCOUNTING PAGE
+        # ============================================
+        'accounting_page_title': "Данные об оплате 💳",
+        'accounting_dean_title': "Финансовый контроль факультета 💰",
+        'accounting_page_subtitle': "Анализ платежей по системе",
+        'accounting_dean_subtitle': "Мониторинг контрактов",
+        'excel_import': 'Импорт Excel',
+        'export_excel': 'Экспорт Excel',
+        'contract_badge': 'Контракт',
+        'total_contract_sum': "Общая сумма контракта (сум)",
+        'paid_badge': 'Оплачено',
+        'debt_badge': 'Долг',
+        'remaining_total_sum': "Оставшаяся общая сумма (сум)",
+        'analysis_by_courses': "Анализ по курсам",
+        'analysis_by_faculties': "Анализ по факультетам",
+        'payment_status': "Статус оплаты",
+        'course_students': "Студенты {course_year} курса",
+        'total_count': "Всего: {count}",
+        'paid_well': "Хорошо оплатившие",
+        'medium_paid': "Средне",
+        'debts': "Долги",
+        'search_student_id_name': "Поиск по ID студента или имени...",
+        'filter_button': 'Фильтр',
+        'clear_filters': 'Очистить',
+        'student_and_group': 'Студент и группа',
+        'contract_col': 'Контракт',
+        'paid_col': 'Оплачено',
+        'balance_col': 'Остаток',
+        'progress_col': 'Прогресс',
+        'no_id': "НЕТ ID",
+        'no_group': 'БЕЗ ГРУППЫ',
+        'view_title': "Просмотр",
+        'page_of': "Страница {page} / {pages}",
+        'no_data_found': "Данные не найдены",
+        'no_payment_data_hint': "По результатам поиска платежная информация не найдена. Проверьте фильтры.",
+        'clear_filters_button': "Очистить фильтры",
+        
+        # ============================================
+        # FLASH MESSAGES - IMPORT/EXPORT
+        # ============================================
+        'file_not_selected': "Файл не выбран",
+        'only_excel_files_allowed': "Поддерживаются только Excel файлы (.xlsx, .xls)",
+        'only_xlsx_or_xls_allowed': "Принимаются только файлы формата .xlsx или .xls",
+        'only_xlsx_files_allowed': "Можно загружать только файлы формата .xlsx",
+        'no_changes_made': "Никаких изменений не внесено",
+        'no_students_imported': "Не импортировано ни одного студента",
+        'students_imported': "{imported_count} студентов успешно импортировано",
+        'no_subjects_imported': "Не импортировано ни одного предмета",
+        'subjects_imported': "{imported_count} предметов успешно импортировано",
+        'subjects_migrated': "{count} предметов переведено в многоязычный формат",
+        'no_subjects_to_migrate': "Все предметы уже в многоязычном формате",
+        'migrate_translations': "Обновить переводы",
+        'confirm_migrate_translations': "Перевести все предметы в многоязычный формат и выполнить автоперевод?",
+        'subjects_updated': "{updated_count} предметов обновлено",
+        'no_users_imported': "Не импортировано ни одного пользователя",
+        'users_imported': "{imported_count} пользователей успешно импортировано",
+        'no_records_imported': "Не импортировано ни одной записи",
+        'records_imported': "{imported_count} записей успешно импортировано",
+        'openpyxl_not_installed': "Функция экспорта Excel не работает. Пожалуйста, выполните команду 'pip install openpyxl'.",
+        
+        # ============================================
+        # IMPORT STUDENTS PAGE
+        # ============================================
+        'import_students_title': "Импорт студентов",
+        'import_students_subtitle': "Импорт списка студентов из файла Excel",
+        'import_payments_title': "Импорт данных об оплате",
+        'import_payments_subtitle': "Импорт данных об оплате из Excel",
+        'col_header_payment_talaba_id': "ID студента",
+        'col_desc_payment_talaba_id': "ID студента",
+        'col_header_payment_ismi': "Полное имя",
+        'col_desc_payment_ismi': "Полное имя студента",
+        'col_header_payment_oquv_yili': "Учебный год",
+        'col_desc_payment_oquv_yili': "Учебный год (2024-2025). При указании суммы контракта обязательно — применяется только к этому учебному году данного студента",
+        'col_header_payment_kontrakt': "Сумма контракта",
+        'col_desc_payment_kontrakt': "Сумма контракта, действующая только для этого студента в указанном учебном году",
+        'col_header_payment_tolov': "Сумма оплаты",
+        'col_desc_payment_tolov': "Оплаченная сумма (число)",
+        'col_header_payment_talab': "Сумма контракта",
+        'col_desc_payment_talab': "При указании — используется эта сумма (не по направлению). Для дифференцированных или восстановления.",
+        'col_header_payment_tolagani': "Сумма оплаты",
+        'col_desc_payment_tolagani': "Оплаченная сумма (число)",
+        'col_header_payment_eslatmalar': "Примечания",
+        'col_desc_payment_eslatmalar': "Дополнительные примечания (текст)",
+        'excel_file_format': "Формат файла Excel",
+        'excel_columns_required': "В файле Excel должны быть следующие столбцы:",
+        'column_name': "Название столбца",
+        'required_field': "Обязательно",
+        'optional_field': "Необязательно",
+        'required_if_contract_entered': "Обязательно при указании суммы контракта",
+        'import_note_title': "Примечание:",
+        'import_note_file_format': "Файл должен быть в формате .xlsx или .xls",
+        'import_note_required': "Обязательные поля: Полное имя, ID студента, Серия и номер паспорта",
+        'import_note_optional': "Необязательные поля: Все остальные поля",
+        'import_note_auto_group': "Если указаны факультет, курс, форма обучения, год набора и группа, студент будет автоматически добавлен в группу",
+        'import_note_enrollment': "Год набора важен для привязки к направлению (например: 2024, 2025)",
+        'import_note_group_name': "Название группы должно быть указано верно (например: DI-21). Если группы нет, она будет создана",
+        'import_note_unique': "Email и ID студента не должны повторяться",
+        'import_note_password': "Начальный пароль для новых студентов: серия и номер паспорта",
+        'excel_upload_title': "Загрузка файла Excel",
+        'excel_file_label': "Файл Excel *",
+        'file_format_note': "Формат файла: .xlsx или .xls",
+        'download_sample': "Скачать образец",
+        'import_button': "Импортировать",
+        'import_col_student_id': "ID студента (A)",
+        'import_desc_student_id': "Номер ID студента",
+        'import_col_full_name': "Полное имя (B)",
+        'import_desc_full_name': "Полное имя студента (Фамилия Имя Отчество)",
+        'import_col_passport': "Серия и номер паспорта (C)",
+        'import_desc_passport': "Серия и номер паспорта",
+        'import_col_pinfl': "ПИНФЛ (D)",
+        'import_desc_pinfl': "ПИНФЛ код (14 цифр)",
+        'import_col_birth_date': "Дата рождения (E)",
+        'import_desc_birth_date': "Формат DD.MM.YYYY или YYYY-MM-DD",
+        'import_col_phone': "Телефон (F)",
+        'import_desc_phone': "Номер телефона",
+        'import_col_email': "Email (G)",
+        'import_desc_email': "Адрес email (не должен повторяться)",
+        'import_col_faculty': "Факультет (I)",
+        'import_desc_faculty': "Название факультета (для привязки к группе)",
+        'import_col_course': "Курс (J)",
+        'import_desc_course': "Номер курса (1-курс, 2-курс)",
+        'import_col_semester': "Семестр (K)",
+        'import_desc_semester': "Номер семестра (1-семестр, 2-семестр)",
+        'import_col_education_type': "Форма обучения (L)",
+        'import_desc_education_type': "Очная, Заочная, Вечерняя, Дистанционная (с заглавной буквы)",
+        'import_col_enrollment_year': "Год набора (M)",
+        'import_desc_enrollment_year': "Год набора (например: 2024, 2025)",
+        'import_col_specialty_code': "Код специальности (N)",
+        'import_desc_specialty_code': "Код направления (например: DI)",
+        'import_col_specialty_name': "Название специальности (O)",
+        'import_desc_specialty_name': "Название направления (например: Программная инженерия)",
+        'import_col_group': "Группа (P)",
+        'import_desc_group': "Название группы (например: DI-21)",
+        
+        # Sample file (talabalar import namuna)
+        'sample_students_title': "Файл-образец для импорта студентов",
+        'sample_requirements_title': "ТРЕБОВАНИЯ ИМПОРТА:",
+        'sample_note_title': "ПРИМЕЧАНИЕ:",
+        'sample_req_1': "1. ID студента - обязательное поле, должно быть уникальным",
+        'sample_req_2': "2. Полное имя - обязательное поле",
+        'sample_req_3': "3. Серия и номер паспорта - обязательное поле (например: AB1234567)",
+        'sample_req_4': "4. ПИНФЛ - необязательное поле (14 цифр)",
+        'sample_req_5': "5. Дата рождения - необязательное поле (формат DD.MM.YYYY или YYYY-MM-DD)",
+        'sample_req_6': "6. Телефон - необязательное поле",
+        'sample_req_7': "7. Email - необязательное поле, должен быть уникальным",
+        'sample_req_8': "8. Описание - необязательное поле",
+        'sample_req_9_fid': "9. F.ID - необязательное поле (идентификатор студента в устройстве)",
+        'sample_req_9': "9. Факультет - необязательное поле (для привязки к группе)",
+        'sample_req_10': "10. Факультет - необязательное поле (для привязки к группе)",
+        'sample_req_11': "11. Курс - необязательное поле (формат: 1-курс, 2-курс)",
+        'sample_req_12': "12. Семестр - необязательное поле (формат: 1-семестр, 2-семестр)",
+        'sample_req_13': "13. Форма обучения - необязательное поле (Очная, Заочная, Вечерняя, Дистанционная)",
+        'sample_req_14': "14. Год набора - необязательное поле (например: 2024)",
+        'sample_req_15': "15. Код специальности - необязательное поле (код направления)",
+        'sample_req_16': "16. Название специальности - необязательное поле (название направления)",
+        'sample_req_17': "17. Группа - необязательное поле (если есть - добавляется, иначе создается новая)",
+        'sample_filename_students': "import_studentov_obrazec",
+        'sample_staff_title': "Файл-образец для импорта сотрудников",
+        'sample_filename_staff': "import_sotrudnikov_obrazec",
+        
+        # ============================================
+        # IMPORT SUBJECTS PAGE
+        # ============================================
+        'import_subjects_title': "Импорт предметов",
+        'import_subjects_subtitle': "Импорт списка предметов из файла Excel",
+        'import_col_subject_name': "Название предмета (A)",
+        'import_desc_subject_name': "Полное название предмета",
+        'import_col_subject_description': "Описание (B)",
+        'import_desc_subject_description': "Дополнительная информация о предмете",
+        'import_note_subject_name': "Название предмета - обязательное поле",
+        'import_note_subject_update': "Если предмет с таким названием существует, он будет обновлён",
+        'import_note_subject_create': "Если предмет новый, он будет создан",
+        'import_note_subject_desc': "Описание - необязательное поле",
+        'import_note_subject_department': "По названию кафедры в столбце предмет привязывается к этой кафедре (несколько через запятую).",
+        'import_note_subjects_1col': "Если заполнен один столбец языка (A, B или C) – перевод выполняется на язык платформы",
+        'import_note_subjects_3col': "Если заполнены все три столбца – перевод не выполняется",
+        'import_col_subject_uz': "Название предмета (узб.)",
+        'import_col_subject_ru': "Название предмета (рус.)",
+        'import_col_subject_en': "Название предмета (англ.)",
+        'import_desc_subject_uz': "Название предмета на узбекском",
+        'import_desc_subject_ru': "Название предмета на русском",
+        'import_desc_subject_en': "Название предмета на английском",
+        'import_subject_department_hint': "Название кафедры (несколько через запятую)",
+        'sample_subjects_title': "Файл-образец для импорта предметов",
+        
+        # IMPORT DEPARTMENTS (Кафедры)
+        'import_departments_title': "Импорт кафедр",
+        'import_departments_subtitle': "Импорт списка кафедр из Excel (1 столбец – язык платформы и перевод, или 3 столбца – Уз/Ру/En)",
+        'departments_imported': "Добавлено кафедр: {imported_count}",
+        'departments_updated': "Обновлено кафедр: {updated_count}",
+        'no_data_imported': "Нет данных для импорта",
+        'import_col_department_uz': "Название кафедры (узб.) (A)",
+        'import_col_department_ru': "Название кафедры (рус.) (B)",
+        'import_col_department_en': "Название кафедры (англ.) (C)",
+        'import_col_department_head': "Заведующий кафедрой (D)",
+        'import_desc_department_uz': "Название кафедры на узбекском",
+        'import_desc_department_ru': "Название кафедры на русском",
+        'import_desc_department_en': "Название кафедры на английском",
+        'import_desc_department_head': "Полное имя зав. кафедрой (из базы сотрудников)",
+        'import_note_departments_1col': "Если заполнен один столбец – считается языком платформы, остальные языки переводятся автоматически",
+        'import_note_departments_3col': "Если заполнены столбцы A, B, C – используются как есть (без перевода). Существующие кафедры обновляются",
+        'sample_departments_title': "Файл-образец для импорта кафедр",
+        
+        'import_staff_title': "Импорт сотрудников",
+        'import_staff_subtitle': "Импортируйте всех пользователей из файла Excel",
+        'import_users_title': "Импорт пользователей",
+        'import_col_full_name_a': "Полное имя (A)",
+        'import_desc_full_name_staff': "Полное имя сотрудника (Фамилия Имя Отчество)",
+        'import_col_login_b': "Логин (B)",
+        'import_desc_login': "Логин (должен быть уникальным)",
+        'import_col_passport_c': "Серия и номер паспорта (C)",
+        'import_col_pinfl_d': "ПИНФЛ (D)",
+        'import_col_birth_date_e': "Дата рождения (E)",
+        'import_col_phone_f': "Телефон (F)",
+        'import_col_email_g': "Email (G)",
+        'import_col_description_h': "Описание (H)",
+        'import_desc_staff_description': "Дополнительная информация о сотруднике. Для декана укажите название факультета (например: декан IT-факультета)",
+        'import_optional_dean_required': "Необязательно (обязательно для роли декана)",
+        'import_col_fid_i': "F.ID (I)",
+        'import_desc_fid': "Идентификатор сотрудника в устройстве (необязательно)",
+        'import_desc_fid_student': "Идентификатор студента в устройстве (необязательно)",
+        'import_col_roles_j': "Роли (J)",
+        'import_col_roles_i': "Роли (I)",
+        'import_desc_roles_staff': "Через запятую: Администратор, Декан, Преподаватель, Бухгалтер, Сотрудник. Если пусто — сохраняется как «Сотрудник»",
+        'import_note_staff_file': "Файл должен быть в формате .xlsx или .xls",
+        'import_note_staff_required': "Обязательные поля: Полное имя, Логин, Серия и номер паспорта. Роли необязательны — если пусто, сохраняется как «Сотрудник»",
+        'import_note_staff_dean': "Если выбрана роль декана, в поле Описание укажите название факультета (например: \"декан IT-факультета\")",
+        'import_note_staff_unique': "Логин и Email должны быть уникальными",
+        'import_note_staff_password': "Начальный пароль для новых сотрудников: серия и номер паспорта",
+        'sample_subjects_title': "Файл-образец для импорта предметов",
+        'sample_filename_subjects': "import_predmetov_obrazec",
+        'sample_curriculum_title': "Файл-образец для импорта учебного плана",
+        'sample_filename_curriculum': "import_uchebnogo_plana_obrazec",
+        'sample_schedule_title': "Файл-образец для импорта расписания",
+        'sample_filename_schedule': "raspisanie_namuna",
+        'sample_contracts_title': "Файл-образец для импорта контрактов",
+        'sample_filename_contracts': "kontrakt_obrazec",
+        'contract_col_student_id': "ID студента",
+        'contract_col_name': "Полное имя",
+        'contract_col_amount': "Сумма контракта",
+        'contract_col_talab': "Сумма контракта",
+        'contract_col_paid': "Сумма оплаты",
+        'contract_col_notes': "Примечания",
+        'contract_sample_note': "ПРИМЕЧАНИЕ: Студент определяется по ID или имени. Сумма контракта обязательна.",
+        
+        # ============================================
+        # FLASH MESSAGES - ERROR MESSAGES
+        # ============================================
+        'error_occurred': "Произошла ошибка: {error}",
+        'import_error': "Ошибка импорта: {error}",
+        'import_error_with_details': "Ошибка импорта: {errors}",
+        'import_error_joined': "Ошибка при импорте: {errors}",
+        'export_error': "Ошибка экспорта: {error}",
+        'export_grades_error': "Произошла ошибка при экспорте: {error}",
+        'export_ungraded_blocked': "Экспорт невозможен: есть неоцененные ответы. Сначала оцените все ответы.",
+        'role_permissions_saved': "Права ролей сохранены.",
+        'reset_to_default': "Восстановить по умолчанию",
+        'role_settings_reset_confirm': "Настройки ролей будут сброшены в начальное состояние. Продолжить?",
+        'role_settings_reset_to_default': "Настройки ролей восстановлены по умолчанию.",
+        'role_settings_description': "Назначьте или снимите права для каждой роли.",
+        'role_settings_all_permissions_note': "В таблице ниже приведены все права просмотра, доступа и возможности в системе — каждое можно назначить отдельно.",
+        'role_settings_superadmin_only': "Этот раздел только для суперадмина. Вы можете управлять правами для всех ролей с помощью флажков.",
+        'permission': "Право",
+        'perm_view_admin_panel': "Доступ в панель администратора",
+        'perm_view_users': "Список пользователей",
+        'perm_create_user': "Добавить пользователя",
+        'perm_edit_user': "Редактировать пользователя",
+        'perm_delete_user': "Удалить пользователя",
+        'perm_toggle_user': "Изменить активность пользователя",
+        'perm_reset_user_password': "Сбросить пароль",
+        'perm_view_staff': "Список сотрудников",
+        'perm_create_staff': "Добавить сотрудника",
+        'perm_edit_staff': "Редактировать сотрудника",
+        'perm_delete_staff': "Удалить сотрудника",
+        'perm_view_students': "Список студентов",
+        'perm_create_student': "Добавить студента",
+        'perm_edit_student': "Редактировать студента",
+        'perm_delete_student': "Удалить студента",
+        'perm_view_faculties': "Факультеты",
+        'perm_create_faculty': "Добавить факультет",
+        'perm_edit_faculty': "Редактировать факультет",
+        'perm_delete_faculty': "Удалить факультет",
+        'perm_view_directions': "Направления",
+        'perm_create_direction': "Добавить направление",
+        'perm_edit_direction': "Редактировать направление",
+        'perm_delete_direction': "Удалить направление",
+        'perm_manage_groups': "Управление группами",
+        'perm_create_group': "Добавить группу",
+        'perm_edit_group': "Редактировать группу",
+        'perm_delete_group': "Удалить группу",
+        'perm_view_subjects': "Предметы",
+        'perm_create_subject': "Добавить предмет",
+        'perm_edit_subject': "Редактировать предмет",
+        'perm_delete_subject': "Удалить предмет",
+        'perm_view_curriculum': "Учебный план",
+        'perm_edit_curriculum': "Редактировать учебный план",
+        'perm_view_schedule': "Расписание",
+        'perm_create_schedule': "Добавить расписание",
+        'perm_edit_schedule': "Редактировать расписание",
+        'perm_delete_schedule': "Удалить расписание",
+        'perm_view_reports': "Отчёты",
+        'perm_view_grade_scale': "Система оценивания",
+        'perm_manage_grade_scale': "Управление системой оценивания",
+        'perm_view_teachers': "Список преподавателей",
+        'perm_assign_teachers': "Назначить преподавателя",
+        'no_department_assigned': "Вам не назначена ни одна кафедра",
+        'assign_teacher': "Назначить преподавателя",
+        'teacher_assigned_successfully': "Преподаватель успешно назначен",
+        'assignment_already_exists': "Это назначение уже существует",
+        'change_teacher': "Сменить преподавателя",
+        'new_teacher': "Новый преподаватель",
+        'teacher_changed_successfully': "Преподаватель успешно изменён",
+        'assignment_not_found': "Назначение не найдено",
+        'department_head_subjects_subtitle': "Предметы и преподаватели кафедры",
+        'department_head_resources_subtitle': "Ресурсы предметов кафедры",
+        'plan_hours': "План (часы)",
+        'all_lesson_types': "Все типы занятий",
+        'all_progress': "Все проценты",
+        'total_rows': "Всего строк",
+        'perm_export_subjects': "Экспорт предметов",
+        'perm_import_subjects': "Импорт предметов",
+        'perm_import_schedule': "Импорт расписания",
+        'perm_import_students': "Импорт студентов",
+        'perm_import_staff': "Импорт сотрудников",
+        'perm_view_dean_panel': "Доступ в панель декана",
+        'perm_dean_manage_students': "Декан: управление студентами",
+        'perm_dean_manage_directions': "Декан: направления",
+        'perm_dean_manage_groups': "Декан: группы",
+        'perm_dean_manage_curriculum': "Декан: учебный план",
+        'perm_dean_manage_teachers': "Декан: преподаватели",
+        'perm_dean_manage_schedule': "Декан: расписание",
+        'perm_create_lesson': "Создать урок",
+        'perm_edit_lesson': "Редактировать урок",
+        'perm_delete_lesson': "Удалить урок",
+        'perm_create_assignment': "Создать задание",
+        'perm_edit_assignment': "Редактировать задание",
+        'perm_delete_assignment': "Удалить задание",
+        'perm_grade_students': "Оценивать ответы",
+        'perm_view_submissions': "Просмотр ответов",
+        'perm_create_announcement': "Создать объявление",
+        'perm_view_lessons': "Просмотр уроков",
+        'perm_submit_assignment': "Отправить задание",
+        'perm_view_grades': "Просмотр оценок",
+        'perm_view_accounting': "Доступ в бухгалтерию",
+        'perm_manage_payments': "Управление платежами",
+        'perm_manage_contracts': "Управление контрактами",
+        'perm_view_contract_amounts': "Просмотр сумм контрактов",
+        'perm_import_payments': "Импорт платежей",
+        'perm_view_announcements': "Просмотр объявлений",
+        'perm_send_message': "Отправить сообщение",
+        'perm_view_messages': "Просмотр сообщений",
+        'excel_import_not_working': "Функция импорта Excel не работает: {error}",
+        'template_file_creation_error': "Ошибка при создании файла шаблона: {error}",
+        'template_file_download_error': "Ошибка при скачивании файла шаблона: {error}",
+        'announcement_delete_error': "Произошла ошибка при удалении объявления: {error}",
+        'announcements_delete_error': "Произошла ошибка при удалении объявлений: {error}",
+        'invalid_file_format': "Недопустимый формат файла: {filename}. Допустимые форматы: PDF, DOC, DOCX, XLS, XLSX, PPT, PPTX, TXT, ZIP, RAR",
+        'file_size_limit': "Размер файла не должен превышать {max} МБ",
+    },
+    'en': {
+        # ============================================
+        # SITE INFO
+        # ============================================
+        'site_name': 'Tashkent Institute of Irrigation and Agricultural Mechanization Engineers National Research University LMS',
+        'site_name_short': '"TIIAME" NRU LMS',
+        'site_tagline': 'Distance Learning Platform',
+        'university_name': 'Tashkent Institute of Irrigation and Agricultural Mechanization Engineers National Research University',
+        
+        # ============================================
+        # COMMON UI ELEMENTS
+        # ============================================
+        'dashboard': 'Dashboard',
+        'logout': 'Logout',
+        'login': 'Login',
+        'register': 'Register',
+        'settings': 'Settings',
+        'search': 'Search',
+        'save': 'Save',
+        'cancel': 'Cancel',
+        'delete': 'Delete',
+        'not_found': 'Not found',
+        'edit': 'Edit',
+        'copy_text': 'Copy',
+        'more_options': 'More',
+        'reply': 'Reply',
+        'forward': 'Forward',
+        'select': 'Select',
+        'selected': 'selected',
+        'translate': 'Translate',
+        'create': 'Create',
+        'back': 'Back',
+        'next': 'Next',
+        'previous': 'Previous',
+        'submit': 'Submit',
+        'close': 'Close',
+        'yes': 'Yes',
+        'no': 'No',
+        'actions': 'Actions',
+        'status': 'Status',
+        'date': 'Date',
+        'name': 'Name',
+        'email': 'Email',
+        'phone': 'Phone',
+        'password': 'Password',
+        'confirm_password': 'Confirm Password',
+        'role': 'Role',
+        'active': 'Active',
+        'inactive': 'Inactive',
+        
+        # ============================================
+        # NAVIGATION & MENU
+        # ============================================
+        'institution_name': '"TIIAME" NRU',
+        'remote_education_platform': 'Distance Learning Platform',
+        'payment_info': 'Payment Information',
+        'accounting': 'Accounting',
+        'admin_panel': 'Admin Panel',
+        'staff_database': 'Staff Database',
+        'students_database': 'Students Database',
+        'subjects_database': 'Subjects Database',
+        'department_head_subjects_subtitle': "Manage subjects of your department",
+        'department_head_resources_subtitle': "Department subject resources and teachers",
+        'no_department_assigned': "No department assigned to you",
+        'assign_teachers_menu': "Assign Teachers",
+        'assign_teachers_subtitle': "Assign teachers to directions and groups in active semesters",
+        'teacher_assigned_success': "Teacher assigned successfully",
+        'teacher_removed_success': "Teacher removed successfully",
+        'assign_teacher': "Assign teacher",
+        'select_subject': "Select subject",
+        'select_teacher': "Select teacher",
+        'select_group': "Select group",
+        'select_lesson_type': "Select lesson type",
+        'assign': "Assign",
+        'assignment_already_exists': "This assignment already exists",
+        'teacher_assigned_successfully': "Teacher assigned successfully",
+        'change_teacher': "Change teacher",
+        'new_teacher': "New teacher",
+        'assignment_not_found': "Assignment not found",
+        'teacher_changed_successfully': "Teacher changed successfully",
+        'plan_hours': "Plan (hours)",
+        'all_lesson_types': "All lesson types",
+        'all_progress': "All",
+        'total_rows': "Total rows",
+        'subjects_database_subtitle': 'Subjects linked to curriculum (direction, group, teacher, subject)',
+        'subject_resources': 'Subject resources',
+        'subject_resources_subtitle': 'Full list by teacher–subject–group with filters',
+        'search_resources_placeholder': 'Search by teacher, subject, group...',
+        'dashboard_zero_percent_only': 'Mainly 0% resources (full list in Subject resources section)',
+        'total_rows': 'Total rows',
+        'filters': 'Filters',
+        'all': 'All',
+        'all_faculties': 'All faculties',
+        'all_courses': 'All courses',
+        'all_academic_years': 'All academic years',
+        'all_semesters': 'All semesters',
+        'all_education_types': 'All types',
+        'all_directions': 'All directions',
+        'all_groups': 'All groups',
+        'search_placeholder_curriculum': 'Search by subject name, enrollment year, direction name/code, group name, teacher, education type...',
+        'subject_count': 'subject',
+        'credit': 'credit',
+        'no_description': 'No description available',
+        'lecture': 'Lecture',
+        'practice': 'Practice',
+        'lab': 'Lab',
+        'seminar': 'Seminar',
+        'course_work': 'Course work',
+        'available': 'available',
+        'independent': 'Independent',
+        'hour': 'hour',
+        'subjects_not_found': 'Subjects not found',
+        'subjects_for_group': 'Subjects assigned to your group',
+        'subjects_assigned_to_you': 'Your assigned subjects',
+        'subject_search_placeholder': 'Search subject...',
+        'curriculum_not_completed': 'Curriculum not fully completed:',
+        'curriculum_warning_no_topics': '{name}: At least 1 topic must be created, but none created yet',
+        'curriculum_warning_missing': '{name}: {required} topics needed for {hours} hours, but {actual} entered (missing: {missing})',
+        'lessons_unit': 'lesson',
+        'assignments_unit': 'assignment',
+        'no_group_assigned': 'No group assigned to you yet',
+        'change_search_query': 'Change search query',
+        'prev_page': 'Previous',
+        'next_page': 'Next',
+        'change_search': 'Change search parameters.',
+        'dean_office': "Dean's Office",
+        'dean_panel': 'Dean Panel',
+        'dean_control': 'Deanery control',
+        'student_groups': 'Study groups',
+        'academic_subjects': 'Academic subjects',
+        'faculty_students': 'Faculty students',
+        'total_teachers_label': 'Total teachers',
+        'education_directions': 'Education directions',
+        'reports': 'Reports',
+        'system_reports': 'System reports',
+        'general_statistics': 'General statistics and data',
+        'total_users': 'Total users',
+        'active_users': 'Active users',
+        'students_excel': 'Students Excel',
+        'schedule_excel': 'Schedule Excel',
+        'by_faculties': 'By faculties',
+        'students_by_groups': 'Students by groups',
+        'no_faculties': 'No faculties available',
+        'no_groups': 'No groups available',
+        'student_count': 'student',
+        'grading_system': 'Grading System',
+        'role_settings': 'Role settings',
+        'site_settings': 'Site settings',
+        'site_settings_description': 'Change platform name, short name, tagline and logo.',
+        'site_settings_general': 'General information',
+        'site_settings_institution_name': 'Institution (platform) full name',
+        'site_settings_short_name': 'Short name (for page title)',
+        'site_settings_short_name_hint': 'Shown in browser tab and page title',
+        'site_settings_tagline': 'Tagline',
+        'site_settings_logo': 'Logo',
+        'site_settings_current_logo': 'Current logo',
+        'site_settings_click_to_enlarge': 'Click to view',
+        'site_settings_no_logo': 'No logo uploaded (default logo is used)',
+        'site_settings_upload_logo': 'Upload new logo',
+        'site_settings_logo_hint': 'PNG, JPG, GIF, WebP or SVG. Leave empty to keep current logo.',
+        'site_settings_remove_logo': 'Remove logo',
+        'site_settings_logo_upload_error': 'Logo upload failed. Check file size and permissions.',
+        'site_settings_logo_format_error': 'Logo format not allowed. Allowed: PNG, JPG, GIF, WebP, SVG.',
+        'site_settings_saved': 'Site settings saved.',
+        'site_settings_reset_to_default': 'Reset to default',
+        'site_settings_reset_confirm': 'All site settings (names, tagline, logos) will be cleared. Continue?',
+        'site_settings_reset_done': 'Site settings have been reset to default.',
+        'grade_scale_settings': 'Grade scale settings',
+        'reset_to_default': 'Reset to default',
+        'new_grade': 'New grade',
+        'about_grading_system': 'About grading system',
+        'grading_system_description': 'Here you can configure the grading system used to calculate student grades. For each grade, set the minimum and maximum score range, GPA value, and other parameters.',
+        'grades_table': 'Grades table',
+        'order': 'Order',
+        'grade': 'Grade',
+        'name': 'Name',
+        'score_range': 'Score range',
+        'status': 'Status',
+        'actions': 'Actions',
+        'passed': 'Passed',
+        'failed': 'Failed',
+        'no_grades': 'No grades',
+        'grading_system_not_configured': 'Grading system not yet configured',
+        'add_new_grade': 'Add new grade',
+        'visual_appearance': 'Visual appearance',
+        'confirm_reset_grades': 'Do you really want to reset to default?',
+        'confirm_delete_grade': 'Do you really want to delete?',
+        
+        # ============================================
+        # PAGE TITLES & HEADERS
+        # ============================================
+        'home_page': 'Home Page',
+        'admin_control_panel': 'Admin Control Panel',
+        'system_management_monitoring': 'System Management and Monitoring',
+        'all_users_list': 'All Users List',
+        'all_students_list': 'All Students List',
+        'all_staff_list': 'All Staff List',
+        'all_faculties_list': 'All Faculties List',
+        'all_subjects_list': 'All Subjects List',
+        'directions_page_subtitle': 'All faculties • Year + Education form → Direction → Course → Semester → Groups',
+        'faculty_directions_subtitle': 'Enrollment year + Education form → Direction → Course → Semester → Groups',
+        'groups_page_subtitle': 'Only groups with students (active) • Filter by faculty',
+        
+        # ============================================
+        # BUTTONS & ACTIONS
+        # ============================================
+        'new_user': 'New User',
+        'add_user': 'Add User',
+        'new_student': 'New Student',
+        'new_subject': 'New Subject',
+        'new_faculty': 'New Faculty',
+        'create_subject': 'Create Subject',
+        'create_group': 'Create Group',
+        'new_account': 'New Account',
+        'add_faculty': 'Add Faculty',
+        'new_staff': 'New Staff',
+        'create_staff_title': 'Create New Staff',
+        'create_staff_button': 'Create Staff',
+        'edit_staff_title': 'Edit Staff',
+        'basic_info': 'Basic Information',
+        'academic_info': 'Academic information',
+        'create_student_title': 'Create student',
+        'create_student_subtitle': 'Enter student details and assign to a group',
+        'student_id_label': 'Student ID',
+        'passport_label': 'Passport',
+        'enrollment_year': 'Enrollment year',
+        'select_course_placeholder': 'Select course',
+        'select_semester_placeholder': 'Select semester',
+        'select_education_type_placeholder': 'Select education type',
+        'select_direction_placeholder': 'Select direction',
+        'select_group_placeholder': 'Select group',
+        'select_education_type_placeholder': 'Select education type',
+        'create_student_button': 'Create student',
+        'group_name_placeholder': 'Group name',
+        'create_group_title': 'Create new group',
+        'create_group_page_title': 'New group',
+        'group_name_placeholder_example': 'Example: DI-21',
+        'edit_student_title': 'Edit student',
+        'edit_student_subtitle': 'Edit details',
+        'edit_group_title': 'Edit group',
+        'group_name_label': 'Group name *',
+        'faculty_auto_selected': 'Faculty is auto-selected',
+        'update': 'Update',
+        'update_page_title': 'System update',
+        'update_page_description': 'Check platform version and update manually (auto-update at institutions runs 00:00–06:00).',
+        'update_check_btn': 'Check for updates',
+        'update_run_btn': 'Install update',
+        'update_current_version': 'Current version',
+        'update_latest_version': 'Latest version',
+        'update_available': 'Update available.',
+        'update_up_to_date': 'Platform is up to date.',
+        'update_not_available': 'No update available.',
+        'update_center_timeout': 'Connection to center timed out — {url}',
+        'update_center_connection_error': 'Connection to center failed (address or network) — {url}',
+        'update_center_not_configured': 'CENTRAL_API_URL not set',
+        'update_center_bad_response': 'Center response: {code} — {url}',
+        'update_version_failed': 'Failed to get latest version',
+        'update_center_no_connection': 'No connection to center (CENTRAL_API_URL)',
+        'error': 'Error',
+        'update_disabled_note': 'No connection to center (CENTRAL_API_URL not set).',
+        'update_installed_restart': 'Update installed. System will restart shortly.',
+        'update_not_applied': 'Update not applied (already installed or error).',
+        'update_broadcast_sent': 'Update notification sent to all institutions.',
+        'update_broadcast_error': 'Error sending notification.',
+        'institutions_updated': 'Institutions list updated.',
+        'update_institutions_section_title': 'Institutions connected to center',
+        'update_trigger_btn': 'Send update to all institutions',
+        'center_block_status': 'Center status',
+        'center_blocked': 'Center blocked',
+        'center_not_blocked': 'Center not blocked',
+        'center_block_btn': 'Block center',
+        'center_unblock_btn': 'Unblock center',
+        'institutions_connected': 'Connected',
+        'institutions_blocked': 'Blocked',
+        'institution_edit': 'Edit',
+        'institution_block': 'Block',
+        'institution_unblock': 'Unblock',
+        'institution_name_label': 'Institution name',
+        'institution_id_label': 'Institution ID',
+        'institution_block_reason': 'Block reason',
+        'institution_deleted': 'Institution removed from list.',
+        'confirm_delete_institution': 'Remove this institution from the list?',
+        'institution_id_exists': 'This ID already exists. Enter a different ID.',
+        'add_institution': 'Add institution',
+        'faollik': 'Active',
+        'description_short_placeholder': 'Brief information...',
+        'passport_info': 'Passport Information',
+        'passport_series_number': 'Passport series and number',
+        'pinfl': 'PINFL',
+        'used_as_password': 'Will be used as password',
+        'birth_date': 'Date of birth',
+        'name_placeholder': 'Name Surname',
+        'staff_description_placeholder': 'Brief information about the staff...',
+        'multiple_roles_can_select': 'Multiple roles can be selected',
+        'role_optional_default_xodim': 'Role is optional; if none selected, displayed as «Employee».',
+        'role_optional_no_xodim_role': 'There is no separate «Employee» role; if no role is selected, saved as «Employee».',
+        'staff_fid': 'F.ID',
+        'staff_fid_placeholder': 'Device employee ID',
+        'student_fid_placeholder': 'Device student ID',
+        'staff_role_xodim': 'Employee',
+        'select_faculty_placeholder': 'Select faculty...',
+        'dean_must_select_faculty': 'Faculty selection is required for dean role',
+        'accountant': 'Accountant',
+        'new_lesson': 'New Lesson',
+        'add_subject': 'Add Subject',
+        'create_faculty': 'Create Faculty',
+        'import_from_excel': 'Import from Excel',
+        'export_to_excel': 'Export to Excel',
+        'export': 'Export',
+        'import': 'Import',
+        'clear': 'Clear',
+        'ok': 'OK',
+        'all_subjects': 'All subjects',
+        'view_all': 'View All',
+        'block': 'Block',
+        'activate': 'Activate',
+        'reset_password': 'Reset Password',
+        'edit_info': 'Edit Information',
+        
+        # ============================================
+        # TABLE HEADERS & LABELS
+        # ============================================
+        'additional': 'Additional',
+        'full_name_student_id': 'Full Name / Student ID',
+        'full_name_login': 'Full Name / Login',
+        'passport_pinfl': 'Passport Number / PINFL',
+        'phone_email': 'Phone / Email',
+        'group_direction': 'Group / Direction',
+        'responsible_deans': 'Responsible Deans',
+        'no_responsible_dean': 'Responsible dean not assigned',
+        
+        # ============================================
+        # FILTERS & OPTIONS
+        # ============================================
+        'all_roles': 'All Roles',
+        'all_faculties': 'All Faculties',
+        'all_courses': 'All Courses',
+        'all_academic_years': 'All Academic Years',
+        'all_semesters': 'All Semesters',
+        'all_types': 'All Types',
+        'all_directions': 'All Directions',
+        'all_groups': 'All Groups',
+        'course_suffix': '-course',
+        'semester_suffix': '-semester',
+        'education_type': 'Education Type',
+        'education_type_kunduzgi': 'Full-time',
+        'education_type_sirtqi': 'Part-time',
+        'education_type_kechki': 'Evening',
+        'education_type_masofaviy': 'Distance',
+        'course_year_option': 'Year {n}',
+        'select_option_choose': 'Select',
+        'create_group_mode': 'Create group',
+        'switch_back_to_select': 'Switch back to select',
+        'please_enter_group_name': 'Please enter group name!',
+        
+        # ============================================
+        # STATUS & MESSAGES
+        # ============================================
+        'blocked': 'Blocked',
+        'group_not_assigned': 'Group not assigned',
+        'description': 'Description',
+        'no_description': 'No description',
+        'users_not_found': 'Users not found',
+        'students_not_found': 'Students not found',
+        'no_faculties': 'No faculties',
+        'no_users': 'No users',
+        'no_subjects': 'No subjects',
+        'no_active_groups': 'No active groups found',
+        'groups_empty_hint': 'Groups with students are shown here. Change filters or create a new group.',
+        'direction_not_assigned': 'Direction not assigned',
+        'lessons_no_content_warning': 'Lessons exist but no videos/files',
+        'description_not_available': 'No description available',
+        'search_result_empty': 'Search result empty',
+        'start_creating_faculty': 'Start creating new faculty',
+        'start_creating_subject': 'Start creating new subject',
+        'loading': 'Loading…',
+        'load_error': 'Load error. Refresh the page.',
+        
+        # ============================================
+        # PAGINATION
+        # ============================================
+        'first': 'First',
+        'last': 'Last',
+        'total_items': 'total',
+        'pagination_range': '{start}-{end} of {total}',
+        
+        # ============================================
+        # STATS & COUNTS
+        # ============================================
+        'total': 'Total',
+        'admins': 'Admins',
+        'deans': 'Deans',
+        'teachers': 'Teachers',
+        'students': 'Students',
+        'staff': 'Staff',
+        'all_users': 'All Users',
+        'all_staff': 'All Staff',
+        'student_count': 'Student Count',
+        'available': 'Available',
+        'taught_subjects': 'Taught Subjects',
+        'items_count': 'items',
+        'with_assignments': 'with assignments',
+        'groups_with_students': 'groups with students',
+        'system_members': 'System Members',
+        
+        # ============================================
+        # SEARCH & PLACEHOLDERS
+        # ============================================
+        'search_name_email': 'Search (name, email)...',
+        'search_name_email_role': 'Search (name, email, role)...',
+        'search_name_code': 'Search (name, code)...',
+        'search_student_fields': 'Search (name, login, passport, PINFL, phone, email)...',
+        'search_direction_placeholder': 'Enrollment year, code, name, education form...',
+        'search_group_placeholder': 'Group name, direction...',
+        'search_subject_placeholder': 'Search by subject name or description...',
+        'search_teacher_placeholder': 'Search teacher',
+        'search_name_placeholder': 'Search by name or description...',
+        'search_department_name_or_head_placeholder': 'Search by department name or department head...',
+        
+        # ============================================
+        # CONFIRMATION MESSAGES
+        # ============================================
+        'confirm_delete_user': 'Do you want to delete this user?',
+        'confirm_delete_student': 'Do you want to delete this student?',
+        'confirm_delete_faculty': 'Do you want to delete this faculty? All groups, subjects and data will be deleted.',
+        'confirm_delete_subject': 'Do you want to delete this subject?',
+        'confirm_delete_group': 'Do you want to delete this group? Students in it may also be removed.',
+        'confirm_delete_direction': 'Are you sure you want to delete this direction?',
+        'confirm_reset_password': 'Do you want to reset the password?',
+        
+        # ============================================
+        # OTHER COMMON
+        # ============================================
+        'today_overview': "Today's Overview",
+        'recent_users': 'Recent Users',
+        'new_members': 'New Members',
+        'no_announcements_found': 'No announcements found',
+        'create_announcement_label': 'Post announcement',
+        'important_label': 'Important',
+        'quick_actions': 'Quick Actions',
+        'my_subjects': 'My Subjects',
+        'assigned_subjects': 'Assigned subjects',
+        'assigned_groups_count': 'Number of groups',
+        'subject_assignments_count': 'Subject assignments',
+        'unchecked': 'Unchecked',
+        'students_awaiting_grading': 'Awaiting grading',
+        'search_subjects_placeholder': 'Search subjects...',
+        'search_assignments_placeholder': 'Search assignments...',
+        'resources_available': 'resources available',
+        'resources': 'Resources',
+        'resource': 'Resource',
+        'no_assigned_subjects': 'No subjects assigned to you',
+        'all_assignments': 'All assignments',
+        'new_count_suffix': 'new',
+        'no_deadline': 'No deadline',
+        'no_new_answers': 'No new answers',
+        'all_checked': 'All checked!',
+        'no_pending_to_check': 'You have no pending assignments to check.',
+        'assignments_not_found': 'Assignments not found',
+        'resubmit_count': 'resubmissions',
+        'new_short': 'new',
+        'assigned': 'Assigned',
+        'not_assigned': 'Not assigned',
+        'roles': 'Roles',
+        'profile_settings': 'Profile Settings',
+        'settings_subtitle': 'Manage your account settings',
+        'profile_info': 'Profile information',
+        'new_password_confirm_label': 'Confirm new password',
+        'min_8_chars': 'At least 8 characters',
+        'additional_info': 'Additional information',
+        'registered_at': 'Registered',
+        'last_login': 'Last login',
+        'session_timeout_message': 'For security, you will be automatically logged out in 30 minutes',
+        'course': 'Course',
+        'administrator': 'Administrator',
+        
+        # ============================================
+        # ROLES
+        # ============================================
+        'admin': 'Administrator',
+        'dean': 'Dean',
+        'edu_dept': 'Educational Department',
+        'department_head': 'Department Head',
+        'teacher': 'Teacher',
+        'student': 'Student',
+        'superadmin': 'Superadmin',
+        
+        # ============================================
+        # DASHBOARD ELEMENTS
+        # ============================================
+        'welcome': 'Welcome',
+        'good_morning': 'Good Morning',
+        'good_afternoon': 'Good Afternoon',
+        'good_evening': 'Good Evening',
+        'good_night': 'Good Night',
+        'today': 'Today',
+        'total_users': 'Total Users',
+        'total_students': 'Total Students',
+        'total_teachers': 'Total Teachers',
+        'total_faculties': 'Total Faculties',
+        'total_groups': 'Total Groups',
+        'total_subjects': 'Total Subjects',
+        'active_groups_count': 'Active groups',
+        'active_by_faculty': 'By faculty',
+        'available_subjects': 'Available subjects',
+        'recent_announcements': 'Recent announcements',
+        'important': 'Important',
+        'view_all': 'View all',
+        
+        # ============================================
+        # SUBJECTS
+        # ============================================
+        'subjects': 'Subjects',
+        'subject': 'Subject',
+        'subject_name': 'Subject Name',
+        'subject_code': 'Subject Code',
+        'subject_name_placeholder': 'Programming Basics',
+        'course_name_label': 'Course name',
+        'course_title_placeholder': 'Example: Programming Basics',
+        'course_description_placeholder': 'Brief information about the course...',
+        'category_label': 'Category',
+        'subject_description_placeholder': 'Brief information about the subject...',
+        'create_new_subject': 'Create new subject',
+        'credits': 'Credits',
+        'semester': 'Semester',
+        'lessons': 'Lessons',
+        'lesson': 'Lesson',
+        'assignments': 'Assignments',
+        'assignment': 'Assignment',
+        'grades': 'Grades',
+        'grade': 'Grade',
+        'grades_subtitle': 'Your academic results (grading system)',
+        'teacher_grades_subtitle': 'Student grades by subjects and groups',
+        'no_subjects_assigned_to_you': 'No subjects assigned to you yet',
+        'overall_score': 'Overall score',
+        'subject_count_grades': 'subject grades',
+        'assignment_count_grades': 'assignments',
+        'mastered_label': 'Mastered',
+        'subjects_by_grades': 'Grades by subject',
+        'no_graded_assignments': 'No graded assignments yet',
+        
+        # ============================================
+        # USERS
+        # ============================================
+        'users': 'Users',
+        'user': 'User',
+        'full_name': 'Full Name',
+        'student_id': 'Student ID',
+        'group': 'Group',
+        'groups': 'Groups',
+        'direction': 'Direction',
+        'directions': 'Directions',
+        'direction_count_label': 'directions',
+        'group_count_label': 'groups',
+        'student_count_label': 'students',
+        'year_suffix': 'year',
+        'curriculum_label': 'Curriculum',
+        'curriculum_subject_teachers': 'Subject teachers',
+        'curriculum_selected_count': '{count} selected',
+        'curriculum_subject_search_placeholder': 'Search subject',
+        'curriculum_total_workload': 'Total workload',
+        'curriculum_hours_unit': 'hours',
+        'hours_plan': 'plan',
+        'hours_loaded': 'loaded',
+        'curriculum_credits_unit': 'credits',
+        'curriculum_semester_select_label': 'Select semester',
+        'curriculum_add_to_semester': 'Add to semester',
+        'curriculum_semester_format': '{n}-semester',
+        'curriculum_table_subjects': 'SUBJECTS',
+        'curriculum_table_total': 'TOTAL',
+        'curriculum_table_credits': 'CREDITS',
+        'curriculum_table_actions': 'ACTIONS',
+        'curriculum_replace_subject_tooltip': 'Replace subject',
+        'curriculum_no_subjects_in_semester': 'No subjects in this semester',
+        'curriculum_replace_modal_title': 'Replace subject',
+        'curriculum_new_subject_label': 'New subject',
+        'curriculum_replace_btn': 'Replace',
+        'curriculum_confirm_delete_subject': 'Remove this subject from curriculum?',
+        'curriculum_please_select_subject': 'Please select at least one subject!',
+        'curriculum_please_select_semester': 'Please select a semester!',
+        'subject_count_unit': 'subject',
+        'lesson_type': 'Lesson type',
+        'hours': 'Hours',
+        'lesson_type_maruza': 'Lecture',
+        'lesson_type_amaliyot': 'Practice',
+        'lesson_type_laboratoriya': 'Laboratory',
+        'lesson_type_seminar': 'Seminar',
+        'lesson_type_kurs_ishi': 'Coursework',
+        'lesson_type_mustaqil_talim': 'Self-study',
+        'lesson_type_short_m': "Lec",
+        'lesson_type_short_a': "Prac",
+        'lesson_type_short_l': "Lab",
+        'lesson_type_short_s': "Sem",
+        'lesson_type_short_k': "CW",
+        'lesson_type_short_mt': "SS",
+        'select_teacher_placeholder': 'Search teacher...',
+        'select_subject_placeholder': 'Select subject...',
+        'back_to_subjects_list': 'Back to subjects list',
+        'add_lesson': 'Add lesson',
+        'add_assignment': 'Add assignment',
+        'add_test': 'Add test',
+        'create_lesson_title': 'Add new lesson',
+        'edit_lesson_title': 'Edit lesson',
+        'create_assignment_title': 'Create new assignment',
+        'edit_assignment_title': 'Edit assignment',
+        'add_assignment_to_subject': 'Add new assignment to subject {subject}',
+        'create_test_title': 'Create new test',
+        'add_test_to_subject': 'Add new test to subject {subject}',
+        'tests_coming_soon': 'Tests section will be added soon.',
+        'tests': 'Tests',
+        'take_test': 'Take test',
+        'no_tests': 'No tests',
+        'questions': 'questions',
+        'submit_test': 'Submit',
+        'test_submitted_success': 'Test submitted successfully.',
+        'answers_sidebar': 'Answers',
+        'finish_test': 'Finish',
+        'confirm_finish_test': 'Finish the test?',
+        'confirm_leave_test': 'Leave the test? Selected answers will be cleared.',
+        'title': 'Title',
+        'content': 'Content',
+        'title_placeholder_suffix': ' – Test',
+        'test_create_content': 'Create test',
+        'test_content_placeholder': "Question 1\n=====\nVariant 1\n=====\nVariant 2\n=====\n#Variant 3 correct\n=====\nVariant 4\n+++++\nQuestion 2",
+        'test_format_hint': 'Format: question ===== option1 ===== #correct option ===== +++++ next question',
+        'view_preview': 'Preview',
+        'test_questions': 'Test questions',
+        'enter_test_questions_please': 'Please enter at least one question!',
+        'enter_title_please': 'Please enter the title!',
+        'test_created_success': 'Test created successfully.',
+        'preview_placeholder': 'Click the Preview button to see the result.',
+        'edit_assignment_subtitle': 'Edit assignment in subject {subject}',
+        'which_topics_related': 'Related topics',
+        'select_lesson_type_first': 'Please select lesson type first',
+        'select_related_topics_hint': 'Specify which topics this assignment relates to',
+        'no_topics_created_yet': 'No topics have been created for this subject and direction yet',
+        'no_topics_in_lesson_type': 'No topics for this lesson type yet',
+        'file_upload_required': 'File upload required',
+        'file_required_hint': '(If checked, students must upload a file when submitting)',
+        'enter_description_please': 'Please enter description!',
+        'select_at_least_one_topic': 'Please select at least one topic!',
+        'enter_deadline_please': 'Please enter deadline!',
+        'lesson_type_select': 'Select lesson type',
+        'lesson_type_not_available': 'Lesson type not available',
+        'lesson_content_placeholder': 'Enter lesson content...',
+        'score': 'Score',
+        'max_short': 'Max',
+        'assignment_name_label': 'Assignment title',
+        'assignment_title_placeholder': 'E.g.: Practical assignment #1',
+        'assignment_description_placeholder': 'Detailed information about the assignment...',
+        'back_to_lesson': 'Back to lesson',
+        'next_lesson': 'Next lesson',
+        'confirm_delete_short': 'Are you sure you want to delete?',
+        'add_lesson_to_subject': 'Add new lesson to subject {subject}',
+        'edit_lesson_subtitle': 'Edit lesson in subject {subject}',
+        'no_lesson_type_assigned': 'You are not assigned any lesson type for this subject (in this direction)',
+        'assignment_only_with_topics': 'Assignments can only be created for lesson types that have topics',
+        'topic_name_label': 'Topic title',
+        'topic_name_placeholder': 'E.g.: Topic 1: Introduction',
+        'video_url_youtube': 'Video URL (YouTube only)',
+        'video_url_placeholder': 'https://youtube.com/watch?v=... or https://youtu.be/...',
+        'only_youtube_supported': 'Only YouTube videos are supported',
+        'or_separator': '— or —',
+        'video_upload_label': 'Upload video file (max 200 MB)',
+        'select_video_or_drop': 'Select video or drag here',
+        'video_formats': 'MP4, WebM, OGG formats',
+        'file_url_cloud': 'File URL (cloud storage etc.)',
+        'file_url_preview': 'Validated file',
+        'add_url': 'Add URL',
+        'check': 'Check',
+        'file_url_optional_hint': 'If a file is found at the link, file upload is optional',
+        'file_upload_multiple': 'Upload file (multiple files allowed)',
+        'select_files_or_drop': 'Select files or drag here',
+        'file_formats_list': 'PDF, DOC, DOCX, XLS, XLSX, PPT, PPTX, TXT, ZIP, RAR',
+        'checking': 'Checking...',
+        'file_too_large_200': 'File size must not exceed 200 MB!',
+        'select_lesson_type_please': 'Please select lesson type!',
+        'video_required_for_lecture': 'Video is required for lecture! Upload video file or enter video URL.',
+        'upload_topic_file_please': 'Please upload topic file or enter file URL!',
+        'check_file_url_please': 'Please click the check file URL button!',
+        'file_not_found_upload': 'File not found at URL. Please upload file!',
+        'error_try_again': 'An error occurred. Please try again.',
+        'please_enter_url': 'Please enter URL!',
+        'url_or_file_hint': 'Enter URL or drag file here',
+        'switch_to_url': 'Enter via URL',
+        'upload_via_url': 'Upload via URL',
+        'video_url_preview': 'Validated video',
+        'video_url_playable': 'Video URL was validated. Due to YouTube restrictions, some videos may still fail to open inside the lesson.',
+        'video_url_not_playable': 'Video is not playable or was not found.',
+        'video_url_check_error': 'Error while checking video URL. Please try again.',
+        'check_video_url_please': 'Please click the check video URL button!',
+        'youtube_embed_fallback_hint': 'Some videos may not open inside the site due to YouTube restrictions.',
+        'watch_on_youtube': 'Watch on YouTube',
+        'current_video': 'Current video',
+        'current_files': 'Current file(s)',
+        'replace_existing_video_notice': 'If you upload a new video or enter a URL, the current one will be replaced',
+        'replace_existing_file_notice': 'If you upload a new file or enter a URL, current files will be replaced',
+        'file_checking': 'Checking file...',
+        'google_link_detected_optional': 'Google Drive/Sheets/Docs link detected. The link is considered available. File upload is now optional.',
+        'file_found_upload_optional': 'File found! File upload is now optional.',
+        'file_not_found_upload_required': 'File not found. File upload will be required.',
+        'selected_files_count': 'Selected files: {count}',
+        'add_file': '+ Add additional file',
+        'add_btn': 'Add',
+        'about_subject': 'About subject',
+        'no_assignments': 'No assignments',
+        'teacher_not_assigned': 'No teacher assigned',
+        'select_group': 'Select group',
+        'until_deadline': 'until 23:59',
+        'deadline': 'Deadline',
+        'graded': 'Graded',
+        'not_graded': 'Not graded',
+        'resubmit_available': 'Resubmit available',
+        'awaiting_grade': 'Awaiting grade',
+        'not_submitted': 'Not submitted',
+        'submitted': 'Submitted',
+        'max_score': 'Maximum score',
+        'submitted_count': 'Submitted',
+        'student_answers': 'Student answers',
+        'ungraded': 'not checked',
+        'assignment_description': 'Assignment description',
+        'related_topics': 'Related topics:',
+        'submitted_students': 'Submitted students',
+        'student': 'Student',
+        'submitted_at': 'Submitted at',
+        'feedback': 'Feedback',
+        'actions': 'Actions',
+        'attempts': 'Attempts',
+        'last': 'Last',
+        'no_answers': 'No answers',
+        'no_submissions_yet': 'No one has submitted an answer yet',
+        'unsubmitted_students': 'Unsubmitted students',
+        'all_submitted': 'All students have submitted',
+        'student_submission': 'Student submission',
+        'all_attempts_history': 'All attempts history',
+        'attempt': 'Attempt',
+        'resubmitted': 'Resubmitted',
+        'download': 'Download',
+        'file': 'file',
+        'grading': 'Grading',
+        'grade_for_latest': 'Grade (latest attempt)',
+        'cancel': 'Cancel',
+        'comment_optional': 'Comment (optional)',
+        'leave_comment': 'Leave a comment...',
+        'save': 'Save',
+        'edit': 'Edit',
+        'no_grade_permission': "You don't have permission to grade this assignment.",
+        'view': 'View',
+        'not_graded_yet': 'Not graded yet',
+        'answers_title': 'Answers',
+        'received_answers': 'Received answers',
+        'deadline_by': 'Deadline: {date}, until 23:59',
+        'overdue': 'Overdue',
+        'assimilation': 'Progress',
+        'across_all_subjects': 'Across all subjects',
+        'collected_points': 'Collected points',
+        'contract_payments': 'Contract payments',
+        'sum_currency': 'UZS',
+        'paid_label': 'Paid',
+        'remaining_label': 'Remaining',
+        'fully_paid': 'Fully paid',
+        'partially_paid': 'Partially paid',
+        'payment_required': 'Payment required',
+        'no_payment_info': 'No payment information',
+        'accounting_must_add_payment_info': 'Accounting department needs to add payment information',
+        'contract_amount_total': 'Contract amount',
+        'period_range': "Period (from – to)",
+        'remaining_payment': 'Remaining payment',
+        'overpayment_payment': 'Overpayment',
+        'overpayment_label': 'Overpayment',
+        'payment_history': 'Payment history',
+        'contract_by_year_title': "Contract amount by academic year",
+        'current_year_payment_title': "Current academic year payment",
+        'payment_amount_col': "Payment amount",
+        'payment_date_col': "Payment date",
+        'custom_contract_badge': "Custom",
+        'contract_short': 'Contract',
+        'updated_at_label': 'Updated',
+        'percent_paid_suffix': 'paid',
+        'view_all_subjects': 'View all subjects',
+        'upcoming_assignments': 'Upcoming assignments',
+        'deadline_until': 'until 23:59',
+        'deadline_label': 'Deadline',
+        'time_label': 'Time',
+        'subjects_not_assigned': 'No subjects assigned',
+        'all_filter': 'All',
+        'time_left': 'Time left:',
+        'deadline_passed_short': 'Not submitted',
+        'less_than_1_hour_left': 'Less than 1 hour left!',
+        'hours_left_suffix': 'hours left',
+        'due_tomorrow': 'Due tomorrow',
+        'days_left_suffix': 'days left',
+        'due_today': 'Due today!',
+        'description_label': 'Description',
+        'submissions_history': 'Submissions history',
+        'grade_for_attempt': 'Grade for this attempt:',
+        'teacher_feedback': "Teacher's feedback:",
+        'this_attempt_pending': 'This attempt is still pending...',
+        'edit_answer': 'Edit',
+        'resubmit_answer': 'Resubmit answer',
+        'submit_answer': 'Submit answer',
+        'attempts_left': '{n} attempts left',
+        'file_required': 'File required',
+        'overdue_no_resubmit': 'Assignment deadline has passed. Resubmission is not allowed.',
+        'max_attempts_reached': 'You have already submitted 3 times. Contact the teacher for additional attempts.',
+        'your_answer_optional': 'Your answer (optional)',
+        'write_answer': 'Write your answer...',
+        'upload_file': 'Upload file',
+        'optional': '(optional)',
+        'select_file_or_drop': 'Select file or drop here',
+        'file_formats_hint': 'PDF, DOC, DOCX, JPG, PNG, etc. (max. 10 MB)',
+        'uploaded_file': 'Uploaded file',
+        'edit_answer_modal': 'Edit answer',
+        'your_answer': 'Your answer',
+        'update_file_optional': 'Update file (optional)',
+        'resubmit_btn': 'Resubmit',
+        'submit_btn': 'Submit',
+        'file_size_limit': 'File size must not exceed {max} MB!',
+        'file_size_label': 'Size: {size} MB',
+        'grade_below_threshold_comment': 'Comment is required when grade is below passing score ({threshold})!',
+        'answer': 'answer',
+        'answers': 'answer',
+        'locked': 'Locked',
+        'watch_previous_videos': 'Please watch all previous videos first',
+        'video_lesson': 'Video lesson',
+        'topic_files': 'Topic files',
+        'topic_file': 'Topic file',
+        'download_file': 'Download file',
+        'download_file_external': 'Download file (External source)',
+        'lesson_content': 'Lesson content',
+        'video_locked': 'Video lesson locked',
+        'video_watch_previous': 'Please watch all previous video lessons first',
+        'video_completed': 'Video lesson completed!',
+        'video_completed_desc': 'You have successfully completed this video lesson',
+        'watch_again': 'Watch again',
+        'watch_video_lesson': 'Watch video lesson',
+        'watch_video_and_checks': 'Watch the video and complete the checks',
+        'lesson_progress': 'Lesson progress',
+        'check_label': 'Check',
+        'completed_at': 'Completed',
+        'attention_check_title': 'ATTENTION CHECK!',
+        'video_watching_question': 'Are you watching the video lesson?',
+        'video_restart_warning': 'Otherwise the video will restart!',
+        'answer_time': 'Time to answer:',
+        'seconds_unit': 'seconds',
+        'yes_watching': 'Yes, I am watching',
+        'congratulations': 'Congratulations! 🎉',
+        'lesson_completed_success': 'You have successfully completed the lesson and passed all checks',
+        'attention_check_failed': 'You did not pass the attention check!',
+        'video_not_supported': 'Your browser does not support video.',
+        'material_studied': 'Material studied',
+        'confirm_delete': 'Are you sure you want to delete?',
+        'current_teacher': 'Current',
+        'no_lessons_added_yet': 'lessons not added yet',
+        'no_results': 'No results found',
+        'searching': 'Searching...',
+        'create_direction_title': 'Create direction',
+        'create_direction_page_title': 'New direction',
+        'direction_code_max_hint': 'Maximum 15 digits',
+        'direction_code_placeholder': '60410100',
+        'faculty_suffix': 'faculty',
+        'no_groups': 'No groups',
+        'no_directions': 'No directions',
+        'enrollment_year_not_set': 'Enrollment year not set',
+        'education_type_not_set': 'Education type not set',
+        'directions_count_ta': 'directions',
+        'faculty_no_directions_groups': 'This faculty has no directions or groups yet',
+        'faculty': 'Faculty',
+        'faculties': 'Faculties',
+        'groups_title': 'Groups',
+        'directions_title': 'Directions',
+        'groups_only_active_hint': 'Only groups with students (active)',
+        'course_label': 'Course',
+        'semester_label': 'Semester',
+        'direction_label': 'Direction',
+        'search_label': 'Search',
+        'start_creating_group': 'Start creating a new group',
+        'group_description_placeholder': 'Brief description of the group (optional)',
+        'direction_name_placeholder': 'Software engineering',
+        'create_direction_button': 'Create direction',
+        'modal_groups_title': 'Groups',
+        'groups_active': 'Groups (active)',
+        'groups_stats': 'Statistics by groups',
+        'modal_directions_title': 'Directions',
+        'directions_empty_hint': 'Directions with groups are shown here. Change faculty or search.',
+        
+        # ============================================
+        # GROUP STUDENTS PAGE
+        # ============================================
+        'group_students_title': "{group_name} group students",
+        'group_students_page_title': "{group_name} students",
+        'students_list': "Students list",
+        'select_all': "Select all",
+        'selected_count': "Selected",
+        'remove_selected_from_group': "Remove selected from group",
+        'confirm_remove_students': "Are you sure you want to remove selected students from the group?",
+        'no_students_in_group': "No students in this group yet",
+        'add_student': "Add student",
+        'add_student_hint': "You can select multiple students",
+        'select_students': "Select students",
+        'add_selected_students': "Add selected students",
+        'no_available_students': "No available students to add",
+        'student_unit': "student",
+        'education_suffix': "education",
+        
+        # ============================================
+        # MESSAGES
+        # ============================================
+        'messages': 'Messages',
+        'messages_page_subtitle': 'Conversations and messages',
+        'chat_title_with': 'Chat with',
+        'chat_start_conversation': 'Start the conversation!',
+        'message_placeholder': 'Write a message...',
+        'ai_advisor': 'AI Advisor',
+        'new_conversation': 'New conversation',
+        'no_messages': 'No messages',
+        'no_conversations_yet': 'No conversations yet',
+        'new_conversation_modal_title': 'Start new conversation',
+        'ai_advisor_modal_subtitle': 'Distance learning advisor',
+        'electronic_library': 'Electronic library',
+        'electronic_library_subtitle': 'University electronic library — unilibrary.uz',
+        'electronic_library_lang_hint': 'To change the language, use the language switcher on the library page.',
+        'announcements': 'Announcements',
+        'announcements_subtitle': 'Important news and updates',
+        'delete_all_announcements': 'Delete all announcements',
+        'new_announcement': 'New announcement',
+        'no_announcements': 'No announcements',
+        'confirm_delete_announcement': 'Are you sure you want to delete this announcement?',
+        'confirm_delete_all_announcements': 'Are you sure you want to delete all announcements? This action cannot be undone!',
+        'back_to_announcements': 'Back to announcements',
+        'create_announcement_title': 'Create new announcement',
+        'create_announcement_subtitle': 'Send an announcement to all users',
+        'title_label': 'Title',
+        'announcement_title_placeholder': 'Enter announcement title',
+        'content_label': 'Text',
+        'announcement_content_placeholder': 'Enter announcement text...',
+        'who_should_see': 'Who should see it?',
+        'mark_as_important_announcement': 'Mark as important announcement',
+        'reklamalar': 'Advertisements',
+        'reklamalar_description': 'List of flash messages and advertisements',
+        'face_logs_title': 'Hikvision log',
+        'face_logs_description': 'Face recognition logs from Hikvision devices (superadmin only)',
+        'face_logs_device_employee_id': 'Employee ID',
+        'face_logs_person': 'Person',
+        'face_logs_picture': 'Picture',
+        'face_logs_event_time': 'Event Time',
+        'face_logs_event_day': 'Event day',
+        'face_logs_device_ip': 'Device IP',
+        'face_logs_external_ip': 'External IP',
+        'face_logs_created': 'Received',
+        'face_logs_raw': 'Raw data',
+        'face_logs_raw_button': 'Raw',
+        'face_logs_empty': 'No logs found',
+        'face_logs_search_placeholder': 'Search by name or F.ID...',
+        'face_logs_clear_btn': 'Clear logs',
+        'face_logs_clear_confirm': 'All face recognition logs will be deleted. Continue?',
+        'face_logs_cleared': 'Logs cleared',
+        'face_logs_last_request': 'Last request received',
+        'face_logs_diagnostic': 'Diagnostic:',
+        'face_logs_no_request_yet': 'No requests received yet. Check server:',
+        'face_logs_ping_link': 'Ping',
+        'face_logs_check_device': '— if it opens, in device settings (HTTP Notification / Linkage) link face recognition event to URL: .../face-api/receive or .../face-api/receive.php',
+        'face_logs_backfill': 'Backfill employee IDs from old logs',
+        'face_logs_table_created': 'face_logs table created; refresh the page.',
+        'face_logs_query_error': 'Error reading logs (table missing?). Error: %s',
+        'staff_attendance_title': 'Staff attendance',
+        'staff_attendance_description': 'Daily staff attendance from Hikvision face log',
+        'student_attendance_title': 'Student attendance',
+        'student_attendance_description': 'Daily student attendance',
+        'kpi_report_title': 'KPI report',
+        'kpi_report_description': 'Staff KPI report',
+        'live_monitor_title': 'Live monitor',
+        'live_monitor_description': 'Real-time attendance view',
+        'attendance_compute': 'Compute attendance',
+        'attendance_computed': 'Attendance computed',
+        'staff_name': 'Staff',
+        'student_name': 'Student',
+        'first_entry': 'First entry',
+        'last_exit': 'Last exit',
+        'late_minutes': 'Late (min)',
+        'work_duration': 'Work duration',
+        'status': 'Status',
+        'kpi_score': 'KPI',
+        'status_ontime': 'On time',
+        'status_late': 'Late',
+        'status_serious_late': 'Serious late',
+        'status_absent': 'Absent',
+        'status_present': 'Present',
+        'days_count': 'Days',
+        'total_kpi': 'Total KPI',
+        'avg_kpi': 'Avg KPI',
+        'student_arrived': 'Student arrived',
+        'live_monitor_waiting': 'Waiting for Hikvision logs...',
+        'live_monitor_connected': 'Connected. New logs appear here.',
+        'live_monitor_disconnected': 'Disconnected.',
+        'live_monitor_no_socket': 'WebSocket not connected',
+        'filter': 'Filter',
+        'no_data': 'No data',
+        'flash_xabar_qoshish': 'Add flash message',
+        'flash_xabar_current': 'Current flash message',
+        'flash_xabar_url': 'URL',
+        'flash_xabar_status': 'Status',
+        'enabled': 'Enabled',
+        'disabled': 'Disabled',
+        'flash_xabar_not_set': 'Flash message is not set.',
+        'flash_xabar_settings': 'Flash message settings',
+        'flash_xabar_text': 'Message text',
+        'flash_xabar_text_placeholder': 'Enter flash message text...',
+        'flash_xabar_url_label': 'URL (optional)',
+        'flash_xabar_date_from': 'From',
+        'flash_xabar_date_to': 'To',
+        'flash_xabar_date_hint': 'If dates are left empty, the message is shown without a time limit.',
+        'flash_xabar_color': 'Text color',
+        'flash_xabar_color_white': 'White',
+        'flash_xabar_color_red': 'Red',
+        'flash_xabar_enabled': 'Activate',
+        'flash_xabar_saved': 'Flash message saved.',
+        'flash_xabar_deleted': 'Flash message deleted.',
+        'flash_xabar_confirm_delete': 'Delete this flash message?',
+        'flash_xabar_toggle_off': 'Hide',
+        'publish_announcement': 'Publish',
+        'edit_announcement_title': 'Edit announcement',
+        'edit_announcement_subtitle': 'Update announcement details',
+        'schedule': 'Schedule',
+        'add_to_schedule': 'Add to schedule',
+        'edit_schedule': 'Edit schedule',
+        'select_faculty_placeholder': 'Select faculty...',
+        'select_course_placeholder': 'Select course...',
+        'select_semester_placeholder': 'Select semester...',
+        'select_direction_placeholder': 'Select direction...',
+        'select_subject_placeholder': 'Select subject...',
+        'select_teacher_placeholder': 'Select teacher...',
+        'schedule_date_label': 'Date',
+        'start_time_label': 'Start time',
+        'online_link_label': 'Online consultation link',
+        'online_link_placeholder': 'Zoom, Teams or other link...',
+        'add_to_schedule_btn': 'Add to schedule',
+        'save_changes': 'Save changes',
+        'all_teachers': 'All teachers',
+        'start_date': 'Start date',
+        'end_date': 'End date',
+        'date_placeholder': 'dd.mm.yyyy',
+        'confirm_delete_lesson': 'Are you sure you want to delete this lesson topic?',
+        'confirm_delete_assignment': 'Are you sure you want to delete this assignment?',
+        'unknown': 'Unknown',
+        'group_label': 'Group',
+        'type_label': 'Type',
+        'join_lesson': 'Join lesson',
+        'month_1': 'January',
+        'month_2': 'February',
+        'month_3': 'March',
+        'month_4': 'April',
+        'month_5': 'May',
+        'month_6': 'June',
+        'month_7': 'July',
+        'month_8': 'August',
+        'month_9': 'September',
+        'month_10': 'October',
+        'month_11': 'November',
+        'month_12': 'December',
+        'day_monday': 'Monday',
+        'day_tuesday': 'Tuesday',
+        'day_wednesday': 'Wednesday',
+        'day_thursday': 'Thursday',
+        'day_friday': 'Friday',
+        'day_saturday': 'Saturday',
+        'day_sunday': 'Sunday',
+        'edit_faculty_title': 'Edit faculty',
+        'create_faculty_page_title': 'Create faculty',
+        'faculty_name_label': 'Faculty name *',
+        'faculty_name_placeholder': 'Faculty of Information Technology',
+        'faculty_name_uz': 'Faculty name (Uzbek)',
+        'faculty_name_ru': 'Faculty name (Russian)',
+        'faculty_name_en': 'Faculty name (English)',
+        'faculty_name_example_uz': "Masalan: Axborot texnologiyalari fakulteti",
+        'faculty_name_example_ru': 'Например: Факультет информационных технологий',
+        'faculty_name_example_en': 'e.g. Faculty of Information Technology',
+        'faculty_description_placeholder_uz': "Fakultet haqida qisqacha ma'lumot...",
+        'faculty_description_placeholder_ru': "Краткое описание факультета...",
+        'faculty_description_placeholder_en': "Brief description of the faculty...",
+        'faculty_sync_translate': 'Translate to other languages',
+        'faculty_sync_empty': 'Enter text in this field first',
+        'faculty_name_required': 'Faculty name is required in at least one language',
+        'faculty_name_all_languages_required': 'Faculty name is required in all languages (Uzbek, Russian, English)',
+        'code_label': 'Code *',
+        'code_placeholder': 'IT',
+        'code_short_hint': 'Short code (auto-uppercase)',
+        'faculty_description_placeholder': 'Brief description of the faculty...',
+        'faculty_description_uz': 'Description (Uzbek)',
+        'faculty_description_ru': 'Description (Russian)',
+        'faculty_description_en': 'Description (English)',
+        'faculty_dean_select_placeholder': 'Select dean...',
+        'faculty_dean_add_btn': 'Add dean',
+        'responsible_deans_select_hint': 'You can select multiple deans.',
+        'responsible_deans_multiple_hint': 'You can select multiple deans. Unselected deans will be removed from the faculty.',
+        'no_deans': 'No deans available',
+        'edit_direction_title': 'Edit direction',
+        'faculty_label': 'Faculty *',
+        'direction_code_label': 'Code *',
+        'direction_name_label': 'Name *',
+        'direction_name_uz': 'Direction name (Uzbek)',
+        'direction_name_ru': 'Direction name (Russian)',
+        'direction_name_en': 'Direction name (English)',
+        'direction_description_uz': 'Description (Uzbek)',
+        'direction_description_ru': 'Description (Russian)',
+        'direction_description_en': 'Description (English)',
+        'direction_sync_translate': 'Translate to other languages',
+        'direction_sync_empty': 'Enter text in this field first',
+        'direction_name_all_languages_required': 'Direction name is required in all languages (Uzbek, Russian, English)',
+        'edit_subject_title': 'Edit subject',
+        'subject_name_label': 'Subject name *',
+        'subject_description_placeholder': 'Brief description of the subject...',
+        'edit_user_title': 'Edit user',
+        'full_name_label': 'Full name *',
+        'optional_short': 'Optional',
+        'roles_label': 'Roles *',
+        'multiple_roles_hint': 'You can select multiple roles',
+        'active_status': 'Active status',
+        'student_info_section': 'Student information',
+        'teacher_info_section': 'Teacher information',
+        'dean_info_section': 'Dean information',
+        'change_password_section': 'Change password',
+        'password_leave_blank_placeholder': 'Leave blank if you do not want to change',
+        'select_group_placeholder': 'Select group...',
+        'enrollment_year_label': 'Enrollment year',
+        'enrollment_year_placeholder': 'Example: 2025',
+        'department_label': 'Department',
+        'departments': 'Departments',
+        'department': 'Department',
+        'select_department': 'Select department',
+        'select_departments': 'Select departments',
+        'select_multiple_departments_hint': 'You can select multiple departments',
+        'add_department': 'Add department',
+        'my_departments': 'My departments',
+        'my_department': 'My Department',
+        'no_subjects_found': 'No subjects found',
+        'department_subjects_teachers': 'Department subjects and teachers',
+        'all_departments': 'All departments',
+        'search_subject': 'Search subject',
+        'search_teacher': 'Search teacher',
+        'no_teachers_found': 'No teachers found',
+        'in_department': 'In department',
+        'active_groups': 'Active groups',
+        'teachers_count': 'Teachers count',
+        'subjects_count': 'Subjects count',
+        'all_departments_list': 'All departments list',
+        'new_department': 'New department',
+        'create_department_page_title': 'Create department',
+        'edit_department_page_title': 'Edit department',
+        'department_name_label': 'Department name',
+        'department_name_placeholder': 'e.g. Software Engineering',
+        'department_name_example_uz': "Masalan: Dasturiy injiniring",
+        'department_name_example_ru': "Например: Программная инженерия",
+        'department_name_example_en': "e.g. Software Engineering",
+        'department_name_uz': 'Department name (Uzbek)',
+        'department_name_ru': 'Department name (Russian)',
+        'department_name_en': 'Department name (English)',
+        'department_name_all_languages_required': 'Department name is required in all languages',
+        'department_sync_translate': 'Translate to other languages',
+        'department_sync_empty': 'Enter text in this field first',
+        'department_migration_required': 'Department table needs to be updated. Run: flask db upgrade',
+        'department_description_placeholder': 'Brief description of department...',
+        'no_departments': 'No departments',
+        'start_creating_department': 'Create your first department',
+        'items': 'items',
+        'add_teacher': 'Add teacher',
+        'please_select_subject': 'Please select a subject',
+        'please_select_teacher': 'Please select a teacher',
+        'subject_added_to_department': '"{name}" added to department',
+        'subject_removed_from_department': '"{name}" removed from department',
+        'teacher_added_to_department': '"{name}" added to department',
+        'teacher_removed_from_department': 'Teacher removed from department',
+        'teacher_not_found': 'Teacher not found',
+        'teacher_already_in_department': 'Teacher is already in department',
+        'confirm_remove_subject_from_department': 'Remove this subject from department?',
+        'confirm_remove_teacher_from_department': 'Remove teacher from department?',
+        'no_subjects_in_department': 'No subjects in department',
+        'no_teachers_in_department': 'No teachers in department',
+        'department_created': 'Department "{name}" created',
+        'department_updated': 'Department updated',
+        'department_deleted': 'Department "{name}" deleted',
+        'confirm_delete_department': 'Delete this department?',
+        'add_subjects_teachers': 'Add subject / teacher',
+        'assignments_saved': 'Assignments saved',
+        'select_department_placeholder': 'Select department...',
+        'department_heads_label': 'Department heads',
+        'department_heads_placeholder': 'Select staff (multiple allowed)',
+        'department_head_add_btn': 'Add department head',
+        'staff_add_department_btn': 'Add department',
+        'staff_add_faculty_btn': 'Add faculty',
+        'department_head_select_placeholder': 'Select staff...',
+        'department_head_must_select_department': 'Department head must select a department',
+        'department_required_for_department_head': 'Department selection is required for department head',
+        'department_not_found': 'Selected department not found',
+        'position_label': 'Position',
+        'select_faculty_placeholder': 'Select faculty...',
+        'edit_schedule_title': 'Edit schedule entry',
+        'edit_payment_title': 'Edit payment',
+        'back_to_payments': 'Back to payments',
+        'contract_amount_label': 'Contract amount (sum) *',
+        'paid_amount_label': 'Paid amount (sum) *',
+        'academic_year_label': 'Academic year',
+        'semester_1_2': '1st semester',
+        'semester_2_2': '2nd semester',
+        'notes_label': 'Additional notes',
+        'notes_placeholder': 'Additional information...',
+        'schedule_date_label': 'Date *',
+        'start_time_label': 'Start time *',
+        'online_consultation_link_placeholder': 'Zoom, Teams or other link...',
+        
+        # ============================================
+        # AUTH PAGES (LOGIN, REGISTER, FORGOT, RESET)
+        # ============================================
+        'sign_in_to_account': 'Sign in to your account',
+        'login_talaba_email_label': 'Login / Student ID / Email',
+        'login_placeholder': 'Login, Student ID or Email',
+        'remember_me': 'Remember me',
+        'forgot_password_link': 'Forgot password?',
+        'register_title': 'Register',
+        'register_subtitle': 'Create a new account',
+        'create_account_button': 'Register',
+        'have_account': 'Already have an account?',
+        'sign_in_link': 'Sign in',
+        'forgot_password_title': 'Forgot password?',
+        'forgot_password_subtitle': 'Enter login, Student ID or email',
+        'only_teachers_students': 'For teachers and students only',
+        'check_button': 'Check',
+        'passport_series_label': 'Passport series and number',
+        'passport_placeholder': 'AB1234567',
+        'enter_passport_series': 'Enter passport series and number',
+        'reset_to_initial_button': 'Reset password to initial',
+        'back_to_login': '← Back to login page',
+        'set_new_password_title': 'Set new password',
+        'set_new_password_for': 'Enter new password for {full_name}',
+        'new_password_label': 'New password',
+        'min_6_chars': 'At least 6 characters',
+        'change_password_button': 'Change password',
+        
+        # ============================================
+        # GRADE SCALE
+        # ============================================
+        'grade_scale': 'Grade Scale',
+        'excellent': 'Excellent',
+        'good': 'Good',
+        'satisfactory': 'Satisfactory',
+        'poor': 'Poor',
+        'failed': 'Failed',
+        
+        # ============================================
+        # FLASH MESSAGES - AUTH
+        # ============================================
+        'no_access_permission': "You do not have permission to access this page",
+        'account_blocked': 'Your account has been blocked',
+        'invalid_login_credentials': "Invalid login, email, student ID or password",
+        'logout_success': "You have successfully logged out",
+        'registration_closed': "Registration is closed. Please contact the administrator.",
+        'login_required_input': "Please enter login, student ID or email",
+        'user_not_found_by_credentials': "User with this login, student ID or email not found",
+        'function_only_for_teachers_students': "This function is only available for teachers and students",
+        'passport_number_required_input': "Please enter passport series and number",
+        'user_not_found': "User not found",
+        'incorrect_passport_number': "Incorrect passport series and number",
+        'passport_not_available': "User does not have passport series and number",
+        'token_not_found_or_used': "Token not found or already used",
+        'token_expired': "Token has expired. Please submit a new request",
+        'passwords_do_not_match': "Passwords do not match",
+        'password_min_length': "Password must contain at least 6 characters",
+        'password_min_length_8': "Password must contain at least 8 characters",
+        'password_changed_success': "Password successfully changed! Now log in to the system",
+        'password_changed_success_short': "Password successfully changed",
+        'password_reset_success': "Password successfully reset! Password: {new_password}",
+        'user_password_reset': "{full_name}'s password has been reset. New password: {new_password}",
+        'student_password_reset': "{full_name}'s password has been reset. New password: {new_password}",
+        'no_permission_for_role': "You do not have access to this role",
+        
+        # ============================================
+        # FLASH MESSAGES - VALIDATION ERRORS
+        # ============================================
+        'login_required_field': "Login is a required field",
+        'login_required_for_staff': "Login is a required field (for staff)",
+        'login_already_exists': "This login already exists",
+        'login_already_exists_other_user': "This login already exists for another user",
+        'student_id_required': "Student ID is a required field",
+        'student_id_required_for_students': "Student ID is a required field (for students)",
+        'student_id_already_exists': "This student ID already exists",
+        'student_id_already_exists_other_student': "This student ID already exists for another student",
+        'email_already_exists': "This email already exists",
+        'email_already_exists_other_user': "This email already exists for another user",
+        'email_already_exists_other_student': "This email already exists for another student",
+        'email_used_by_another_user': "This email is already used by another user",
+        'login_used_by_another_user': "This login is already used by another user",
+        'passport_required': "Passport series and number are required",
+        'initial_password_passport': "Initial password: passport series and number",
+        'passport_not_available_for_user': "This user does not have passport series and number",
+        'passport_not_available_for_student': "This student does not have passport series and number",
+        'birthdate_invalid_format': "Invalid birthdate format (yyyy-mm-dd)",
+        'date_invalid_format': "Invalid date format",
+        'date_invalid_format_use_calendar': "Invalid date format. Please select from the calendar.",
+        'date_required': "Date is required",
+        'date_required_select': "Date is required.",
+        'all_required_fields': "All required fields must be filled",
+        'all_fields_required': "All fields must be filled",
+        'at_least_one_role_required': "At least one role must be selected",
+        'code_already_exists': "This code already exists",
+        'invalid_request': "Invalid request",
+        'title_and_text_required': "Title and text are required",
+        'message_cannot_be_empty': "Message cannot be empty",
+        'new_passwords_do_not_match': "New passwords do not match",
+        
+        # ============================================
+        # FLASH MESSAGES - PERMISSION ERRORS
+        # ============================================
+        'no_permission_for_operation': "You do not have permission for this operation",
+        'no_permission_for_action': "You do not have permission for this action",
+        'no_permission_to_edit_group': "You do not have permission to edit this group",
+        'no_permission_to_delete_group': "You do not have permission to delete this group",
+        'no_permission_to_view_group': "You do not have permission to view this group",
+        'no_permission_to_add_students_to_group': "You do not have permission to add students to this group",
+        'no_permission_to_edit_student': "You do not have permission to edit this student",
+        'no_permission_to_create_announcement': "You do not have permission to create an announcement",
+        'no_permission_to_edit_announcement': "You do not have permission to edit this announcement",
+        'no_permission_to_delete_announcement': "You do not have permission to delete this announcement",
+        'no_permission_to_delete_all_announcements': "You do not have permission to delete all announcements",
+        'no_permission_to_chat': "You do not have permission to chat with this user",
+        'no_permission_to_view_course': "You do not have permission to view this course",
+        'no_permission_to_edit_course': "You do not have permission to edit this course",
+        'no_permission_to_delete_course': "You do not have permission to delete this course",
+        'no_permission_to_view_lesson': "You do not have permission to view this lesson",
+        'no_permission_to_edit_lesson': "You do not have permission to edit this lesson",
+        'no_permission_to_delete_lesson': "You do not have permission to delete this lesson",
+        'no_permission_to_view_assignment': "You do not have permission to view this assignment",
+        'no_permission_to_edit_assignment': "You do not have permission to edit this assignment",
+        'no_permission_to_delete_assignment': "You do not have permission to delete this assignment",
+        'no_permission_to_view_submission': "You do not have permission to view this submission",
+        'no_permission_to_edit_submission': "You do not have permission to edit this submission",
+        'no_permission_to_delete_submission': "You do not have permission to delete this submission",
+        'no_permission_to_view_grade': "You do not have permission to view this grade",
+        'no_permission_to_edit_grade': "You do not have permission to edit this grade",
+        'no_permission_to_delete_grade': "You do not have permission to delete this grade",
+        
+        # ============================================
+        # FLASH MESSAGES - USER OPERATIONS
+        # ============================================
+        'user_created_with_role': "{role} successfully created",
+        'user_status_changed': "User {status}",
+        'user_updated': "User successfully updated",
+        'user_deleted': "User deleted",
+        'clear_staff': "Clear staff",
+        'confirm_clear_staff': "Delete all staff? This action cannot be undone!",
+        'staff_cleared': "{count} staff members deleted",
+        'clear_students': "Clear students",
+        'confirm_clear_students': "Delete all students? This action cannot be undone!",
+        'students_cleared': "{count} students deleted",
+        'clear_departments': "Clear departments",
+        'confirm_clear_departments': "Delete all departments? This action cannot be undone!",
+        'departments_cleared': "{count} departments deleted",
+        'clear_subjects': "Clear subjects",
+        'confirm_clear_subjects': "Delete all subjects? This action cannot be undone!",
+        'subjects_cleared': "{count} subjects deleted",
+        'staff_deleted': "{staff_name} deleted",
+        'staff_created': "Staff member {full_name} successfully created",
+        'staff_create_error': "Error saving staff. Please check the data.",
+        'staff_updated': "Staff member {full_name} information updated",
+        'profile_updated': "Information successfully updated",
+        'profile_role_changed': "Profile changed to {role_name} role. Now you are working as {role_name}.",
+        'cannot_block_yourself': "You cannot block yourself",
+        'cannot_delete_yourself': "You cannot delete yourself",
+        'cannot_delete_superadmin': "Superadmin account cannot be deleted.",
+        'only_superadmin_can_modify': "Only superadmin can edit, toggle activity, or reset password for the superadmin account.",
+        'user_not_staff': "This is a student, not a staff member",
+        'user_not_student': "This user is not a student",
+        'user_not_superadmin': "This user is not a superadmin",
+        'full_name_required': "Full name is required",
+        'password_required': "Password is required",
+        'email_already_used': "This email is already in use",
+        'superadmins_section': "Superadmins",
+        'superadmins_database': "Superadmins database",
+        'all_superadmins_list': "All superadmins list",
+        'new_superadmin': "New superadmin",
+        'create_superadmin_title': "Add superadmin",
+        'edit_superadmin_title': "Edit superadmin",
+        'superadmin_created': "Superadmin {full_name} successfully added",
+        'superadmin_updated': "Superadmin {full_name} updated",
+        'superadmin_deleted': "Superadmin deleted",
+        'config_superadmin_cannot_delete': "The main config superadmin account cannot be deleted",
+        'cannot_delete_last_superadmin': "Cannot delete the last superadmin (at least one must remain)",
+        
+        # ============================================
+        # FLASH MESSAGES - FACULTY OPERATIONS
+        # ============================================
+        'faculty_created': "Faculty successfully created",
+        'faculty_updated': "Faculty successfully updated",
+        'faculty_deleted': "Faculty «{faculty_name}» and all its directions, groups deleted",
+        'faculty_not_found': "Faculty not found",
+        'faculty_required': "Faculty selection is required",
+        'faculty_selected_not_found': "Selected faculty not found",
+        'faculty_incorrect_selection': "Faculty incorrectly selected",
+        'faculty_not_assigned': "Faculty not assigned to you",
+        'faculty_required_for_dean': "If dean role is selected, faculty selection is required",
+        'faculty_has_students': "Faculty has {students_count} students. To delete faculty, first transfer or delete students",
+        'responsible_deans_changed': "Responsible deans successfully changed",
+        
+        # ============================================
+        # FLASH MESSAGES - DIRECTION OPERATIONS
+        # ============================================
+        'direction_created': "Direction successfully created",
+        'direction_updated': "Direction updated",
+        'direction_deleted': "Direction deleted",
+        'direction_required': "Direction selection is required",
+        'direction_incorrect_selection': "Incorrect direction selected",
+        'direction_name_and_code_required': "Direction name and code are required",
+        'direction_name_and_code_required_fill': "Direction name and code must be filled",
+        'direction_code_digits_only': "Direction code must contain only digits",
+        'direction_already_exists': "Direction with this code, course, semester and education type already exists",
+        'direction_code_already_exists': "Direction with this code already exists",
+        'direction_has_groups_and_students': "Direction has {groups_count} groups and {total_students} students. Cannot delete",
+        'direction_has_groups': "Direction has {groups_count} groups. First delete or transfer groups to another direction",
+        'direction_no_groups': "Direction has no groups",
+        'groups_assigned_to_direction': "Groups assigned to direction",
+        'directions_and_groups_imported': "{d_count} directions and {g_count} groups imported",
+        
+        # ============================================
+        # FLASH MESSAGES - GROUP OPERATIONS
+        # ============================================
+        'group_created': "Group successfully created",
+        'group_updated': "Group updated",
+        'group_deleted': "Group deleted",
+        'group_name_required': "Group name is required",
+        'group_already_exists': "Group with this name already exists in this direction, course and semester",
+        'group_course_and_semester_required': "Course and semester are required",
+        'group_all_fields_required': "Course, semester and education type are required",
+        'group_has_students': "Group has students. Cannot delete",
+        'group_has_students_transfer_first': "Group has students. First transfer students to another group",
+        'no_groups_for_year_education_type': "No groups for year {year} with education type {education_type}",
+        'no_active_groups_for_semester': "No active groups found for semester {semester}",
+        
+        # ============================================
+        # FLASH MESSAGES - STUDENT OPERATIONS
+        # ============================================
+        'student_created': "{full_name} successfully created",
+        'student_updated': "{full_name} information updated",
+        'student_deleted': "{student_name} deleted",
+        'student_status_changed': "Student {full_name} {status}",
+        'students_added_to_group': "{added_count} students added to group",
+        'student_removed_from_group': "{full_name} removed from group",
+        'students_removed_from_group': "{count} students removed from group",
+        'no_students_selected': "No students selected",
+        'no_students_added': "No students added. Selected students may already be assigned to another group",
+        'no_students_removed': "No students removed from group",
+        
+        # ============================================
+        # FLASH MESSAGES - SUBJECT OPERATIONS
+        # ============================================
+        'subject_name_required': "Subject name is a required field",
+        'subject_name_all_languages_required': "Subject name is required in all languages (Uzbek, Russian, English)",
+        'subject_created': "Subject successfully created",
+        'subject_updated': "Subject updated",
+        'subject_deleted': "Subject deleted",
+        'subject_not_in_curriculum': "Subject is no longer used in any curriculum. You can delete it.",
+        'subject_removed_from_all_curriculums': "«{subject_name}» removed from all curriculums ({deleted} entries). Now you can delete the subject.",
+        'subject_not_found': "Selected subject not found",
+        
+        # ============================================
+        # FLASH MESSAGES - CURRICULUM OPERATIONS
+        # ============================================
+        'subjects_added_to_curriculum': "{added} subjects added to curriculum",
+        'curriculum_updated': "Curriculum for semester {semester} updated",
+        'subject_removed_from_curriculum': "Subject removed from curriculum",
+        'curriculum_import_success': "Success! {imported} new added, {updated} updated.",
+        'curriculum_import_subjects_created': "{subjects_created} new subjects created.",
+        'curriculum_import_errors': "{errors_count} errors occurred.",
+        'subject_already_in_semester': "Subject {subject_name} already exists in this semester",
+        'subject_replaced': "Subject replaced with {new_subject_name}",
+        'subject_and_semester_required': "Subject and semester selection is required",
+        'new_subject_not_selected': "New subject not selected",
+        'semester_not_selected': "Semester not selected",
+        'semester_teachers_saved': "Teachers for semester {semester} successfully saved",
+        
+        # ============================================
+        # FLASH MESSAGES - SCHEDULE OPERATIONS
+        # ============================================
+        'schedule_added': "Added to class schedule",
+        'schedule_updated': "Class schedule updated",
+        'schedule_deleted': "Schedule deleted",
+        'schedules_imported': "{count} schedules successfully imported",
+        'zoom_links_queued': "Zoom links for {count} lessons are being created in the background",
+        'teacher_not_assigned_to_lesson_type': "This teacher is not assigned a lesson type for this group and subject",
+        'lesson_already_exists_at_time': "At this time ({start_time}) the group already has a lesson: {existing_subject}",
+        
+        # ============================================
+        # FLASH MESSAGES - GRADING SYSTEM
+        # ============================================
+        'grade_letter_already_exists': "This grade letter already exists",
+        'min_score_greater_than_max': "Minimum score cannot be greater than maximum",
+        'grade_added': "Grade successfully added",
+        'grade_updated': "Grade updated",
+        'grade_deleted': "Grade deleted",
+        'grade_required': "Grade is required",
+        'grade_assigned': "Grade successfully assigned",
+        'grading_system_reset': "Grading system reset to default state",
+        
+        # ============================================
+        # FLASH MESSAGES - COURSE/LESSON/ASSIGNMENT
+        # ============================================
+        'course_name_required': "Course name is required",
+        'course_created': "Course successfully created",
+        'course_updated': "Course updated",
+        'course_deleted': "Course deleted",
+        'lesson_name_required': "Lesson name is required",
+        'lesson_created': "Lesson successfully created",
+        'lesson_created_for_groups': "Lesson successfully added for {created_count} groups",
+        'lesson_updated': "Lesson updated",
+        'lesson_deleted': "Lesson deleted",
+        'lesson_cannot_delete_has_assignments': "Cannot delete this topic! The following assignments are linked to it: {assignments_list}",
+        'assignment_name_required': "Assignment name is required",
+        'assignment_created': "Assignment successfully created",
+        'assignment_created_for_groups': "Assignment successfully created for {created_count} groups",
+        'assignment_updated': "Assignment updated",
+        'assignment_deleted': "Assignment deleted",
+        'submission_text_required': "Submission text is required",
+        'submission_submitted': "Submission successfully submitted",
+        'submission_resubmitted': "Your submission resubmitted ({resubmission_count}/3)",
+        'submission_updated': "Submission updated",
+        'submission_deleted': "Submission deleted",
+        'submission_wait_for_grade': "You cannot submit a new answer until the teacher has graded your previous one.",
+        'teacher_not_assigned_to_lesson_type_direction': "You are not assigned to the selected lesson type in this direction. You can only create lessons for lesson types assigned to you.",
+        'teacher_not_assigned_to_new_lesson_type': "You are not assigned to lesson type '{lesson_type}' in this direction. You can only modify lesson types assigned to you.",
+        'teacher_not_assigned_to_assignment_lesson_type': "You are not assigned to the selected lesson type in this direction.",
+        'teacher_not_assigned_for_grading': "You are not assigned to lesson type '{lesson_type}' in this direction. You can only grade for lesson types assigned to you.",
+        
+        # ============================================
+        # FLASH MESSAGES - ANNOUNCEMENTS
+        # ============================================
+        'announcement_created': "Announcement successfully created",
+        'announcement_updated': "Announcement successfully updated",
+        'announcement_deleted': "Announcement deleted",
+        'all_announcements_deleted': "All {count} announcements deleted",
+        
+        # ============================================
+        # FLASH MESSAGES - MESSAGING
+        # ============================================
+        'message_sent': "Message sent",
+        
+        # ============================================
+        # FLASH MESSAGES - ACCOUNTING
+        # ============================================
+        'contract_not_found': "Contract information not found",
+        'payment_info_updated': "Payment information updated",
+        'payment_created_success': "Payment information added successfully",
+        'payment_deleted': "Payment record deleted",
+        'confirm_delete_payment': "Delete this payment record?",
+        'contract_amount_required': "Contract amount is required",
+        'paid_amount_required': "Paid amount is required",
+        'create_payment_title': "Add payment",
+        'add_payment': "Add payment",
+        'custom_contract_label': "Contract amount for this student for specified academic year only (optional)",
+        'custom_contract_hint': "Leave empty — direction standard amount is used. If specified, academic year is required.",
+        'academic_year_required_with_contract': "Academic year is required when contract amount is specified",
+        'contract_amounts_title': "Payment amount",
+        'contract_amounts_subtitle': "Contract amounts by direction and enrollment year",
+        'contract_amounts_import_title': "Import payment amounts",
+        'contract_amounts_import_subtitle': "Import contract amounts by direction from Excel",
+        'add_contract_amount_btn': "New contract",
+        'add_custom_contract_btn': "Add custom contract",
+        'edit_custom_contract_btn': "Edit custom contract",
+        'col_faculty_desc': "Faculty name",
+        'col_direction_code_desc': "Direction code",
+        'col_direction_code_digits': "Digits only (e.g.: 5230100)",
+        'education_type_values': "full-time, part-time, evening, distance",
+        'col_header_faculty': "Faculty",
+        'col_header_direction_code': "Direction code",
+        'col_header_direction_name': "Direction name",
+        'col_header_education_type': "Education type",
+        'col_header_academic_year': "Academic year",
+        'col_header_contract_amount': "Contract amount",
+        'col_year_example': "2025-2026",
+        'col_header_period_start': "Start",
+        'col_desc_period_start': "Academic year start date (DD.MM.YYYY, e.g. 02.09.2025)",
+        'col_header_period_end': "End",
+        'col_desc_period_end': "Academic year end date (DD.MM.YYYY, e.g. 06.06.2026)",
+        'import_note_period_dates': "Enter start and end dates (02.09.2025 – 06.06.2026)",
+        'import_note_faculty_direction': "Faculty and direction must exist in the system",
+        'import_note_year_format': "Academic year: 2025-2026 format (all fields required)",
+        'import_note_existing_updated': "Existing record will be updated",
+        'import_note_each_row_new_payment': "Each row adds a new payment record.",
+        'import_note_student_lookup': "Student found by Student ID or name",
+        'import_note_contract_optional': "Contract amount is optional. If empty, the amount from the direction is used.",
+        'import_note_contract_year_required': "When contract amount is specified, academic year is required — amount is for this year, subsequent years taken from direction.",
+        'import_note_contract_from_direction': "Contract is taken from the amount specified for the direction.",
+        'import_note_talab_paid': "Talab required, empty Paid = 0",
+        'col_direction_name_desc': "Direction name",
+        'col_contract_amount_desc': "Contract amount (number)",
+        'sample_file': "Sample Excel file",
+        'sample_file_desc': "Download sample for correct format.",
+        'enrollment_year_label': "Enrollment year",
+        'enrollment_year_placeholder': 'Example: 2025',
+        'select_academic_year': "Select academic year",
+        'period_start_label': "Start date",
+        'period_end_label': "End date",
+        'period_start_hint': "e.g. 02.09.2025",
+        'period_end_hint': "e.g. 06.06.2026",
+        'period_dates_required': "Enter start and end dates",
+        'period_end_must_be_after_start': "End date must be after start date",
+        'contract_amount_created': "Contract amount added",
+        'contract_amount_updated': "Contract amount updated",
+        'contract_amount_deleted': "Contract amount deleted",
+        'clear_contract_amounts': "Clear payment amounts",
+        'confirm_clear_contract_amounts': "Delete all payment amounts (contract amounts)? This action cannot be undone!",
+        'contract_amounts_cleared': "{count} payment amounts deleted",
+        'contract_amount_exists_for_direction_year': "Contract amount for this direction and year already exists",
+        'fill_required_fields': "Fill required fields",
+        'search_direction_placeholder': "Enrollment year, code, name, education type...",
+        
+        # ============================================
+        # ACCOUNTING PAGE
+        # ============================================
+        'accounting_page_title': "Payment information 💳",
+        'accounting_dean_title': "Faculty financial control 💰",
+        'accounting_page_subtitle': "System-wide payment analysis",
+        'accounting_dean_subtitle': "Contracts monitoring",
+        'excel_import': 'Excel Import',
+        'export_excel': 'Export Excel',
+        'contract_badge': 'Contract',
+        'total_contract_sum': "Total contract amount (UZS)",
+        'paid_badge': 'Paid',
+        'debt_badge': 'Debt',
+        'remaining_total_sum': "Remaining total payment (UZS)",
+        'analysis_by_courses': "Analysis by courses",
+        'analysis_by_faculties': "Analysis by faculties",
+        'payment_status': "Payment status",
+        'course_students': "Year {course_year} students",
+        'total_count': "Total: {count}",
+        'paid_well': "Paid in full",
+        'medium_paid': "Medium",
+        'debts': "Debts",
+        'search_student_id_name': "Search by Student ID or name...",
+        'filter_button': 'Filter',
+        'clear_filters': 'Clear',
+        'student_and_group': 'Student and Group',
+        'contract_col': 'Contract',
+        'paid_col': 'Paid',
+        'balance_col': 'Balance',
+        'progress_col': 'Progress',
+        'no_id': "NO ID",
+        'no_group': 'NO GROUP',
+        'view_title': "View",
+        'page_of': "Page {page} / {pages}",
+        'no_data_found': "No data found",
+        'no_payment_data_hint': "No payment data found for your search. Please check the filters.",
+        'clear_filters_button': "Clear filters",
+        
+        # ============================================
+        # FLASH MESSAGES - IMPORT/EXPORT
+        # ============================================
+        'file_not_selected': "File not selected",
+        'only_excel_files_allowed': "Only Excel files (.xlsx, .xls) are supported",
+        'only_xlsx_or_xls_allowed': "Only .xlsx or .xls format files are accepted",
+        'only_xlsx_files_allowed': "Only .xlsx format files can be uploaded",
+        'no_changes_made': "No changes made",
+        'no_students_imported': "No students imported",
+        'students_imported': "{imported_count} students successfully imported",
+        'no_subjects_imported': "No subjects imported",
+        'subjects_imported': "{imported_count} subjects successfully imported",
+        'subjects_migrated': "{count} subjects migrated to multilingual format",
+        'no_subjects_to_migrate': "All subjects are already in multilingual format",
+        'migrate_translations': "Update translations",
+        'confirm_migrate_translations': "Convert all subjects to multilingual format and auto-translate?",
+        'subjects_updated': "{updated_count} subjects updated",
+        'no_users_imported': "No users imported",
+        'users_imported': "{imported_count} users successfully imported",
+        'no_records_imported': "No records imported",
+        'records_imported': "{imported_count} records successfully imported",
+        'openpyxl_not_installed': "Excel export function is not working. Please run 'pip install openpyxl' command.",
+        
+        # ============================================
+        # IMPORT STUDENTS PAGE
+        # ============================================
+        'import_students_title': "Import students",
+        'import_students_subtitle': "Import student list from Excel file",
+        'import_payments_title': "Import payment data",
+        'import_payments_subtitle': "Import payment data from Excel",
+        'col_header_payment_talaba_id': "Student ID",
+        'col_desc_payment_talaba_id': "Student ID number",
+        'col_header_payment_ismi': "Full name",
+        'col_desc_payment_ismi': "Student full name",
+        'col_header_payment_oquv_yili': "Academic year",
+        'col_desc_payment_oquv_yili': "Academic year (2024-2025). Required when contract amount is specified — applies only to this academic year for this student",
+        'col_header_payment_kontrakt': "Contract amount",
+        'col_desc_payment_kontrakt': "Contract amount that applies only to this student for the specified academic year",
+        'col_header_payment_tolov': "Payment amount",
+        'col_desc_payment_tolov': "Paid amount (number)",
+        'col_header_payment_talab': "Contract amount",
+        'col_desc_payment_talab': "Required amount / Contract amount (number)",
+        'col_header_payment_tolagani': "Payment amount",
+        'col_desc_payment_tolagani': "Paid amount (number)",
+        'col_header_payment_eslatmalar': "Notes",
+        'col_desc_payment_eslatmalar': "Additional notes (text)",
+        'excel_file_format': "Excel file format",
+        'excel_columns_required': "The Excel file must contain the following columns:",
+        'column_name': "Column name",
+        'required_field': "Required",
+        'optional_field': "Optional",
+        'required_if_contract_entered': "Required when contract amount is entered",
+        'import_note_title': "Note:",
+        'import_note_file_format': "File must be in .xlsx or .xls format",
+        'import_note_required': "Required fields: Full name, Student ID, Passport series and number",
+        'import_note_optional': "Optional fields: All other fields",
+        'import_note_auto_group': "If Faculty, Course, Education type, Enrollment year and Group are complete, the student will be automatically added to the group",
+        'import_note_enrollment': "Enrollment year is important for linking to direction (e.g. 2024, 2025)",
+        'import_note_group_name': "Group name must be correct (e.g. DI-21). If the group does not exist, it will be created",
+        'import_note_unique': "Email and Student ID must be unique",
+        'import_note_password': "Initial password for new students: passport series and number",
+        'excel_upload_title': "Upload Excel file",
+        'excel_file_label': "Excel file *",
+        'file_format_note': "File format: .xlsx or .xls",
+        'download_sample': "Download sample",
+        'import_button': "Import",
+        'import_col_student_id': "Student ID (A)",
+        'import_desc_student_id': "Student ID number",
+        'import_col_full_name': "Full name (B)",
+        'import_desc_full_name': "Student's full name (Last Name First Name Patronymic)",
+        'import_col_passport': "Passport series and number (C)",
+        'import_desc_passport': "Passport series and number",
+        'import_col_pinfl': "PINFL (D)",
+        'import_desc_pinfl': "PINFL code (14 digits)",
+        'import_col_birth_date': "Date of birth (E)",
+        'import_desc_birth_date': "Format DD.MM.YYYY or YYYY-MM-DD",
+        'import_col_phone': "Phone (F)",
+        'import_desc_phone': "Phone number",
+        'import_col_email': "Email (G)",
+        'import_desc_email': "Email address (must be unique)",
+        'import_col_faculty': "Faculty (I)",
+        'import_desc_faculty': "Faculty name (for group assignment)",
+        'import_col_course': "Course (J)",
+        'import_desc_course': "Course number (1-course, 2-course format)",
+        'import_col_semester': "Semester (K)",
+        'import_desc_semester': "Semester number (1-semester, 2-semester format)",
+        'import_col_education_type': "Education type (L)",
+        'import_desc_education_type': "Full-time, Part-time, Evening, Distance (capitalized)",
+        'import_col_enrollment_year': "Enrollment year (M)",
+        'import_desc_enrollment_year': "Enrollment year (e.g. 2024, 2025)",
+        'import_col_specialty_code': "Specialty code (N)",
+        'import_desc_specialty_code': "Direction code (e.g. DI)",
+        'import_col_specialty_name': "Specialty name (O)",
+        'import_desc_specialty_name': "Direction name (e.g. Software engineering)",
+        'import_col_group': "Group (P)",
+        'import_desc_group': "Group name (e.g. DI-21)",
+        
+        # Sample file (student import sample)
+        'sample_students_title': "Sample file for student import",
+        'sample_requirements_title': "IMPORT REQUIREMENTS:",
+        'sample_note_title': "NOTE:",
+        'sample_req_1': "1. Student ID - required field, must be unique",
+        'sample_req_2': "2. Full name - required field",
+        'sample_req_3': "3. Passport series and number - required field (e.g. AB1234567)",
+        'sample_req_4': "4. PINFL - optional field (14 digits)",
+        'sample_req_5': "5. Date of birth - optional field (format DD.MM.YYYY or YYYY-MM-DD)",
+        'sample_req_6': "6. Phone - optional field",
+        'sample_req_7': "7. Email - optional field, must be unique",
+        'sample_req_8': "8. Description - optional field",
+        'sample_req_9_fid': "9. F.ID - optional field (student ID on device)",
+        'sample_req_9': "9. Faculty - optional field (for group assignment)",
+        'sample_req_10': "10. Faculty - optional field (for group assignment)",
+        'sample_req_11': "11. Course - optional field (format: 1-course, 2-course)",
+        'sample_req_12': "12. Semester - optional field (format: 1-semester, 2-semester)",
+        'sample_req_13': "13. Education type - optional field (Full-time, Part-time, Evening, Distance)",
+        'sample_req_14': "14. Enrollment year - optional field (e.g. 2024)",
+        'sample_req_15': "15. Specialty code - optional field (direction code)",
+        'sample_req_16': "16. Specialty name - optional field (direction name)",
+        'sample_req_17': "17. Group - optional field (if exists - added, otherwise created)",
+        'sample_filename_students': "student_import_sample",
+        'sample_staff_title': "Sample file for staff import",
+        'sample_filename_staff': "staff_import_sample",
+        
+        # ============================================
+        # IMPORT SUBJECTS PAGE
+        # ============================================
+        'import_subjects_title': "Import subjects",
+        'import_subjects_subtitle': "Import subject list from Excel file",
+        'import_col_subject_name': "Subject name (A)",
+        'import_desc_subject_name': "Full subject name",
+        'import_col_subject_description': "Description (B)",
+        'import_desc_subject_description': "Additional information about the subject",
+        'import_note_subject_name': "Subject name - required field",
+        'import_note_subject_update': "If a subject with this name exists, it will be updated",
+        'import_note_subject_create': "If the subject is new, it will be created",
+        'import_note_subject_desc': "Description - optional field",
+        'import_note_subject_department': "Subject is linked to the department(s) by name in the column (multiple separated by comma).",
+        'import_note_subjects_1col': "If only one language column (A, B or C) is filled – translation uses platform language",
+        'import_note_subjects_3col': "If all three columns are filled – no translation",
+        'import_col_subject_uz': "Subject name (Uzbek)",
+        'import_col_subject_ru': "Subject name (Russian)",
+        'import_col_subject_en': "Subject name (English)",
+        'import_desc_subject_uz': "Subject name in Uzbek",
+        'import_desc_subject_ru': "Subject name in Russian",
+        'import_desc_subject_en': "Subject name in English",
+        'import_subject_department_hint': "Department name (multiple separated by comma)",
+        'sample_subjects_title': "Sample file for subjects import",
+        
+        # IMPORT DEPARTMENTS
+        'import_departments_title': "Import departments",
+        'import_departments_subtitle': "Import department list from Excel (1 column – platform language and auto-translate, or 3 columns – Uz/Ru/En)",
+        'departments_imported': "{imported_count} department(s) added",
+        'departments_updated': "{updated_count} department(s) updated",
+        'no_data_imported': "No data imported",
+        'import_col_department_uz': "Department name (Uzbek) (A)",
+        'import_col_department_ru': "Department name (Russian) (B)",
+        'import_col_department_en': "Department name (English) (C)",
+        'import_col_department_head': "Department head (D)",
+        'import_desc_department_uz': "Department name in Uzbek",
+        'import_desc_department_ru': "Department name in Russian",
+        'import_desc_department_en': "Department name in English",
+        'import_desc_department_head': "Full name of the department head (from staff database)",
+        'import_note_departments_1col': "If only one column is filled – it is the platform language; other languages are auto-translated",
+        'import_note_departments_3col': "If columns A, B, C are filled – used as-is (no translation). Existing departments are updated",
+        'sample_departments_title': "Sample file for departments import",
+        
+        'import_staff_title': "Import staff",
+        'import_staff_subtitle': "Import all users from Excel file",
+        'import_users_title': "Import users",
+        'import_col_full_name_a': "Full name (A)",
+        'import_desc_full_name_staff': "Staff full name (Last name First name)",
+        'import_col_login_b': "Login (B)",
+        'import_desc_login': "Login (must be unique)",
+        'import_col_passport_c': "Passport series and number (C)",
+        'import_col_pinfl_d': "PINFL (D)",
+        'import_col_birth_date_e': "Date of birth (E)",
+        'import_col_phone_f': "Phone (F)",
+        'import_col_email_g': "Email (G)",
+        'import_col_description_h': "Description (H)",
+        'import_desc_staff_description': "Additional information about the staff. For dean role, enter faculty name (e.g.: Dean of IT faculty)",
+        'import_optional_dean_required': "Optional (required for dean role)",
+        'import_col_fid_i': "F.ID (I)",
+        'import_desc_fid': "Employee ID on device (optional)",
+        'import_desc_fid_student': "Student ID on device (optional)",
+        'import_col_roles_j': "Roles (J)",
+        'import_col_roles_i': "Roles (I)",
+        'import_desc_roles_staff': "Comma-separated: Administrator, Dean, Teacher, Accountant, Staff. If empty, saved as \"Staff\"",
+        'import_note_staff_file': "File must be in .xlsx or .xls format",
+        'import_note_staff_required': "Required fields: Full name, Login, Passport series and number. Roles optional — if empty, saved as \"Staff\"",
+        'import_note_staff_dean': "If dean role is selected, show faculty name in Description field (e.g.: \"Dean of IT faculty\")",
+        'import_note_staff_unique': "Login and Email must be unique",
+        'import_note_staff_password': "Initial password for new staff: passport series and number",
+        'sample_subjects_title': "Sample file for subjects import",
+        'sample_filename_subjects': "subjects_import_sample",
+        'sample_curriculum_title': "Sample file for curriculum import",
+        'sample_filename_curriculum': "curriculum_import_sample",
+        'sample_schedule_title': "Sample file for schedule import",
+        'sample_filename_schedule': "schedule_import_sample",
+        'sample_contracts_title': "Sample file for contracts import",
+        'sample_filename_contracts': "contracts_sample",
+        'contract_col_student_id': "Student_id",
+        'contract_col_name': "Name",
+        'contract_col_amount': "Contract amount",
+        'contract_col_talab': "Contract amount",
+        'contract_col_paid': "Paid",
+        'contract_col_notes': "Notes",
+        'contract_sample_note': "NOTE: Student is identified by ID or name. Contract amount is required.",
+        
+        # ============================================
+        # FLASH MESSAGES - ERROR MESSAGES
+        # ============================================
+        'error_occurred': "An error occurred: {error}",
+        'import_error': "Import error: {error}",
+        'import_error_with_details': "Import error: {errors}",
+        'import_error_joined': "Error during import: {errors}",
+        'export_error': "Export error: {error}",
+        'export_grades_error': "An error occurred during export: {error}",
+        'export_ungraded_blocked': "Export is not allowed: there are ungraded submissions. Please grade all submissions first.",
+        'role_permissions_saved': "Role permissions saved.",
+        'reset_to_default': "Reset to default",
+        'role_settings_reset_confirm': "Role settings will be reset to initial state. Continue?",
+        'role_settings_reset_to_default': "Role settings have been reset to default.",
+        'role_settings_description': "Assign or remove permissions for each role.",
+        'role_settings_all_permissions_note': "The table below lists all viewing, permission and capability options in the system — each can be assigned separately.",
+        'role_settings_superadmin_only': "This section is for superadmin only. You can manage permissions for all roles via checkboxes.",
+        'permission': "Permission",
+        'perm_view_admin_panel': "Access admin panel",
+        'perm_view_users': "List of users",
+        'perm_create_user': "Add user",
+        'perm_edit_user': "Edit user",
+        'perm_delete_user': "Delete user",
+        'perm_toggle_user': "Change user activity",
+        'perm_reset_user_password': "Reset password",
+        'perm_view_staff': "List of staff",
+        'perm_create_staff': "Add staff",
+        'perm_edit_staff': "Edit staff",
+        'perm_delete_staff': "Delete staff",
+        'perm_view_students': "List of students",
+        'perm_create_student': "Add student",
+        'perm_edit_student': "Edit student",
+        'perm_delete_student': "Delete student",
+        'perm_view_faculties': "Faculties",
+        'perm_create_faculty': "Add faculty",
+        'perm_edit_faculty': "Edit faculty",
+        'perm_delete_faculty': "Delete faculty",
+        'perm_view_directions': "Directions",
+        'perm_create_direction': "Add direction",
+        'perm_edit_direction': "Edit direction",
+        'perm_delete_direction': "Delete direction",
+        'perm_manage_groups': "Manage groups",
+        'perm_create_group': "Add group",
+        'perm_edit_group': "Edit group",
+        'perm_delete_group': "Delete group",
+        'perm_view_subjects': "Subjects",
+        'perm_create_subject': "Add subject",
+        'perm_edit_subject': "Edit subject",
+        'perm_delete_subject': "Delete subject",
+        'perm_view_curriculum': "Curriculum",
+        'perm_edit_curriculum': "Edit curriculum",
+        'perm_view_schedule': "Schedule",
+        'perm_create_schedule': "Add schedule",
+        'perm_edit_schedule': "Edit schedule",
+        'perm_delete_schedule': "Delete schedule",
+        'perm_view_reports': "Reports",
+        'perm_view_grade_scale': "Grade scale",
+        'perm_manage_grade_scale': "Manage grade scale",
+        'perm_view_teachers': "List of teachers",
+        'perm_assign_teachers': "Assign teacher",
+        'no_department_assigned': "No department assigned to you",
+        'assign_teacher': "Assign teacher",
+        'teacher_assigned_successfully': "Teacher assigned successfully",
+        'assignment_already_exists': "This assignment already exists",
+        'change_teacher': "Change teacher",
+        'new_teacher': "New teacher",
+        'teacher_changed_successfully': "Teacher changed successfully",
+        'assignment_not_found': "Assignment not found",
+        'department_head_subjects_subtitle': "Department subjects and teachers",
+        'department_head_resources_subtitle': "Department subject resources",
+        'plan_hours': "Plan (hours)",
+        'all_lesson_types': "All lesson types",
+        'all_progress': "All percentages",
+        'total_rows': "Total rows",
+        'perm_export_subjects': "Export subjects",
+        'perm_import_subjects': "Import subjects",
+        'perm_import_schedule': "Import schedule",
+        'perm_import_students': "Import students",
+        'perm_import_staff': "Import staff",
+        'perm_view_dean_panel': "Access dean panel",
+        'perm_dean_manage_students': "Dean: manage students",
+        'perm_dean_manage_directions': "Dean: directions",
+        'perm_dean_manage_groups': "Dean: groups",
+        'perm_dean_manage_curriculum': "Dean: curriculum",
+        'perm_dean_manage_teachers': "Dean: teachers",
+        'perm_dean_manage_schedule': "Dean: schedule",
+        'perm_create_lesson': "Create lesson",
+        'perm_edit_lesson': "Edit lesson",
+        'perm_delete_lesson': "Delete lesson",
+        'perm_create_assignment': "Create assignment",
+        'perm_edit_assignment': "Edit assignment",
+        'perm_delete_assignment': "Delete assignment",
+        'perm_grade_students': "Grade submissions",
+        'perm_view_submissions': "View submissions",
+        'perm_create_announcement': "Create announcement",
+        'perm_view_lessons': "View lessons",
+        'perm_submit_assignment': "Submit assignment",
+        'perm_view_grades': "View grades",
+        'perm_view_accounting': "Access accounting",
+        'perm_manage_payments': "Manage payments",
+        'perm_manage_contracts': "Manage contracts",
+        'perm_view_contract_amounts': "View contract amounts",
+        'perm_import_payments': "Import payments",
+        'perm_view_announcements': "View announcements",
+        'perm_send_message': "Send message",
+        'perm_view_messages': "View messages",
+        'excel_import_not_working': "Excel import function is not working: {error}",
+        'template_file_creation_error': "Error creating template file: {error}",
+        'template_file_download_error': "Error downloading template file: {error}",
+        'announcement_delete_error': "An error occurred while deleting announcement: {error}",
+        'announcements_delete_error': "An error occurred while deleting announcements: {error}",
+        'invalid_file_format': "Invalid file format: {filename}. Allowed formats: PDF, DOC, DOCX, XLS, XLSX, PPT, PPTX, TXT, ZIP, RAR",
+        'file_size_limit': "File size must not exceed {max} MB",
+    }
+}
@@ -27,18 +27,65 @@ class Config:
     ZOOM_CLIENT_SECRET = os.environ.get('ZOOM_CLIENT_SECRET', '')
     ZOOM_DURATION_MINUTES = int(os.environ.get('ZOOM_DURATION_MINUTES', '90'))
     ZOOM_TIMEZONE = os.environ.get('ZOOM_TIMEZONE', 'Asia/Tashkent')
+    # Stub/test server uchun almashtirish mumkin
+    ZOOM_TOKEN_URL = os.environ.get('ZOOM_TOKEN_URL', 'https://zoom.us/oauth/token')
+    ZOOM_API_BASE = os.environ.get('ZOOM_API_BASE', 'https://api.zoom.us/v2')
+    # Excel dan import qilingan jadvallar uchun ham Zoom meeting yaratish (havolasiz qatorlar) – yangi xatti-harakat,
+    # sukut bo'yicha o'chiq: avval meeting faqat qo'lda yaratilgan jadval uchun ochilardi
+    ZOOM_CREATE_ON_IMPORT = os.environ.get('ZOOM_CREATE_ON_IMPORT', '0').strip().lower() in ('1', 'true', 'yes', 'on')
+    # Import qilingan jadvallar uchun fon navbati: parallel so'rovlar va soniyasiga so'rovlar chegarasi
+    ZOOM_MAX_CONCURRENCY = int(os.environ.get('ZOOM_MAX_CONCURRENCY', '4'))
+    ZOOM_REQUESTS_PER_SEC = float(os.environ.get('ZOOM_REQUESTS_PER_SEC', '8'))
 
     # Markaziy boshqaruv (vazirlik)
     INSTITUTION_ID = os.environ.get('INSTITUTION_ID', '')
     # Markaz serverida OTM ro'yxati ko'rinsin: IS_CENTRAL_SERVER=True (.env da)
     IS_CENTRAL_SERVER = os.environ.get('IS_CENTRAL_SERVER', '').strip().lower() in ('1', 'true', 'yes', 'on')
     CENTRAL_API_URL = os.environ.get('CENTRAL_API_URL', '')  # masalan: https://update.elemes.uz
+    # Markaz holati hali ma'lum bo'lmasa (javob yo'q, instance/central_status.json yo'q): 0 – blok yo'q deb
+    # xizmat qilinadi, 1 – kirish sahifalari va /admin/update dan boshqasi 503
+    CENTRAL_STATUS_FAIL_CLOSED = os.environ.get('CENTRAL_STATUS_FAIL_CLOSED', '0').strip().lower() in ('1', 'true', 'yes', 'on')
     # Markazda: nashr uchun public URL (institutlar zipni shu manzildan yuklaydi)
     CENTRAL_PUBLIC_URL = os.environ.get('CENTRAL_PUBLIC_URL', '')  # masalan: http://green.elemes.uz
     # Markazda: avtomatik nashr o'chirilgan – yangi versiya faqat "flask release" buyrug'i orqali
     # PUBLISH_ON_STARTUP eski sozlama (endi ishlatilmaydi)
     PUBLISH_ON_STARTUP = False
 
+    # Face log yozuvchi: navbatdan bir siklda ko'pi bilan shuncha log yoki shuncha ms ichida kelganlar bitta commit bilan yoziladi
+    FACE_LOG_BATCH_SIZE = int(os.environ.get('FACE_LOG_BATCH_SIZE', '200'))
+    FACE_LOG_FLUSH_INTERVAL_MS = int(os.environ.get('FACE_LOG_FLUSH_INTERVAL_MS', '500'))
+    # Diskdagi navbat (spool) fayli; bo'sh bo'lsa instance/face_log_spool.db
+    FACE_LOG_SPOOL_PATH = os.environ.get('FACE_LOG_SPOOL_PATH', '')
+    # Alohida yozilmagan log shuncha urinishdan keyin spool ning dead_letter jadvaliga (flask face-log-requeue)
+    FACE_LOG_MAX_ATTEMPTS = int(os.environ.get('FACE_LOG_MAX_ATTEMPTS', '5'))
+    # Davomat qatorlarini face log kelishi bilan yangilash (tungi job – reconciliation)
+    ATTENDANCE_LIVE_MATERIALIZE = os.environ.get('ATTENDANCE_LIVE_MATERIALIZE', '1').strip().lower() in ('1', 'true', 'yes', 'on')
+    # Live monitor / Smart Dashboard SSE oqimi: bir jarayondagi obunachilar chegarasi
+    FACE_STREAM_MAX_SUBSCRIBERS = int(os.environ.get('FACE_STREAM_MAX_SUBSCRIBERS', '40'))
+    # Tashqi HTTP so'rovlar (markaz, Zoom): host bo'yicha keep-alive pool, qayta urinish, ulanish timeouti
+    HTTP_POOL_MAXSIZE = int(os.environ.get('HTTP_POOL_MAXSIZE', '10'))
+    HTTP_RETRIES = int(os.environ.get('HTTP_RETRIES', '2'))
+    HTTP_RETRY_BACKOFF = float(os.environ.get('HTTP_RETRY_BACKOFF', '0.5'))
+    HTTP_CONNECT_TIMEOUT = float(os.environ.get('HTTP_CONNECT_TIMEOUT', '5'))
+    # Host bo'yicha ulanish timeouti (soniya), masalan: "api.zoom.us=10,update.elemes.uz=3"
+    HTTP_HOST_TIMEOUTS = os.environ.get('HTTP_HOST_TIMEOUTS', '')
+    # Mashina tarjimasi: backend (google | stub | modul:funksiya) va import paytidagi parallel so'rovlar
+    TRANSLATION_BACKEND = os.environ.get('TRANSLATION_BACKEND', 'google')
+    TRANSLATION_MAX_WORKERS = int(os.environ.get('TRANSLATION_MAX_WORKERS', '4'))
+    # Rejalashtirilgan ishlar: faqat bitta (lider) jarayonda; boshqalar liderlikni shu oraliqda tekshiradi
+    SCHEDULER_ENABLED = os.environ.get('SCHEDULER_ENABLED', '1').strip().lower() in ('1', 'true', 'yes', 'on')
+    SCHEDULER_LEADER_RETRY_SEC = float(os.environ.get('SCHEDULER_LEADER_RETRY_SEC', '30'))
+    SCHEDULER_MISFIRE_GRACE_SEC = int(os.environ.get('SCHEDULER_MISFIRE_GRACE_SEC', '3600'))
+    # SQLite profili (har ulanishda PRAGMA): WAL – o'quvchilar face log yozuvchisini kutmaydi; busy_timeout –
+    # qulf band bo'lsa shuncha ms kutish. foreign_keys eski ma'lumot/o'chirish oqimlari tekshirilmaguncha o'chiq
+    SQLITE_PROFILE_ENABLED = os.environ.get('SQLITE_PROFILE_ENABLED', '1').strip().lower() in ('1', 'true', 'yes', 'on')
+    SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', '10000'))
+    SQLITE_MMAP_SIZE_MB = int(os.environ.get('SQLITE_MMAP_SIZE_MB', '256'))
+    SQLITE_CACHE_SIZE_KB = int(os.environ.get('SQLITE_CACHE_SIZE_KB', '65536'))
+    SQLITE_FOREIGN_KEYS = os.environ.get('SQLITE_FOREIGN_KEYS', '0').strip().lower() in ('1', 'true', 'yes', 'on')
+
     # Session timeout settings (30 daqiqa)
     PERMANENT_SESSION_LIFETIME = timedelta(minutes=30)
     SESSION_COOKIE_HTTPONLY = True
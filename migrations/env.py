@@ -11,7 +11,9 @@ config = context.config
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-fileConfig(config.config_file_name)
+# (ilova ichidan ishga tushirilganda – app/services/schema.py – ilova logging i saqlanadi)
+if config.attributes.get('configure_logger', True):
+    fileConfig(config.config_file_name)
 logger = logging.getLogger('alembic.env')
 
 
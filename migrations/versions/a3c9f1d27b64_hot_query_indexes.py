@@ -0,0 +1,51 @@
+"""hot query composite indexes
+
+Revision ID: a3c9f1d27b64
+Revises: 076d59e9faea
+Create Date: 2026-10-16 23:40:12.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c9f1d27b64'
+down_revision = '076d59e9faea'
+branch_labels = None
+depends_on = None
+
+
+# (jadval, indeks, ustunlar) – app/models.py dagi __table_args__ bilan bir xil
+INDEXES = (
+    ('message', 'ix_message_sender_receiver_created', ['sender_id', 'receiver_id', 'created_at']),
+    ('teacher_subject', 'ix_teacher_subject_subject_group_type', ['subject_id', 'group_id', 'lesson_type']),
+    ('lesson', 'ix_lesson_subject_direction_type_order', ['subject_id', 'direction_id', 'lesson_type', 'order']),
+    ('lesson_view', 'ix_lesson_view_lesson_student', ['lesson_id', 'student_id']),
+    ('submission', 'ix_submission_student_assignment', ['student_id', 'assignment_id']),
+    ('direction_curriculum', 'ix_direction_curriculum_dir_sem_year_type',
+     ['direction_id', 'semester', 'enrollment_year', 'education_type']),
+    ('student_payment', 'ix_student_payment_student', ['student_id']),
+    ('user', 'ix_user_role_group', ['role', 'group_id']),
+)
+
+
+def _existing_indexes(inspector, table):
+    return {ix['name'] for ix in inspector.get_indexes(table)}
+
+
+def upgrade():
+    # db.create_all() bilan yaratilgan bazada indekslar allaqachon bo'lishi mumkin
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    for table, name, columns in INDEXES:
+        if table in tables and name not in _existing_indexes(inspector, table):
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    for table, name, _ in reversed(INDEXES):
+        if table in tables and name in _existing_indexes(inspector, table):
+            op.drop_index(name, table_name=table)
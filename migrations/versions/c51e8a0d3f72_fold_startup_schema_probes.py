@@ -0,0 +1,755 @@
+"""fold startup schema probes
+
+create_app avval har ishga tushishda bajargan ishlar: db.create_all(), user/subject/assignment/
+submission/face_logs/message jadvallariga ALTER TABLE ADD COLUMN, indekslar va ma'lumot ko'chirishlar.
+Barcha qadamlar idempotent – eski (alembic_version siz) baza ham, qisman yangilangani ham shu yerdan
+bir xil holatga keladi. Yo'q jadvallar shu reviziya paytidagi ta'riflar bilan (op.create_table) yaratiladi,
+shuning uchun keyingi reviziyalar yangi jadval/ustunlarni odatdagidek qo'shadi.
+
+Revision ID: c51e8a0d3f72
+Revises: a3c9f1d27b64
+Create Date: 2026-10-16 23:52:40.104417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c51e8a0d3f72'
+down_revision = 'a3c9f1d27b64'
+branch_labels = None
+depends_on = None
+
+
+# (jadval, ustun, tur, qo'shimcha) – eski startup ALTER lari bilan bir xil turlar va default lar
+COLUMNS = (
+    ('user', 'superadmin_flag', sa.Integer, {}),
+    ('user', 'managed_department_id', sa.Integer, {}),
+    ('user', 'unread_message_count', sa.Integer, {'nullable': False, 'server_default': '0'}),
+    ('user', 'employee_code', sa.String(50), {}),
+    ('subject', 'department_id', sa.Integer, {}),
+    ('assignment', 'direction_id', sa.Integer, {}),
+    ('assignment', 'lesson_type', sa.String(20), {}),
+    ('assignment', 'lesson_ids', sa.Text, {}),
+    ('submission', 'resubmission_count', sa.Integer, {'server_default': '0'}),
+    ('submission', 'allow_resubmission', sa.Boolean, {'server_default': sa.false()}),
+    ('submission', 'is_active', sa.Boolean, {'server_default': sa.true()}),
+    ('face_logs', 'device_employee_id', sa.String(50), {}),
+    ('face_logs', 'picture_path', sa.String(255), {}),
+    ('face_logs', 'direction', sa.String(10), {'server_default': 'IN'}),
+    ('face_logs', 'dedupe_key', sa.String(64), {}),
+    ('face_logs', 'raw_parsed', sa.Boolean, {'server_default': sa.false()}),
+    ('face_logs', 'device_time', sa.DateTime, {}),
+    ('face_logs', 'device_local_ip', sa.String(50), {}),
+    ('face_logs', 'device_name', sa.String(150), {}),
+    ('face_logs', 'role', sa.String(100), {}),
+    ('face_logs', 'department', sa.String(150), {}),
+    ('face_logs', 'similarity', sa.Integer, {}),
+    ('face_logs', 'kpi_score', sa.Integer, {}),
+    ('face_logs', 'attendance_status', sa.String(30), {}),
+    ('message', 'reply_to_id', sa.Integer, {}),
+    ('message', 'is_pinned', sa.Boolean, {'server_default': sa.false()}),
+)
+
+# (jadval, indeks, ustunlar, unique)
+INDEXES = (
+    ('user', 'ix_user_employee_code', ['employee_code'], False),
+    ('face_logs', 'ix_face_logs_device_employee_id', ['device_employee_id'], False),
+    ('face_logs', 'ix_face_logs_direction', ['direction'], False),
+    ('face_logs', 'ix_face_logs_dedupe_key', ['dedupe_key'], True),
+    ('face_logs', 'ix_face_logs_raw_parsed', ['raw_parsed'], False),
+    ('face_logs', 'ix_face_logs_device_time', ['device_time'], False),
+    ('face_logs', 'ix_face_logs_device_local_ip', ['device_local_ip'], False),
+    ('face_logs', 'ix_face_logs_device_name', ['device_name'], False),
+    ('face_logs', 'ix_face_logs_role', ['role'], False),
+    ('face_logs', 'ix_face_logs_department', ['department'], False),
+    ('face_logs', 'ix_face_logs_attendance_status', ['attendance_status'], False),
+    ('face_logs', 'ix_face_logs_event_emp_dir', ['event_time', 'device_employee_id', 'direction'], False),
+    ('message', 'ix_message_receiver_read', ['receiver_id', 'is_read'], False),
+)
+
+
+def _create_missing_tables(bind):
+    """
+    Bazada yo'q jadvallar (avval har ishga tushishda db.create_all qilardi). Ta'riflar shu reviziyadagi
+    modellardan ko'chirilgan va muzlatilgan – keyingi model o'zgarishlari bu yerga ta'sir qilmaydi.
+    """
+    existing = set(sa.inspect(bind).get_table_names())
+    if 'department' not in existing:
+        op.create_table('department',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=200), nullable=False),
+            sa.Column('name_uz', sa.String(length=200), nullable=True),
+            sa.Column('name_ru', sa.String(length=200), nullable=True),
+            sa.Column('name_en', sa.String(length=200), nullable=True),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'face_logs' not in existing:
+        op.create_table('face_logs',
+            sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column('device_employee_id', sa.String(length=50), nullable=True),
+            sa.Column('person_name', sa.String(length=150), nullable=True),
+            sa.Column('event_time', sa.DateTime(), nullable=True),
+            sa.Column('direction', sa.String(length=10), nullable=True),
+            sa.Column('device_ip', sa.String(length=50), nullable=True),
+            sa.Column('raw_data', sa.Text(), nullable=True),
+            sa.Column('picture_path', sa.String(length=255), nullable=True),
+            sa.Column('dedupe_key', sa.String(length=64), nullable=True),
+            sa.Column('raw_parsed', sa.Boolean(), nullable=True),
+            sa.Column('device_time', sa.DateTime(), nullable=True),
+            sa.Column('device_local_ip', sa.String(length=50), nullable=True),
+            sa.Column('device_name', sa.String(length=150), nullable=True),
+            sa.Column('role', sa.String(length=100), nullable=True),
+            sa.Column('department', sa.String(length=150), nullable=True),
+            sa.Column('similarity', sa.Integer(), nullable=True),
+            sa.Column('kpi_score', sa.Integer(), nullable=True),
+            sa.Column('attendance_status', sa.String(length=30), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_face_logs_attendance_status'), 'face_logs', ['attendance_status'], unique=False)
+        op.create_index(op.f('ix_face_logs_dedupe_key'), 'face_logs', ['dedupe_key'], unique=True)
+        op.create_index(op.f('ix_face_logs_department'), 'face_logs', ['department'], unique=False)
+        op.create_index(op.f('ix_face_logs_device_employee_id'), 'face_logs', ['device_employee_id'], unique=False)
+        op.create_index(op.f('ix_face_logs_device_ip'), 'face_logs', ['device_ip'], unique=False)
+        op.create_index(op.f('ix_face_logs_device_local_ip'), 'face_logs', ['device_local_ip'], unique=False)
+        op.create_index(op.f('ix_face_logs_device_name'), 'face_logs', ['device_name'], unique=False)
+        op.create_index(op.f('ix_face_logs_device_time'), 'face_logs', ['device_time'], unique=False)
+        op.create_index(op.f('ix_face_logs_direction'), 'face_logs', ['direction'], unique=False)
+        op.create_index('ix_face_logs_event_emp_dir', 'face_logs', ['event_time', 'device_employee_id', 'direction'], unique=False)
+        op.create_index(op.f('ix_face_logs_event_time'), 'face_logs', ['event_time'], unique=False)
+        op.create_index(op.f('ix_face_logs_person_name'), 'face_logs', ['person_name'], unique=False)
+        op.create_index(op.f('ix_face_logs_raw_parsed'), 'face_logs', ['raw_parsed'], unique=False)
+        op.create_index(op.f('ix_face_logs_role'), 'face_logs', ['role'], unique=False)
+
+    if 'faculty' not in existing:
+        op.create_table('faculty',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=200), nullable=False),
+            sa.Column('name_uz', sa.String(length=200), nullable=True),
+            sa.Column('name_ru', sa.String(length=200), nullable=True),
+            sa.Column('name_en', sa.String(length=200), nullable=True),
+            sa.Column('code', sa.String(length=20), nullable=False),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('description_uz', sa.Text(), nullable=True),
+            sa.Column('description_ru', sa.Text(), nullable=True),
+            sa.Column('description_en', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('code'),
+            sa.UniqueConstraint('name')
+        )
+
+    if 'flash_message' not in existing:
+        op.create_table('flash_message',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('text_uz', sa.Text(), nullable=True),
+            sa.Column('text_ru', sa.Text(), nullable=True),
+            sa.Column('text_en', sa.Text(), nullable=True),
+            sa.Column('url', sa.String(length=500), nullable=True),
+            sa.Column('text_color', sa.String(length=20), nullable=True),
+            sa.Column('enabled', sa.Boolean(), nullable=True),
+            sa.Column('date_from', sa.Date(), nullable=True),
+            sa.Column('date_to', sa.Date(), nullable=True),
+            sa.Column('sort_order', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'grade_scale' not in existing:
+        op.create_table('grade_scale',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=50), nullable=False),
+            sa.Column('letter', sa.String(length=5), nullable=False),
+            sa.Column('min_score', sa.Float(), nullable=False),
+            sa.Column('max_score', sa.Float(), nullable=False),
+            sa.Column('description', sa.String(length=100), nullable=True),
+            sa.Column('gpa_value', sa.Float(), nullable=True),
+            sa.Column('color', sa.String(length=20), nullable=True),
+            sa.Column('order', sa.Integer(), nullable=True),
+            sa.Column('is_passing', sa.Boolean(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'role_permissions' not in existing:
+        op.create_table('role_permissions',
+            sa.Column('role', sa.String(length=30), nullable=False),
+            sa.Column('permission', sa.String(length=80), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('role', 'permission')
+        )
+
+    if 'site_settings' not in existing:
+        op.create_table('site_settings',
+            sa.Column('key', sa.String(length=80), nullable=False),
+            sa.Column('value', sa.Text(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('key')
+        )
+
+    if 'translation_memory' not in existing:
+        op.create_table('translation_memory',
+            sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column('source_hash', sa.String(length=64), nullable=False),
+            sa.Column('source_lang', sa.String(length=10), nullable=False),
+            sa.Column('target_lang', sa.String(length=10), nullable=False),
+            sa.Column('source_text', sa.Text(), nullable=False),
+            sa.Column('translated_text', sa.Text(), nullable=False),
+            sa.Column('backend', sa.String(length=30), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('source_hash', 'source_lang', 'target_lang', name='uq_translation_memory_key')
+        )
+
+    if 'direction' not in existing:
+        op.create_table('direction',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=200), nullable=False),
+            sa.Column('name_uz', sa.String(length=200), nullable=True),
+            sa.Column('name_ru', sa.String(length=200), nullable=True),
+            sa.Column('name_en', sa.String(length=200), nullable=True),
+            sa.Column('code', sa.String(length=20), nullable=False),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('description_uz', sa.Text(), nullable=True),
+            sa.Column('description_ru', sa.Text(), nullable=True),
+            sa.Column('description_en', sa.Text(), nullable=True),
+            sa.Column('faculty_id', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['faculty_id'], ['faculty.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'subject' not in existing:
+        op.create_table('subject',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=200), nullable=True),
+            sa.Column('name_uz', sa.String(length=200), nullable=True),
+            sa.Column('name_ru', sa.String(length=200), nullable=True),
+            sa.Column('name_en', sa.String(length=200), nullable=True),
+            sa.Column('code', sa.String(length=20), nullable=True),
+            sa.Column('department_id', sa.Integer(), nullable=True),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('description_uz', sa.Text(), nullable=True),
+            sa.Column('description_ru', sa.Text(), nullable=True),
+            sa.Column('description_en', sa.Text(), nullable=True),
+            sa.Column('credits', sa.Integer(), nullable=True),
+            sa.Column('semester', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['department_id'], ['department.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'direction_contract_amount' not in existing:
+        op.create_table('direction_contract_amount',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('direction_id', sa.Integer(), nullable=False),
+            sa.Column('enrollment_year', sa.Integer(), nullable=False),
+            sa.Column('education_type', sa.String(length=20), nullable=True),
+            sa.Column('period_start', sa.Date(), nullable=True),
+            sa.Column('period_end', sa.Date(), nullable=True),
+            sa.Column('contract_amount', sa.Numeric(precision=15, scale=2), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['direction_id'], ['direction.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'direction_curriculum' not in existing:
+        op.create_table('direction_curriculum',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('direction_id', sa.Integer(), nullable=False),
+            sa.Column('subject_id', sa.Integer(), nullable=False),
+            sa.Column('semester', sa.Integer(), nullable=False),
+            sa.Column('enrollment_year', sa.Integer(), nullable=True),
+            sa.Column('education_type', sa.String(length=20), nullable=True),
+            sa.Column('hours_maruza', sa.Integer(), nullable=True),
+            sa.Column('hours_amaliyot', sa.Integer(), nullable=True),
+            sa.Column('hours_laboratoriya', sa.Integer(), nullable=True),
+            sa.Column('hours_seminar', sa.Integer(), nullable=True),
+            sa.Column('hours_kurs_ishi', sa.Integer(), nullable=True),
+            sa.Column('hours_mustaqil', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['direction_id'], ['direction.id'], ),
+            sa.ForeignKeyConstraint(['subject_id'], ['subject.id'], ),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('direction_id', 'subject_id', 'semester', 'enrollment_year', 'education_type', name='uq_direction_subject_semester_year_type')
+        )
+        op.create_index('ix_direction_curriculum_dir_sem_year_type', 'direction_curriculum', ['direction_id', 'semester', 'enrollment_year', 'education_type'], unique=False)
+
+    if 'group' not in existing:
+        op.create_table('group',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=50), nullable=False),
+            sa.Column('faculty_id', sa.Integer(), nullable=False),
+            sa.Column('direction_id', sa.Integer(), nullable=True),
+            sa.Column('course_year', sa.Integer(), nullable=False),
+            sa.Column('semester', sa.Integer(), nullable=False),
+            sa.Column('education_type', sa.String(length=20), nullable=True),
+            sa.Column('enrollment_year', sa.Integer(), nullable=True),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['direction_id'], ['direction.id'], ),
+            sa.ForeignKeyConstraint(['faculty_id'], ['faculty.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'subject_department' not in existing:
+        op.create_table('subject_department',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('subject_id', sa.Integer(), nullable=False),
+            sa.Column('department_id', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['department_id'], ['department.id'], ),
+            sa.ForeignKeyConstraint(['subject_id'], ['subject.id'], ),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('subject_id', 'department_id', name='uq_subject_department')
+        )
+
+    if 'user' not in existing:
+        op.create_table('user',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('email', sa.String(length=120), nullable=True),
+            sa.Column('login', sa.String(length=50), nullable=True),
+            sa.Column('password_hash', sa.String(length=256), nullable=False),
+            sa.Column('full_name', sa.String(length=100), nullable=False),
+            sa.Column('role', sa.String(length=20), nullable=False),
+            sa.Column('is_active', sa.Boolean(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('last_login', sa.DateTime(), nullable=True),
+            sa.Column('phone', sa.String(length=20), nullable=True),
+            sa.Column('student_id', sa.String(length=20), nullable=True),
+            sa.Column('group_id', sa.Integer(), nullable=True),
+            sa.Column('enrollment_year', sa.Integer(), nullable=True),
+            sa.Column('semester', sa.Integer(), nullable=True),
+            sa.Column('passport_number', sa.String(length=20), nullable=True),
+            sa.Column('pinfl', sa.String(length=14), nullable=True),
+            sa.Column('birth_date', sa.Date(), nullable=True),
+            sa.Column('specialty', sa.String(length=200), nullable=True),
+            sa.Column('specialty_code', sa.String(length=50), nullable=True),
+            sa.Column('education_type', sa.String(length=50), nullable=True),
+            sa.Column('employee_code', sa.String(length=50), nullable=True),
+            sa.Column('department', sa.String(length=100), nullable=True),
+            sa.Column('position', sa.String(length=50), nullable=True),
+            sa.Column('faculty_id', sa.Integer(), nullable=True),
+            sa.Column('managed_department_id', sa.Integer(), nullable=True),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('superadmin_flag', sa.Boolean(), nullable=True),
+            sa.Column('unread_message_count', sa.Integer(), server_default='0', nullable=False),
+            sa.ForeignKeyConstraint(['faculty_id'], ['faculty.id'], ),
+            sa.ForeignKeyConstraint(['group_id'], ['group.id'], ),
+            sa.ForeignKeyConstraint(['managed_department_id'], ['department.id'], ),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('email'),
+            sa.UniqueConstraint('login'),
+            sa.UniqueConstraint('student_id')
+        )
+        op.create_index(op.f('ix_user_employee_code'), 'user', ['employee_code'], unique=False)
+        op.create_index('ix_user_role_group', 'user', ['role', 'group_id'], unique=False)
+
+    if 'announcement' not in existing:
+        op.create_table('announcement',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('title', sa.String(length=200), nullable=False),
+            sa.Column('content', sa.Text(), nullable=False),
+            sa.Column('author_id', sa.Integer(), nullable=False),
+            sa.Column('author_role', sa.String(length=50), nullable=True),
+            sa.Column('is_important', sa.Boolean(), nullable=True),
+            sa.Column('target_roles', sa.String(length=100), nullable=True),
+            sa.Column('faculty_id', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['author_id'], ['user.id'], ),
+            sa.ForeignKeyConstraint(['faculty_id'], ['faculty.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'assignment' not in existing:
+        op.create_table('assignment',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('title', sa.String(length=200), nullable=False),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('subject_id', sa.Integer(), nullable=False),
+            sa.Column('group_id', sa.Integer(), nullable=True),
+            sa.Column('direction_id', sa.Integer(), nullable=True),
+            sa.Column('lesson_type', sa.String(length=20), nullable=True),
+            sa.Column('lesson_ids', sa.Text(), nullable=True),
+            sa.Column('due_date', sa.DateTime(), nullable=True),
+            sa.Column('max_score', sa.Float(), nullable=True),
+            sa.Column('file_required', sa.Boolean(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('created_by', sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(['created_by'], ['user.id'], ),
+            sa.ForeignKeyConstraint(['direction_id'], ['direction.id'], ),
+            sa.ForeignKeyConstraint(['group_id'], ['group.id'], ),
+            sa.ForeignKeyConstraint(['subject_id'], ['subject.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'department_head' not in existing:
+        op.create_table('department_head',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('department_id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['department_id'], ['department.id'], ),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('department_id', 'user_id', name='uq_department_head_dept_user')
+        )
+
+    if 'lesson' not in existing:
+        op.create_table('lesson',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('title', sa.String(length=200), nullable=False),
+            sa.Column('content', sa.Text(), nullable=True),
+            sa.Column('video_url', sa.String(length=500), nullable=True),
+            sa.Column('video_file', sa.String(length=500), nullable=True),
+            sa.Column('file_url', sa.String(length=500), nullable=True),
+            sa.Column('duration', sa.Integer(), nullable=True),
+            sa.Column('order', sa.Integer(), nullable=True),
+            sa.Column('lesson_type', sa.String(length=20), nullable=True),
+            sa.Column('subject_id', sa.Integer(), nullable=False),
+            sa.Column('group_id', sa.Integer(), nullable=True),
+            sa.Column('direction_id', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('created_by', sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(['created_by'], ['user.id'], ),
+            sa.ForeignKeyConstraint(['direction_id'], ['direction.id'], ),
+            sa.ForeignKeyConstraint(['group_id'], ['group.id'], ),
+            sa.ForeignKeyConstraint(['subject_id'], ['subject.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_lesson_subject_direction_type_order', 'lesson', ['subject_id', 'direction_id', 'lesson_type', 'order'], unique=False)
+
+    if 'message' not in existing:
+        op.create_table('message',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('sender_id', sa.Integer(), nullable=False),
+            sa.Column('receiver_id', sa.Integer(), nullable=False),
+            sa.Column('content', sa.Text(), nullable=False),
+            sa.Column('is_read', sa.Boolean(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('reply_to_id', sa.Integer(), nullable=True),
+            sa.Column('is_pinned', sa.Boolean(), nullable=True),
+            sa.ForeignKeyConstraint(['receiver_id'], ['user.id'], ),
+            sa.ForeignKeyConstraint(['reply_to_id'], ['message.id'], ),
+            sa.ForeignKeyConstraint(['sender_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_message_receiver_read', 'message', ['receiver_id', 'is_read'], unique=False)
+        op.create_index('ix_message_sender_receiver_created', 'message', ['sender_id', 'receiver_id', 'created_at'], unique=False)
+
+    if 'password_reset_token' not in existing:
+        op.create_table('password_reset_token',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('token', sa.String(length=100), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('expires_at', sa.DateTime(), nullable=False),
+            sa.Column('is_used', sa.Boolean(), nullable=True),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('token')
+        )
+
+    if 'schedule' not in existing:
+        op.create_table('schedule',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('subject_id', sa.Integer(), nullable=False),
+            sa.Column('group_id', sa.Integer(), nullable=False),
+            sa.Column('teacher_id', sa.Integer(), nullable=True),
+            sa.Column('day_of_week', sa.Integer(), nullable=True),
+            sa.Column('start_time', sa.String(length=5), nullable=True),
+            sa.Column('end_time', sa.String(length=5), nullable=True),
+            sa.Column('link', sa.String(length=500), nullable=True),
+            sa.Column('lesson_type', sa.String(length=20), nullable=True),
+            sa.ForeignKeyConstraint(['group_id'], ['group.id'], ),
+            sa.ForeignKeyConstraint(['subject_id'], ['subject.id'], ),
+            sa.ForeignKeyConstraint(['teacher_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'staff_attendance_daily' not in existing:
+        op.create_table('staff_attendance_daily',
+            sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column('staff_id', sa.Integer(), nullable=False),
+            sa.Column('date', sa.Date(), nullable=False),
+            sa.Column('first_entry', sa.DateTime(), nullable=True),
+            sa.Column('last_exit', sa.DateTime(), nullable=True),
+            sa.Column('late_minutes', sa.Integer(), nullable=True),
+            sa.Column('work_duration', sa.Integer(), nullable=True),
+            sa.Column('status', sa.String(length=20), nullable=False),
+            sa.Column('kpi_score', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['staff_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('staff_id', 'date', name='uq_staff_attendance_staff_date')
+        )
+        op.create_index(op.f('ix_staff_attendance_daily_date'), 'staff_attendance_daily', ['date'], unique=False)
+        op.create_index(op.f('ix_staff_attendance_daily_staff_id'), 'staff_attendance_daily', ['staff_id'], unique=False)
+
+    if 'staff_kpi_monthly' not in existing:
+        op.create_table('staff_kpi_monthly',
+            sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column('staff_id', sa.Integer(), nullable=False),
+            sa.Column('month', sa.Date(), nullable=False),
+            sa.Column('total_kpi', sa.Integer(), nullable=False),
+            sa.Column('days_count', sa.Integer(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['staff_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('staff_id', 'month', name='uq_staff_kpi_monthly_staff_month')
+        )
+        op.create_index(op.f('ix_staff_kpi_monthly_month'), 'staff_kpi_monthly', ['month'], unique=False)
+        op.create_index(op.f('ix_staff_kpi_monthly_staff_id'), 'staff_kpi_monthly', ['staff_id'], unique=False)
+
+    if 'student_attendance_daily' not in existing:
+        op.create_table('student_attendance_daily',
+            sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column('student_id', sa.Integer(), nullable=False),
+            sa.Column('date', sa.Date(), nullable=False),
+            sa.Column('first_entry', sa.DateTime(), nullable=True),
+            sa.Column('last_exit', sa.DateTime(), nullable=True),
+            sa.Column('status', sa.String(length=20), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['student_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('student_id', 'date', name='uq_student_attendance_student_date')
+        )
+        op.create_index(op.f('ix_student_attendance_daily_date'), 'student_attendance_daily', ['date'], unique=False)
+        op.create_index(op.f('ix_student_attendance_daily_student_id'), 'student_attendance_daily', ['student_id'], unique=False)
+
+    if 'student_payment' not in existing:
+        op.create_table('student_payment',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('student_id', sa.Integer(), nullable=False),
+            sa.Column('contract_amount', sa.Numeric(precision=15, scale=2), nullable=False),
+            sa.Column('paid_amount', sa.Numeric(precision=15, scale=2), nullable=True),
+            sa.Column('academic_year', sa.String(length=20), nullable=True),
+            sa.Column('semester', sa.Integer(), nullable=True),
+            sa.Column('period_start', sa.Date(), nullable=True),
+            sa.Column('period_end', sa.Date(), nullable=True),
+            sa.Column('notes', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['student_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_student_payment_student', 'student_payment', ['student_id'], unique=False)
+
+    if 'teacher_department' not in existing:
+        op.create_table('teacher_department',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('teacher_id', sa.Integer(), nullable=False),
+            sa.Column('department_id', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['department_id'], ['department.id'], ),
+            sa.ForeignKeyConstraint(['teacher_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'teacher_subject' not in existing:
+        op.create_table('teacher_subject',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('teacher_id', sa.Integer(), nullable=False),
+            sa.Column('subject_id', sa.Integer(), nullable=False),
+            sa.Column('group_id', sa.Integer(), nullable=False),
+            sa.Column('lesson_type', sa.String(length=20), nullable=True),
+            sa.Column('academic_year', sa.String(length=20), nullable=True),
+            sa.Column('semester', sa.Integer(), nullable=True),
+            sa.Column('assigned_at', sa.DateTime(), nullable=True),
+            sa.Column('assigned_by', sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(['assigned_by'], ['user.id'], ),
+            sa.ForeignKeyConstraint(['group_id'], ['group.id'], ),
+            sa.ForeignKeyConstraint(['subject_id'], ['subject.id'], ),
+            sa.ForeignKeyConstraint(['teacher_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_teacher_subject_subject_group_type', 'teacher_subject', ['subject_id', 'group_id', 'lesson_type'], unique=False)
+
+    if 'test' not in existing:
+        op.create_table('test',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('title', sa.String(length=200), nullable=False),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('subject_id', sa.Integer(), nullable=False),
+            sa.Column('direction_id', sa.Integer(), nullable=True),
+            sa.Column('group_id', sa.Integer(), nullable=True),
+            sa.Column('max_score', sa.Float(), nullable=True),
+            sa.Column('time_limit_minutes', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('created_by', sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(['created_by'], ['user.id'], ),
+            sa.ForeignKeyConstraint(['direction_id'], ['direction.id'], ),
+            sa.ForeignKeyConstraint(['group_id'], ['group.id'], ),
+            sa.ForeignKeyConstraint(['subject_id'], ['subject.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'user_faculty' not in existing:
+        op.create_table('user_faculty',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('faculty_id', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['faculty_id'], ['faculty.id'], ),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('user_id', 'faculty_id', name='uq_user_faculty_user_faculty')
+        )
+
+    if 'user_roles' not in existing:
+        op.create_table('user_roles',
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('role', sa.String(length=20), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('user_id', 'role')
+        )
+
+    if 'lesson_view' not in existing:
+        op.create_table('lesson_view',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('lesson_id', sa.Integer(), nullable=False),
+            sa.Column('student_id', sa.Integer(), nullable=False),
+            sa.Column('started_at', sa.DateTime(), nullable=True),
+            sa.Column('completed_at', sa.DateTime(), nullable=True),
+            sa.Column('attention_checks_passed', sa.Integer(), nullable=True),
+            sa.Column('is_completed', sa.Boolean(), nullable=True),
+            sa.Column('watch_duration', sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(['lesson_id'], ['lesson.id'], ),
+            sa.ForeignKeyConstraint(['student_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_lesson_view_lesson_student', 'lesson_view', ['lesson_id', 'student_id'], unique=False)
+
+    if 'submission' not in existing:
+        op.create_table('submission',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('student_id', sa.Integer(), nullable=False),
+            sa.Column('assignment_id', sa.Integer(), nullable=False),
+            sa.Column('content', sa.Text(), nullable=True),
+            sa.Column('file_url', sa.String(length=500), nullable=True),
+            sa.Column('submitted_at', sa.DateTime(), nullable=True),
+            sa.Column('score', sa.Float(), nullable=True),
+            sa.Column('feedback', sa.Text(), nullable=True),
+            sa.Column('graded_at', sa.DateTime(), nullable=True),
+            sa.Column('graded_by', sa.Integer(), nullable=True),
+            sa.Column('resubmission_count', sa.Integer(), nullable=True),
+            sa.Column('allow_resubmission', sa.Boolean(), nullable=True),
+            sa.Column('is_active', sa.Boolean(), nullable=True),
+            sa.ForeignKeyConstraint(['assignment_id'], ['assignment.id'], ),
+            sa.ForeignKeyConstraint(['graded_by'], ['user.id'], ),
+            sa.ForeignKeyConstraint(['student_id'], ['user.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_submission_student_assignment', 'submission', ['student_id', 'assignment_id'], unique=False)
+
+    if 'test_question' not in existing:
+        op.create_table('test_question',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('test_id', sa.Integer(), nullable=False),
+            sa.Column('text', sa.Text(), nullable=False),
+            sa.Column('order', sa.Integer(), nullable=True),
+            sa.Column('points', sa.Float(), nullable=True),
+            sa.ForeignKeyConstraint(['test_id'], ['test.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'test_submission' not in existing:
+        op.create_table('test_submission',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('test_id', sa.Integer(), nullable=False),
+            sa.Column('student_id', sa.Integer(), nullable=False),
+            sa.Column('score', sa.Float(), nullable=True),
+            sa.Column('submitted_at', sa.DateTime(), nullable=True),
+            sa.Column('answers_json', sa.Text(), nullable=True),
+            sa.ForeignKeyConstraint(['student_id'], ['user.id'], ),
+            sa.ForeignKeyConstraint(['test_id'], ['test.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'test_option' not in existing:
+        op.create_table('test_option',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('question_id', sa.Integer(), nullable=False),
+            sa.Column('text', sa.String(length=500), nullable=False),
+            sa.Column('is_correct', sa.Boolean(), nullable=True),
+            sa.Column('order', sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(['question_id'], ['test_question.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+
+def _migrate_ticker_settings(bind):
+    """Eski site_settings ticker_* kalitlari -> flash_message (jadval bo'sh bo'lsa)."""
+    from datetime import date
+    if bind.execute(sa.text('SELECT COUNT(*) FROM flash_message')).scalar():
+        return
+    settings = dict(bind.execute(sa.text(
+        "SELECT key, value FROM site_settings WHERE key LIKE 'ticker%'")).all())
+    get = lambda key: (settings.get(key) or '').strip()
+    main = get('ticker_text')
+    if not (get('ticker_text_uz') or get('ticker_text_ru') or get('ticker_text_en') or main):
+        return
+
+    def _date(key):
+        try:
+            return date.fromisoformat(get(key)) if get(key) else None
+        except ValueError:
+            return None
+
+    flash_message = sa.table(
+        'flash_message', sa.column('text_uz'), sa.column('text_ru'), sa.column('text_en'), sa.column('url'),
+        sa.column('text_color'), sa.column('enabled', sa.Boolean), sa.column('date_from', sa.Date),
+        sa.column('date_to', sa.Date), sa.column('sort_order'),
+    )
+    op.bulk_insert(flash_message, [{
+        'text_uz': get('ticker_text_uz') or main, 'text_ru': get('ticker_text_ru') or main,
+        'text_en': get('ticker_text_en') or main, 'url': get('ticker_url'),
+        'text_color': (get('ticker_text_color') or 'white').lower(),
+        'enabled': get('ticker_enabled').lower() in ('1', 'true', 'yes', 'on'),
+        'date_from': _date('ticker_date_from'), 'date_to': _date('ticker_date_to'), 'sort_order': 0,
+    }])
+
+
+def upgrade():
+    bind = op.get_bind()
+    _create_missing_tables(bind)
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+    added = set()
+    for table, name, type_, kwargs in COLUMNS:
+        if table in tables and name not in {c['name'] for c in inspector.get_columns(table)}:
+            op.add_column(table, sa.Column(name, type_, **kwargs))
+            added.add((table, name))
+    inspector = sa.inspect(bind)
+    for table, name, columns, unique in INDEXES:
+        if table not in tables or name in {ix['name'] for ix in inspector.get_indexes(table)}:
+            continue
+        # Unique indeks faqat ustun hozir qo'shilganda (eski qatorlarda takror qiymatlar bo'lishi mumkin)
+        if unique and (table, columns[0]) not in added:
+            continue
+        op.create_index(name, table, columns, unique=unique)
+
+    if ('user', 'unread_message_count') in added and 'message' in tables:
+        user = sa.table('user', sa.column('id'), sa.column('unread_message_count'))
+        message = sa.table('message', sa.column('receiver_id'), sa.column('is_read', sa.Boolean))
+        op.execute(user.update().values(unread_message_count=sa.select(sa.func.count()).where(
+            message.c.receiver_id == user.c.id, message.c.is_read == sa.false()).scalar_subquery()))
+    if ('submission', 'is_active') in added:
+        submission = sa.table('submission', sa.column('is_active', sa.Boolean))
+        op.execute(submission.update().where(submission.c.is_active.is_(None)).values(is_active=True))
+    if 'flash_message' in tables and 'site_settings' in tables:
+        _migrate_ticker_settings(bind)
+
+
+def downgrade():
+    # Eski startup probe lari hech qachon qaytarilmagan; ustunlar modellarda ishlatiladi
+    pass
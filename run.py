@@ -8,6 +8,7 @@ except ImportError:
 from waitress import serve
 from app import create_app
 import logging
+import os
 
 # logs papkasini yaratish (Render va boshqa muhitlarda mavjud bo'lmasa)
 logs_dir = Path(__file__).resolve().parent / 'logs'
@@ -32,4 +33,5 @@ if __name__ == '__main__':
     except Exception as e:
         logging.getLogger(__name__).warning("SSE client ishga tushmadi: %s", e)
 
-    serve(app, host="0.0.0.0", port=80)
+    # SSE oqimlari (TV lar, markaz) har biri bitta thread band qiladi
+    serve(app, host="0.0.0.0", port=80, threads=int(os.environ.get('WAITRESS_THREADS', '48')))